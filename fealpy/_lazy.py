@@ -0,0 +1,45 @@
+"""Lazy attributes of packages, by the module `__getattr__` of PEP 562.
+
+A package lists its public names with the submodules defining them, and the
+submodules are imported on first access, as in
+
+    __getattr__, __dir__, __all__ = attach(__name__, {
+        'TriangleMesh': '.triangle_mesh',
+        'SourceIntegrator': '.cell_source_integrator:CellSourceIntegrator',
+    })
+
+so that `import fealpy.mesh` does not import every mesh and its dependencies.
+"""
+import sys
+import importlib
+from typing import Dict, Tuple, List, Callable, Any
+
+
+def attach(package: str, mapping: Dict[str, str]) -> Tuple[Callable[[str], Any],
+                                                          Callable[[], List[str]],
+                                                          List[str]]:
+    """Make the module-level `__getattr__`, `__dir__` and `__all__` of a package.
+
+    Parameters:
+        package (str): Name of the package, i.e. `__name__` of its `__init__`.
+        mapping (Dict[str, str]): Map from public names to the relative names
+            of the submodules defining them, in the form of '.module' or
+            '.module:attribute' if the attribute has another name.
+
+    Returns:
+        Tuple: The `__getattr__`, `__dir__` and `__all__` of the package.
+    """
+    def __getattr__(name: str):
+        if name not in mapping:
+            raise AttributeError(f"module '{package}' has no attribute '{name}'")
+        module_name, _, attr = mapping[name].partition(':')
+        module = importlib.import_module(module_name, package)
+        value = getattr(module, attr or name)
+        # NOTE: Cache in the package, so the next access is a plain lookup.
+        setattr(sys.modules[package], name, value)
+        return value
+
+    def __dir__() -> List[str]:
+        return sorted(set(sys.modules[package].__dict__) | set(mapping))
+
+    return __getattr__, __dir__, list(mapping)
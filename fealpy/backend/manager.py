@@ -7,7 +7,21 @@ from ..import logger
 from .base import BackendProxy
 
 
+class _BackendState(threading.local):
+    # NOTE: The backend of each thread, swapped by `set_backend`.
+    # A class attribute gives the default without try-except.
+    backend: Optional[BackendProxy] = None
+
+
 class BackendManager():
+    """Dispatch attribute access to the backend of the current thread.
+
+    Attribute access is resolved in `__getattribute__` with one lookup of the
+    thread-local backend, so that `bm.xxx` costs about as much as an attribute
+    access on the backend itself plus a Python call. Hot loops may bind the
+    backend once, as in `xp = bm.get_current_backend()`, whose attributes are
+    plain class attributes.
+    """
     # _instance = None
 
     # def __new__(cls, *, default_backend: str):
@@ -17,14 +31,14 @@ class BackendManager():
 
     def __init__(self, *, default_backend: Optional[str]=None):
         self._backends: Dict[str, BackendProxy] = {}
-        self._THREAD_LOCAL = threading.local()
+        self._THREAD_LOCAL = _BackendState()
         self._default_backend_name = default_backend
 
     def set_backend(self, name: str) -> None:
         """Set the current backend."""
         if name not in self._backends:
             self.load_backend(name)
-        self._THREAD_LOCAL.__dict__['backend'] = self._backends[name]
+        self._THREAD_LOCAL.backend = self._backends[name]
 
     def load_backend(self, name: str) -> None:
         """Load a backend by name."""
@@ -47,7 +61,7 @@ class BackendManager():
 
     def get_current_backend(self, logger_msg=None) -> BackendProxy:
         """Get the current backend."""
-        if 'backend' not in self._THREAD_LOCAL.__dict__:
+        if self._THREAD_LOCAL.backend is None:
             if self._default_backend_name is None:
                 raise RuntimeError(
                     f"Backend properties were accessed ({logger_msg}) "
@@ -58,15 +72,24 @@ class BackendManager():
             logger.info(f"Backend auto-setting triggered by {logger_msg}."
                         "To reduce unnecessary backend loading, "
                         "get backend properties and methods after executing set_backend()")
-        return self._THREAD_LOCAL.__dict__['backend']
+        return self._THREAD_LOCAL.backend
 
-    def __getattr__(self, item):
+    def __getattribute__(self, item):
         """Redirct attribute access to the current backend."""
-        return getattr(self.get_current_backend("GET_ATTR: " + item), item)
+        if item in _MANAGER_ATTRIBUTES:
+            return object.__getattribute__(self, item)
+        backend = object.__getattribute__(self, '_THREAD_LOCAL').backend
+        if backend is None:
+            backend = self.get_current_backend("GET_ATTR: " + item)
+        return getattr(backend, item)
 
     def __setattr__(self, key, value):
         """Redirct attribute access to the current backend."""
-        if key in {'_backends', '_THREAD_LOCAL', '_default_backend_name'}:
+        if key in _INSTANCE_ATTRIBUTES:
             super().__setattr__(key, value)
         else:
             setattr(self.get_current_backend("SET_ATTR: " + key), key, value)
+
+
+_INSTANCE_ATTRIBUTES = frozenset({'_backends', '_THREAD_LOCAL', '_default_backend_name'})
+_MANAGER_ATTRIBUTES = frozenset(dir(BackendManager)) | _INSTANCE_ATTRIBUTES
@@ -154,63 +154,87 @@ class NumPyBackend(BackendProxy, backend_name='numpy'):
 
 
     ### Sparse Functions ###
+    @staticmethod
+    def _batched_spmm(kernel, values, other, shape):
+        """Apply the scipy kernel `kernel(value, x, out)` on each batch."""
+        if other.ndim == 0:
+            raise ValueError("`other` must be a 1-D, 2-D or batched 2-D array.")
+        dtype = np.result_type(values, other)
+        values = np.asarray(values, dtype=dtype)
+        other = np.asarray(other, dtype=dtype)
+
+        if other.ndim <= 2:
+            if values.ndim == 1:
+                result = np.zeros((shape[0],) + other.shape[1:], dtype=dtype)
+                kernel(values, other, result)
+                return result
+            batch_shape = values.shape[:-1]
+            other_batch_shape = ()
+        else:
+            batch_shape = np.broadcast_shapes(values.shape[:-1], other.shape[:-2])
+            other_batch_shape = other.shape[:-2]
+
+        tail = (shape[0],) if other.ndim == 1 else (shape[0], other.shape[-1])
+        result = np.zeros(batch_shape + tail, dtype=dtype)
+        values = np.broadcast_to(values, batch_shape + values.shape[-1:])
+        if len(other_batch_shape) > 0:
+            other = np.broadcast_to(other, batch_shape + other.shape[-2:])
+
+        for idx in np.ndindex(*batch_shape):
+            x = other[idx] if len(other_batch_shape) > 0 else other
+            kernel(np.ascontiguousarray(values[idx]), np.ascontiguousarray(x), result[idx])
+
+        return result
+
     @staticmethod
     def coo_spmm(indices, value, shape, other):
         nnz = value.shape[-1]
         row = indices[0]
         col = indices[1]
 
-        if value.ndim == 1:
-            if other.ndim == 1:
-                result = np.zeros((shape[0],), dtype=other.dtype)
-                coo_matvec(nnz, row, col, value, other, result)
-                return result
-            elif other.ndim == 2:
-                new_shape = (shape[0], other.shape[-1])
-                result = np.zeros(new_shape, dtype=other.dtype)
-                rT = result.T
-                for i, acol in enumerate(other.T):
-                    coo_matvec(nnz, row, col, value, acol, rT[i])
-                return result
+        def kernel(v, x, out):
+            if x.ndim == 1:
+                coo_matvec(nnz, row, col, v, x, out)
             else:
-                raise ValueError("`other` must be a 1-D or 2-D array.")
-        else:
-            raise NotImplementedError("Batch sparse matrix multiplication has "
-                                      "not been supported yet.")
+                xT = np.ascontiguousarray(x.T)
+                outT = np.zeros((x.shape[-1], shape[0]), dtype=out.dtype)
+                for i in range(x.shape[-1]):
+                    coo_matvec(nnz, row, col, v, xT[i], outT[i])
+                out[...] = outT.T
+
+        return NumPyBackend._batched_spmm(kernel, value, other, shape)
 
     @staticmethod
     def csr_spmm(crow, col, value, shape, other):
         M, N = shape
 
-        if value.ndim == 1:
-            if other.ndim == 1:
-                result = np.zeros((shape[0],), dtype=other.dtype)
-                csr_matvec(M, N, crow, col, value, other, result)
-                return result
-            elif other.ndim == 2:
-                n_vecs = other.shape[-1]
-                new_shape = (shape[0], other.shape[-1])
-                result = np.zeros(new_shape, dtype=other.dtype)
-                csr_matvecs(M, N, n_vecs, crow, col, value, other.ravel(), result.ravel())
-                return result
+        def kernel(v, x, out):
+            if x.ndim == 1:
+                csr_matvec(M, N, crow, col, v, x, out)
             else:
-                raise ValueError("`other` must be a 1-D or 2-D array.")
-        else:
-            raise NotImplementedError("Batch sparse matrix multiplication has "
-                                      "not been supported yet.")
+                n_vecs = x.shape[-1]
+                csr_matvecs(M, N, n_vecs, crow, col, v, x.ravel(), out.reshape(-1))
+
+        return NumPyBackend._batched_spmm(kernel, value, other, shape)
 
     @staticmethod
     def coo_tocsr(indices, values, shape):
         M, N = shape
         idx_dtype = indices.dtype
         major, minor = indices
-        nnz = len(values)
+        nnz = minor.shape[0]
         crow = np.empty(M+1, dtype=idx_dtype)
         col = np.empty_like(minor, dtype=idx_dtype)
-        data = np.empty_like(values, dtype=values.dtype)
-        coo_tocsr(M, N, nnz, major, minor, values, crow, col, data)
 
-        return crow, col, data
+        if values.ndim == 1:
+            data = np.empty_like(values, dtype=values.dtype)
+            coo_tocsr(M, N, nnz, major, minor, values, crow, col, data)
+            return crow, col, data
+
+        # NOTE: For batched values, get the permutation of non-zeros first.
+        perm = np.empty(nnz, dtype=np.int64)
+        coo_tocsr(M, N, nnz, major, minor, np.arange(nnz, dtype=np.int64), crow, col, perm)
+        return crow, col, values[..., perm]
 
     ### FEALPy Functions ###
 
@@ -147,7 +147,11 @@ class PyTorchBackend(BackendProxy, backend_name='pytorch'):
     vecdot = staticmethod(_dim_to_axis(torch.linalg.vecdot))
 
     # non-standard
-    cross = staticmethod(_dim_to_axis(torch.cross))
+    @staticmethod
+    def cross(x1, x2, /, *, axis=-1):
+        # NOTE: torch.cross uses the first dimension sized 3 by default,
+        # which is wrong for arrays of three vectors.
+        return torch.cross(x1, x2, dim=axis)
 
     @staticmethod
     def dot(x1, x2, /, *, axis=-1):
@@ -254,9 +258,12 @@ class PyTorchBackend(BackendProxy, backend_name='pytorch'):
 
     @staticmethod
     def unique(a, return_index=False, return_inverse=False, return_counts=False, axis=0, **kwargs):
+        # NOTE: torch.unique with `dim` falls back to a much slower kernel,
+        # which is not necessary for 1-D tensors.
+        dim = None if (a.ndim == 1) else axis
         b, inverse, counts = torch.unique(a, return_inverse=True,
                 return_counts=True,
-                dim=axis, **kwargs)
+                dim=dim, **kwargs)
         any_return = return_index or return_inverse or return_counts
         if any_return:
             result = (b, )
@@ -406,7 +413,7 @@ class PyTorchBackend(BackendProxy, backend_name='pytorch'):
 
     @staticmethod
     def coo_spmm(indices, values, shape, other):
-        if values.ndim == 1:
+        if values.ndim == 1 and other.ndim <= 2:
             mat = torch.sparse_coo_tensor(indices, values, size=shape)
             return PyTorchBackend._spmm(mat, other)
         else:
@@ -415,7 +422,7 @@ class PyTorchBackend(BackendProxy, backend_name='pytorch'):
 
     @staticmethod
     def csr_spmm(crow, col, values, shape, other):
-        if values.ndim == 1:
+        if values.ndim == 1 and other.ndim <= 2:
             mat = torch.sparse_csr_tensor(crow, col, values, size=shape)
             return PyTorchBackend._spmm(mat, other)
         else:
@@ -431,9 +438,18 @@ class PyTorchBackend(BackendProxy, backend_name='pytorch'):
 
     @staticmethod
     def coo_tocsr(indices, values, shape):
-        mat = torch.sparse_coo_tensor(indices, values, size=shape)
-        mat = mat.to_sparse_csr()
-        return mat.crow_indices(), mat.col_indices(), mat.values()
+        if values.ndim == 1:
+            mat = torch.sparse_coo_tensor(indices, values, size=shape)
+            mat = mat.to_sparse_csr()
+            return mat.crow_indices(), mat.col_indices(), mat.values()
+
+        # NOTE: Batched values are converted as a dense dimension of hybrid tensors.
+        batch_shape = values.shape[:-1]
+        dense_values = values.reshape(-1, values.shape[-1]).T
+        mat = torch.sparse_coo_tensor(indices, dense_values, size=tuple(shape) + dense_values.shape[1:])
+        mat = mat.coalesce().to_sparse_csr()
+        new_values = mat.values().T.reshape(batch_shape + (-1, ))
+        return mat.crow_indices(), mat.col_indices(), new_values
 
     ### FEALPy functionals ###
 
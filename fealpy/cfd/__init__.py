@@ -1,3 +1,8 @@
-from .ns_mac_solver import NSMacSolver
-from .ns_fem_solver import NSFEMSolver
-#from .ns_flip_solver import NSFlipSolver
+from .._lazy import attach
+
+__getattr__, __dir__, __all__ = attach(__name__, {
+    'NSMacSolver': '.ns_mac_solver',
+    'NSFEMSolver': '.ns_fem_solver',
+    'NSFlipSolver': '.ns_flip_solver',
+    'ParticleGridTransfer': '.particle_transfer',
+})
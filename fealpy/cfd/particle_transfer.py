@@ -0,0 +1,241 @@
+from typing import Union, Tuple, Optional
+
+from ..backend import backend_manager as bm
+from ..backend import TensorLike
+from ..sparse import COOTensor, CSRTensor
+
+
+KERNELS = ('nearest', 'linear', 'quadratic')
+LOCATIONS = ('node', 'cell')
+
+
+def _kernel_1d(s: TensorLike, kernel: str):
+    """Weights of a 1D kernel and their derivatives at positions `s` in grid
+    units, with the first grid index of the support of each position."""
+    if kernel == 'nearest':
+        base = bm.floor(s + 0.5)
+        w = bm.ones_like(s)[:, None]
+        dw = bm.zeros_like(s)[:, None]
+    elif kernel == 'linear':
+        base = bm.floor(s)
+        t = s - base
+        one = bm.ones_like(t)
+        w = bm.stack([1 - t, t], axis=-1)
+        dw = bm.stack([-one, one], axis=-1)
+    else:
+        base = bm.floor(s - 0.5)
+        t = s - base
+        w = bm.stack([0.5*(1.5 - t)**2, 0.75 - (t - 1)**2, 0.5*(t - 0.5)**2], axis=-1)
+        dw = bm.stack([t - 1.5, 2*(1 - t), t - 0.5], axis=-1)
+    return base, w, dw
+
+
+class ParticleGridTransfer():
+    """Particle-grid transfer of PIC/FLIP/APIC methods on uniform meshes.
+
+    The grid points are the nodes or the cell centers of a `UniformMesh2d` or
+    `UniformMesh3d`. The host cell of a particle is found by index arithmetic,
+    and the weights are tensor products of 1D kernels on the `S^GD` grid
+    points around it, so a transfer costs O(NP S^GD) without any search or
+    dense matrix.
+
+    - 'nearest': weight 1 on the nearest grid point, i.e. the host cell for
+      cell centers;
+    - 'linear': bilinear/trilinear weights, S = 2;
+    - 'quadratic': quadratic B-spline weights, S = 3.
+
+    Grid points out of the grid are moved to the nearest boundary layer, so
+    the weights always sum to one.
+
+    Parameters:
+        mesh (UniformMesh2d | UniformMesh3d): The mesh.
+        kernel (str, optional): The kernel. Defaults to 'linear'.
+        location (str, optional): 'node' or 'cell'. Defaults to 'node'.
+
+    Example:
+        transfer = ParticleGridTransfer(mesh, kernel='quadratic')
+        M, U = transfer.particle_to_grid(x, v, mass=m, affine=C) # APIC
+        ... # update the grid velocity U to U1
+        v, C = transfer.grid_to_particle(x, U1, affine=True)
+        v_flip = v_old + transfer.grid_to_particle(x, U1 - U) # FLIP
+    """
+    def __init__(self, mesh, kernel: str='linear', location: str='node'):
+        if kernel not in KERNELS:
+            raise ValueError(f"Unknown kernel: {kernel}, expected one of {KERNELS}.")
+        if location not in LOCATIONS:
+            raise ValueError(f"Unknown location: {location}, expected one of {LOCATIONS}.")
+
+        GD = mesh.geo_dimension()
+        n = (mesh.nx, mesh.ny) if GD == 2 else (mesh.nx, mesh.ny, mesh.nz)
+        self.mesh = mesh
+        self.GD = GD
+        self.kernel = kernel
+        self.location = location
+        self.cells = tuple(int(k) for k in n)
+        self.shape = tuple(k + 1 for k in self.cells) if location == 'node' else self.cells
+        self.offset = 0.0 if location == 'node' else 0.5
+        self.h = tuple(float(h) for h in mesh.h)
+        self.origin = tuple(float(o) for o in mesh.origin)
+        self.itype = mesh.itype
+
+    def number_of_grid_points(self) -> int:
+        NG = 1
+        for n in self.shape:
+            NG *= n
+        return NG
+
+    def cell_location(self, points: TensorLike) -> TensorLike:
+        """The host cells of the points, moved into the mesh if outside.
+
+        Parameters:
+            points (Tensor): Positions of the particles, shaped (NP, GD).
+
+        Returns:
+            Tensor: Indices of the cells shaped (NP, ).
+        """
+        cell = bm.zeros(points.shape[:1], dtype=self.itype, device=bm.get_device(points))
+        for a, n in enumerate(self.cells):
+            i = bm.floor((points[:, a] - self.origin[a]) / self.h[a])
+            cell = cell * n + bm.clip(bm.astype(i, self.itype), 0, n - 1)
+        return cell
+
+    def grid_point(self, index: TensorLike) -> TensorLike:
+        """Coordinates of the grid points.
+
+        Parameters:
+            index (Tensor): Indices of the grid points.
+
+        Returns:
+            Tensor: Coordinates shaped index.shape + (GD, ).
+        """
+        x = []
+        for a in range(self.GD - 1, -1, -1):
+            n = self.shape[a]
+            i = index % n
+            index = index // n
+            x.append(self.origin[a] + (i + self.offset) * self.h[a])
+        return bm.stack(x[::-1], axis=-1)
+
+    def weights(self, points: TensorLike, grad: bool=False):
+        """Grid points around the particles and their weights.
+
+        Parameters:
+            points (Tensor): Positions of the particles, shaped (NP, GD).
+            grad (bool, optional): Whether to return the gradients of the
+                weights. Defaults to False.
+
+        Returns:
+            Tuple[Tensor, ...]: Indices of the grid points and the weights,
+                both shaped (NP, S^GD), and the gradients shaped (NP, S^GD, GD)
+                if `grad` is True.
+        """
+        NP = points.shape[0]
+        device = bm.get_device(points)
+        index = bm.zeros((NP, 1), dtype=self.itype, device=device)
+        weight = bm.ones((NP, 1), dtype=points.dtype, device=device)
+        grads = []
+
+        for a, n in enumerate(self.shape):
+            s = (points[:, a] - self.origin[a]) / self.h[a] - self.offset
+            base, w, dw = _kernel_1d(s, self.kernel)
+            S = w.shape[-1]
+            i = bm.astype(base, self.itype)[:, None] + bm.arange(S, dtype=self.itype, device=device)
+            i = bm.clip(i, 0, n - 1)
+            index = (index[:, :, None] * n + i[:, None, :]).reshape(NP, -1)
+            if grad:
+                grads = [(g[:, :, None] * w[:, None, :]).reshape(NP, -1) for g in grads]
+                grads.append((weight[:, :, None] * dw[:, None, :]).reshape(NP, -1) / self.h[a])
+            weight = (weight[:, :, None] * w[:, None, :]).reshape(NP, -1)
+
+        if grad:
+            return index, weight, bm.stack(grads, axis=-1)
+        return index, weight
+
+    def operator(self, points: TensorLike) -> CSRTensor:
+        """The grid-to-particle interpolation matrix, whose transpose is the
+        particle-to-grid scattering.
+
+        Parameters:
+            points (Tensor): Positions of the particles, shaped (NP, GD).
+
+        Returns:
+            CSRTensor: The matrix shaped (NP, NG).
+        """
+        index, weight = self.weights(points)
+        NP, NS = index.shape
+        row = bm.arange(NP, dtype=self.itype, device=bm.get_device(points))
+        row = bm.broadcast_to(row[:, None], (NP, NS)).reshape(-1)
+        indices = bm.stack([row, index.reshape(-1)], axis=0)
+        spshape = (NP, self.number_of_grid_points())
+        return COOTensor(indices, weight.reshape(-1), spshape).coalesce().tocsr()
+
+    def particle_to_grid(self, points: TensorLike, value: TensorLike,
+                         mass: Optional[TensorLike]=None,
+                         affine: Optional[TensorLike]=None) -> Union[TensorLike, Tuple[TensorLike, TensorLike]]:
+        """Scatter particle values to the grid points.
+
+        Parameters:
+            points (Tensor): Positions of the particles, shaped (NP, GD).
+            value (Tensor): Values of the particles, shaped (NP, ...).
+            mass (Tensor | None, optional): Masses of the particles, shaped (NP, ).
+                Defaults to None.
+            affine (Tensor | None, optional): The APIC affine matrices `C_p`,
+                shaped (NP, D, GD) for values shaped (NP, D). The value
+                scattered to grid point `x_i` is `v_p + C_p (x_i - x_p)`.
+                Defaults to None.
+
+        Returns:
+            Tensor | Tuple[Tensor, Tensor]: Sums of the weighted values shaped
+                (NG, ...), or the grid masses shaped (NG, ) and the mass
+                averages of the values shaped (NG, ...) if `mass` is given.
+                The averages are zero on grid points without mass.
+        """
+        index, weight = self.weights(points)
+        if mass is not None:
+            weight = weight * mass[:, None]
+        vshape = tuple(value.shape[1:])
+        w = weight.reshape(weight.shape + (1, )*len(vshape))
+        src = w * value[:, None]
+        if affine is not None:
+            d = self.grid_point(index) - points[:, None, :]
+            src = src + w * bm.einsum('pdg, psg -> psd', affine, d)
+
+        NG = self.number_of_grid_points()
+        kwargs = {'dtype': src.dtype, 'device': bm.get_device(src)}
+        out = bm.zeros((NG, ) + vshape, **kwargs)
+        out = bm.index_add(out, index.reshape(-1), src.reshape((-1, ) + vshape))
+        if mass is None:
+            return out
+
+        M = bm.zeros((NG, ), **kwargs)
+        M = bm.index_add(M, index.reshape(-1), weight.reshape(-1))
+        Mr = M.reshape((NG, ) + (1, )*len(vshape))
+        U = bm.where(Mr > 0, out / bm.where(Mr > 0, Mr, 1.0), 0.0)
+        return M, U
+
+    def grid_to_particle(self, points: TensorLike, value: TensorLike,
+                         affine: bool=False) -> Union[TensorLike, Tuple[TensorLike, TensorLike]]:
+        """Interpolate grid values to the particles.
+
+        Parameters:
+            points (Tensor): Positions of the particles, shaped (NP, GD).
+            value (Tensor): Values on the grid points, shaped (NG, ...).
+            affine (bool, optional): Whether to return the APIC affine matrices
+                `C_p = sum_i v_i grad(w_ip)^T`, for values shaped (NG, D).
+                Defaults to False.
+
+        Returns:
+            Tensor | Tuple[Tensor, Tensor]: Values of the particles shaped
+                (NP, ...), and the affine matrices shaped (NP, D, GD) if
+                `affine` is True.
+        """
+        if affine:
+            index, weight, grad = self.weights(points, grad=True)
+        else:
+            index, weight = self.weights(points)
+        v = value[index]
+        w = weight.reshape(weight.shape + (1, )*(v.ndim - 2))
+        vp = bm.sum(w * v, axis=1)
+        if not affine:
+            return vp
+        return vp, bm.einsum('psd, psg -> pdg', v, grad)
@@ -0,0 +1,10 @@
+from .._lazy import attach
+
+__getattr__, __dir__, __all__ = attach(__name__, {
+    'StencilOperator': '.stencil',
+    'LaplaceOperator': '.laplace_operator',
+    'DiffOperator': '.difference_operator',
+    'GradientOperator': '.difference_operator',
+    'DivergenceOperator': '.difference_operator',
+    'AdvectionOperator': '.advection_operator',
+})
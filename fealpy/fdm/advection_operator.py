@@ -0,0 +1,49 @@
+from typing import Union, Sequence
+
+from ..backend import backend_manager as bm
+from ..typing import TensorLike
+from .stencil import StencilOperator
+
+
+class AdvectionOperator(StencilOperator):
+    """The difference of the advection term `a · ∇u` on the nodes of a uniform
+    mesh, with a given velocity `a`.
+
+    Parameters:
+        mesh (UniformMesh2d | UniformMesh3d): The mesh.
+        velocity (Sequence[float | Tensor] | Tensor): Components of the velocity,
+            scalars or node values, or node values shaped (NN, GD).
+        scheme (str, optional): 'upwind' for the first order upwind difference,
+            or 'central' for the second order central difference.
+            Defaults to 'upwind'.
+        bc (str, optional): The boundary condition. Defaults to 'extrapolate'.
+    """
+    def __init__(self, mesh, velocity: Union[Sequence, TensorLike],
+                 scheme: str='upwind', bc: str='extrapolate'):
+        if scheme not in ('upwind', 'central'):
+            raise ValueError(f"Unknown scheme: {scheme}, expected 'upwind' or 'central'.")
+        GD = mesh.geo_dimension()
+        if bm.is_tensor(velocity) and velocity.ndim == 2:
+            velocity = [velocity[:, a] for a in range(GD)]
+        if len(velocity) != GD:
+            raise ValueError(f"Expected {GD} components of the velocity, "
+                             f"but got {len(velocity)}.")
+
+        terms = []
+        for a in range(GD):
+            v, h = velocity[a], mesh.h[a]
+            lower, upper = [0]*GD, [0]*GD
+            lower[a], upper[a] = -1, 1
+            if scheme == 'central':
+                terms.append((tuple(lower), -0.5*v/h))
+                terms.append((tuple(upper), 0.5*v/h))
+            else:
+                if bm.is_tensor(v):
+                    vp, vm = (bm.abs(v) + v)/2, (v - bm.abs(v))/2
+                else:
+                    vp, vm = max(v, 0.0), min(v, 0.0)
+                terms.append((tuple(lower), -vp/h))
+                terms.append(((0, )*GD, (vp - vm)/h))
+                terms.append((tuple(upper), vm/h))
+        super().__init__(mesh, terms, bc)
+        self.scheme = scheme
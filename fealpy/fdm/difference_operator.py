@@ -0,0 +1,82 @@
+from typing import List
+
+from ..backend import backend_manager as bm
+from ..typing import TensorLike
+from ..sparse import COOTensor, CSRTensor
+from .stencil import StencilOperator
+
+
+def _unit(GD: int, axis: int, s: int):
+    offset = [0]*GD
+    offset[axis] = s
+    return tuple(offset)
+
+
+class DiffOperator(StencilOperator):
+    """The central difference of the first derivative along one axis, with
+    one-sided differences on the boundary by default.
+
+    Parameters:
+        mesh (UniformMesh2d | UniformMesh3d): The mesh.
+        axis (int): The axis of the derivative.
+        bc (str, optional): The boundary condition. Defaults to 'extrapolate'.
+    """
+    def __init__(self, mesh, axis: int, bc: str='extrapolate'):
+        GD = mesh.geo_dimension()
+        if not (0 <= axis < GD):
+            raise ValueError(f"The axis must be in [0, {GD}), but got {axis}.")
+        c = 0.5/mesh.h[axis]
+        terms = [(_unit(GD, axis, -1), -c), (_unit(GD, axis, 1), c)]
+        super().__init__(mesh, terms, bc)
+        self.axis = axis
+
+
+class GradientOperator():
+    """The central difference of the gradient on the nodes of a uniform mesh.
+
+    Parameters:
+        mesh (UniformMesh2d | UniformMesh3d): The mesh.
+        bc (str, optional): The boundary condition. Defaults to 'extrapolate'.
+    """
+    def __init__(self, mesh, bc: str='extrapolate'):
+        self.mesh = mesh
+        self.ops: List[DiffOperator] = [DiffOperator(mesh, a, bc)
+                                        for a in range(mesh.geo_dimension())]
+
+    def __call__(self, u: TensorLike) -> TensorLike:
+        return self.apply(u)
+
+    def apply(self, u: TensorLike) -> TensorLike:
+        """Gradient of node values shaped (..., NN), in shape (..., NN, GD)."""
+        return bm.stack([op(u) for op in self.ops], axis=-1)
+
+    def to_csr(self) -> CSRTensor:
+        """The matrix shaped (GD*NN, NN), with the components stacked by axis."""
+        return COOTensor.concat([op.to_coo() for op in self.ops], axis=0).tocsr()
+
+
+class DivergenceOperator():
+    """The central difference of the divergence on the nodes of a uniform mesh.
+
+    Parameters:
+        mesh (UniformMesh2d | UniformMesh3d): The mesh.
+        bc (str, optional): The boundary condition. Defaults to 'extrapolate'.
+    """
+    def __init__(self, mesh, bc: str='extrapolate'):
+        self.mesh = mesh
+        self.ops: List[DiffOperator] = [DiffOperator(mesh, a, bc)
+                                        for a in range(mesh.geo_dimension())]
+
+    def __call__(self, u: TensorLike) -> TensorLike:
+        return self.apply(u)
+
+    def apply(self, u: TensorLike) -> TensorLike:
+        """Divergence of vector node values shaped (..., NN, GD), in shape (..., NN)."""
+        val = self.ops[0](u[..., 0])
+        for a in range(1, len(self.ops)):
+            val = val + self.ops[a](u[..., a])
+        return val
+
+    def to_csr(self) -> CSRTensor:
+        """The matrix shaped (NN, GD*NN), acting on the components stacked by axis."""
+        return COOTensor.concat([op.to_coo() for op in self.ops], axis=1).tocsr()
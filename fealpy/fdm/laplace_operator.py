@@ -0,0 +1,31 @@
+from typing import Union
+
+from ..typing import TensorLike
+from .stencil import StencilOperator
+
+
+class LaplaceOperator(StencilOperator):
+    """The (2*GD+1)-point central difference of `c Δu` on the nodes of a
+    uniform mesh.
+
+    Parameters:
+        mesh (UniformMesh2d | UniformMesh3d): The mesh.
+        coef (float | Tensor, optional): The coefficient `c`, a scalar or node
+            values. Defaults to 1.0.
+        bc (str, optional): 'dirichlet' for identity rows on the boundary, or
+            'neumann' for zero normal derivative. Defaults to 'dirichlet'.
+
+    Example:
+        L = LaplaceOperator(mesh)
+        A = -L.to_csr() # the matrix of the Poisson problem
+    """
+    def __init__(self, mesh, coef: Union[float, TensorLike]=1.0, bc: str='dirichlet'):
+        GD = mesh.geo_dimension()
+        w = [1.0/mesh.h[a]**2 for a in range(GD)]
+        terms = [((0, )*GD, -2.0*sum(w)*coef)]
+        for a in range(GD):
+            for s in (-1, 1):
+                offset = [0]*GD
+                offset[a] = s
+                terms.append((tuple(offset), w[a]*coef))
+        super().__init__(mesh, terms, bc)
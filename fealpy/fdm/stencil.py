@@ -0,0 +1,215 @@
+from typing import Union, Sequence, Tuple, List
+from itertools import product
+
+from ..backend import backend_manager as bm
+from ..typing import TensorLike
+from ..sparse import COOTensor, CSRTensor
+
+
+_Offset = Tuple[int, ...]
+_Coef = Union[float, TensorLike]
+
+BOUNDARY_CONDITIONS = ('dirichlet', 'neumann', 'extrapolate', 'zero')
+
+
+class StencilOperator():
+    """A linear finite difference operator on the nodes of a uniform mesh,
+    applied as sums of shifted slices of the node grid, without a matrix.
+
+    The operator is a list of terms `(offset, coef)`, and its value at the
+    node `x` is the sum of `coef[x] * u[x + offset]`. Values outside of the
+    grid are given by the boundary condition:
+
+    - 'dirichlet': the rows of boundary nodes are the identity, so that the
+      boundary values of a linear system carry the boundary condition;
+    - 'neumann': zero normal derivative, by the reflection `u[-1] = u[1]`;
+    - 'extrapolate': the linear extrapolation `u[-1] = 2 u[0] - u[1]`,
+      which turns central differences into one-sided ones on the boundary;
+    - 'zero': zero values outside of the grid.
+
+    Parameters:
+        mesh (UniformMesh2d | UniformMesh3d): The mesh.
+        terms (Sequence[Tuple[Tuple[int, ...], float | Tensor]]): Offsets of the
+            stencil in the grid and their coefficients, scalars or tensors of
+            node values shaped (NN, ) or the grid shape.
+        bc (str, optional): The boundary condition. Defaults to 'dirichlet'.
+
+    Example:
+        L = LaplaceOperator(mesh)
+        r = f - L(u) # matrix-free residual
+        A = L.to_csr() # for direct solvers
+    """
+    def __init__(self, mesh, terms: Sequence[Tuple[_Offset, _Coef]], bc: str='dirichlet'):
+        if bc not in BOUNDARY_CONDITIONS:
+            raise ValueError(f"Unknown boundary condition: {bc}, "
+                             f"expected one of {BOUNDARY_CONDITIONS}.")
+        self.mesh = mesh
+        self.GD = mesh.geo_dimension()
+        self.shape = tuple(int(n) + 1 for n in ((mesh.nx, mesh.ny) if self.GD == 2
+                                                else (mesh.nx, mesh.ny, mesh.nz)))
+        self.bc = bc
+        self.terms: List[Tuple[_Offset, _Coef]] = []
+        for offset, coef in terms:
+            if len(offset) != self.GD:
+                raise ValueError(f"Offset {offset} does not match the dimension {self.GD}.")
+            if bm.is_tensor(coef):
+                coef = coef.reshape(self.shape)
+            self.terms.append((tuple(int(o) for o in offset), coef))
+        self.radius = max([max(abs(o) for o in offset) for offset, _ in self.terms] + [1])
+
+    def number_of_nodes(self) -> int:
+        NN = 1
+        for n in self.shape:
+            NN *= n
+        return NN
+
+    def __call__(self, u: TensorLike) -> TensorLike:
+        return self.apply(u)
+
+    def __matmul__(self, u: TensorLike) -> TensorLike:
+        return self.apply(u)
+
+    def apply(self, u: TensorLike) -> TensorLike:
+        """Apply the operator to node values.
+
+        Parameters:
+            u (Tensor): Node values shaped (..., NN) or (..., *grid shape).
+
+        Returns:
+            Tensor: Values of the same shape as `u`.
+        """
+        in_shape = u.shape
+        GD, r = self.GD, self.radius
+        flat = (in_shape[-1] == self.number_of_nodes()) and (len(in_shape) < GD or
+               tuple(in_shape[-GD:]) != self.shape)
+        batch = in_shape[:-1] if flat else in_shape[:-GD]
+        u = u.reshape(batch + self.shape)
+        padded = self._pad(u, r)
+
+        out = None
+        for offset, coef in self.terms:
+            index = (...,) + tuple(slice(r + o, r + o + n) for o, n in zip(offset, self.shape))
+            val = coef * padded[index]
+            out = val if out is None else out + val
+        if out is None:
+            out = bm.zeros_like(u)
+
+        if self.bc == 'dirichlet':
+            out = self._set_boundary(out, u)
+
+        return out.reshape(in_shape)
+
+    def to_csr(self) -> CSRTensor:
+        """The sparse matrix of the operator, see `to_coo`.
+
+        Returns:
+            CSRTensor: The matrix shaped (NN, NN).
+        """
+        return self.to_coo().tocsr()
+
+    def to_coo(self) -> COOTensor:
+        """The sparse matrix of the operator, found by applying it to
+        `(2r+1)^GD` probing vectors, where `r` is the radius of the stencil.
+
+        Returns:
+            COOTensor: The coalesced matrix shaped (NN, NN).
+        """
+        NN = self.number_of_nodes()
+        r = self.radius
+        P = 2 * r + 1
+        ftype = self._ftype()
+        device = self.mesh.device
+        itype = self.mesh.itype
+        coords = bm.meshgrid(*[bm.arange(n, dtype=itype, device=device) for n in self.shape],
+                             indexing='ij')
+        row = bm.arange(NN, dtype=itype, device=device).reshape(self.shape)
+
+        rows, cols, vals = [], [], []
+        for color in product(range(P), repeat=self.GD):
+            flag = None
+            col = bm.zeros(self.shape, dtype=itype, device=device)
+            inside = None
+            stride = 1
+            for a in reversed(range(self.GD)):
+                x = coords[a]
+                f = (x % P) == color[a]
+                flag = f if flag is None else flag & f
+                # the unique neighbor of x of this color along the axis
+                d = (color[a] - x + r) % P - r
+                y = x + d
+                ok = (y >= 0) & (y < self.shape[a])
+                inside = ok if inside is None else inside & ok
+                col = col + y * stride
+                stride *= self.shape[a]
+            value = self.apply(bm.astype(flag, ftype))
+            keep = inside & (value != 0)
+            rows.append(row[keep])
+            cols.append(col[keep])
+            vals.append(value[keep])
+
+        indices = bm.stack([bm.concat(rows), bm.concat(cols)], axis=0)
+        return COOTensor(indices, bm.concat(vals), (NN, NN)).coalesce()
+
+    def _ftype(self):
+        for _, coef in self.terms:
+            if bm.is_tensor(coef):
+                return coef.dtype
+        return self.mesh.ftype
+
+    def _pad(self, u: TensorLike, r: int) -> TensorLike:
+        """Pad the grid with `r` layers on each side, by the boundary condition."""
+        GD = self.GD
+        for a in range(GD):
+            axis = u.ndim - GD + a
+            n = u.shape[axis]
+            def take(start, stop):
+                return u[(slice(None), )*axis + (slice(start, stop), )]
+            lower, upper = [], []
+            for k in range(r, 0, -1):
+                if self.bc == 'neumann':
+                    lower.append(take(k, k+1))
+                    upper.insert(0, take(n-1-k, n-k))
+                elif self.bc == 'extrapolate':
+                    lower.append((k + 1) * take(0, 1) - k * take(1, 2))
+                    upper.insert(0, (k + 1) * take(n-1, n) - k * take(n-2, n-1))
+                else:
+                    lower.append(bm.zeros_like(take(0, 1)))
+                    upper.insert(0, bm.zeros_like(take(0, 1)))
+            u = bm.concat(lower + [u] + upper, axis=axis)
+        return u
+
+    def _set_boundary(self, out: TensorLike, u: TensorLike) -> TensorLike:
+        GD = self.GD
+        for a in range(GD):
+            axis = out.ndim - GD + a
+            for i in (0, -1):
+                index = (slice(None), )*axis + (i, )
+                out = bm.set_at(out, index, u[index])
+        return out
+
+    ### Arithmetic
+    def _combine(self, other: 'StencilOperator', alpha: float) -> 'StencilOperator':
+        if not isinstance(other, StencilOperator):
+            return NotImplemented
+        if (other.mesh is not self.mesh) or (other.bc != self.bc):
+            raise ValueError("Only operators on the same mesh with the same "
+                             "boundary condition can be combined.")
+        terms = self.terms + [(o, alpha * c) for o, c in other.terms]
+        return StencilOperator(self.mesh, terms, self.bc)
+
+    def __add__(self, other: 'StencilOperator') -> 'StencilOperator':
+        return self._combine(other, 1.0)
+
+    def __sub__(self, other: 'StencilOperator') -> 'StencilOperator':
+        return self._combine(other, -1.0)
+
+    def __mul__(self, alpha: float) -> 'StencilOperator':
+        if bm.is_tensor(alpha) or isinstance(alpha, (int, float)):
+            return StencilOperator(self.mesh, [(o, alpha * c) for o, c in self.terms], self.bc)
+        return NotImplemented
+
+    __rmul__ = __mul__
+
+    def __neg__(self) -> 'StencilOperator':
+        return self * (-1.0)
+
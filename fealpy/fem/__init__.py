@@ -1,48 +1,64 @@
 """The FEM Module"""
+from .._lazy import attach
 
-### Forms and bases
-from .integrator import *
-from .bilinear_form import BilinearForm
-from .linear_form import LinearForm
-from .nonlinear_form import NonlinearForm
-from .block_form import BlockForm
-from .linear_block_form import LinearBlockForm
-
-### Cell Operator
-from .scalar_diffusion_integrator import ScalarDiffusionIntegrator
-from .scalar_nonlinear_diffusion_integrator import ScalarNonlinearDiffusionIntegrator
-from .scalar_mass_integrator import ScalarMassIntegrator
-from .scalar_nonlinear_mass_integrator import ScalarNonlinearMassIntegrator
-from .scalar_convection_integrator import ScalarConvectionIntegrator
-from .linear_elastic_integrator import LinearElasticIntegrator
-from .press_work_integrator import PressWorkIntegrator, PressWorkIntegratorX, PressWorkIntegratorY
-from .vector_mass_integrator import VectorMassIntegrator
-from .curlcurl_integrator import CurlCurlIntegrator
-from .nonlinear_elastic_integrator import NonlinearElasticIntegrator
-from .div_integrator import DivIntegrator
-
-
-### Cell Source
-from .cell_source_integrator import CellSourceIntegrator
-SourceIntegrator = CellSourceIntegrator
-
-from .scalar_source_integrator import ScalarSourceIntegrator
-from .vector_source_integrator import VectorSourceIntegrator
-
-### Face Operator
-from .scalar_robin_bc_integrator import ScalarRobinBCIntegrator
-from .face_mass_integrator import BoundaryFaceMassIntegrator, InterFaceMassIntegrator
-
-### Face Source
-from .scalar_neumann_bc_integrator import ScalarNeumannBCIntegrator, ScalarRobinSourceIntegrator
-from .face_source_integrator import BoundaryFaceSourceIntegrator, InterFaceSourceIntegrator
-
-### Dirichlet BC
-from .dirichlet_bc import DirichletBC
-from .dirichlet_bc_operator import DirichletBCOperator
-
-### recovery estimate
-from .recovery_alg import RecoveryAlg
-
-### Other
-from .nonlinear_wrapper import NonlinearWrapperInt
+# NOTE: The forms and integrators are imported on first access.
+__getattr__, __dir__, __all__ = attach(__name__, {
+    ### Forms and bases
+    'Integrator': '.integrator',
+    'NonlinearInt': '.integrator',
+    'LinearInt': '.integrator',
+    'OpInt': '.integrator',
+    'SrcInt': '.integrator',
+    'CellInt': '.integrator',
+    'FaceInt': '.integrator',
+    'ConstIntegrator': '.integrator',
+    'GroupIntegrator': '.integrator',
+    'BilinearForm': '.bilinear_form',
+    'LinearForm': '.linear_form',
+    'NonlinearForm': '.nonlinear_form',
+    'BlockForm': '.block_form',
+    'LinearBlockForm': '.linear_block_form',
+    'MatrixFreeOperator': '.matrix_free_operator',
+
+    ### Cell Operator
+    'ScalarDiffusionIntegrator': '.scalar_diffusion_integrator',
+    'ScalarNonlinearDiffusionIntegrator': '.scalar_nonlinear_diffusion_integrator',
+    'ScalarMassIntegrator': '.scalar_mass_integrator',
+    'ScalarNonlinearMassIntegrator': '.scalar_nonlinear_mass_integrator',
+    'ScalarConvectionIntegrator': '.scalar_convection_integrator',
+    'LinearElasticIntegrator': '.linear_elastic_integrator',
+    'PressWorkIntegrator': '.press_work_integrator',
+    'PressWorkIntegratorX': '.press_work_integrator',
+    'PressWorkIntegratorY': '.press_work_integrator',
+    'VectorMassIntegrator': '.vector_mass_integrator',
+    'CurlCurlIntegrator': '.curlcurl_integrator',
+    'NonlinearElasticIntegrator': '.nonlinear_elastic_integrator',
+    'DivIntegrator': '.div_integrator',
+
+    ### Cell Source
+    'CellSourceIntegrator': '.cell_source_integrator',
+    'SourceIntegrator': '.cell_source_integrator:CellSourceIntegrator',
+    'ScalarSourceIntegrator': '.scalar_source_integrator',
+    'VectorSourceIntegrator': '.vector_source_integrator',
+
+    ### Face Operator
+    'ScalarRobinBCIntegrator': '.scalar_robin_bc_integrator',
+    'BoundaryFaceMassIntegrator': '.face_mass_integrator',
+    'InterFaceMassIntegrator': '.face_mass_integrator',
+
+    ### Face Source
+    'ScalarNeumannBCIntegrator': '.scalar_neumann_bc_integrator',
+    'ScalarRobinSourceIntegrator': '.scalar_neumann_bc_integrator',
+    'BoundaryFaceSourceIntegrator': '.face_source_integrator',
+    'InterFaceSourceIntegrator': '.face_source_integrator',
+
+    ### Dirichlet BC
+    'DirichletBC': '.dirichlet_bc',
+    'DirichletBCOperator': '.dirichlet_bc_operator',
+
+    ### recovery estimate
+    'RecoveryAlg': '.recovery_alg',
+
+    ### Other
+    'NonlinearWrapperInt': '.nonlinear_wrapper',
+})
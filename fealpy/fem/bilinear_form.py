@@ -7,10 +7,14 @@ from ..backend import backend_manager as bm
 from ..sparse import COOTensor, CSRTensor
 from .form import Form
 from .integrator import LinearInt
+from .matrix_free_operator import MatrixFreeOperator
 
 
 class BilinearForm(Form[LinearInt]):
     _M = None
+    _local_rank = 2
+    _keep_pattern = False
+    _pattern = None
 
     def _get_sparse_shape(self):
         spaces = self._spaces
@@ -43,36 +47,191 @@ class BilinearForm(Form[LinearInt]):
                 raise ValueError("Spaces should have the same dtype, "
                                 f"but got {s0.ftype} and {s1.ftype}.")
 
+    ### START: Sparsity Pattern Cache ###
+    def keep_pattern(self, status_on=True, /):
+        """Set whether to keep the sparsity pattern of the global matrix.
+
+        When enabled, the first assembly computes the CSR pattern and the map
+        from the entries of local tensors to the non-zeros (symbolic phase).
+        Later assemblies only recompute the local tensors and scatter them into
+        the values of the cached pattern (numeric phase), without any sorting.
+        This is useful when only the coefficients change in an iteration.
+        """
+        self._keep_pattern = status_on
+        if not status_on:
+            self._pattern = None
+        return self
+
+    def clear_pattern(self) -> None:
+        """Clear the cached sparsity pattern."""
+        self._pattern = None
+
+    def _add_integrator_impl(self, I, group=None, chunk_size=0):
+        self._pattern = None
+        return super()._add_integrator_impl(I, group, chunk_size)
+
+    def _pattern_key(self):
+        """Everything the cached pattern depends on besides the local values:
+        the spaces with their dof orderings and meshes, and the layout of each
+        group, i.e. the integrator, its region, chunk size and the shapes of
+        its entity-to-dof maps. Regions are compared by identity, do not
+        modify them in place."""
+        spaces = tuple((id(s), s.number_of_global_dofs(), _dof_ordering_version(s),
+                        getattr(getattr(s, 'mesh', None), 'version', 0))
+                       for s in self._spaces)
+        groups = []
+        for group, etg in zip(self.integrators, self.local_layout()):
+            integrator = self.integrators[group]
+            region = integrator._region
+            if bm.is_tensor(region):
+                region = (id(region), tuple(region.shape))
+            groups.append((group, id(integrator), region, self.chunk_sizes[group],
+                           tuple(tuple(e.shape) for e in etg)))
+        return spaces + (tuple(groups), getattr(self, '_transposed', False))
+
+    def _pattern_refs(self):
+        # NOTE: Keep the regions alive with the pattern, so that their ids in
+        # the key are not reused by other tensors.
+        return tuple(integrator._region for integrator in self.integrators.values())
+
+    def _symbolic_assembly(self):
+        """Build the CSR pattern and the local-to-nnz scatter map,
+        then return the values assembled with them."""
+        self.check_space()
+        vgdof, ugdof = self._get_sparse_shape()
+        transposed = getattr(self, '_transposed', False)
+        nrow, ncol = (ugdof, vgdof) if transposed else (vgdof, ugdof)
+        flat_list = []
+        sizes = []
+        tensors = []
+
+        for group_tensor, e2dofs_tuple in self.assembly_local_iterative():
+            ue2dof = e2dofs_tuple[0]
+            ve2dof = e2dofs_tuple[1] if (len(e2dofs_tuple) > 1) else ue2dof
+            local_shape = group_tensor.shape[-3:] # (NC, vldof, uldof)
+            I = bm.broadcast_to(ve2dof[:, :, None], local_shape).reshape(-1)
+            J = bm.broadcast_to(ue2dof[:, None, :], local_shape).reshape(-1)
+            if transposed:
+                I, J = J, I
+            flat_list.append(bm.astype(I, bm.int64) * ncol + J)
+            sizes.append(I.shape[0])
+            tensors.append(group_tensor)
+
+        flat = bm.concat(flat_list, axis=0)
+        keys, inverse = bm.unique(flat, return_inverse=True)
+        itype = self._spaces[0].itype
+        row = bm.astype(keys // ncol, itype)
+        col = bm.astype(keys % ncol, itype)
+        kwargs = bm.context(row)
+        crow = bm.searchsorted(row, bm.arange(nrow + 1, **kwargs))
+        inverse = inverse.reshape(-1)
+        scatters = []
+        start = 0
+
+        for size in sizes:
+            scatters.append(inverse[start:start+size])
+            start += size
+
+        self._pattern = (self._pattern_key(), crow, col, row, tuple(scatters),
+                         self._pattern_refs())
+
+        return self._numeric_assembly(tensors)
+
+    def _numeric_assembly(self, tensors=None):
+        """Scatter local tensors into the values of the cached pattern.
+        Returns None if the local tensors do not match the pattern."""
+        _, crow, col, _, scatters, _ = self._pattern
+        batch_size = self.batch_size
+        space = self._spaces[0]
+        nnz = col.shape[0]
+        value_shape = (nnz, ) if (batch_size == 0) else (batch_size, nnz)
+        values = bm.zeros(value_shape, dtype=space.ftype, device=bm.get_device(space))
+
+        if tensors is None:
+            tensors = (t for t, _ in self.assembly_local_iterative())
+
+        count = 0
+        for group_tensor in tensors:
+            if count >= len(scatters):
+                return None
+            scatter = scatters[count]
+            if (batch_size > 0) and (group_tensor.ndim == 3):
+                group_tensor = bm.stack([group_tensor]*batch_size, axis=0)
+            group_tensor = bm.reshape(group_tensor, self._values_ravel_shape)
+            if group_tensor.shape[-1] != scatter.shape[0]:
+                return None
+            values = bm.index_add(values, scatter, group_tensor, axis=-1)
+            count += 1
+
+        if count != len(scatters):
+            return None
+
+        return values
+
+    def _pattern_assembly(self, format: str):
+        values = None
+
+        if (self._pattern is not None) and (self._pattern[0] == self._pattern_key()):
+            logger.debug("(ASSEMBLY NUMERIC) Reuse the cached sparsity pattern.")
+            values = self._numeric_assembly()
+
+        if values is None:
+            logger.debug("(ASSEMBLY SYMBOLIC) Build the sparsity pattern.")
+            values = self._symbolic_assembly()
+
+        _, crow, col, row, _, _ = self._pattern
+        vgdof, ugdof = self._get_sparse_shape()
+        spshape = (ugdof, vgdof) if getattr(self, '_transposed', False) else (vgdof, ugdof)
+
+        if format == 'csr':
+            return CSRTensor(crow, col, values, spshape)
+        elif format == 'coo':
+            indices = bm.stack([row, col], axis=0)
+            return COOTensor(indices, values, spshape, is_coalesced=True)
+        else:
+            raise ValueError(f"Unsupported format {format}.")
+    ### END: Sparsity Pattern Cache ###
+
     def _scalar_assembly(self):
         self.check_space()
         space = self._spaces
         batch_size = self.batch_size
         ugdof = space[0].number_of_global_dofs()
         vgdof = space[1].number_of_global_dofs() if (len(space) > 1) else ugdof
-        init_value_shape = (0,) if (batch_size == 0) else (batch_size, 0)
         sparse_shape = (vgdof, ugdof)
+        context = dict(dtype=space[0].ftype, device=bm.get_device(space[0]))
 
-        M = COOTensor(
-            indices = bm.empty((2, 0), dtype=space[0].itype, device=bm.get_device(space[0])),
-            values = bm.empty(init_value_shape, dtype=space[0].ftype, device=bm.get_device(space[0])),
-            spshape = sparse_shape
-        )
-        # for group in self.integrators.keys():
-            # group_tensor, e2dofs = self._assembly_group(group, retain_ints)
-        for group_tensor, e2dofs_tuple in self.assembly_local_iterative():
+        # NOTE: Indices are built from the entity-to-dof layout of groups, then
+        # local tensors are written into a preallocated values buffer chunk by
+        # chunk, instead of concatenating COO tensors one after another.
+        I_list = [bm.empty((0, ), dtype=space[0].itype, device=bm.get_device(space[0]))]
+        J_list = [I_list[0]]
+        for e2dofs_tuple in self.local_layout():
             ue2dof = e2dofs_tuple[0]
             ve2dof = e2dofs_tuple[1] if (len(e2dofs_tuple) > 1) else ue2dof
-            local_shape = group_tensor.shape[-3:] # (NC, vldof, uldof)
+            local_shape = (ue2dof.shape[0], ve2dof.shape[1], ue2dof.shape[1]) # (NC, vldof, uldof)
+            I_list.append(bm.broadcast_to(ve2dof[:, :, None], local_shape).reshape(-1))
+            J_list.append(bm.broadcast_to(ue2dof[:, None, :], local_shape).reshape(-1))
+
+        indices = bm.stack([bm.concat(I_list, axis=0), bm.concat(J_list, axis=0)], axis=0)
+        nnz = indices.shape[-1]
+        values = bm.zeros((nnz, ) if (batch_size == 0) else (batch_size, nnz), **context)
+        offset = 0
 
+        for group_tensor, _ in self.assembly_local_iterative():
             if (batch_size > 0) and (group_tensor.ndim == 3): # Case: no batch dimension
-                group_tensor = bm.stack([group_tensor]*batch_size, axis=0)
-            I = bm.broadcast_to(ve2dof[:, :, None], local_shape)
-            J = bm.broadcast_to(ue2dof[:, None, :], local_shape)
-            indices = bm.stack([I.ravel(), J.ravel()], axis=0)
-            group_tensor = bm.reshape(group_tensor, self._values_ravel_shape)
-            M = M.add(COOTensor(indices, group_tensor, sparse_shape))
+                group_tensor = group_tensor.reshape(-1) # broadcast over the batch
+            else:
+                group_tensor = bm.reshape(group_tensor, self._values_ravel_shape)
+            size = group_tensor.shape[-1]
+            values = bm.set_at(values, (..., slice(offset, offset + size)), group_tensor)
+            offset += size
 
-        return M
+        if offset != nnz:
+            raise RuntimeError(f"Local tensors sized {offset} in total do not match "
+                               f"the entity-to-dof layout of integrators ({nnz}).")
+
+        return COOTensor(indices, values, sparse_shape)
 
     @overload
     def assembly(self) -> CSRTensor: ...
@@ -89,7 +248,16 @@ class BilinearForm(Form[LinearInt]):
 
         Returns:
             global_matrix (CSRTensor | COOTensor): Global sparse matrix shaped ([batch, ]gdof, gdof).
+
+        Note:
+            Use `BilinearForm.keep_pattern(True)` to reuse the sparsity pattern
+            in the following assemblies. See `BilinearForm.keep_pattern` for details.
         """
+        if self._keep_pattern:
+            self._M = self._pattern_assembly(format)
+            logger.info(f"Bilinear form matrix constructed, with shape {list(self._M.shape)}.")
+            return self._M
+
         M = self._scalar_assembly()
         if getattr(self, '_transposed', False):
             M = M.T
@@ -127,35 +295,11 @@ class BilinearForm(Form[LinearInt]):
         if self._M is not None:
             return self._M @ u
 
-        nrow = self.shape[-2]
-        kwargs = bm.context(u)
-
-        if self.batch_size > 0:
-            shape = (self.batch_size, nrow)
-            out_subs = 'bci'
-            gv_reshape = (self.batch_size, -1)
-        else:
-            if u.ndim >= 2:
-                shape = (u.shape[0], nrow)
-                out_subs = 'bci'
-                gv_reshape = (u.shape[0], -1)
-            else:
-                shape = (nrow,)
-                out_subs = 'ci'
-                gv_reshape = (-1,)
-
-        v = bm.zeros(shape, **kwargs)
-        gt_subs = 'bcij' if (self.batch_size > 0) else 'cij'
-        gu_subs = 'bcj' if (u.ndim >= 2) else 'cj'
-
-        for group in self.integrators.keys():
-            group_tensor, e2dofs = self._assembly_group(group, True)
-            ue2dof = e2dofs[0]
-            ve2dof = e2dofs[1] if (len(e2dofs) > 1) else ue2dof
-            gu = u[..., ue2dof] # (..., NC, uldof)
-            gv = bm.einsum(f'{gt_subs}, {gu_subs} -> {out_subs}', group_tensor, gu)
-            v = bm.index_add(v, ve2dof.reshape(-1), gv.reshape(gv_reshape))
-
-        return v
+        # NOTE: Local tensors are recomputed in every product here.
+        # Use MatrixFreeOperator to cache them in iterative solvers.
+        return MatrixFreeOperator(self, max_memory=0) @ u
 
 
+def _dof_ordering_version(space) -> int:
+    space = getattr(space, 'scalar_space', space)
+    return getattr(getattr(space, 'dof', None), 'ordering_version', 0)
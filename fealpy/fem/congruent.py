@@ -0,0 +1,88 @@
+"""Local matrices on meshes whose cells are translates of one another.
+
+On such meshes (uniform meshes, and tensor meshes from `from_box`), the
+local matrix of an integrator with a cellwise constant coefficient is one
+reference matrix scaled on each cell, so it is computed on a single cell.
+"""
+from typing import Optional, Tuple
+
+from ..backend import backend_manager as bm
+from ..typing import TensorLike, CoefLike
+from ..utils import is_scalar
+
+
+def is_congruent_space(space) -> bool:
+    """Whether local matrices of the space are the same on congruent cells,
+    which holds for Lagrange spaces on meshes with congruent cells."""
+    from ..functionspace.lagrange_fe_space import LagrangeFESpace
+    mesh = getattr(space, 'mesh', None)
+    if not isinstance(space, LagrangeFESpace):
+        return False
+    is_congruent = getattr(mesh, 'is_congruent', None)
+    return (is_congruent is not None) and is_congruent()
+
+
+def cellwise_coef(coef: Optional[CoefLike], NC: int,
+                  batched: bool=False) -> Tuple[bool, Optional[TensorLike]]:
+    """Check whether a coefficient is constant on each cell.
+
+    Parameters:
+        coef (CoefLike | None): The coefficient of an integrator.
+        NC (int): Number of cells of the integrator.
+        batched (bool, optional): Whether the coefficient is batched. Defaults to False.
+
+    Returns:
+        Tuple[bool, float | Tensor | None]: Whether it is cellwise constant, and
+            the value as None, a scalar or a tensor shaped (NC, ).
+    """
+    if coef is None:
+        return True, None
+    if batched or callable(coef):
+        return False, None
+    if is_scalar(coef):
+        return True, coef
+    if coef.shape == (NC, ):
+        return True, coef
+    return False, None
+
+
+def congruent_local(K0: TensorLike, scale: Optional[CoefLike], measure: TensorLike) -> TensorLike:
+    """Local matrices from the matrix of a cell of unit measure.
+
+    Parameters:
+        K0 (Tensor): The local matrix divided by the cell measure, shaped (I, J, ...).
+        scale (float | Tensor | None): The cellwise coefficient.
+        measure (Tensor): Measure of the cells, shaped (NC, ).
+
+    Returns:
+        Tensor: Local matrices shaped (NC, I, J, ...).
+    """
+    scale = measure if scale is None else measure * scale
+    return bm.einsum('c, ... -> c...', scale, K0)
+
+
+def congruent_factor(local: TensorLike, rtol: float=1e-12):
+    """Write local matrices as one matrix scaled on each cell, if possible.
+
+    Parameters:
+        local (Tensor): Local matrices shaped (NC, I, J).
+        rtol (float, optional): Relative tolerance. Defaults to 1e-12.
+
+    Returns:
+        Tuple[Tensor, Tensor] | None: The matrix shaped (I, J) and the factors
+            shaped (NC, ), or None if the local matrices are not proportional.
+    """
+    if local.ndim != 3 or local.shape[0] == 0:
+        return None
+    NC, I, J = local.shape
+    flat = local.reshape(NC, -1)
+    k = int(bm.argmax(bm.abs(flat[0])))
+    pivot = flat[0, k]
+    if pivot == 0:
+        return None
+    K0 = local[0] / pivot
+    scale = flat[:, k]
+    error = bm.max(bm.abs(local - scale[:, None, None] * K0[None]))
+    if error > rtol * bm.max(bm.abs(flat)):
+        return None
+    return K0, scale
@@ -1,14 +1,22 @@
 
-from typing import Sequence, overload, Iterable, Dict, Tuple, Optional, Union, TypeVar, Generic
+from typing import Sequence, overload, Iterable, Iterator, Dict, Tuple, Optional, Union, TypeVar, Generic, Callable
+from collections import deque
+from concurrent.futures import ThreadPoolExecutor
+import copy
+from functools import partial
 
 from ..typing import TensorLike, Size, Index
 from ..backend import backend_manager as bm
 from ..functionspace import FunctionSpace as _FS
-from .integrator import Integrator, GroupIntegrator
+from ..utils.utils import size_unit
+from .integrator import Integrator, GroupIntegrator, FaceInt, EdgeInt
 
 from .. import logger
 from abc import ABC
 
+# NOTE: Backends with kernels that can run in concurrent threads. PyTorch is
+# excluded as its function transforms (e.g. jacfwd) keep global states.
+_THREAD_SAFE_BACKENDS = {'numpy'}
 _I = TypeVar('_I', bound=Integrator)
 Self = TypeVar('Self')
 
@@ -19,6 +27,9 @@ class Form(Generic[_I], ABC):
     chunk_sizes: Dict[str, int]
     batch_size: int
     sparse_shape: Tuple[int, ...]
+    max_workers: int = 0
+    max_memory: Optional[float] = None
+    _local_rank: int = 1
 
     @overload
     def __init__(self, space: _FS, /, *, batch_size: int=0): ...
@@ -43,6 +54,9 @@ class Form(Generic[_I], ABC):
     def copy(self):
         new_obj = self.__class__(self._spaces, batch_size=self.batch_size)
         new_obj.integrators.update(self.integrators)
+        new_obj.chunk_sizes.update(self.chunk_sizes)
+        new_obj.max_workers = self.max_workers
+        new_obj.max_memory = self.max_memory
         new_obj._values_ravel_shape = self._values_ravel_shape
         new_obj.sparse_shape = tuple(reversed(self.sparse_shape))
         return new_obj
@@ -125,6 +139,56 @@ class Form(Generic[_I], ABC):
 
         return self
 
+    def set_workers(self, max_workers: int=0, /):
+        """Set the number of threads computing local tensors of chunks concurrently.
+
+        Chunks are given by the `chunk_size` in `add_integrator`. Local tensors
+        are yielded in order, with at most `2*max_workers` chunks in flight,
+        so the peak memory is bounded by the chunk size. This helps for
+        backends releasing the GIL in their kernels, e.g. einsum and BLAS in NumPy.
+        Use 0 (default) to compute chunks one after another. Backends that are
+        not thread-safe, e.g. PyTorch, always compute chunks one after another.
+        """
+        self.max_workers = max_workers
+        return self
+
+    def set_memory_budget(self, max_memory: Optional[float]=None, /):
+        """Set the memory budget of local tensors in Mb.
+
+        Groups added with `chunk_size=0` are split into chunks automatically,
+        such that the chunks in flight fit in the budget. The footprint of each
+        entity is estimated from the number of local dofs, the number of
+        quadrature points, `ftype` and the batch size, see `estimate_entity_memory`.
+        Use None (default) for no budget.
+        """
+        self.max_memory = max_memory
+        return self
+
+    def estimate_entity_memory(self, group: str, /) -> float:
+        """Estimate the memory in Mb to compute the local tensor of one entity
+        in the group, including the basis values on quadrature points."""
+        return _estimate_entity_memory(self.integrators[group], self.space,
+                                       self._local_rank, self.batch_size)
+
+    def _auto_chunk_size(self, group: str, /) -> int:
+        if self.max_memory is None:
+            return 0
+
+        integrator = self.integrators[group]
+        etg = integrator.to_global_dof(self.space)
+        size = (etg[0] if isinstance(etg, (tuple, list)) else etg).shape[0]
+        nflight = 1
+        if (self.max_workers > 0) and (bm.backend_name in _THREAD_SAFE_BACKENDS):
+            nflight = 2 * self.max_workers
+        entity_memory = self.estimate_entity_memory(group)
+        chunk_size = max(int(self.max_memory / nflight / entity_memory), 1)
+
+        if chunk_size >= size:
+            return 0
+        logger.info(f"Group {group} split into chunks of {chunk_size} entities, "
+                    f"estimated {entity_memory * chunk_size:.2f} Mb each.")
+        return chunk_size
+
     def _assembly_group(self, group: str, /, *args, **kwds):
         integrator = self.integrators[group]
         etg = integrator.to_global_dof(self.space)
@@ -132,17 +196,46 @@ class Form(Generic[_I], ABC):
             etg = (etg, )
         return integrator(self.space), etg
 
+    def _group_kernels(self, group: str, /) -> Iterator[Callable[[], Tuple[TensorLike, Tuple[TensorLike, ...]]]]:
+        integrator = self.integrators[group]
+        chunk_size = self.chunk_sizes[group] or self._auto_chunk_size(group)
+
+        if chunk_size == 0:
+            logger.debug(f"(ASSEMBLY LOCAL FULL) {group}")
+            yield lambda: self._assembly_group(group)
+        else:
+            logger.debug(f"(ASSEMBLY LOCAL ITER) {group}, {chunk_size} chunks")
+            yield from IntegralIter.split(integrator, chunk_size, self.space).kernels(self.space)
+
     def assembly_local_iterative(self):
         """Assembly local matrix considering chunk size.
         Yields local matrix and to_global_dof tuple."""
-        for key, int_ in self.integrators.items():
-            chunk_size = self.chunk_sizes[key]
-            if chunk_size == 0:
-                logger.debug(f"(ASSEMBLY LOCAL FULL) {key}")
-                yield self._assembly_group(key)
-            else:
-                logger.debug(f"(ASSEMBLY LOCAL ITER) {key}, {chunk_size} chunks")
-                yield from IntegralIter.split(int_, chunk_size)(self.space)
+        kernels = (k for key in self.integrators for k in self._group_kernels(key))
+
+        if (self.max_workers <= 0) or (bm.backend_name not in _THREAD_SAFE_BACKENDS):
+            for kernel in kernels:
+                yield kernel()
+            return
+
+        # NOTE: The current backend is thread-local, so workers are set to the
+        # backend of the calling thread.
+        with ThreadPoolExecutor(max_workers=self.max_workers,
+                                initializer=bm.set_backend,
+                                initargs=(bm.backend_name, )) as executor:
+            futures = deque()
+            for kernel in kernels:
+                futures.append(executor.submit(kernel))
+                if len(futures) >= 2 * self.max_workers:
+                    yield futures.popleft().result()
+            while futures:
+                yield futures.popleft().result()
+
+    def local_layout(self):
+        """Return the to_global_dof tuple of each group, in the order of
+        local tensors from `assembly_local_iterative`."""
+        for integrator in self.integrators.values():
+            etg = integrator.to_global_dof(self.space)
+            yield etg if isinstance(etg, (tuple, list)) else (etg, )
 
 
 # An iteration util for the `_assembly_group` method.
@@ -158,18 +251,23 @@ class IntegralIter():
         return self.integrator(space, indices=indices), etg
 
     def __call__(self, spaces: Tuple[_FS, ...]):
+        for kernel in self.kernels(spaces):
+            yield kernel()
+
+    def kernels(self, spaces: Tuple[_FS, ...]):
+        """Yield zero-argument callables computing the local tensor of each chunk."""
         if isinstance(self.indices_or_segments, TensorLike):
-            return self._call_impl_segments(spaces, self.indices_or_segments)
+            return self._kernels_segments(spaces, self.indices_or_segments)
         elif isinstance(self.indices_or_segments, Iterable):
-            return self._call_impl_indices(spaces, self.indices_or_segments)
+            return self._kernels_indices(spaces, self.indices_or_segments)
         else:
             raise TypeError(f"Unsupported indices or segments.")
 
-    def _call_impl_indices(self, spaces: Tuple[_FS, ...], /, indices: Iterable[TensorLike]):
+    def _kernels_indices(self, spaces: Tuple[_FS, ...], /, indices: Iterable[TensorLike]):
         for index in indices:
-            yield self.kernel(spaces, index)
+            yield partial(self.kernel, spaces, index)
 
-    def _call_impl_segments(self, spaces: Tuple[_FS, ...], /, segments: TensorLike):
+    def _kernels_segments(self, spaces: Tuple[_FS, ...], /, segments: TensorLike):
         assert segments.ndim == 1
         start = 0
         stop = 0
@@ -179,11 +277,111 @@ class IntegralIter():
             logger.debug(f"(ITERATION) {i}/{length}")
             stop = segments[i] if (i + 1 < length) else None
             slicing = slice(start, stop, 1)
-            yield self.kernel(spaces, slicing)
+            yield partial(self.kernel, spaces, slicing)
             start = stop
 
     @classmethod
-    def split(cls, integrator: Integrator, /, chunk_size=0):
+    def split(cls, integrator: Integrator, /, chunk_size=0, space=None):
+        if (integrator._region is None) and (space is not None):
+            return IndexChunkIter.split(integrator, chunk_size, space)
         size = integrator.get_region().shape[0]
         segments = bm.arange(chunk_size, size, chunk_size)
         return cls(integrator, segments)
+
+
+def _estimate_entity_memory(integrator: Integrator, space, rank: int, batch_size: int=0) -> float:
+    spaces = space if isinstance(space, tuple) else (space, )
+    etg = integrator.to_global_dof(space)
+    etg = etg if isinstance(etg, (tuple, list)) else (etg, )
+    ldofs = [int(e.shape[-1]) for e in etg]
+    if len(ldofs) < rank:
+        ldofs = ldofs * rank
+    nlocal = 1
+    for ldof in ldofs[:rank]:
+        nlocal *= ldof
+
+    ints = integrator.ints if isinstance(integrator, GroupIntegrator) else [integrator]
+    mesh = getattr(spaces[0], 'mesh', None)
+    nitem = 0
+
+    if mesh is not None:
+        GD = mesh.geo_dimension()
+        p = max(getattr(s, 'p', 1) for s in spaces)
+        for int_ in ints:
+            if isinstance(int_, FaceInt):
+                etype = 'face'
+            elif isinstance(int_, EdgeInt):
+                etype = 'edge'
+            else:
+                etype = 'cell'
+            q = getattr(int_, 'q', None)
+            q = p + 3 if q is None else q
+            NQ = mesh.quadrature_formula(q, etype).number_of_quadrature_points()
+            # basis (or gradients) of each space, and the coefficient
+            nitem = max(nitem, NQ * (sum(ldofs) * GD + GD * GD))
+
+    # NOTE: Local tensors of a group are accumulated one after another.
+    nitem += nlocal * (1 if len(ints) == 1 else 2)
+    bits = bm.finfo(spaces[0].ftype).bits
+    return size_unit(bits * nitem * max(batch_size, 1), 'mb')
+
+
+def _restrict(integrator: Integrator, index: Index) -> Integrator:
+    """Shallow copy of the integrator on a subset of entities, with its own cache."""
+    if isinstance(integrator, GroupIntegrator):
+        new = copy.copy(integrator)
+        new.ints = [_restrict(int_, index) for int_ in integrator.ints]
+    else:
+        new = copy.copy(integrator)
+        new.index = index
+    new._cache = {}
+    new._keep_data = False
+    return new
+
+
+def _base_index(integrator: Integrator):
+    if isinstance(integrator, GroupIntegrator):
+        indices = [_base_index(int_) for int_ in integrator.ints]
+        first = indices[0]
+        if any(idx is not first for idx in indices[1:]):
+            return None
+        return first
+    return getattr(integrator, 'index', None)
+
+
+class IndexChunkIter(IntegralIter):
+    """Split integrators by their `index` attribute of entities, for integrators
+    without a region of integration. Each chunk is computed by a shallow copy
+    of the integrator on a part of the entities."""
+    def kernel(self, space: Union[_FS, Tuple[_FS, ...]], /, indices: Index):
+        if indices is None:
+            integrator = self.integrator
+        else:
+            integrator = _restrict(self.integrator, indices)
+        etg = integrator.to_global_dof(space)
+        if not isinstance(etg, (tuple, list)):
+            etg = (etg, )
+        return integrator(space), etg
+
+    @classmethod
+    def split(cls, integrator: Integrator, /, chunk_size=0, space=None):
+        index = _base_index(integrator)
+        etg = integrator.to_global_dof(space)
+        size = (etg[0] if isinstance(etg, (tuple, list)) else etg).shape[0]
+
+        # NOTE: Chunks are given as index tensors, as some meshes do not
+        # accept slices other than the full one, e.g. `len(index)`.
+        if isinstance(index, slice) and (index.step in (None, 1)):
+            start = 0 if index.start is None else index.start
+            if start >= 0 and (index.stop is None or index.stop >= 0):
+                e2dof = etg[0] if isinstance(etg, (tuple, list)) else etg
+                index = bm.arange(start, start + size, **bm.context(e2dof))
+
+        if isinstance(index, TensorLike):
+            if index.dtype == bm.bool:
+                index = bm.nonzero(index)[0]
+            return cls(integrator, [index[i:i+chunk_size] for i in range(0, size, chunk_size)])
+
+        logger.warning(f"{integrator.__class__.__name__} can not be split into chunks, "
+                       "assembled as a whole.")
+        return cls(integrator, [None])
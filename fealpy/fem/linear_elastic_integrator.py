@@ -6,6 +6,7 @@ from ..typing import TensorLike, Index, _S
 from ..mesh import HomogeneousMesh, SimplexMesh
 from ..functionspace.space import FunctionSpace as _FS
 from ..functionspace.tensor_space import TensorFunctionSpace as _TS
+from .congruent import is_congruent_space
 from .integrator import (
     LinearInt, OpInt, CellInt,
     enable_cache,
@@ -57,6 +58,26 @@ class LinearElasticIntegrator(LinearInt, OpInt, CellInt):
 
         return cm, bcs, ws, gphi, detJ
     
+    @enable_cache
+    def fetch_congruent(self, space: _FS):
+        """The data of `fetch_assembly` on the first cell only, for meshes
+        with congruent cells."""
+        index = slice(0, 1)
+        mesh = getattr(space, 'mesh', None)
+        cm = mesh.entity_measure('cell', index=index)
+        q = space.p+3 if self.q is None else self.q
+        qf = mesh.quadrature_formula(q)
+        bcs, ws = qf.get_quadrature_points_and_weights()
+        gphi = space.grad_basis(bcs, index=index, variable='x')
+
+        if isinstance(mesh, SimplexMesh):
+            detJ = None
+        else:
+            J = mesh.jacobi_matrix(bcs, index=index)
+            detJ = bm.linalg.det(J)
+
+        return cm, bcs, ws, gphi, detJ
+
     @enable_cache
     def fetch_fast_assembly(self, space: _FS):
         index = self.index
@@ -106,7 +127,11 @@ class LinearElasticIntegrator(LinearInt, OpInt, CellInt):
     def assembly(self, space: _TS) -> TensorLike:
         scalar_space = space.scalar_space
         mesh = getattr(scalar_space, 'mesh', None)
-        cm, bcs, ws, gphi, detJ = self.fetch_assembly(scalar_space)
+        if is_congruent_space(scalar_space):
+            # 全等单元：只在第一个单元上积分，A_xx 等广播到所有单元
+            cm, bcs, ws, gphi, detJ = self.fetch_congruent(scalar_space)
+        else:
+            cm, bcs, ws, gphi, detJ = self.fetch_assembly(scalar_space)
 
         if isinstance(mesh, SimplexMesh):
             # 单纯形网格：直接在实际单元上积分
@@ -115,8 +140,6 @@ class LinearElasticIntegrator(LinearInt, OpInt, CellInt):
             A_xy = bm.einsum('q, cqi, cqj, c -> cij', ws, gphi[..., 0], gphi[..., 1], cm)
         else:
             # 非单纯形网格：在参考单元上积分
-            J = mesh.jacobi_matrix(bcs)
-            detJ = bm.linalg.det(J)
             A_xx = bm.einsum('q, cqi, cqj, cq -> cij', ws, gphi[..., 0], gphi[..., 0], detJ)
             A_yy = bm.einsum('q, cqi, cqj, cq -> cij', ws, gphi[..., 1], gphi[..., 1], detJ)
             A_xy = bm.einsum('q, cqi, cqj, cq -> cij', ws, gphi[..., 0], gphi[..., 1], detJ)
@@ -38,24 +38,33 @@ class LinearForm(Form[LinearInt]):
         space = self._spaces[0]
         batch_size = self.batch_size
         gdof = space.number_of_global_dofs()
-        init_value_shape = (0,) if (batch_size == 0) else (batch_size, 0)
         sparse_shape = (gdof, )
+        context = dict(dtype=space.ftype, device=bm.get_device(space))
 
-        M = COOTensor(
-            indices = bm.empty((1, 0), dtype=space.itype, device=bm.get_device(space)),
-            values = bm.empty(init_value_shape, dtype=space.ftype, device=bm.get_device(space)),
-            spshape = sparse_shape
-        )
+        # NOTE: See BilinearForm._scalar_assembly.
+        index_list = [bm.empty((0, ), dtype=space.itype, device=bm.get_device(space))]
+        for e2dofs_tuple in self.local_layout():
+            index_list.append(e2dofs_tuple[0].reshape(-1))
 
-        for group_tensor, e2dofs_tuple in self.assembly_local_iterative():
-            if (batch_size > 0) and (group_tensor.ndim == 2):
-                group_tensor = bm.stack([group_tensor]*batch_size, axis=0)
-
-            indices = e2dofs_tuple[0].reshape(1, -1)
-            group_tensor = bm.reshape(group_tensor, self._values_ravel_shape)
-            M = M.add(COOTensor(indices, group_tensor, sparse_shape))
+        indices = bm.concat(index_list, axis=0).reshape(1, -1)
+        nnz = indices.shape[-1]
+        values = bm.zeros((nnz, ) if (batch_size == 0) else (batch_size, nnz), **context)
+        offset = 0
 
-        return M
+        for group_tensor, _ in self.assembly_local_iterative():
+            if (batch_size > 0) and (group_tensor.ndim == 2):
+                group_tensor = group_tensor.reshape(-1) # broadcast over the batch
+            else:
+                group_tensor = bm.reshape(group_tensor, self._values_ravel_shape)
+            size = group_tensor.shape[-1]
+            values = bm.set_at(values, (..., slice(offset, offset + size)), group_tensor)
+            offset += size
+
+        if offset != nnz:
+            raise RuntimeError(f"Local tensors sized {offset} in total do not match "
+                               f"the entity-to-dof layout of integrators ({nnz}).")
+
+        return COOTensor(indices, values, sparse_shape)
 
     @overload
     def assembly(self) -> TensorLike: ...
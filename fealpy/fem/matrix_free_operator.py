@@ -0,0 +1,196 @@
+from typing import Optional, Iterable, Tuple, List
+
+from .. import logger
+from ..typing import TensorLike, Size
+from ..backend import backend_manager as bm
+from ..utils import ftype_memory_size
+from .form import Form
+from .congruent import congruent_factor
+
+_LocalData = Tuple[TensorLike, TensorLike, TensorLike]
+
+
+def local_matvec(local_data: Iterable[_LocalData], u: TensorLike, shape: Size,
+                 batch_size: int = 0) -> TensorLike:
+    """Multiply a vector by the matrix given in local tensors,
+    through gather -> batched einsum -> scatter-add.
+
+    Parameters:
+        local_data (Iterable[Tuple[Tensor, Tensor, Tensor]]): Local tensors shaped
+            ([batch, ]NC, vldof, uldof), with the entity-to-dof relationship
+            of the trial (`u`) and test (`v`) spaces. An optional fourth item
+            of factors shaped (NC, ) means that the local tensor is one matrix
+            shaped (vldof, uldof) scaled on each entity.
+        u (Tensor): The input vector, accepts batch on the first dimension.
+        shape (Size): The shape of the operator, the last two are (vgdof, ugdof).
+        batch_size (int, optional): The batch size of local tensors. Defaults to 0.
+
+    Returns:
+        Tensor: The output vector.
+    """
+    nrow = shape[-2]
+    kwargs = bm.context(u)
+
+    if batch_size > 0:
+        out_shape = (batch_size, nrow)
+        out_subs = 'bci'
+        gv_reshape = (batch_size, -1)
+    else:
+        if u.ndim >= 2:
+            out_shape = (u.shape[0], nrow)
+            out_subs = 'bci'
+            gv_reshape = (u.shape[0], -1)
+        else:
+            out_shape = (nrow,)
+            out_subs = 'ci'
+            gv_reshape = (-1,)
+
+    v = bm.zeros(out_shape, **kwargs)
+    gu_subs = 'bcj' if (u.ndim >= 2) else 'cj'
+
+    for group_tensor, ue2dof, ve2dof, *scale in local_data:
+        gu = u[..., ue2dof] # (..., NC, uldof)
+        if len(scale) > 0:
+            # NOTE: Congruent entities share one local matrix, which is applied
+            # to all of them at once like a stencil.
+            gu = gu * scale[0][:, None]
+            gv = bm.einsum(f'ij, {gu_subs} -> {out_subs}', group_tensor, gu)
+        else:
+            gt_subs = 'bcij' if (group_tensor.ndim == 4) else 'cij'
+            gv = bm.einsum(f'{gt_subs}, {gu_subs} -> {out_subs}', group_tensor, gu)
+        v = bm.index_add(v, ve2dof.reshape(-1), gv.reshape(gv_reshape), axis=-1)
+
+    return v
+
+
+def _same_layout(data0: _LocalData, data1: _LocalData) -> bool:
+    for a, b in zip(data0, data1):
+        if a.shape != b.shape:
+            return False
+    for a, b in zip(data0[1:], data1[1:]):
+        if (a is not b) and (not bm.all(a == b)):
+            return False
+    return True
+
+
+class MatrixFreeOperator():
+    """Matrix-free operator of a bilinear form.
+
+    The local tensors of the form are computed once and cached, then applied
+    to vectors by gather -> batched einsum -> scatter-add, without assembling
+    the global sparse matrix. When the local tensors need more memory than
+    `max_memory`, they are recomputed on the fly in each product instead.
+
+    Local tensors that are one matrix scaled on each entity, as on meshes with
+    congruent cells, are cached as the matrix and the factors only.
+
+    This operator supports `@` and can be passed to `fealpy.solver.cg`.
+
+    Parameters:
+        form (Form): The bilinear form.
+        max_memory (float | None, optional): Memory cap of the cached local tensors
+            in Mb. Use 0 to never cache. Defaults to None (no limit).
+
+    Example:
+    ```
+        bform = BilinearForm(space)
+        bform.add_integrator(ScalarDiffusionIntegrator())
+        A = MatrixFreeOperator(bform, max_memory=1024)
+        x = cg(A, b)
+    ```
+    """
+    def __init__(self, form: Form, *, max_memory: Optional[float]=None):
+        self.form = form
+        self.max_memory = max_memory
+        self._local_data: Optional[List[_LocalData]] = None
+        self.update()
+
+    @property
+    def shape(self) -> Size:
+        return self.form.shape
+
+    @property
+    def cached(self) -> bool:
+        """Whether the local tensors are cached."""
+        return self._local_data is not None
+
+    def _local_iterative(self):
+        for group_tensor, e2dofs in self.form.assembly_local_iterative():
+            ue2dof = e2dofs[0]
+            ve2dof = e2dofs[1] if (len(e2dofs) > 1) else ue2dof
+            yield group_tensor, ue2dof, ve2dof
+
+    def update(self):
+        """Recompute the cached local tensors, for example, after the
+        coefficients of integrators are changed."""
+        self._local_data = None
+        max_memory = self.max_memory
+
+        if (max_memory is not None) and (max_memory <= 0):
+            return self
+
+        local_data = []
+        total = 0.
+
+        for data in self._local_iterative():
+            # NOTE: Groups on the same entities are merged to save
+            # memory and the einsum in each product.
+            if (len(local_data) > 0) and _same_layout(local_data[-1], data):
+                group_tensor, ue2dof, ve2dof = local_data[-1]
+                local_data[-1] = (group_tensor + data[0], ue2dof, ve2dof)
+                continue
+
+            if len(local_data) > 0:
+                local_data[-1] = self._compress(local_data[-1])
+            total += ftype_memory_size(data[0])
+            if (max_memory is not None) and (total > max_memory):
+                logger.info(f"Local tensors exceed the memory cap ({max_memory} Mb) "
+                            "of the matrix-free operator, they will be computed "
+                            "on the fly.")
+                return self
+            local_data.append(data)
+
+        if len(local_data) > 0:
+            local_data[-1] = self._compress(local_data[-1])
+        self._local_data = local_data
+        total = sum(ftype_memory_size(data[0]) for data in local_data)
+        logger.info(f"Local tensors of the matrix-free operator cached, sized {total} Mb.")
+        return self
+
+    @staticmethod
+    def _compress(data: _LocalData):
+        factor = congruent_factor(data[0])
+        if factor is None:
+            return data
+        return (factor[0], data[1], data[2], factor[1])
+
+    def local_data(self) -> Iterable[_LocalData]:
+        """Return the local tensors with the entity-to-dof relationship of the
+        trial and test spaces, computed on the fly if not cached."""
+        if self._local_data is not None:
+            return self._local_data
+        return self._local_iterative()
+
+    def diagonal(self) -> TensorLike:
+        """Return the diagonal of the operator, shaped ([batch, ]gdof)."""
+        nrow = self.shape[-2]
+        form = self.form
+        space = form._spaces[0]
+        batch_size = form.batch_size
+        shape = (nrow, ) if batch_size == 0 else (batch_size, nrow)
+        diag = bm.zeros(shape, dtype=space.ftype, device=bm.get_device(space))
+
+        for group_tensor, ue2dof, ve2dof, *scale in self.local_data():
+            is_diag = (ve2dof[:, :, None] == ue2dof[:, None, :])
+            local_diag = bm.sum(group_tensor * is_diag, axis=-1) # ([batch, ]NC, vldof)
+            if len(scale) > 0:
+                local_diag = local_diag * scale[0][:, None]
+            if (batch_size > 0) and (local_diag.ndim == 2):
+                local_diag = bm.stack([local_diag]*batch_size, axis=0)
+            local_diag = local_diag.reshape(shape[:-1] + (-1, ))
+            diag = bm.index_add(diag, ve2dof.reshape(-1), local_diag, axis=-1)
+
+        return diag
+
+    def __matmul__(self, u: TensorLike) -> TensorLike:
+        return local_matvec(self.local_data(), u, self.shape, self.form.batch_size)
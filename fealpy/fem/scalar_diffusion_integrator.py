@@ -7,6 +7,7 @@ from ..mesh import HomogeneousMesh
 from ..functionspace.space import FunctionSpace as _FS
 from ..utils import process_coef_func
 from ..functional import bilinear_integral, linear_integral, get_semilinear_coef
+from .congruent import is_congruent_space, cellwise_coef, congruent_local
 from .integrator import (
     LinearInt, OpInt, CellInt,
     enable_cache,
@@ -57,13 +58,28 @@ class ScalarDiffusionIntegrator(LinearInt, OpInt, CellInt):
         bcs = self.fetch(space)[0]
         return space.grad_basis(bcs, index=self.index, variable='u')
 
+    @enable_cache
+    def fetch_congruent(self, space: _FS):
+        """The local matrix of the first cell divided by its measure, for
+        meshes with congruent cells."""
+        bcs, ws, _ = self.fetch(space)
+        index = slice(0, 1)
+        gphi = space.grad_basis(bcs, index=index, variable='x')
+        measure = bm.ones((1, ), dtype=ws.dtype, device=bm.get_device(ws))
+        return bilinear_integral(gphi, gphi, ws, measure)[0]
+
     def assembly(self, space: _FS) -> TensorLike:
         coef = self.coef
         mesh = getattr(space, 'mesh', None)
         bcs, ws, cm = self.fetch(space)
         coef = process_coef_func(coef, bcs=bcs, mesh=mesh, etype='cell', index=self.index)
+
+        if is_congruent_space(space):
+            cellwise, scale = cellwise_coef(coef, cm.shape[0], self.batched)
+            if cellwise:
+                return congruent_local(self.fetch_congruent(space), scale, cm)
+
         gphi = self.fetch_gphix(space)
-        
         return bilinear_integral(gphi, gphi, ws, cm, coef, batched=self.batched)
 
     @assemblymethod('fast')
@@ -7,6 +7,7 @@ from ..mesh import HomogeneousMesh
 from ..functionspace.space import FunctionSpace as _FS
 from ..utils import process_coef_func
 from ..functional import bilinear_integral, linear_integral, get_semilinear_coef
+from .congruent import is_congruent_space, cellwise_coef, congruent_local
 from .integrator import (
     LinearInt, OpInt, CellInt,
     enable_cache,
@@ -49,12 +50,26 @@ class ScalarMassIntegrator(LinearInt, OpInt, CellInt):
         phi = space.basis(bcs, index=index)
         return bcs, ws, phi, cm, index
 
+    @enable_cache
+    def fetch_congruent(self, space: _FS):
+        """The local matrix of the first cell divided by its measure, for
+        meshes with congruent cells."""
+        bcs, ws, _, _, _ = self.fetch(space)
+        phi = space.basis(bcs, index=slice(0, 1))
+        measure = bm.ones((1, ), dtype=ws.dtype, device=bm.get_device(ws))
+        return bilinear_integral(phi, phi, ws, measure)[0]
+
     def assembly(self, space: _FS) -> TensorLike:
         coef = self.coef
         mesh = getattr(space, 'mesh', None)
         bcs, ws, phi, cm, index = self.fetch(space)
         val = process_coef_func(coef, bcs=bcs, mesh=mesh, etype='cell', index=index)
 
+        if is_congruent_space(space):
+            cellwise, scale = cellwise_coef(val, cm.shape[0], self.batched)
+            if cellwise:
+                return congruent_local(self.fetch_congruent(space), scale, cm)
+
         return bilinear_integral(phi, phi, ws, cm, val, batched=self.batched)
 
     @assemblymethod('semilinear')
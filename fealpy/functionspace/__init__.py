@@ -1,27 +1,32 @@
 
-from .space import FunctionSpace
-from .function import Function
+from .._lazy import attach
 
-from .dofs import LinearMeshCFEDof
+# NOTE: The spaces are imported on first access.
+__getattr__, __dir__, __all__ = attach(__name__, {
+    'FunctionSpace': '.space',
+    'Function': '.function',
 
-from .lagrange_fe_space import LagrangeFESpace
-from .tensor_space import TensorFunctionSpace
-from .cm_conforming_fe_space import CmConformingFESpace2d
-from .cm_conforming_fe_space3d import CmConformingFESpace3d
-from .bernstein_fe_space import BernsteinFESpace
+    'LinearMeshCFEDof': '.dofs',
 
-from .first_nedelec_fe_space_2d import FirstNedelecFiniteElementSpace2d
-from .first_nedelec_fe_space_3d import FirstNedelecFiniteElementSpace3d
+    'LagrangeFESpace': '.lagrange_fe_space',
+    'TensorFunctionSpace': '.tensor_space',
+    'CmConformingFESpace2d': '.cm_conforming_fe_space',
+    'CmConformingFESpace3d': '.cm_conforming_fe_space3d',
+    'BernsteinFESpace': '.bernstein_fe_space',
 
-from .second_nedelec_fe_space_2d import SecondNedelecFiniteElementSpace2d
-from .second_nedelec_fe_space_3d import SecondNedelecFiniteElementSpace3d
+    'FirstNedelecFiniteElementSpace2d': '.first_nedelec_fe_space_2d',
+    'FirstNedelecFiniteElementSpace3d': '.first_nedelec_fe_space_3d',
 
-from .RaviartThomasFiniteElementSpace2d import RTFiniteElementSpace2d
-from .RaviartThomasFiniteElementSpace3d import RTFiniteElementSpace3d
+    'SecondNedelecFiniteElementSpace2d': '.second_nedelec_fe_space_2d',
+    'SecondNedelecFiniteElementSpace3d': '.second_nedelec_fe_space_3d',
 
-from .parametric_lagrange_fe_space import ParametricLagrangeFESpace
+    'RTFiniteElementSpace2d': '.RaviartThomasFiniteElementSpace2d',
+    'RTFiniteElementSpace3d': '.RaviartThomasFiniteElementSpace3d',
 
-from .huzhang_fe_space_2d import HuZhangFESpace2D
+    'ParametricLagrangeFESpace': '.parametric_lagrange_fe_space',
 
-from .BrezziDouglasMariniFiniteElementSpace2d import BDMFiniteElementSpace2d
-from .BrezziDouglasMariniFiniteElementSpace3d import BDMFiniteElementSpace3d
\ No newline at end of file
+    'HuZhangFESpace2D': '.huzhang_fe_space_2d',
+
+    'BDMFiniteElementSpace2d': '.BrezziDouglasMariniFiniteElementSpace2d',
+    'BDMFiniteElementSpace3d': '.BrezziDouglasMariniFiniteElementSpace3d',
+})
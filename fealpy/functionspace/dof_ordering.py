@@ -0,0 +1,65 @@
+"""Orderings of global dofs, for the locality of assembly and sparse solvers.
+
+Each ordering returns a permutation `perm` of the global dofs, such that the
+new dof `i` is the old dof `perm[i]`.
+"""
+import numpy as np
+
+from ..backend import backend_manager as bm
+from ..typing import TensorLike
+
+
+def reverse_cuthill_mckee(entity2dof: TensorLike, gdof: int) -> TensorLike:
+    """Reverse Cuthill-McKee ordering of the dof graph, in which two dofs are
+    connected if they belong to the same entity. It reduces the bandwidth of
+    the matrices, and the fill-in of direct solvers.
+
+    Parameters:
+        entity2dof (Tensor): Map from entities (usually cells) to dofs, shaped (NC, ldof).
+        gdof (int): Number of global dofs.
+
+    Returns:
+        Tensor: The permutation, shaped (gdof, ).
+    """
+    from scipy.sparse import csr_matrix
+    from scipy.sparse.csgraph import reverse_cuthill_mckee as rcm
+
+    e2d = bm.to_numpy(entity2dof).astype(np.int64)
+    ldof = e2d.shape[-1]
+    I = np.repeat(e2d, ldof, axis=-1).reshape(-1)
+    J = np.tile(e2d, (1, ldof)).reshape(-1)
+    graph = csr_matrix((np.ones(I.shape[0], dtype=np.int8), (I, J)), shape=(gdof, gdof))
+    perm = rcm(graph, symmetric_mode=True)
+
+    return bm.device_put(bm.from_numpy(perm.astype(np.int64)), bm.get_device(entity2dof))
+
+
+def morton_order(points: TensorLike, bits: int=None) -> TensorLike:
+    """Space-filling curve (Morton, or Z-order) ordering of points. Points close
+    in the order are close in space.
+
+    Parameters:
+        points (Tensor): Points shaped (N, GD).
+        bits (int, optional): Bits of the grid in each direction. Defaults to
+            the most that fit in a 64-bit key.
+
+    Returns:
+        Tensor: The permutation, shaped (N, ).
+    """
+    p = bm.to_numpy(points).astype(np.float64)
+    N, GD = p.shape
+    bits = (63 // GD) if bits is None else bits
+
+    pmin = p.min(axis=0)
+    scale = np.max(p.max(axis=0) - pmin)
+    scale = 1.0 if scale == 0 else scale
+    grid = ((p - pmin) / scale * ((1 << bits) - 1)).astype(np.uint64)
+
+    key = np.zeros(N, dtype=np.uint64)
+    for b in range(bits):
+        for d in range(GD):
+            bit = (grid[:, d] >> np.uint64(b)) & np.uint64(1)
+            key |= bit << np.uint64(b * GD + d)
+    perm = np.argsort(key, kind='stable')
+
+    return bm.device_put(bm.from_numpy(perm.astype(np.int64)), bm.get_device(points))
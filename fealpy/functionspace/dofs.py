@@ -1,11 +1,13 @@
 
 __all__ = ['LinearMeshCFEDof']
 
-from typing import Union, Generic, TypeVar
+from typing import Optional, Union, Generic, TypeVar
+import threading
 
 from ..backend import TensorLike
 from ..backend import backend_manager as bm
 from ..mesh.mesh_base import Mesh
+from .dof_ordering import reverse_cuthill_mckee, morton_order
 
 
 _MT = TypeVar('_MT', bound=Mesh)
@@ -14,13 +16,112 @@ _S = slice(None)
 
 
 class LinearMeshCFEDof(Generic[_MT]):
+    """Dofs of continuous Lagrange spaces on linear meshes.
+
+    The global maps of dofs and the interpolation points are built once and
+    memoized, until the version of the mesh changes, see `MeshDS.version`.
+    Memoized tensors are shared, do not modify them in place. Read-only views
+    are returned for the NumPy backend. The memoization is thread-safe, e.g.
+    for assembly in worker threads.
+
+    By default, dofs are numbered as the interpolation points of the mesh,
+    i.e. nodes, then edge interiors, face interiors and cell interiors. Other
+    orderings can be set by `set_ordering`, which are applied to all the maps,
+    the boundary flags and the interpolation points.
+    """
+    ORDERINGS = (None, 'rcm', 'sfc')
+
     def __init__(self, mesh: _MT, p: int):
         TD = mesh.top_dimension()
         self.mesh = mesh
         self.p = p
         self.multiIndex = mesh.multi_index_matrix(p, TD)
-   
+        self.ordering = None
+        self.ordering_version = 0
+        self._cache = {}
+        self._cache_version = None
+        # NOTE: Reentrant, as memoized maps are built from other memoized ones,
+        # e.g. cell_to_dof from inverse_permutation.
+        self._lock = threading.RLock()
+
+    def _memoize(self, key, func):
+        with self._lock:
+            version = self.mesh.version
+            if self._cache_version != version:
+                self._cache = {}
+                self._cache_version = version
+            if key not in self._cache:
+                value = func()
+                if bm.backend_name == 'numpy':
+                    # a read-only view, leaving arrays owned by the mesh writable
+                    value = value.view()
+                    value.flags.writeable = False
+                self._cache[key] = value
+            return self._cache[key]
+
+    def clear(self):
+        """Remove the memoized maps."""
+        with self._lock:
+            self._cache = {}
+
+    def set_ordering(self, ordering: Optional[str]) -> None:
+        """Set the ordering of global dofs.
+
+        Parameters:
+            ordering (str | None): 'rcm' for the reverse Cuthill-McKee ordering,
+                'sfc' for the space-filling curve ordering of interpolation
+                points, or None for the default ordering.
+        """
+        if ordering not in self.ORDERINGS:
+            raise ValueError(f"Unknown ordering: {ordering}, "
+                             f"expected one of {self.ORDERINGS}.")
+        self.ordering = ordering
+        # NOTE: Counted for caches depending on the dof numbering, e.g. the
+        # sparsity pattern kept by BilinearForm.
+        self.ordering_version += 1
+        self.clear()
+
+    def permutation(self) -> Optional[TensorLike]:
+        """The permutation of global dofs, such that the dof `i` is the dof
+        `perm[i]` in the default ordering, or None for the default ordering.
+        It is computed again when the mesh changes."""
+        if self.ordering is None:
+            return None
+        return self._memoize('perm', self._permutation)
+
+    def inverse_permutation(self) -> Optional[TensorLike]:
+        """The inverse of `permutation`, mapping default dofs to the current ones."""
+        if self.ordering is None:
+            return None
+
+        def inverse():
+            perm = self.permutation()
+            iperm = bm.zeros_like(perm)
+            return bm.set_at(iperm, perm, bm.arange(perm.shape[0], dtype=perm.dtype,
+                                                    device=bm.get_device(perm)))
+
+        return self._memoize('iperm', inverse)
+
+    def _permutation(self):
+        if self.ordering == 'rcm':
+            return reverse_cuthill_mckee(self.mesh.cell_to_ipoint(self.p),
+                                         self.number_of_global_dofs())
+        else:
+            return morton_order(self.mesh.interpolation_points(self.p))
+
+    def _renumber(self, entity2dof: TensorLike) -> TensorLike:
+        iperm = self.inverse_permutation()
+        if iperm is None:
+            return entity2dof
+        return bm.astype(iperm[entity2dof], entity2dof.dtype)
+
     def is_boundary_dof(self, threshold=None, method=None):
+        if threshold is None:
+            return self._memoize(('is_boundary_dof', method),
+                                 lambda: self._is_boundary_dof(None, method))
+        return self._is_boundary_dof(threshold, method)
+
+    def _is_boundary_dof(self, threshold=None, method=None):
         TD = self.mesh.top_dimension()
         gdof = self.number_of_global_dofs()
         if bm.is_tensor(threshold):
@@ -45,7 +146,7 @@ class LinearMeshCFEDof(Generic[_MT]):
                 index_dof = face2dof.flatten()
                 if callable(threshold):
                     ##TODO, index_dof加插值点函数里
-                    ipoint = self.mesh.interpolation_points(p=self.p)[index_dof]
+                    ipoint = self.interpolation_points()[index_dof]
                     flag = threshold(ipoint)
                     index_dof = index_dof[flag]
                 isBdDof = bm.zeros(gdof, dtype=bm.bool, device=bm.get_device(self.mesh))
@@ -66,16 +167,24 @@ class LinearMeshCFEDof(Generic[_MT]):
             raise ValueError(f"Unknown entity type: {etype}")
 
     def edge_to_dof(self, index: Index=_S):
-        return self.mesh.edge_to_ipoint(self.p, index=index)
+        edge2dof = self._memoize('edge', lambda: self._renumber(self.mesh.edge_to_ipoint(self.p)))
+        return edge2dof[index]
 
     def face_to_dof(self, index: Index=_S):
-        return self.mesh.face_to_ipoint(self.p, index=index)
+        face2dof = self._memoize('face', lambda: self._renumber(self.mesh.face_to_ipoint(self.p)))
+        return face2dof[index]
 
     def cell_to_dof(self, index: Index=_S):
-        return self.mesh.cell_to_ipoint(self.p, index=index)
+        cell2dof = self._memoize('cell', lambda: self._renumber(self.mesh.cell_to_ipoint(self.p)))
+        return cell2dof[index]
 
     def interpolation_points(self, index: Index=_S) -> TensorLike:
-        return self.mesh.interpolation_points(self.p, index=index)
+        def ipoints():
+            ipoints = self.mesh.interpolation_points(self.p)
+            perm = self.permutation()
+            return ipoints if perm is None else ipoints[perm]
+
+        return self._memoize('ipoints', ipoints)[index]
 
     def number_of_global_dofs(self) -> int:
         return self.mesh.number_of_global_ipoints(self.p)
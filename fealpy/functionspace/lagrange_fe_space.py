@@ -2,9 +2,11 @@
 from typing import Optional, TypeVar, Union, Generic, Callable
 from ..typing import TensorLike, Index, _S, Threshold
 
+from .. import logger
 from ..backend import TensorLike
 from ..backend import backend_manager as bm
 from ..mesh.mesh_base import Mesh
+from ..sparse import CSRTensor
 from .space import FunctionSpace
 from .dofs import LinearMeshCFEDof, LinearMeshDFEDof
 from .function import Function
@@ -65,6 +67,54 @@ class LagrangeFESpace(FunctionSpace, Generic[_MT]):
         else:
             raise RuntimeError("boundary dof is not supported by discontinuous spaces.")
 
+    def renumber(self, ordering: Optional[str]='rcm') -> Optional[TensorLike]:
+        """Renumber the global dofs, for the locality of assembly and SpMV and
+        the fill-in of direct solvers.
+
+        The ordering is applied to the dof maps, the boundary flags and the
+        interpolation points, and kept when the mesh changes.
+
+        Parameters:
+            ordering (str | None, optional): 'rcm' for the reverse Cuthill-McKee
+                ordering, 'sfc' for the space-filling curve ordering, or None
+                for the default ordering. Defaults to 'rcm'.
+
+        Returns:
+            Tensor | None: The permutation, such that the dof `i` is the dof
+                `perm[i]` in the default ordering.
+        """
+        if self.ctype != 'C':
+            raise RuntimeError("renumbering is not supported by discontinuous spaces.")
+        self.dof.set_ordering(ordering)
+        return self.dof.permutation()
+
+    def to_default_ordering(self, uh: TensorLike) -> TensorLike:
+        """Permute dof values of this space to the default ordering.
+
+        Parameters:
+            uh (Tensor): Dof values shaped (..., gdof).
+
+        Returns:
+            Tensor: Values in the default ordering, shaped (..., gdof).
+        """
+        iperm = self.dof.inverse_permutation() if self.ctype == 'C' else None
+        uh = uh[:] if isinstance(uh, Function) else uh
+        return uh if iperm is None else uh[..., iperm]
+
+    def from_default_ordering(self, u: TensorLike) -> TensorLike:
+        """Permute dof values in the default ordering to this space, the inverse
+        of `to_default_ordering`.
+
+        Parameters:
+            u (Tensor): Dof values in the default ordering, shaped (..., gdof).
+
+        Returns:
+            Tensor: Values shaped (..., gdof).
+        """
+        perm = self.dof.permutation() if self.ctype == 'C' else None
+        u = u[:] if isinstance(u, Function) else u
+        return u if perm is None else u[..., perm]
+
     def geo_dimension(self):
         return self.GD
 
@@ -123,6 +173,86 @@ class LagrangeFESpace(FunctionSpace, Generic[_MT]):
 
     set_dirichlet_bc = boundary_interpolate
 
+    def transfer_matrix(self, target: 'LagrangeFESpace') -> CSRTensor:
+        """Build the interpolation operator from this space to a Lagrange space
+        on another mesh.
+
+        The interpolation points of the target space are located in the mesh of
+        this space, and each row holds the values of the basis functions there.
+        Rows of points outside the mesh are empty.
+
+        Parameters:
+            target (LagrangeFESpace): The target space.
+
+        Returns:
+            CSRTensor: The operator in shape (target gdof, gdof).
+        """
+        points = target.interpolation_points()
+        NP = points.shape[0]
+        cell, bc = self.mesh.point_to_bc(points)
+        flag = cell >= 0
+        nout = NP - int(bm.sum(flag))
+        if nout > 0:
+            logger.warning(f"{nout} interpolation points of the target space are "
+                           "outside the mesh, and are transferred as zero.")
+
+        phi = self._point_basis(bc[flag]) # (N, ldof)
+        cell2dof = self.cell_to_dof()
+        kwargs = bm.context(cell2dof)
+        counts = bm.astype(flag, cell2dof.dtype) * phi.shape[-1]
+        crow = bm.concatenate([bm.zeros((1, ), **kwargs), bm.cumsum(counts, axis=0)], axis=0)
+        col = cell2dof[cell[flag]].reshape(-1)
+
+        return CSRTensor(crow, col, phi.reshape(-1),
+                         spshape=(NP, self.number_of_global_dofs()))
+
+    def _point_basis(self, bc: TensorLike) -> TensorLike:
+        """Basis values at one local coordinate for each point, in shape (N, ldof)."""
+        if bc.ndim == 2: # simplex
+            return self.basis(bc)[0]
+        # tensor product of 1D coordinates in shape (N, TD, 2)
+        N = bc.shape[0]
+        phi = self.mesh.shape_function((bc[:, 0, :], ), self.p)
+        for d in range(1, bc.shape[1]):
+            phi1 = self.mesh.shape_function((bc[:, d, :], ), self.p)
+            phi = (phi[:, :, None] * phi1[:, None, :]).reshape(N, -1)
+        return phi
+
+    def transfer(self, uh: TensorLike, target: 'LagrangeFESpace') -> TensorLike:
+        """Transfer a function of this space to a Lagrange space on another mesh
+        by interpolation.
+
+        The operator from `transfer_matrix` is kept for the last target space,
+        until one of the meshes is changed or one of the spaces is renumbered, so
+        repeated transfers between the same spaces only cost a sparse
+        matrix-vector product.
+
+        Parameters:
+            uh (Tensor | Function): Values in shape (..., gdof).
+            target (LagrangeFESpace): The target space.
+
+        Returns:
+            Function: The function in the target space, in shape (..., target gdof).
+        """
+        version = (self.mesh.version, target.mesh.version,
+                   getattr(self.dof, 'ordering_version', 0),
+                   getattr(target.dof, 'ordering_version', 0))
+        cache = getattr(self, '_transfer_cache', None)
+        if (cache is None) or (cache[0] is not target) or (cache[1] != version):
+            cache = (target, version, self.transfer_matrix(target))
+            self._transfer_cache = cache
+        T = cache[2]
+
+        array = uh[:]
+        if array.ndim == 1:
+            val = T @ array
+        else:
+            batch, gdof = array.shape[:-1], array.shape[-1]
+            val = bm.swapaxes(T @ bm.swapaxes(array.reshape(-1, gdof), 0, 1), 0, 1)
+            val = val.reshape(batch + (-1, ))
+
+        return target.function(val)
+
     def basis(self, bc: TensorLike, index: Index=_S):
         phi = self.mesh.shape_function(bc, self.p, index=index)
         return phi[None, ...] # (NC, NQ, LDOF)
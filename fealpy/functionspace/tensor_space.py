@@ -128,7 +128,33 @@ class TensorFunctionSpace(FunctionSpace):
     def interpolation_points(self) -> TensorLike:
 
         return self.scalar_space.interpolation_points()
-    
+
+    def renumber(self, ordering: Optional[str]='rcm') -> Optional[TensorLike]:
+        """Renumber the dofs of the scalar space, see `LagrangeFESpace.renumber`.
+        The tensor dofs follow the scalar ones."""
+        return self.scalar_space.renumber(ordering)
+
+    def to_default_ordering(self, uh: TensorLike) -> TensorLike:
+        """Permute dof values of this space, shaped (..., gdof), to the default
+        ordering of the scalar space."""
+        return self._permute(uh, self.scalar_space.to_default_ordering)
+
+    def from_default_ordering(self, u: TensorLike) -> TensorLike:
+        """Permute dof values in the default ordering, shaped (..., gdof), to
+        this space."""
+        return self._permute(u, self.scalar_space.from_default_ordering)
+
+    def _permute(self, uh: TensorLike, permute: Callable[[TensorLike], TensorLike]):
+        uh = uh[:] if isinstance(uh, Function) else uh
+        batch = uh.shape[:-1]
+        sgdof = self.scalar_space.number_of_global_dofs()
+        if self.dof_priority:
+            val = permute(uh.reshape(batch + (self.dof_numel, sgdof)))
+        else:
+            val = uh.reshape(batch + (sgdof, self.dof_numel))
+            val = bm.swapaxes(permute(bm.swapaxes(val, -1, -2)), -1, -2)
+        return val.reshape(batch + (-1, ))
+
     def interpolate(self, u: Union[Callable[..., TensorLike], TensorLike], ) -> TensorLike:
 
         if self.dof_priority:
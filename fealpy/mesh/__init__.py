@@ -1,12 +1,30 @@
 
-from .mesh_data_structure import MeshDS
-from .mesh_base import Mesh, HomogeneousMesh, SimplexMesh, TensorMesh, StructuredMesh
+from .._lazy import attach
 
-from .interval_mesh import IntervalMesh
-from .triangle_mesh import TriangleMesh
-from .tetrahedron_mesh import TetrahedronMesh
-from .quadrangle_mesh import QuadrangleMesh
-from .hexahedron_mesh import HexahedronMesh
+# NOTE: The meshes are imported on first access.
+__getattr__, __dir__, __all__ = attach(__name__, {
+    'MeshDS': '.mesh_data_structure',
+    'Mesh': '.mesh_base',
+    'HomogeneousMesh': '.mesh_base',
+    'SimplexMesh': '.mesh_base',
+    'TensorMesh': '.mesh_base',
+    'StructuredMesh': '.mesh_base',
 
-from .uniform_mesh_2d import UniformMesh2d
-from .uniform_mesh_3d import UniformMesh3d
+    'IntervalMesh': '.interval_mesh',
+    'TriangleMesh': '.triangle_mesh',
+    'TetrahedronMesh': '.tetrahedron_mesh',
+    'QuadrangleMesh': '.quadrangle_mesh',
+    'HexahedronMesh': '.hexahedron_mesh',
+
+    'UniformMesh2d': '.uniform_mesh_2d',
+    'UniformMesh3d': '.uniform_mesh_3d',
+
+    'NodeMesh': '.node_mesh', # needs jax and jax_md
+
+    'save_checkpoint': '.checkpoint',
+    'load_checkpoint': '.checkpoint',
+    'Checkpoint': '.checkpoint',
+
+    'MeshPartition': '.partition',
+    'partition_mesh': '.partition',
+})
@@ -0,0 +1,245 @@
+"""Checkpoint and restart of meshes, their data and FE solution arrays.
+
+A checkpoint is a directory with a `header.json` and one `.npy` file for each
+array. Arrays are loaded through `numpy.memmap` (copy-on-write), so loading is
+zero-copy on the numpy backend, and fields are only read on first access.
+"""
+import os
+import json
+import shutil
+import importlib
+from collections.abc import MutableMapping
+from typing import Optional, Dict, Any, Callable
+
+import numpy as np
+
+from ..backend import backend_manager as bm
+from ..typing import TensorLike
+
+
+CHECKPOINT_FORMAT = 'fealpy-checkpoint'
+CHECKPOINT_VERSION = 1
+
+# NOTE: Attributes set by `construct`, saved so that loading does not
+# need to construct the topology again.
+_TOPOLOGY_ATTR = ('cell2face', 'face2cell', 'cell2edge', 'edge2cell', 'face2edge')
+_DATA_ATTR = ('nodedata', 'edgedata', 'facedata', 'celldata', 'meshdata')
+
+
+class LazyArrayDict(MutableMapping):
+    """A dict of arrays, of which the stored ones are loaded on first access.
+
+    Parameters:
+        files (Dict[str, str]): Map from keys to the `.npy` files.
+        load (Callable[[str], Tensor]): Load an array from a file.
+    """
+    def __init__(self, files: Dict[str, str], load: Callable[[str], TensorLike]):
+        self._files = dict(files)
+        self._load = load
+        self._data: Dict[str, Any] = {}
+
+    def __getitem__(self, key: str):
+        if key not in self._data:
+            if key not in self._files:
+                raise KeyError(key)
+            self._data[key] = self._load(self._files[key])
+        return self._data[key]
+
+    def __setitem__(self, key: str, value: Any):
+        self._data[key] = value
+        self._files.pop(key, None)
+
+    def __delitem__(self, key: str):
+        if key not in self._data and key not in self._files:
+            raise KeyError(key)
+        self._data.pop(key, None)
+        self._files.pop(key, None)
+
+    def __iter__(self):
+        yield from self._files
+        yield from (k for k in self._data if k not in self._files)
+
+    def __len__(self) -> int:
+        return len(self._files.keys() | self._data.keys())
+
+    def is_loaded(self, key: str) -> bool:
+        return key in self._data
+
+    def __repr__(self) -> str:
+        return f"{self.__class__.__name__}({list(self)})"
+
+
+class Checkpoint():
+    """Contents of a loaded checkpoint.
+
+    Attributes:
+        mesh (Mesh): The mesh, with the topology and the data dicts restored.
+        fields (LazyArrayDict): The saved arrays, e.g. FE solutions.
+        meta (Dict[str, Any]): The JSON-serializable metadata, e.g. the time step.
+        version (int): Version of the format.
+    """
+    def __init__(self, mesh, fields: LazyArrayDict, meta: Dict[str, Any], version: int):
+        self.mesh = mesh
+        self.fields = fields
+        self.meta = meta
+        self.version = version
+
+
+class _ArrayWriter():
+    """Write each array object once, and map its names to the file."""
+    def __init__(self, path: str):
+        self.path = path
+        self._files: Dict[int, str] = {}
+
+    def __call__(self, name: str, array) -> str:
+        key = id(array)
+        if key in self._files:
+            return self._files[key]
+        fname = name + '.npy'
+        if hasattr(array, 'array') and not bm.is_tensor(array): # Function
+            array = array[:]
+        np.save(os.path.join(self.path, fname), np.ascontiguousarray(bm.to_numpy(array)))
+        self._files[key] = fname
+        return fname
+
+
+def save_checkpoint(path: str, mesh, fields: Optional[Dict[str, Any]]=None,
+                    meta: Optional[Dict[str, Any]]=None) -> None:
+    """Save a mesh with its topology, data dicts and other arrays to a
+    checkpoint directory.
+
+    The checkpoint is written to a temporary directory first, and then
+    replaces `path`, so that an interrupted run never leaves a broken one.
+
+    Parameters:
+        path (str): The checkpoint directory.
+        mesh (Mesh): A mesh constructed by `Mesh(node, cell)`.
+        fields (Dict[str, Tensor | Function] | None, optional): Arrays to save,
+            e.g. FE solutions. Defaults to None.
+        meta (Dict[str, Any] | None, optional): JSON-serializable metadata,
+            e.g. the time and the step. Defaults to None.
+    """
+    path = os.path.abspath(path)
+    tmp = path + '.tmp'
+    if os.path.exists(tmp):
+        shutil.rmtree(tmp)
+    os.makedirs(tmp)
+    write = _ArrayWriter(tmp)
+
+    entities = {}
+    for name in ('node', 'edge', 'face', 'cell'):
+        entity = mesh.entity(name)
+        if entity is not None:
+            entities[name] = write(name, entity)
+    if ('node' not in entities) or ('cell' not in entities):
+        raise ValueError("The mesh to save must have nodes and cells.")
+
+    topology = {name: write(name, mesh.__dict__[name])
+                for name in _TOPOLOGY_ATTR if name in mesh.__dict__}
+
+    # NOTE: Data dicts may be aliases, e.g. `facedata` is `edgedata` in
+    # 2-d meshes, which are saved once and restored as the same dict.
+    data, groups = {}, {}
+    for name in _DATA_ATTR:
+        d = getattr(mesh, name, None)
+        if not isinstance(d, MutableMapping):
+            continue
+        if id(d) in groups:
+            data[name] = {'alias': groups[id(d)]}
+            continue
+        groups[id(d)] = name
+        data[name] = {k: write(f'{name}.{k}', v) for k, v in d.items()}
+
+    header = {
+        'format': CHECKPOINT_FORMAT,
+        'version': CHECKPOINT_VERSION,
+        'mesh': {
+            'module': type(mesh).__module__,
+            'class': type(mesh).__name__,
+        },
+        'entities': entities,
+        'topology': topology,
+        'data': data,
+        'fields': {k: write(f'field.{k}', v) for k, v in (fields or {}).items()},
+        'meta': meta or {}
+    }
+    with open(os.path.join(tmp, 'header.json'), 'w') as f:
+        json.dump(header, f, indent=2)
+
+    if os.path.exists(path):
+        old = path + '.old'
+        os.replace(path, old)
+        os.replace(tmp, path)
+        shutil.rmtree(old)
+    else:
+        os.replace(tmp, path)
+
+
+def load_checkpoint(path: str, *, mmap: bool=True, device=None) -> Checkpoint:
+    """Load a checkpoint saved by `save_checkpoint`.
+
+    The mesh is restored without constructing the topology again. Entities
+    and topology arrays are loaded at once, while the data dicts and fields
+    are loaded on first access.
+
+    Parameters:
+        path (str): The checkpoint directory.
+        mmap (bool, optional): Load arrays through copy-on-write memory maps,
+            such that in-place changes are never written back. Defaults to True.
+        device (str | None, optional): Device of the tensors. Defaults to None.
+
+    Returns:
+        Checkpoint: The mesh, fields and metadata.
+    """
+    with open(os.path.join(path, 'header.json'), 'r') as f:
+        header = json.load(f)
+    if header.get('format') != CHECKPOINT_FORMAT:
+        raise ValueError(f"'{path}' is not a fealpy checkpoint.")
+    version = header['version']
+    if version > CHECKPOINT_VERSION:
+        raise ValueError(f"Checkpoint version {version} is not supported, "
+                         f"expected {CHECKPOINT_VERSION} or lower.")
+
+    cache: Dict[str, TensorLike] = {}
+
+    def load(fname: str) -> TensorLike:
+        if fname not in cache:
+            array = np.load(os.path.join(path, fname), mmap_mode='c' if mmap else None)
+            tensor = bm.from_numpy(np.asarray(array)) if bm.backend_name != 'numpy' else array
+            if device is not None:
+                tensor = bm.device_put(tensor, device)
+            cache[fname] = tensor
+        return cache[fname]
+
+    entities = {k: load(v) for k, v in header['entities'].items()}
+    module = importlib.import_module(header['mesh']['module'])
+    Mesh = getattr(module, header['mesh']['class'])
+    mesh = _restore_mesh(Mesh, entities, {k: load(v) for k, v in header['topology'].items()})
+
+    for name, files in header['data'].items():
+        if 'alias' in files:
+            d = getattr(mesh, files['alias'])
+        else:
+            d = LazyArrayDict(files, load)
+        setattr(mesh, name, d)
+
+    fields = LazyArrayDict(header['fields'], load)
+    return Checkpoint(mesh, fields, header['meta'], version)
+
+
+def _restore_mesh(Mesh, entities: Dict[str, TensorLike], topology: Dict[str, TensorLike]):
+    # NOTE: `construct` is shadowed by a no-op on the instance while the
+    # mesh is initialized, and the saved topology is set afterwards.
+    mesh = Mesh.__new__(Mesh)
+    object.__setattr__(mesh, 'construct', lambda: None)
+    try:
+        mesh.__init__(entities['node'], entities['cell'])
+    finally:
+        object.__delattr__(mesh, 'construct')
+
+    for name, entity in entities.items():
+        setattr(mesh, name, entity)
+    for name, value in topology.items():
+        setattr(mesh, name, value)
+
+    return mesh
@@ -1,13 +1,33 @@
 # from test.mesh.tetrahedron_mesh_data import from_box
 from typing import Union, Optional
+from functools import lru_cache
 from math import sqrt
 from ..backend import backend_manager as bm
 from .mesh_base import TensorMesh
 from ..typing import TensorLike, Index, _S
 from .plot import Plotable
+from .refine_topology import RefineTopology
+from .utils import barycenter_prolongation
 
 from scipy.sparse import coo_matrix, csc_matrix, csr_matrix
 
+
+@lru_cache(maxsize=None)
+def _red_refinement() -> RefineTopology:
+    """Children of `uniform_refine`, with the vertices 0-7, the edge midpoints
+    8-19, the face centers 20-25 and the center 26 of the parent cell."""
+    localEdge = [(0, 1), (1, 2), (2, 3), (0, 3), (0, 4), (1, 5),
+                 (2, 6), (3, 7), (4, 5), (5, 6), (6, 7), (4, 7)]
+    localFace = [(0, 3, 2, 1), (4, 5, 6, 7), (0, 4, 7, 3),
+                 (1, 2, 6, 5), (0, 1, 5, 4), (2, 3, 7, 6)]
+    points = [(i, ) for i in range(8)] + localEdge + localFace + [tuple(range(8))]
+    children = [(0,  8, 20, 11, 12, 24, 26, 22), (1,  9, 20,  8, 13, 23, 26, 24),
+                (2, 10, 20,  9, 14, 25, 26, 23), (3, 11, 20, 10, 15, 22, 26, 25),
+                (4, 19, 21, 16, 12, 22, 26, 24), (5, 16, 21, 17, 13, 24, 26, 23),
+                (6, 17, 21, 18, 14, 23, 26, 25), (7, 18, 21, 19, 15, 25, 26, 22)]
+    return RefineTopology(localEdge, localFace, points, children, interleave=True)
+
+
 class HexahedronMesh(TensorMesh, Plotable):
     def __init__(self, node, cell):
         super(HexahedronMesh, self).__init__(TD = 3,
@@ -235,7 +255,8 @@ class HexahedronMesh(TensorMesh, Plotable):
 
         return cell2ipoint[index]
 
-    def uniform_refine(self, n=1, surface=None, interface=None, returnim=False):
+    def uniform_refine(self, n=1, surface=None, interface=None, returnim=False,
+                       *, incremental: bool=False, imformat: str='scipy'):
         """
         @brief Uniform refine the hexahedron mesh n times.
 
@@ -243,7 +264,19 @@ class HexahedronMesh(TensorMesh, Plotable):
             n (int): times refine the hexahedron mesh.
             surface (function): the surface function.
             returnim (bool): return the interpolation matrix or not.
+            incremental (bool, optional): derive the faces, the edges and their
+                relationships with cells of children from the parent mesh, instead of
+                constructing them by sorting. The numbering of faces and edges differs
+                from `construct()`. Defaults to False.
+            imformat (str, optional): format of the interpolation matrices, 'scipy' for
+                scipy csr matrices or 'csr' for CSRTensor. Defaults to 'scipy'.
+
+        Returns:
+            List: The interpolation matrices from the coarse to the fine mesh of each level,
+                shaped (NN_fine, NN_coarse), if `returnim` is True.
         """
+        if imformat not in {'scipy', 'csr'}:
+            raise ValueError(f"Unsupported imformat '{imformat}'.")
         if returnim is True:
             IM = []
         for i in range(n):
@@ -275,13 +308,16 @@ class HexahedronMesh(TensorMesh, Plotable):
             edge2node = self.edge_to_node()
             face2node = self.face_to_node()
             cell2node = self.cell_to_node()
-            if returnim is True:
+            if (returnim is True) and (imformat == 'csr'):
+                IM.append(barycenter_prolongation(NN, edge2node, face2node, cell2node,
+                                                  dtype=self.ftype))
+            elif returnim is True:
                 new_node_num = NN+NE+NF+NC
                 nonzeros = NN+2*NE+4*NF+8*NC
                 data = bm.zeros(nonzeros,dtype=bm.float64)
                 data[:NN] = 1
                 data[NN:NN+2*NE] = 1/2
-                data[NN+2*NE:NN+2*NE+4*NE] = 1/4
+                data[NN+2*NE:NN+2*NE+4*NF] = 1/4
                 data[NN+2*NE+4*NF:] = 1/8
 
                 indices = bm.zeros(nonzeros,dtype=bm.int32)
@@ -371,9 +407,15 @@ class HexahedronMesh(TensorMesh, Plotable):
             cell[7::8, 6] = c2c
             cell[7::8, 7] = c2f[:, 2]
 
+            if incremental:
+                topology = _red_refinement()(self, cell)
+
             self.node = node
             self.cell = cell
-            self.construct()
+            if incremental:
+                self.face, self.cell2face, self.face2cell, self.edge, self.cell2edge = topology
+            else:
+                self.construct()
 
         if returnim is True:
             return IM
@@ -690,8 +732,6 @@ class HexahedronMesh(TensorMesh, Plotable):
         return cls(node, cell)
 
     def to_vtk(self, fname=None, etype='cell', index:Index=_S):
-        from .vtk_extent import  write_to_vtu
-
         node = self.entity('node')
         GD = self.geo_dimension()
 
@@ -716,6 +756,7 @@ class HexahedronMesh(TensorMesh, Plotable):
             return node, cell.flatten(), cellType, NC
         else:
             print("Writting to vtk...")
+            from .vtk_extent import  write_to_vtu
             write_to_vtu(fname, node, NC, cellType, cell.flatten(),
                     nodedata=self.nodedata,
                     celldata=celldata)
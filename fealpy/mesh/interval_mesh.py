@@ -156,7 +156,7 @@ class IntervalMesh(SimplexMesh,Plotable):
             ipoint[:NN] = node
             cell = self.entity('cell')
             w = bm.zeros((p-1,2), dtype=bm.float64)
-            w[:,0] = bm.arange(p-1, 0, -1)/p
+            w[:,0] = bm.arange(p-1, 0, -1, dtype=self.ftype)/p
             w[:,1] = w[-1::-1, 0]
             GD = self.geo_dimension()
             ipoint[NN:NN+(p-1)*NC] = bm.einsum('ij, kj...->ki...', w,
@@ -281,8 +281,6 @@ class IntervalMesh(SimplexMesh,Plotable):
         -----
         把网格转化为 VTK 的格式
         """
-        from fealpy.mesh.vtk_extent import  write_to_vtu
-
         node = self.entity('node')
         GD = self.geo_dimension()
         if GD < 3:
@@ -300,6 +298,7 @@ class IntervalMesh(SimplexMesh,Plotable):
             return node, cell.flatten(), cellType, NC
         else:
             print("Writting to vtk...")
+            from fealpy.mesh.vtk_extent import  write_to_vtu
             write_to_vtu(fname, node, NC, cellType, cell.flatten(),
                     nodedata=self.nodedata,
                     celldata=self.celldata)
@@ -0,0 +1,291 @@
+from typing import Optional, Tuple
+
+from ..backend import backend_manager as bm
+from ..typing import TensorLike
+
+
+# NOTE: Order of the cell vertices in the tensor product of the 1D
+# coordinates, the same as in `TensorMesh.bc_to_point`.
+_TENSOR_VERTEX_ORDER = {
+    2: [0, 3, 1, 2],
+    3: [0, 4, 3, 7, 1, 5, 2, 6]
+}
+
+
+def _multilinear(vertex: TensorLike, bcs) -> TensorLike:
+    """Contract the vertices (P, 2, ..., 2, GD) with 1D coordinates (P, 2) of
+    each axis."""
+    out = vertex
+    for bc in bcs:
+        out = bm.einsum('pa..., pa -> p...', out, bc)
+    return out
+
+
+def _inv(A: TensorLike) -> TensorLike:
+    """Inverse of a batch of small matrices, by the adjugate for 2x2 and 3x3."""
+    n = A.shape[-1]
+    if n == 2:
+        det = A[:, 0, 0] * A[:, 1, 1] - A[:, 0, 1] * A[:, 1, 0]
+        adj = bm.stack([A[:, 1, 1], -A[:, 0, 1], -A[:, 1, 0], A[:, 0, 0]], axis=-1)
+        return adj.reshape(-1, 2, 2) / det[:, None, None]
+    elif n == 3:
+        r0, r1, r2 = A[:, 0, :], A[:, 1, :], A[:, 2, :]
+        adj = bm.stack([bm.cross(r1, r2), bm.cross(r2, r0), bm.cross(r0, r1)], axis=-1)
+        det = bm.sum(r0 * adj[:, :, 0], axis=-1)
+        return adj / det[:, None, None]
+    return bm.linalg.inv(A)
+
+
+def _min_coordinate(bc: TensorLike) -> TensorLike:
+    out = bm.min(bc, axis=-1)
+    return out if out.ndim == 1 else bm.min(out, axis=-1)
+
+
+class CellLocator():
+    """Locate points in the cells of a simplex or tensor-product mesh.
+
+    Cells are sorted into a uniform grid of buckets by their bounding boxes.
+    A point is tested against the cells in its bucket only, and the tests are
+    vectorized over all (point, candidate) pairs. When a hint cell is given
+    for each point, e.g. the cell of a particle in the last time step, points
+    first walk across faces of simplices towards the target cell, and the
+    remaining points fall back to the buckets.
+
+    Parameters:
+        mesh (Mesh): Simplex or tensor-product mesh with the same topological
+            and geometrical dimensions.
+        bucket_scale (float, optional): Size of buckets relative to the average
+            size of cell bounding boxes. Defaults to 1.0.
+        chunk_size (int, optional): Number of points queried at a time in the
+            buckets, to bound the memory of the candidate pairs. Defaults to 65536.
+        maxit (int, optional): Number of Newton iterations to invert the
+            multilinear map of tensor-product cells. Defaults to 8.
+    """
+    def __init__(self, mesh, *, bucket_scale: float=1.0, chunk_size: int=65536,
+                 maxit: int=8):
+        TD = mesh.top_dimension()
+        GD = mesh.geo_dimension()
+        if TD != GD:
+            raise ValueError("Point location requires the same topological and "
+                             f"geometrical dimensions, but got TD={TD} and GD={GD}.")
+        NVC = mesh.number_of_vertices_of_cells()
+        if NVC == TD + 1:
+            self.is_simplex = True
+        elif NVC == 2**TD and TD in _TENSOR_VERTEX_ORDER:
+            self.is_simplex = False
+        else:
+            raise TypeError(f"Unsupported cell type of {type(mesh).__name__} "
+                            "for point location.")
+
+        self.mesh = mesh
+        self.TD = TD
+        self.bucket_scale = bucket_scale
+        self.chunk_size = chunk_size
+        self.maxit = maxit
+        self._cell2cell = None
+        self.update()
+
+    def update(self):
+        """Rebuild the buckets and the cell geometry from the current nodes,
+        e.g. after moving the nodes. The topology is reused."""
+        mesh = self.mesh
+        node = mesh.entity('node')
+        cell = mesh.entity('cell')
+        NC, TD = cell.shape[0], self.TD
+        ikwargs = bm.context(cell)
+        vertex = node[cell] # (NC, NVC, GD)
+
+        lo, hi = bm.min(node, axis=0), bm.max(node, axis=0)
+        self.eps = 1e-10 * float(bm.max(hi - lo))
+        cmin, cmax = vertex[:, 0, :], vertex[:, 0, :]
+        for i in range(1, vertex.shape[1]):
+            cmin = bm.minimum(cmin, vertex[:, i, :])
+            cmax = bm.maximum(cmax, vertex[:, i, :])
+
+        # buckets of the average cell size, at most 4 buckets per cell
+        size = bm.mean(cmax - cmin, axis=0) * self.bucket_scale
+        shape = [max(1, int(v)) for v in bm.to_numpy(bm.floor((hi - lo) / size))]
+        total = 1
+        for n in shape:
+            total *= n
+        if total > 4 * NC:
+            factor = (total / (4 * NC)) ** (1. / TD)
+            shape = [max(1, int(n / factor)) for n in shape]
+        stride = [1] * TD
+        for d in range(TD - 2, -1, -1):
+            stride[d] = stride[d + 1] * shape[d + 1]
+        self.lo = lo
+        self.shape = bm.tensor(shape, **ikwargs)
+        self.stride = bm.tensor(stride, **ikwargs)
+        self.h = (hi - lo) / bm.astype(self.shape, lo.dtype)
+        NB = stride[0] * shape[0]
+
+        # NOTE: Cells are only put in buckets overlapping their bounding boxes
+        # with positive measure, and points are put in the bucket by rounding
+        # down. Points on the lower boundary of a bucket but outside of all its
+        # cells are searched again in the buckets below, see `locate`.
+        imin = self._bucket_index(cmin)
+        imax = bm.maximum(self._bucket_index(cmax, upper=True), imin)
+        width = imax - imin + 1
+        counts = bm.prod(width, axis=1)
+        pair_cell = bm.repeat(bm.arange(NC, **ikwargs), counts)
+        k = bm.arange(pair_cell.shape[0], **ikwargs) - (bm.cumsum(counts, axis=0) - counts)[pair_cell]
+        bucket = bm.zeros_like(pair_cell)
+        for d in range(TD - 1, -1, -1):
+            w = width[pair_cell, d]
+            bucket = bucket + (imin[pair_cell, d] + k % w) * stride[d]
+            k = k // w
+
+        order = bm.argsort(bucket, stable=True)
+        self.bucket_cell = pair_cell[order]
+        crow = bm.zeros((NB + 1, ), **ikwargs)
+        crow = bm.index_add(crow, bucket + 1, bm.ones(bucket.shape, **ikwargs))
+        self.bucket_crow = bm.cumsum(crow, axis=0)
+
+        if self.is_simplex:
+            self.origin = vertex[:, 0, :]
+            self.inv_jacobian = _inv(vertex[:, 1:, :] - self.origin[:, None, :])
+        else:
+            vertex = vertex[:, _TENSOR_VERTEX_ORDER[TD], :]
+            self.vertex = vertex.reshape((NC, ) + (2, ) * TD + (vertex.shape[-1], ))
+
+        eye = bm.eye(TD, dtype=lo.dtype, device=bm.get_device(lo))
+        self.shifts = [None, bm.full((TD, ), -self.eps, **bm.context(lo))]
+        self.shifts.extend(-self.eps * eye[d] for d in range(TD) if TD > 1)
+        self.version = mesh.version
+
+    def _bucket_index(self, points: TensorLike, upper: bool=False) -> TensorLike:
+        v = (points - self.lo) / self.h
+        v = bm.ceil(v) - 1 if upper else bm.floor(v)
+        idx = bm.astype(v, self.shape.dtype)
+        return bm.clip(idx, bm.zeros_like(self.shape), self.shape - 1)
+
+    def cell_bc(self, points: TensorLike, cell: TensorLike) -> TensorLike:
+        """Local coordinates of points in the given cells, one cell for each point.
+
+        Parameters:
+            points (Tensor): Points in shape (N, GD).
+            cell (Tensor): Cell indices in shape (N, ).
+
+        Returns:
+            Tensor: Barycentric coordinates in shape (N, TD+1) for simplices, or
+                1D coordinates of each axis in shape (N, TD, 2) for tensor-product
+                cells, in the same convention as `bc_to_point`. Coordinates are NaN
+                where the Newton iterations of tensor-product cells fail.
+        """
+        if self.is_simplex:
+            v = points - self.origin[cell]
+            bc = bm.einsum('pg, pgt -> pt', v, self.inv_jacobian[cell])
+            return bm.concatenate([1. - bm.sum(bc, axis=-1, keepdims=True), bc], axis=-1)
+
+        TD = self.TD
+        vertex = self.vertex[cell]
+        xi = bm.full(points.shape[:1] + (TD, ), 0.5, **bm.context(points))
+        dphi = bm.tensor([-1., 1.], **bm.context(points))
+        dphi = bm.broadcast_to(dphi, points.shape[:1] + (2, ))
+
+        for _ in range(self.maxit):
+            bcs = [bm.stack([1. - xi[:, i], xi[:, i]], axis=-1) for i in range(TD)]
+            res = points - _multilinear(vertex, bcs)
+            J = bm.stack([_multilinear(vertex, bcs[:i] + [dphi] + bcs[i+1:])
+                          for i in range(TD)], axis=-1) # (N, GD, TD)
+            xi = xi + bm.linalg.solve(J, res[..., None])[..., 0]
+
+        # NOTE: the map may not be invertible out of the cell, so coordinates
+        # failing to converge are set to NaN and never taken as inside.
+        bcs = [bm.stack([1. - xi[:, i], xi[:, i]], axis=-1) for i in range(TD)]
+        res = bm.max(bm.abs(points - _multilinear(vertex, bcs)), axis=-1)
+        xi = bm.where((res < 100 * self.eps)[:, None], xi, bm.nan)
+
+        return bm.stack([1. - xi, xi], axis=-1)
+
+    def locate(self, points: TensorLike, hint: Optional[TensorLike]=None, *,
+               tol: float=1e-12, maxstep: int=32) -> Tuple[TensorLike, TensorLike]:
+        """Find the cells containing the points and the local coordinates.
+
+        Parameters:
+            points (Tensor): Points in shape (N, GD).
+            hint (Tensor | None, optional): A cell index near each point, in
+                shape (N, ). Defaults to None.
+            tol (float, optional): Tolerance of the local coordinates for points
+                on the boundary of cells. Defaults to 1e-12.
+            maxstep (int, optional): Maximum number of walking steps from the hint
+                cells of simplices. Defaults to 32.
+
+        Returns:
+            Tuple[Tensor, Tensor]: Cell indices in shape (N, ), where -1 for points
+                outside the mesh, and the local coordinates as in `cell_bc`, zeros
+                for points outside the mesh.
+        """
+        mesh = self.mesh
+        N, TD = points.shape[0], self.TD
+        ikwargs = bm.context(self.bucket_cell)
+        bc_shape = (N, TD + 1) if self.is_simplex else (N, TD, 2)
+        cell = bm.full((N, ), -1, **ikwargs)
+        bc = bm.zeros(bc_shape, dtype=mesh.ftype, device=mesh.device)
+        rest = bm.arange(N, **ikwargs)
+
+        if hint is not None:
+            hint = bm.astype(hint, cell.dtype)
+            cell, bc, rest = self._walk(points, hint, cell, bc, tol, maxstep)
+
+        for start in range(0, rest.shape[0], self.chunk_size):
+            pid = rest[start:start + self.chunk_size]
+            for shift in self.shifts:
+                found, cand, cbc = self._search(points[pid], tol, shift)
+                cell = bm.set_at(cell, pid[found], cand)
+                bc = bm.set_at(bc, pid[found], cbc)
+                flag = bm.set_at(bm.ones(pid.shape, dtype=bm.bool, device=bm.get_device(pid)),
+                                 found, False)
+                pid = pid[flag]
+                if pid.shape[0] == 0:
+                    break
+
+        return cell, bc
+
+    def _walk(self, points, hint, cell, bc, tol, maxstep):
+        if self.is_simplex and self._cell2cell is None:
+            self._cell2cell = self.mesh.cell_to_cell()
+        active = bm.arange(points.shape[0], **bm.context(cell))
+        current = hint
+        nstep = maxstep if self.is_simplex else 1
+        rest = []
+
+        for _ in range(nstep):
+            local = self.cell_bc(points[active], current)
+            inside = _min_coordinate(local) >= -tol
+            cell = bm.set_at(cell, active[inside], current[inside])
+            bc = bm.set_at(bc, active[inside], local[inside])
+            outside = bm.logical_not(inside)
+            active, current, local = active[outside], current[outside], local[outside]
+            if (active.shape[0] == 0) or (not self.is_simplex):
+                break
+            # cross the face opposite to the vertex of the smallest coordinate
+            nxt = self._cell2cell[current, bm.argmin(local, axis=1)]
+            stuck = (nxt == current)
+            rest.append(active[stuck])
+            moving = bm.logical_not(stuck)
+            active, current = active[moving], nxt[moving]
+
+        rest.append(active)
+        return cell, bc, bm.concatenate(rest, axis=0)
+
+    def _search(self, points: TensorLike, tol: float, shift: Optional[TensorLike]=None):
+        ikwargs = bm.context(self.bucket_cell)
+        crow = self.bucket_crow
+        lo, hi = self.lo, self.lo + self.h * bm.astype(self.shape, self.h.dtype)
+        valid = bm.all((points >= lo - self.eps) & (points <= hi + self.eps), axis=1)
+        shifted = points if shift is None else points + shift
+        bucket = bm.sum(self._bucket_index(shifted) * self.stride, axis=1)
+        start = crow[bucket]
+        counts = bm.where(valid, crow[bucket + 1] - start, 0)
+
+        local = bm.repeat(bm.arange(points.shape[0], **ikwargs), counts)
+        offset = (bm.cumsum(counts, axis=0) - counts)[local]
+        cand = self.bucket_cell[start[local] + bm.arange(local.shape[0], **ikwargs) - offset]
+        cbc = self.cell_bc(points[local], cand)
+        inside = _min_coordinate(cbc) >= -tol
+        local, cand, cbc = local[inside], cand[inside], cbc[inside]
+        # NOTE: points on shared boundaries take the first candidate
+        found, first = bm.unique(local, return_index=True)
+        return found, cand[first], cbc[first]
@@ -1,16 +1,53 @@
 
-from typing import Union, Optional, Sequence, Tuple, Any
+from typing import Union, Optional, Sequence, Tuple, Any, Callable
 
 from ..backend import backend_manager as bm
 from ..typing import TensorLike, Index, _S
 from .. import logger
-from ..quadrature import Quadrature
+from ..quadrature import Quadrature, QuadratureCache, quadrature_cache
 from .mesh_data_structure import MeshDS
+from .locator import CellLocator
 from .utils import (
     estr2dim, simplex_gdof, simplex_ldof, tensor_gdof, tensor_ldof
 )
 
 
+##################################################
+### Reference Basis Tabulation
+##################################################
+
+# NOTE: Entries are keyed by the identity of the quadrature points shared
+# by `quadrature_cache`, and keep the points alive so that the ids are not
+# reused by other tensors.
+tabulation_cache = QuadratureCache(maxsize=256)
+
+
+def tabulate_simplex_basis(bcs: TensorLike, p: int, *, grad: bool=False,
+                           mi: Optional[TensorLike]=None) -> TensorLike:
+    """Tabulate the simplex shape functions (or their gradients with respect to
+    the barycentric coordinates) of order `p` on the reference element.
+
+    Results on the tables of `quadrature_cache` with the default multi-index
+    matrix are cached in `tabulation_cache`, and should not be modified in place.
+
+    Parameters:
+        bcs (Tensor): The bc points, in shape (NQ, TD+1).
+        p (int): The order of the shape function.
+        grad (bool, optional): Tabulate the gradients instead. Defaults to False.
+        mi (Tensor, optional): The multi-index matrix. Defaults to None.
+
+    Returns:
+        Tensor: Shaped (NQ, ldof), or (NQ, ldof, TD+1) for the gradients.
+    """
+    func = bm.simplex_grad_shape_function if grad else bm.simplex_shape_function
+
+    if (mi is not None) or (not quadrature_cache.owns(bcs)):
+        return func(bcs, p, mi)
+
+    key = (func.__name__, p, id(bcs), bm.backend_name)
+    return tabulation_cache.get(key, lambda: (bcs, func(bcs, p, mi)))[1]
+
+
 ##################################################
 ### Mesh Base
 ##################################################
@@ -455,6 +492,66 @@ class HomogeneousMesh(Mesh):
             e = bm.power(bm.sum(e, axis=tuple(range(1, len(e.shape)))), 1/power)
         return e # float or (NC, )
 
+    def is_congruent(self, rtol: float=1e-10) -> bool:
+        """Whether every cell is a translate of the first one with the same
+        local order of nodes, so that integrators with cellwise constant
+        coefficients have the same local matrices on all cells up to a factor.
+        The check is not cached, since the nodes may be changed in place.
+
+        Parameters:
+            rtol (float, optional): Tolerance relative to the size of the first
+                cell. Defaults to 1e-10.
+
+        Returns:
+            bool: The result.
+        """
+        node = self.entity('node')
+        cell = self.entity('cell')
+        v = node[cell[:, 1:]] - node[cell[:, 0:1]] # (NC, NVC-1, GD)
+        tol = rtol * bm.max(bm.abs(v[0]))
+        return bool(bm.all(bm.abs(v - v[0:1]) <= tol))
+
+    # point location
+    def cell_locator(self, **kwargs) -> CellLocator:
+        """Return the point locator of this mesh, built on the first call and
+        rebuilt after the entities of the mesh are set again. Keyword arguments
+        are passed to `CellLocator` and force a rebuild.
+
+        Call `update()` of the locator after moving nodes in place.
+        """
+        locator = getattr(self, '_locator', None)
+        if (locator is None) or (locator.version != self.version) or kwargs:
+            locator = CellLocator(self, **kwargs)
+            self._locator = locator
+        return locator
+
+    def location(self, points: TensorLike, hint: Optional[TensorLike]=None) -> TensorLike:
+        """Find the cells containing the points.
+
+        Parameters:
+            points (Tensor): Points in shape (N, GD).
+            hint (Tensor | None, optional): A cell index near each point, e.g.
+                the cells found in the last call for moving points. Defaults to None.
+
+        Returns:
+            Tensor: Cell indices in shape (N, ), where -1 for points outside the mesh.
+        """
+        return self.cell_locator().locate(points, hint)[0]
+
+    def point_to_bc(self, points: TensorLike, hint: Optional[TensorLike]=None):
+        """Find the cells containing the points and the local coordinates.
+
+        Parameters:
+            points (Tensor): Points in shape (N, GD).
+            hint (Tensor | None, optional): A cell index near each point. Defaults to None.
+
+        Returns:
+            Tuple[Tensor, Tensor]: Cell indices in shape (N, ), and the barycentric
+                coordinates in shape (N, TD+1) for simplex meshes, or the coordinates
+                of each axis in shape (N, TD, 2) for tensor-product meshes.
+        """
+        return self.cell_locator().locate(points, hint)
+
 
 class SimplexMesh(HomogeneousMesh):
     # ipoints
@@ -473,10 +570,7 @@ class SimplexMesh(HomogeneousMesh):
 
     def shape_function(self, bcs: TensorLike, p: int=1, *, index: Index=_S,
                        mi: Optional[TensorLike]=None) -> TensorLike:
-        TD = bcs.shape[-1] - 1
-        if mi is None:
-            mi = bm.multi_index_matrix(p, TD, dtype=self.itype)
-        phi = bm.simplex_shape_function(bcs, p, mi)
+        phi = tabulate_simplex_basis(bcs, p, mi=mi)
         return phi
     
     face_shape_function = shape_function
@@ -484,10 +578,7 @@ class SimplexMesh(HomogeneousMesh):
 
     def grad_shape_function(self, bcs: TensorLike, p: int=1, *, index: Index=_S,
                             variables: str='u', mi: Optional[TensorLike]=None) -> TensorLike:
-        TD = bcs.shape[-1] - 1
-        if mi is None:
-            mi = bm.multi_index_matrix(p, TD, dtype=self.itype)
-        R = bm.simplex_grad_shape_function(bcs, p, mi) # (NQ, ldof, bc)
+        R = tabulate_simplex_basis(bcs, p, grad=True, mi=mi) # (NQ, ldof, bc)
         if variables == 'u':
             return R
         elif variables == 'x':
@@ -660,7 +751,20 @@ class StructuredMesh(HomogeneousMesh):
     # shape function
     def grad_lambda(self, index: Index=_S) -> TensorLike:
         raise NotImplementedError
-    
+
+    def is_congruent(self, rtol: float=1e-10) -> bool:
+        return True
+
+    def _topology(self, name: str, factory: Callable[[], TensorLike]) -> TensorLike:
+        """Topology arrays of structured meshes are built on first use, and
+        kept until the mesh version changes."""
+        cache = self.__dict__.setdefault('_topology_cache', {})
+        version, value = cache.get(name, (None, None))
+        if version != self.version:
+            value = factory()
+            cache[name] = (self.version, value)
+        return value
+
     @property
     def device(self) -> Any:
         return self._device
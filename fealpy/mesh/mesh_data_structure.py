@@ -23,6 +23,7 @@ class MeshDS(metaclass=MeshMeta):
     localEdge: TensorLike # only for homogeneous mesh
     localFace: TensorLike # only for homogeneous mesh
     localFace2Edge: TensorLike
+    _version: int = 0
 
     def __init__(self, *, TD: int, itype, ftype) -> None:
         assert hasattr(self, '_entity_dim_method_name_map')
@@ -50,18 +51,32 @@ class MeshDS(metaclass=MeshMeta):
                 raise RuntimeError('please call super().__init__() before setting attributes.')
             etype_dim = estr2dim(self, name)
             self._entity_storage[etype_dim] = value
+            self._touch()
         else:
             super().__setattr__(name, value)
 
     def __delattr__(self, name: str) -> None:
         if name in self._STORAGE_ATTR:
             del self._entity_storage[estr2dim(self, name)]
+            self._touch()
         else:
             super().__delattr__(name)
 
+    def _touch(self) -> None:
+        object.__setattr__(self, '_version', self._version + 1)
+
+    @property
+    def version(self) -> int:
+        """Counter increased whenever entities are set or removed, e.g. in
+        refinement. Caches depending on the mesh compare it to invalidate.
+        In-place changes of entity tensors are not counted, so assign them
+        back to the mesh, e.g. `mesh.node = node`."""
+        return self._version
+
     def clear(self) -> None:
         """Remove all entities from the storage."""
         self._entity_storage.clear()
+        self._touch()
 
     ### properties
     def top_dimension(self) -> int: return self.TD
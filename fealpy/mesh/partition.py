@@ -0,0 +1,234 @@
+"""Partitioning of mesh cells, without external libraries.
+
+Cells are split by recursive coordinate (or inertial) bisection of their
+barycenters, and the cut of the dual graph, in which cells are connected
+through their faces, is then reduced by a greedy refinement pass. Work on
+the integer graph is done in NumPy, and the results are tensors of the
+current backend.
+"""
+from typing import Optional, Tuple
+
+import numpy as np
+
+from ..backend import backend_manager as bm
+from ..typing import TensorLike
+
+
+def _to_tensor(array: np.ndarray, like: TensorLike) -> TensorLike:
+    tensor = bm.from_numpy(np.ascontiguousarray(array))
+    tensor = bm.astype(tensor, like.dtype)
+    return bm.device_put(tensor, bm.get_device(like))
+
+
+class MeshPartition():
+    """Partition of the cells of a mesh, with the interfaces, ghost cells and
+    local numbering of each part.
+
+    Parameters:
+        mesh (Mesh): The mesh.
+        part (Tensor): Part ids of the cells, shaped (NC, ).
+        nparts (int | None, optional): Number of parts. Defaults to `max(part) + 1`.
+
+    Attributes:
+        part (Tensor): Part ids of the cells, shaped (NC, ).
+        nparts (int): Number of parts.
+    """
+    def __init__(self, mesh, part: TensorLike, nparts: Optional[int]=None):
+        self.mesh = mesh
+        self.part = part
+        self._part = bm.to_numpy(part).astype(np.int64)
+        self.nparts = int(self._part.max()) + 1 if nparts is None else nparts
+        if self._part.shape[0] != mesh.number_of_cells():
+            raise ValueError(f"Expected {mesh.number_of_cells()} part ids, "
+                             f"but got {self._part.shape[0]}.")
+
+        self._cell = bm.to_numpy(mesh.entity('cell')).astype(np.int64)
+        face2cell = bm.to_numpy(mesh.face_to_cell()).astype(np.int64)
+        self._face2cell = face2cell[face2cell[:, 0] != face2cell[:, 1], :2]
+        self._order = np.argsort(self._part, kind='stable')
+        self._offsets = np.zeros(self.nparts + 1, dtype=np.int64)
+        self._offsets[1:] = np.cumsum(np.bincount(self._part, minlength=self.nparts))
+
+    def number_of_cells(self) -> TensorLike:
+        """Number of cells in each part, shaped (nparts, )."""
+        return _to_tensor(np.diff(self._offsets), self.part)
+
+    def edge_cut(self) -> int:
+        """Number of faces between cells of different parts."""
+        p = self._part[self._face2cell]
+        return int(np.count_nonzero(p[:, 0] != p[:, 1]))
+
+    def cells(self, k: int) -> TensorLike:
+        """Global indices of the cells of part `k`, in increasing order, which
+        is also the local numbering of the cells."""
+        return _to_tensor(self._order[self._offsets[k]:self._offsets[k+1]], self.part)
+
+    def nodes(self, k: int) -> TensorLike:
+        """Global indices of the nodes of part `k`, in increasing order, which
+        is also the local numbering of the nodes."""
+        return _to_tensor(self._nodes(k), self.part)
+
+    def local_cells(self, k: int) -> TensorLike:
+        """Cells of part `k` in the local numbering of nodes, shaped (NC_k, NVC)."""
+        nodes = self._nodes(k)
+        cell = self._cell[self._order[self._offsets[k]:self._offsets[k+1]]]
+        return _to_tensor(np.searchsorted(nodes, cell), self.part)
+
+    def ghost_cells(self, k: int) -> TensorLike:
+        """Cells of other parts sharing a face with part `k`."""
+        f2c = self._face2cell
+        p = self._part[f2c]
+        ghost = np.concatenate([f2c[(p[:, 0] == k) & (p[:, 1] != k), 1],
+                                f2c[(p[:, 1] == k) & (p[:, 0] != k), 0]])
+        return _to_tensor(np.unique(ghost), self.part)
+
+    def interface_faces(self) -> TensorLike:
+        """Global indices of the faces between cells of different parts."""
+        face2cell = bm.to_numpy(self.mesh.face_to_cell())
+        p = self._part[face2cell[:, :2]]
+        return _to_tensor(np.nonzero(p[:, 0] != p[:, 1])[0], self.part)
+
+    def interface_nodes(self, k: Optional[int]=None) -> TensorLike:
+        """Nodes shared by more than one part, or by part `k` and other parts
+        if `k` is given."""
+        NN = self.mesh.number_of_nodes()
+        NVC = self._cell.shape[1]
+        node = self._cell.reshape(-1)
+        part = np.repeat(self._part, NVC)
+        pmin = np.full(NN, self.nparts, dtype=np.int64)
+        pmax = np.full(NN, -1, dtype=np.int64)
+        np.minimum.at(pmin, node, part)
+        np.maximum.at(pmax, node, part)
+        flag = pmin != pmax
+        if k is not None:
+            touched = np.zeros(NN, dtype=np.bool_)
+            touched[self._nodes(k)] = True
+            flag &= touched
+        return _to_tensor(np.nonzero(flag)[0], self.part)
+
+    def reorder(self) -> Tuple['MeshPartition', TensorLike, TensorLike]:
+        """Build a mesh with the cells numbered part by part, so that each part
+        is a contiguous range of cells. Nodes are numbered by the first part
+        using them. Data in `nodedata` and `celldata` are permuted as well.
+
+        Returns:
+            Tuple[MeshPartition, Tensor, Tensor]: The partition of the new mesh,
+                and the old indices of the new cells and of the new nodes.
+        """
+        mesh = self.mesh
+        NN = mesh.number_of_nodes()
+        NVC = self._cell.shape[1]
+        cperm = self._order
+        owner = np.full(NN, self.nparts, dtype=np.int64)
+        np.minimum.at(owner, self._cell.reshape(-1), np.repeat(self._part, NVC))
+        nperm = np.argsort(owner, kind='stable')
+        inverse = np.empty_like(nperm)
+        inverse[nperm] = np.arange(NN)
+
+        node = mesh.entity('node')
+        cell = mesh.entity('cell')
+        cperm_t, nperm_t = _to_tensor(cperm, cell), _to_tensor(nperm, cell)
+        new_cell = _to_tensor(inverse[self._cell[cperm]], cell)
+        new_mesh = type(mesh)(node[nperm_t], new_cell)
+        for name, perm, n in (('nodedata', nperm_t, NN), ('celldata', cperm_t, len(cperm))):
+            for k, v in getattr(mesh, name, {}).items():
+                if bm.is_tensor(v) and v.shape[0] == n:
+                    getattr(new_mesh, name)[k] = v[perm]
+
+        partition = MeshPartition(new_mesh, self.part[cperm_t], self.nparts)
+        return partition, cperm_t, nperm_t
+
+    def _nodes(self, k: int) -> np.ndarray:
+        cell = self._cell[self._order[self._offsets[k]:self._offsets[k+1]]]
+        return np.unique(cell)
+
+
+def _bisect(points: np.ndarray, index: np.ndarray, nparts: int, offset: int,
+            part: np.ndarray, method: str):
+    if nparts == 1:
+        part[index] = offset
+        return
+    p = points[index]
+    if method == 'rcb':
+        axis = np.argmax(p.max(axis=0) - p.min(axis=0))
+        proj = p[:, axis]
+    else:
+        q = p - p.mean(axis=0)
+        _, v = np.linalg.eigh(q.T @ q)
+        proj = q @ v[:, -1]
+    k = nparts // 2
+    n = int(round(index.shape[0] * k / nparts))
+    order = np.argsort(proj, kind='stable')
+    _bisect(points, index[order[:n]], k, offset, part, method)
+    _bisect(points, index[order[n:]], nparts - k, offset + k, part, method)
+
+
+def _refine(part: np.ndarray, cell2cell: np.ndarray, nparts: int, imbalance: float,
+            maxit: int):
+    """Move cells on the interfaces to the neighboring part with the most
+    faces, when it reduces the cut and keeps the balance."""
+    NC = part.shape[0]
+    size = np.bincount(part, minlength=nparts)
+    upper = int(np.ceil((1 + imbalance) * NC / nparts))
+    lower = int(np.floor((1 - imbalance) * NC / nparts))
+    valid = cell2cell >= 0
+
+    for _ in range(maxit):
+        neighbor = np.where(valid, part[np.maximum(cell2cell, 0)], -1)
+        candidate = np.nonzero(np.any(valid & (neighbor != part[:, None]), axis=1))[0]
+        moved = 0
+        for c in candidate:
+            p = part[c]
+            nb = part[cell2cell[c][valid[c]]]
+            count = np.bincount(nb, minlength=nparts)
+            gain = count - count[p]
+            gain[p] = 0
+            q = int(np.argmax(gain))
+            if gain[q] > 0 and size[q] < upper and size[p] > lower:
+                part[c] = q
+                size[q] += 1
+                size[p] -= 1
+                moved += 1
+        if moved == 0:
+            break
+
+
+def partition_mesh(mesh, nparts: int, *, method: str='rcb', refine: bool=True,
+                   imbalance: float=0.03, maxit: int=4) -> MeshPartition:
+    """Partition the cells of a mesh into parts of balanced sizes.
+
+    Parameters:
+        mesh (Mesh): The mesh.
+        nparts (int): Number of parts.
+        method (str, optional): 'rcb' for recursive coordinate bisection along
+            the longest extent, or 'rib' for recursive inertial bisection along
+            the principal axis. Defaults to 'rcb'.
+        refine (bool, optional): Reduce the cut of the dual graph by a greedy
+            refinement pass. Defaults to True.
+        imbalance (float, optional): Allowed relative imbalance of the part
+            sizes in refinement. Defaults to 0.03.
+        maxit (int, optional): Maximum number of refinement sweeps. Defaults to 4.
+
+    Returns:
+        MeshPartition: The partition.
+    """
+    if method not in ('rcb', 'rib'):
+        raise ValueError(f"Unknown method: {method}, expected 'rcb' or 'rib'.")
+    NC = mesh.number_of_cells()
+    if not (0 < nparts <= NC):
+        raise ValueError(f"The number of parts must be in [1, {NC}], but got {nparts}.")
+
+    points = bm.to_numpy(mesh.entity_barycenter('cell')).astype(np.float64)
+    points = points.reshape(NC, -1)
+    part = np.zeros(NC, dtype=np.int64)
+    _bisect(points, np.arange(NC), nparts, 0, part, method)
+
+    if refine and nparts > 1:
+        face2cell = bm.to_numpy(mesh.face_to_cell()).astype(np.int64)
+        face2cell = face2cell[face2cell[:, 0] != face2cell[:, 1]]
+        cell2cell = np.full((NC, mesh.number_of_faces_of_cells()), -1, dtype=np.int64)
+        cell2cell[face2cell[:, 0], face2cell[:, 2]] = face2cell[:, 1]
+        cell2cell[face2cell[:, 1], face2cell[:, 3]] = face2cell[:, 0]
+        _refine(part, cell2cell, nparts, imbalance, maxit)
+
+    return MeshPartition(mesh, _to_tensor(part, mesh.entity('cell')), nparts)
@@ -1,17 +1,29 @@
 from typing import Union, Optional, List, Tuple, Any, Callable
+from functools import lru_cache
 
 from ..backend import backend_manager as bm
 from ..typing import TensorLike, Index, _S
 from .. import logger
-from .utils import estr2dim
+from .utils import estr2dim, barycenter_prolongation
 
 from .mesh_base import TensorMesh
 from .plot import Plotable
+from .refine_topology import RefineTopology
 
 from scipy.sparse import coo_matrix, csc_matrix, csr_matrix
 from scipy.sparse import spdiags, eye, tril, triu, bmat
 
 
+@lru_cache(maxsize=None)
+def _red_refinement() -> RefineTopology:
+    """Children of `uniform_refine`, with the vertices 0-3, the edge midpoints
+    4-7 and the center 8 of the parent cell."""
+    localEdge = [(0, 1), (1, 2), (2, 3), (3, 0)]
+    points = [(0, ), (1, ), (2, ), (3, )] + localEdge + [(0, 1, 2, 3)]
+    children = [(0, 4, 8, 7), (4, 1, 5, 8), (8, 5, 2, 6), (7, 8, 6, 3)]
+    return RefineTopology(localEdge, localEdge, points, children, interleave=True)
+
+
 class QuadrangleMesh(TensorMesh, Plotable):
     def __init__(self, node, cell):
         """
@@ -340,7 +352,8 @@ class QuadrangleMesh(TensorMesh, Plotable):
         # cell = cell[bm.arange(NC).reshape(-1, 1), self.localCell[idx]]
         # self.ds.reinit(NN, cell)
 
-    def uniform_refine(self, n=1, surface=None, interface=None, returnim=False) -> 'QuadrangleMesh':
+    def uniform_refine(self, n=1, surface=None, interface=None, returnim=False,
+                       *, incremental: bool=False, imformat: str='scipy') -> 'QuadrangleMesh':
         """
         Uniform refine the triangle mesh n times.
 
@@ -348,7 +361,18 @@ class QuadrangleMesh(TensorMesh, Plotable):
             n (int): times refine the triangle mesh.
             surface (function): the surface function.
             returnim (bool): return the interpolation matrix or not.
-        """
+            incremental (bool, optional): derive the edges and the cell-edge relationships
+                of children from the parent mesh, instead of constructing them by sorting
+                all faces. The numbering of edges differs from `construct()`. Defaults to False.
+            imformat (str, optional): format of the interpolation matrices, 'scipy' for
+                scipy csr matrices or 'csr' for CSRTensor. Defaults to 'scipy'.
+
+        Returns:
+            List: The interpolation matrices from the coarse to the fine mesh of each level,
+                shaped (NN_fine, NN_coarse), if `returnim` is True.
+        """
+        if imformat not in {'scipy', 'csr'}:
+            raise ValueError(f"Unsupported imformat '{imformat}'.")
         if returnim is True:
             IM = []
         for i in range(n):
@@ -357,7 +381,9 @@ class QuadrangleMesh(TensorMesh, Plotable):
             NC = self.number_of_cells()
             edge2node = self.edge_to_node()
             cell2node = self.cell_to_node()
-            if returnim is True:
+            if (returnim is True) and (imformat == 'csr'):
+                IM.append(barycenter_prolongation(NN, edge2node, cell2node, dtype=self.ftype))
+            elif returnim is True:
                 nonzeros = NN + 2 * NE + 4 * NC
                 num_new_node = NN + NE + NC
 
@@ -423,10 +449,18 @@ class QuadrangleMesh(TensorMesh, Plotable):
             # else:
             #     raise ValueError("Unsupported backend")
 
+            if incremental:
+                topology = _red_refinement()(self, cell)
+
             self.node = bm.concatenate([self.node, edgeCenter, cellCenter], axis=0)
             self.cell = cell
 
-            self.construct()
+            if incremental:
+                self.edge, self.cell2edge, self.edge2cell = topology
+                self.cell2face = self.cell2edge
+                self.face2cell = self.edge2cell
+            else:
+                self.construct()
         if returnim is True:
             return IM
 
@@ -440,8 +474,6 @@ class QuadrangleMesh(TensorMesh, Plotable):
 
     def to_vtk(self, fname=None, etype='cell', index: Index = _S):
 
-        from fealpy.mesh.vtk_extent import write_to_vtu
-
         node = self.entity('node')
         GD = self.GD
         if GD == 2:
@@ -459,6 +491,7 @@ class QuadrangleMesh(TensorMesh, Plotable):
             return node, cell.flatten(), cellType, NC
         else:
             print("Writting to vtk...")
+            from fealpy.mesh.vtk_extent import write_to_vtu
             write_to_vtu(fname, node, NC, cellType, cell.flatten(),
                          nodedata=self.nodedata,
                          celldata=self.celldata)
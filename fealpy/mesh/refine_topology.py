@@ -0,0 +1,254 @@
+from itertools import permutations
+from typing import Sequence, Optional, Tuple
+
+from ..backend import backend_manager as bm
+from ..typing import TensorLike
+
+
+_EDGE, _FACE, _CELL = 0, 1, 2
+
+
+def _position_code(local: TensorLike, glob: TensorLike) -> TensorLike:
+    """Code of the positions of the local vertices of entities in the global
+    ones, sum_i pos[i] n^i, where both are shaped (NC, K, n)."""
+    n = local.shape[-1]
+    code = 0
+    for i in range(n):
+        for k in range(1, n):
+            code = code + (k * n**i) * (local[..., i] == glob[..., k])
+    return code
+
+class RefineTopology():
+    """Topology of a refined mesh derived from the parent mesh, without sorting
+    the faces and edges of the children as `construct()` does.
+
+    The refinement is described on the reference cell by `points`, the vertex
+    sets of the points of the children, i.e. {i} for the vertex i, the local
+    edge for the midpoint of an edge, the local face for the center of a face
+    and all vertices for the center of the cell; and by `children`, the indices
+    of the points of each child. A child entity lies on a parent edge or face if
+    all of its points do, and is numbered by the parent entity and its position
+    on it, which is found from how the parent entity is seen from the cell, so
+    neighbouring cells get the same number. The other child entities are
+    interior to the parent cell. The parts of edges are numbered first, as
+    idx*NE + e for the idx-th part of edge e (3D only), followed by the parts of
+    faces, idx*NF + f, and the interior entities, t*NC + c for the t-th one in
+    cell c.
+
+    Parameters:
+        localEdge (Sequence): Local edges of the cell.
+        localFace (Sequence): Local faces of the cell, the same as the local edges
+            in 2D.
+        points (Sequence): Vertex sets of the points of the refined cell.
+        children (Sequence): Points of the children, shaped (NQ, NVC), or
+            (NT, NQ, NVC) for cells refined in NT different ways.
+        interleave (bool, optional): Whether the child q of cell c is numbered
+            c*NQ + q instead of q*NC + c. Defaults to False.
+    """
+    def __init__(self, localEdge: Sequence, localFace: Sequence, points: Sequence,
+                 children: Sequence, *, interleave: bool=False):
+        self.localEdge = [tuple(e) for e in localEdge]
+        self.localFace = [tuple(f) for f in localFace]
+        self.TD = 2 if len(self.localFace[0]) == 2 else 3
+        self.interleave = interleave
+        if isinstance(children[0][0], int):
+            children = [children]
+        self.children = [[tuple(c) for c in child] for child in children]
+        self.NQ = len(self.children[0])
+        points = [frozenset(p) for p in points]
+
+        self.face_tables = self._tables(self.localFace, points, (_FACE, ))
+        if self.TD == 3:
+            self.edge_tables = self._tables(self.localEdge, points, (_EDGE, _FACE))
+
+    def _tables(self, local, points, supports):
+        """Static tables of the child entities, indexed by [variant, child, local entity]."""
+        parents = {_EDGE: self.localEdge, _FACE: self.localFace}
+        entries = []
+        reps = {_EDGE: set(), _FACE: set()}
+        count = None
+
+        for child in self.children:
+            keys = []
+            rows = []
+            for c in child:
+                row = []
+                for l in local:
+                    P = [points[c[i]] for i in l]
+                    U = frozenset().union(*P)
+                    for kind in supports:
+                        k = next((k for k, L in enumerate(parents[kind]) if U <= set(L)), None)
+                        if k is not None:
+                            L = parents[kind][k]
+                            rep = frozenset(frozenset(L.index(a) for a in p) for p in P)
+                            reps[kind].add(rep)
+                            row.append((kind, k, rep))
+                            break
+                    else:
+                        key = frozenset(P)
+                        if key not in keys:
+                            keys.append(key)
+                            row.append((_CELL, len(keys) - 1, True))
+                        else:
+                            row.append((_CELL, keys.index(key), False))
+                rows.append(row)
+            if count not in (None, len(keys)):
+                raise ValueError("Different numbers of interior entities in the variants.")
+            count = len(keys)
+            entries.append(rows)
+
+        order = lambda r: sorted(sorted(s) for s in r)
+        index = {kind: {r: i for i, r in enumerate(sorted(reps[kind], key=order))}
+                 for kind in reps}
+        nf = len(self.localFace[0])
+
+        def table(kind, k, rep, n):
+            out = [-1] * n**n
+            if rep is None:
+                return out
+            for pos in permutations(range(n)):
+                mapped = frozenset(frozenset(pos[i] for i in s) for s in rep)
+                out[sum(pos[i] * n**i for i in range(n))] = index[kind].get(mapped, -1)
+            return out
+
+        tables = {'kind': [], 'support': [], 'edge': [], 'face': [], 'left': []}
+        for rows in entries:
+            for name in tables:
+                tables[name].append([])
+            for row in rows:
+                tables['kind'][-1].append([e[0] for e in row])
+                tables['support'][-1].append([e[1] for e in row])
+                tables['edge'][-1].append(
+                    [table(_EDGE, *e[1:], 2) if e[0] == _EDGE else [-1]*4 for e in row])
+                tables['face'][-1].append(
+                    [table(_FACE, *e[1:], nf) if e[0] == _FACE else [-1]*nf**nf for e in row])
+                tables['left'][-1].append([e[2] if e[0] == _CELL else False for e in row])
+        tables['number'] = (len(reps[_EDGE]), len(reps[_FACE]), count)
+        return tables
+
+    def _numbering(self, tables, variant: Optional[TensorLike], parent: dict):
+        """Numbers of the child entities shaped (NC, NQ, K), the kinds and the
+        local indices of their supports, the supporting parent faces and the
+        number of entities."""
+        kwargs = bm.context(parent['cell2face'])
+        NC, NFC = parent['cell2face'].shape
+        kind = bm.tensor(tables['kind'], **kwargs)
+        _, NQ, K = kind.shape
+        if variant is None: # the tables broadcast over cells
+            variant = bm.zeros((1, ), **kwargs)
+        kind = kind[variant]
+        support = bm.tensor(tables['support'], **kwargs)[variant]
+        cidx = bm.arange(NC, **kwargs)[:, None, None]
+        # NOTE: gathers by flat indices, which are much cheaper than the
+        # broadcasted advanced indexing.
+        entry = (variant[:, None, None]*NQ + bm.arange(NQ, **kwargs)[:, None])*K \
+                + bm.arange(K, **kwargs)
+        me, mf, mc = tables['number']
+
+        NF = parent['face'].shape[0]
+        s = cidx*NFC + bm.where(kind == _FACE, support, 0)
+        f = parent['cell2face'].reshape(-1)[s]
+        code = parent['face_code'].reshape(-1)[s]
+        T = len(tables['face'][0][0][0])
+        idx_f = bm.tensor(tables['face'], **kwargs).reshape(-1)[entry*T + code]
+        number = bm.where(kind == _FACE, idx_f*NF + f, mf*NF + support*NC + cidx)
+
+        NE = 0
+        if me > 0:
+            NE = parent['edge'].shape[0]
+            NEC = parent['cell2edge'].shape[1]
+            s = cidx*NEC + bm.where(kind == _EDGE, support, 0)
+            e = parent['cell2edge'].reshape(-1)[s]
+            code = parent['edge_code'].reshape(-1)[s]
+            idx_e = bm.tensor(tables['edge'], **kwargs).reshape(-1)[entry*4 + code]
+            number = bm.where(kind == _EDGE, idx_e*NE + e, number + me*NE)
+
+        return number, kind, support, f, me*NE + mf*NF + mc*NC
+
+    def _by_child(self, number: TensorLike) -> TensorLike:
+        """Reshape (NC, NQ, K) to (NC*NQ, K) in the order of the children."""
+        if not self.interleave:
+            number = bm.swapaxes(number, 0, 1)
+        return number.reshape(-1, number.shape[-1])
+
+    def __call__(self, mesh, cell: TensorLike, variant: Optional[TensorLike]=None) -> Tuple[TensorLike, ...]:
+        """Derive the topology of the refined mesh.
+
+        Parameters:
+            mesh (Mesh): The parent mesh, before its cells are replaced.
+            cell (Tensor): Cells of the refined mesh.
+            variant (Tensor | None, optional): Index of the way each cell is
+                refined, shaped (NC, ). Defaults to None.
+
+        Returns:
+            Tuple[Tensor, ...]: face, cell2face and face2cell of the refined mesh,
+                followed by edge and cell2edge in 3D.
+        """
+        pcell = mesh.entity('cell')
+        NC = pcell.shape[0]
+        NQ = self.NQ
+        kwargs = bm.context(pcell)
+        if variant is not None:
+            variant = bm.astype(variant, pcell.dtype)
+        localFace = bm.tensor(self.localFace, **kwargs)
+
+        parent = {
+            'face': mesh.entity('face'),
+            'cell2face': mesh.cell_to_face(),
+        }
+        parent['face_code'] = _position_code(pcell[:, localFace],
+                                             parent['face'][parent['cell2face']])
+        face2cell = mesh.face_to_cell()
+
+        cidx = bm.arange(NC, **kwargs)
+        qidx = bm.arange(NQ, **kwargs)
+        if self.interleave:
+            child = cidx[:, None] * NQ + qidx[None, :]
+        else:
+            child = qidx[None, :] * NC + cidx[:, None]
+
+        # faces
+        number, kind, support, f, NF = self._numbering(self.face_tables, variant, parent)
+        K = number.shape[-1]
+        c = cidx[:, None, None]
+        inner_left = bm.tensor(self.face_tables['left'], dtype=bm.bool,
+                               device=bm.get_device(pcell))
+        inner_left = inner_left[0][None] if variant is None else inner_left[variant]
+        is_face = (kind == _FACE)
+        side = [(face2cell[:, k][f] == c) & (face2cell[:, k+2][f] == support) for k in (0, 1)]
+        left = bm.where(is_face, side[0], inner_left)
+        right = bm.where(is_face, side[1], ~inner_left)
+
+        # NOTE: entities not on the given side are scattered to a dummy slot NF,
+        # which is cheaper than compressing by the masks.
+        local = bm.broadcast_to(bm.arange(K, **kwargs), number.shape)
+        child3 = bm.broadcast_to(child[..., None], number.shape)
+        slots = [bm.where(left, number, NF).reshape(-1), bm.where(right, number, NF).reshape(-1)]
+        columns = []
+        for value in (child3, local):
+            for slot in slots:
+                col = bm.set_at(bm.zeros((NF + 1, ), **kwargs), slot, value.reshape(-1))
+                columns.append(col[:NF])
+        new_face2cell = bm.stack(columns, axis=1)
+
+        cface = cell[child][..., localFace]
+        new_face = bm.zeros((NF + 1, cface.shape[-1]), **bm.context(cell))
+        new_face = bm.set_at(new_face, slots[0], cface.reshape(-1, cface.shape[-1]))[:NF]
+        new_cell2face = self._by_child(number)
+
+        if self.TD == 2:
+            return new_face, new_cell2face, new_face2cell
+
+        # edges
+        localEdge = bm.tensor(self.localEdge, **kwargs)
+        parent['edge'] = mesh.entity('edge')
+        parent['cell2edge'] = mesh.cell_to_edge()
+        parent['edge_code'] = _position_code(pcell[:, localEdge],
+                                             parent['edge'][parent['cell2edge']])
+        number, _, _, _, NE = self._numbering(self.edge_tables, variant, parent)
+        cedge = bm.sort(cell[child][..., localEdge], axis=-1)
+        new_edge = bm.zeros((NE, 2), **bm.context(cell))
+        new_edge = bm.set_at(new_edge, number.reshape(-1), cedge.reshape(-1, 2))
+        new_cell2edge = self._by_child(number)
+
+        return new_face, new_cell2face, new_face2cell, new_edge, new_cell2edge
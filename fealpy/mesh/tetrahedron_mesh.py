@@ -1,12 +1,33 @@
 from typing import Union, Optional
+from functools import lru_cache
 from math import sqrt
 from ..backend import backend_manager as bm
 from ..typing import TensorLike, Index, _S
 from .mesh_base import SimplexMesh
 from .plot import Plotable
+from .refine_topology import RefineTopology
+from .utils import barycenter_prolongation
+from ..sparse.csr_tensor import CSRTensor
 from scipy.sparse import coo_matrix, csc_matrix, csr_matrix
 from scipy.sparse import spdiags, eye, tril, triu, bmat
 
+
+@lru_cache(maxsize=None)
+def _red_refinement() -> RefineTopology:
+    """Children of `uniform_refine`, with the vertices 0-3 and the edge midpoints
+    4-9 of the parent cell, in the three ways to split the inner octahedron."""
+    localEdge = [(0, 1), (0, 2), (0, 3), (1, 2), (1, 3), (2, 3)]
+    localFace = [(1, 2, 3), (0, 3, 2), (0, 1, 3), (0, 2, 1)]
+    points = [(i, ) for i in range(4)] + localEdge
+    corner = [(4, 6, 5, 0), (4, 7, 8, 1), (5, 9, 7, 2), (6, 8, 9, 3)]
+    children = []
+    for T in [(1, 3, 4, 2, 5, 0), (0, 2, 5, 3, 4, 1), (0, 4, 5, 1, 3, 2)]:
+        T = [4 + t for t in T]
+        inner = [(T[k], T[(k+1)%4], T[4], T[5]) for k in range(4)]
+        children.append(corner + inner)
+    return RefineTopology(localEdge, localFace, points, children)
+
+
 class TetrahedronMesh(SimplexMesh, Plotable): 
     def __init__(self, node, cell):
         super().__init__(TD=3, itype=cell.dtype, ftype=node.dtype)
@@ -201,14 +222,14 @@ class TetrahedronMesh(SimplexMesh, Plotable):
     def grad_lambda(self, index=_S):
         localFace = self.localFace
         node = self.node
-        cell = self.cell
-        NC = self.number_of_cells() if index == _S else len(index)
+        cell = self.cell[index]
+        NC = cell.shape[0]
         Dlambda = bm.zeros((NC, 4, 3), device=self.device, dtype=self.ftype)
         volume = self.entity_measure('cell', index=index)
         for i in range(4):
             j,k,m = localFace[i]
-            vjk = node[cell[index, k],:] - node[cell[index, j],:]
-            vjm = node[cell[index, m],:] - node[cell[index, j],:]
+            vjk = node[cell[:, k],:] - node[cell[:, j],:]
+            vjm = node[cell[:, m],:] - node[cell[:, j],:]
             Dlambda[:, i, :] = bm.cross(vjm, vjk)/(6*volume.reshape(-1, 1))
         return Dlambda
     
@@ -302,7 +323,7 @@ class TetrahedronMesh(SimplexMesh, Plotable):
             NE = self.number_of_edges()
             edge = self.entity('edge')
             w = bm.zeros((p-1,2), dtype=self.ftype) #TODO: fix it
-            w[:, 0] = bm.arange(p-1, 0, -1)/p
+            w[:, 0] = bm.arange(p-1, 0, -1, dtype=self.ftype)/p
             w[:, 1] = bm.flip(w,axis=0)[:,0]
             ipoints[NN:NN+(p-1)*NE, :] = bm.einsum('ij, kj...->ki...', w, node[edge,:]).reshape(-1, GD)
 
@@ -455,12 +476,24 @@ class TetrahedronMesh(SimplexMesh, Plotable):
 
 
 
-    def uniform_refine(self, n=1, returnim=False):
+    def uniform_refine(self, n=1, returnim=False, *, incremental: bool=False,
+                       imformat: str='scipy'):
         """
         Perform uniform refinement on the tetrahedral mesh.
 
         @param n Number of refinement iterations (default: 1)
+        @param returnim Return the interpolation matrices or not.
+        @param incremental Derive the faces, the edges and their relationships with
+            cells of children from the parent mesh, instead of constructing them by
+            sorting. The numbering of faces and edges differs from `construct()`.
+        @param imformat Format of the interpolation matrices, 'scipy' for scipy csr
+            matrices or 'csr' for CSRTensor (default: 'scipy').
+        @return The interpolation matrices of the nodes, shaped (NN_fine, NN_coarse),
+            and of the cells, shaped (NC_fine, NC_coarse), of each level, if `returnim`
+            is True.
         """
+        if imformat not in {'scipy', 'csr'}:
+            raise ValueError(f"Unsupported imformat '{imformat}'.")
         if returnim:
             nodeIMatrix = []
             cellIMatrix = []
@@ -480,7 +513,14 @@ class TetrahedronMesh(SimplexMesh, Plotable):
 
             self.node = bm.concatenate((node, newNode), axis=0)
 
-            if returnim:
+            if returnim and (imformat == 'csr'):
+                nodeIMatrix.append(barycenter_prolongation(NN, edge, dtype=self.ftype))
+                kwargs = bm.context(cell)
+                cellIMatrix.append(CSRTensor(bm.arange(8*NC + 1, **kwargs),
+                                             bm.concatenate([bm.arange(NC, **kwargs)]*8, axis=0),
+                                             bm.ones((8*NC, ), dtype=self.ftype, device=self.device),
+                                             spshape=(8*NC, NC)))
+            elif returnim:
                 A = coo_matrix((bm.ones(NN), (range(NN), range(NN))), shape=(NN+NE, NN), dtype=self.ftype)
                 A += coo_matrix((0.5*bm.ones(NE), (range(NN, NN+NE), edge[:, 0])), shape=(NN+NE, NN), dtype=self.ftype)
                 A += coo_matrix((0.5*bm.ones(NE), (range(NN, NN+NE), edge[:, 1])), shape=(NN+NE, NN), dtype=self.ftype)
@@ -532,10 +572,21 @@ class TetrahedronMesh(SimplexMesh, Plotable):
             newCell = bm.set_at(newCell , (slice(7*NC , 8*NC),1) , p[bm.arange(NC), T[:, 0]])
             newCell = bm.set_at(newCell , (slice(7*NC , 8*NC),2) , p[bm.arange(NC), T[:, 4]])
             newCell = bm.set_at(newCell , (slice(7*NC , 8*NC),3) , p[bm.arange(NC), T[:, 5]])
+
+            if incremental:
+                topology = _red_refinement()(self, newCell, variant=idx)
+
             self.cell = newCell
-            self.construct()
+            if incremental:
+                self.face, self.cell2face, self.face2cell, self.edge, self.cell2edge = topology
+            else:
+                self.construct()
 
             #self.ds.reinit(NN+NE, newCell)
+
+        if returnim:
+            return nodeIMatrix, cellIMatrix
+
     def circumcenter(self, index=_S, returnradius=False):
         """
         @brief 计算外接圆圆心和半径
@@ -1105,8 +1156,6 @@ class TetrahedronMesh(SimplexMesh, Plotable):
         return mesh
 
     def to_vtk(self, fname=None, etype='cell', index:Index=_S):
-        from .vtk_extent import  write_to_vtu
-
         node = self.entity('node')
         GD = self.geo_dimension()
 
@@ -1131,6 +1180,7 @@ class TetrahedronMesh(SimplexMesh, Plotable):
             return node, cell.flatten(), cellType, NC
         else:
             print("Writting to vtk...")
+            from .vtk_extent import  write_to_vtu
             write_to_vtu(fname, node, NC, cellType, cell.flatten(),
                     nodedata=self.nodedata,
                     celldata=celldata)
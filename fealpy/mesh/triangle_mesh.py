@@ -3,8 +3,8 @@ from ..backend import backend_manager as bm
 from ..typing import TensorLike, Index, _S
 from .. import logger
 
-from .utils import simplex_gdof, simplex_ldof
-from .mesh_base import SimplexMesh, estr2dim
+from .utils import simplex_gdof, simplex_ldof, barycenter_prolongation
+from .mesh_base import SimplexMesh, estr2dim, tabulate_simplex_basis
 from .plot import Plotable
 
 from fealpy.sparse.coo_tensor import COOTensor
@@ -125,7 +125,7 @@ class TriangleMesh(SimplexMesh, Plotable):
         @berif 这里调用的是网格空间基函数的梯度
         """
         TD = bc.shape[1] - 1
-        R = bm.simplex_grad_shape_function(bc, p)
+        R = tabulate_simplex_basis(bc, p, grad=True)
         if variables == 'x':
             Dlambda = self.grad_lambda(index=index, TD=TD)
             gphi = bm.einsum('...ij, kjm -> k...im', R, Dlambda)
@@ -284,7 +284,8 @@ class TriangleMesh(SimplexMesh, Plotable):
         length = bm.sqrt(bm.square(v).sum(axis=1))
         return v/length.reshape(-1, 1)
 
-    def uniform_refine(self, n=1, surface=None, interface=None, returnim=False):
+    def uniform_refine(self, n=1, surface=None, interface=None, returnim=False,
+                       *, incremental: bool=False, imformat: str='scipy'):
         """
         Uniform refine the triangle mesh n times.
 
@@ -292,7 +293,18 @@ class TriangleMesh(SimplexMesh, Plotable):
             n (int): times refine the triangle mesh.
             surface (function): the surface function.
             returnim (bool): return the interpolation  matrix or not.
+            incremental (bool, optional): derive the edges and the cell-edge relationships
+                of children from the parent mesh, instead of constructing them by sorting
+                all faces. The numbering of edges differs from `construct()`. Defaults to False.
+            imformat (str, optional): format of the interpolation matrices, 'scipy' for
+                scipy csr matrices or 'csr' for CSRTensor. Defaults to 'scipy'.
+
+        Returns:
+            List: The interpolation matrices from the coarse to the fine mesh of each level,
+                shaped (NN_fine, NN_coarse), if `returnim` is True.
         """
+        if imformat not in {'scipy', 'csr'}:
+            raise ValueError(f"Unsupported imformat '{imformat}'.")
         if returnim is True:
             IM = []
 
@@ -308,26 +320,103 @@ class TriangleMesh(SimplexMesh, Plotable):
             newNode = (node[edge[:, 0], :] + node[edge[:, 1], :]) / 2.0
 
             if returnim is True:
-                A = coo_matrix(
-                        (bm.ones(NN, dtype=self.ftype), (bm.arange(NN), bm.arange(NN))), 
-                        shape=(NN + NE, NN))
-                A += coo_matrix((0.5 * bm.ones(NE, dtype=self.ftype), (bm.arange(NN, NN + NE), edge[:, 0])), 
-                                shape=(NN + NE, NN))
-                A += coo_matrix((0.5 * bm.ones(NE, dtype=self.ftype), (bm.arange(NN, NN + NE), edge[:, 1])), 
-                                shape=(NN + NE, NN))
-
-                IM.append(A.tocsr())
+                if imformat == 'csr':
+                    IM.append(self._edge_prolongation(NN, edge))
+                else:
+                    A = coo_matrix(
+                            (bm.ones(NN, dtype=self.ftype), (bm.arange(NN), bm.arange(NN))), 
+                            shape=(NN + NE, NN))
+                    A += coo_matrix((0.5 * bm.ones(NE, dtype=self.ftype), (bm.arange(NN, NN + NE), edge[:, 0])), 
+                                    shape=(NN + NE, NN))
+                    A += coo_matrix((0.5 * bm.ones(NE, dtype=self.ftype), (bm.arange(NN, NN + NE), edge[:, 1])), 
+                                    shape=(NN + NE, NN))
+
+                    IM.append(A.tocsr())
+
+            if incremental:
+                topology = self._refine_topology(NN)
 
             self.node = bm.concatenate((node, newNode), axis=0)
             p = bm.concatenate((cell, edge2newNode[cell2edge]), axis=1)
             self.cell = bm.concatenate(
                     (p[:,[0,5,4]], p[:,[5,1,3]], p[:,[4,3,2]], p[:,[3,4,5]]),
                     axis=0)
-            self.construct()
+
+            if incremental:
+                self.edge, self.cell2edge, self.edge2cell = topology
+                self.cell2face = self.cell2edge
+                self.face2cell = self.edge2cell
+            else:
+                self.construct()
 
         if returnim is True:
             return IM
 
+    def _edge_prolongation(self, NN: int, edge: TensorLike) -> CSRTensor:
+        """Linear interpolation from nodes to nodes and edge midpoints, as a CSRTensor
+        shaped (NN + NE, NN)."""
+        return barycenter_prolongation(NN, edge, dtype=self.ftype)
+
+    def _refine_topology(self, NN: int):
+        """Edges, cell2edge and edge2cell of the red refinement, derived from the
+        parent topology without sorting.
+
+        The children of cell c are (v0, m2, m1), (m2, v1, m0), (m1, m0, v2) and
+        (m0, m1, m2), numbered c, c + NC, c + 2NC and c + 3NC, where m_i is the
+        midpoint of the i-th local edge. Edge e = (a, b) is split into e = (a, m)
+        and e + NE = (m, b), and the interior edge opposite to m_k is numbered
+        2NE + k*NC + c, oriented as in the k-th corner child.
+        """
+        edge = self.entity('edge')
+        cell = self.entity('cell')
+        cell2edge = self.cell2edge
+        edge2cell = self.edge2cell
+        NE = edge.shape[0]
+        NC = cell.shape[0]
+        kwargs = bm.context(cell)
+        cidx = bm.arange(NC, **kwargs)
+        eidx = bm.arange(NE, **kwargs)
+        mid = NN + cell2edge # (NC, 3)
+
+        # edges
+        half0 = bm.stack([edge[:, 0], NN + eidx], axis=1)
+        half1 = bm.stack([NN + eidx, edge[:, 1]], axis=1)
+        inner = bm.concatenate([bm.stack([mid[:, (k+2)%3], mid[:, (k+1)%3]], axis=1)
+                                for k in range(3)], axis=0)
+        new_edge = bm.concatenate([half0, half1, inner], axis=0)
+
+        # cell2edge: in the k-th corner child, the k-th local edge is interior and
+        # the others are the halves of the parent edges containing the vertex k.
+        corner = []
+        for k in range(3):
+            c2e = [None, None, None]
+            c2e[k] = 2*NE + k*NC + cidx
+            for j in ((k+1)%3, (k+2)%3):
+                e = cell2edge[:, j]
+                c2e[j] = bm.where(edge[e, 0] == cell[:, k], e, NE + e)
+            corner.append(bm.stack(c2e, axis=1))
+        center = bm.stack([2*NE + k*NC + cidx for k in range(3)], axis=1)
+        new_cell2edge = bm.concatenate(corner + [center], axis=0)
+
+        # edge2cell
+        c0, c1, l0, l1 = edge2cell[:, 0], edge2cell[:, 1], edge2cell[:, 2], edge2cell[:, 3]
+        is_bd = (c0 == c1)
+        left0, left1 = c0 + ((l0+1)%3)*NC, c0 + ((l0+2)%3)*NC
+        right0 = bm.where(is_bd, left0, c1 + ((l1+2)%3)*NC)
+        right1 = bm.where(is_bd, left1, c1 + ((l1+1)%3)*NC)
+        inner2cell = bm.concatenate([
+            bm.stack([k*NC + cidx, 3*NC + cidx, bm.full((NC, ), k, **kwargs),
+                      bm.full((NC, ), k, **kwargs)], axis=1) for k in range(3)
+        ], axis=0)
+        new_edge2cell = bm.concatenate([
+            bm.stack([left0, right0, l0, l1], axis=1),
+            bm.stack([left1, right1, l0, l1], axis=1),
+            inner2cell
+        ], axis=0)
+
+        return (bm.astype(new_edge, self.itype), bm.astype(new_cell2edge, self.itype),
+                bm.astype(new_edge2cell, self.itype))
+
     def is_crossed_cell(self, point, segment):
         """
         @berif 给定一组线段，找到这些线段的一个邻域单元集合, 且这些单元要满足一定的连通
@@ -335,18 +424,6 @@ class TriangleMesh(SimplexMesh, Plotable):
         """
         pass
     
-    def location(self, points):
-        """
-        @breif  给定一组点 p , 找到这些点所在的单元
-
-        这里假设：
-
-        1. 所有点在网格内部，
-        2. 网格中没有洞
-        3. 区域还要是凸的
-        """
-        pass
-
     def circumcenter(self, index: Index=_S, returnradius=False):
         """
         @brief 计算三角形外接圆的圆心和半径
@@ -1049,12 +1126,6 @@ class TriangleMesh(SimplexMesh, Plotable):
 
         return J
 
-    def point_to_bc(self, point):
-        """
-        @brief 找到定点 point 所在的单元，并计算其重心坐标 
-        """
-        pass
-
     def mark_interface_cell(self, phi):
         """
         @brief 标记穿过界面的单元
@@ -1394,8 +1465,6 @@ class TriangleMesh(SimplexMesh, Plotable):
         """
         @brief 把网格转化为 vtk 的数据格式
         """
-        from .vtk_extent import  write_to_vtu
-
         node = self.entity('node')
         GD = self.geo_dimension()
         if GD == 2:
@@ -1413,6 +1482,7 @@ class TriangleMesh(SimplexMesh, Plotable):
             return node, cell.flatten(), cellType, NC
         else:
             print("Writting to vtk...")
+            from .vtk_extent import  write_to_vtu
             write_to_vtu(fname, node, NC, cellType, cell.flatten(),
                          nodedata=self.nodedata,
                          celldata=self.celldata)
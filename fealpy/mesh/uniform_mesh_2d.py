@@ -3,7 +3,7 @@ from ..backend import backend_manager as bm
 from typing import Union, Optional, Callable, Tuple
 from ..typing import TensorLike, Index, _S, Union, Tuple
 
-from .utils import entitymethod, estr2dim
+from .utils import entitymethod, estr2dim, grid_boundary_flag
 
 from .mesh_base import StructuredMesh, TensorMesh
 from .plot import Plotable
@@ -116,16 +116,9 @@ class UniformMesh2d(StructuredMesh, TensorMesh, Plotable):
         # Whether to flip
         self.flip_direction = flip_direction
 
-        # Initialize edge adjustment mask
-        self.adjusted_edge_mask = self.get_adjusted_edge_mask()
-
         # Specify the counterclockwise drawing
         self.ccw = bm.array([0, 2, 3, 1], dtype=self.itype, device=self.device)
 
-        self.edge2cell = self.edge_to_cell()
-        self.face2cell = self.edge2cell
-        self.cell2edge = self.cell_to_edge()
-
         self.localEdge = bm.array([(0, 2), (1, 3), 
                                    (0, 1), (2, 3)], dtype=self.itype, device=self.device)   
 
@@ -209,6 +202,22 @@ class UniformMesh2d(StructuredMesh, TensorMesh, Plotable):
         return cell
     
     # 实体拓扑
+    # NOTE: The topology arrays are built on first use, so that stencil and
+    # finite difference users never pay for them.
+    @property
+    def edge2cell(self) -> TensorLike:
+        return self._topology('edge2cell', self.edge_to_cell)
+
+    face2cell = edge2cell
+
+    @property
+    def cell2edge(self) -> TensorLike:
+        return self._topology('cell2edge', self.cell_to_edge)
+
+    @property
+    def adjusted_edge_mask(self) -> TensorLike:
+        return self._topology('adjusted_edge_mask', self.get_adjusted_edge_mask)
+
     def number_of_nodes_of_cells(self):
         return 4
 
@@ -311,40 +320,46 @@ class UniformMesh2d(StructuredMesh, TensorMesh, Plotable):
 
         return cell2edge[index]
         
+    def cell_to_cell(self, index: Index=_S) -> TensorLike:
+        """
+        @brief Neighbors of the cells across the bottom, top, left and right
+        edges, and the cell itself on the boundary
+        """
+        nx, ny = self.nx, self.ny
+        c = bm.arange(self.NC, dtype=self.itype, device=self.device)[index]
+        i, j = c // ny, c % ny
+        cell2cell = bm.stack([bm.where(j > 0, c - 1, c),
+                              bm.where(j < ny - 1, c + 1, c),
+                              bm.where(i > 0, c - ny, c),
+                              bm.where(i < nx - 1, c + ny, c)], axis=-1)
+
+        return cell2cell
+
     def boundary_node_flag(self):
         """
         @brief Determine if a point is a boundary point.
         """
-        NN = self.NN
-        edge = self.edge
-        isBdEdge = self.boundary_edge_flag()
-        isBdPoint = bm.zeros((NN,), dtype=bool)
-        # isBdPoint[edge[isBdEdge, :]] = True
-        isBdPoint = bm.set_at(isBdPoint, edge[isBdEdge, :], True)
-        
-        return isBdPoint
+        nx, ny = self.nx, self.ny
+
+        return grid_boundary_flag((nx + 1, ny + 1), (0, 1), device=self.device)
     
     def boundary_edge_flag(self):
         """
         @brief Determine if an edge is a boundary edge.
         """
-        edge2cell = self.edge_to_cell()
-        isBdEdge = edge2cell[:, 0] == edge2cell[:, 1]
-        return isBdEdge
+        nx, ny = self.nx, self.ny
+        isBdEdge0 = grid_boundary_flag((nx, ny + 1), (1, ), device=self.device)
+        isBdEdge1 = grid_boundary_flag((nx + 1, ny), (0, ), device=self.device)
+
+        return bm.concat([isBdEdge0, isBdEdge1])
     
     def boundary_cell_flag(self):
         """
         @brief Determine if a cell is a boundary cell.
         """
-        NC = self.NC
-
-        edge2cell = self.edge_to_cell()
-        isBdCell = bm.zeros((NC,), dtype=bool)
-        isBdEdge = self.boundary_edge_flag()
-        # isBdCell[edge2cell[isBdEdge, 0]] = True
-        isBdCell = bm.set_at(isBdCell, edge2cell[isBdEdge, 0], True)
+        nx, ny = self.nx, self.ny
 
-        return isBdCell
+        return grid_boundary_flag((nx, ny), (0, 1), device=self.device)
 
     
 #################################### 实体几何 #############################################
@@ -363,7 +378,7 @@ class UniformMesh2d(StructuredMesh, TensorMesh, Plotable):
             return temp2.reshape(-1)
         elif etype == 2:
             temp = bm.tensor(self.h[0] * self.h[1], dtype=self.ftype)
-            return bm.broadcast_to(temp, (NC,))
+            return bm.broadcast_to(temp, (NC,))[index]
         else:
             raise ValueError(f"Unsupported entity or top-dimension: {etype}")
         
@@ -493,7 +508,7 @@ class UniformMesh2d(StructuredMesh, TensorMesh, Plotable):
         edge = self.entity('edge', index=index)
         normals = bm.edge_normal(edge, self.node, unit=unit, out=out)
 
-        adjusted_edge_mask = self.get_adjusted_edge_mask()
+        adjusted_edge_mask = self.adjusted_edge_mask[index]
 
         normals = bm.set_at(normals, (adjusted_edge_mask, slice(None)),
                             -normals[adjusted_edge_mask])
@@ -518,7 +533,7 @@ class UniformMesh2d(StructuredMesh, TensorMesh, Plotable):
         n0 = v[..., 0] // hx
         n1 = v[..., 1] // hy
 
-        return n0.astype('int64'), n1.astype('int64')
+        return bm.astype(n0, bm.int64), bm.astype(n1, bm.int64)
     
     def point_to_bc(self, points):
 
@@ -793,7 +808,7 @@ class UniformMesh2d(StructuredMesh, TensorMesh, Plotable):
         node = self.entity('node')
         cell = self.entity('cell', index=index)
         gphi = self.grad_shape_function(bcs, p=1, variables='u', index=index)
-        J = bm.einsum( 'cim, ...in -> ...cmn', node[cell[:]], gphi)
+        J = bm.einsum( 'cim, qin -> cqmn', node[cell[:]], gphi)
 
         return J
     
@@ -866,10 +881,6 @@ class UniformMesh2d(StructuredMesh, TensorMesh, Plotable):
             self.NF = self.NE
             self.NN = (self.nx + 1) * (self.ny + 1)
 
-            self.edge2cell = self.edge_to_cell()
-            self.cell2edge = self.cell_to_edge()
-            self.face2cell = self.edge2cell
-
         self.clear() 
 
     def to_vtk(self, filename, celldata=None, nodedata=None):
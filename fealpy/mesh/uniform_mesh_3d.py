@@ -1,7 +1,7 @@
 import numpy as np 
 from typing import Union, Optional, Sequence, Tuple, Any
 
-from .utils import entitymethod, estr2dim
+from .utils import entitymethod, estr2dim, grid_boundary_flag
 
 from ..backend import backend_manager as bm 
 from ..typing import TensorLike, Index, _S, Union, Tuple
@@ -143,17 +143,9 @@ class UniformMesh3d(StructuredMesh, TensorMesh, Plotable):
         # Whether to flip
         self.flip_direction = flip_direction
 
-        # Initialize face adjustment mask
-        self.adjusted_face_mask = self.get_adjusted_face_mask()
-
         # Specify the counterclockwise drawing
         self.ccw = bm.array([0, 2, 3, 1], dtype=self.itype)
 
-        self.cell2edge = self.cell_to_edge()
-        self.cell2face = self.cell_to_face()
-        self.face2edge = self.face_to_edge()
-        self.face2cell = self.face_to_cell()
-
         self.localEdge = bm.array([
         (0, 4), (1, 5), (2, 6), (3, 7),
         (0, 2), (1, 3), (4, 6), (5, 7),
@@ -336,6 +328,28 @@ class UniformMesh3d(StructuredMesh, TensorMesh, Plotable):
     
     
     # 实体拓扑
+    # NOTE: The topology arrays are built on first use, so that stencil and
+    # finite difference users never pay for them.
+    @property
+    def cell2edge(self) -> TensorLike:
+        return self._topology('cell2edge', self.cell_to_edge)
+
+    @property
+    def cell2face(self) -> TensorLike:
+        return self._topology('cell2face', self.cell_to_face)
+
+    @property
+    def face2edge(self) -> TensorLike:
+        return self._topology('face2edge', self.face_to_edge)
+
+    @property
+    def face2cell(self) -> TensorLike:
+        return self._topology('face2cell', self.face_to_cell)
+
+    @property
+    def adjusted_face_mask(self) -> TensorLike:
+        return self._topology('adjusted_face_mask', self.get_adjusted_face_mask)
+
     def number_of_nodes_of_cells(self):
         return 8
 
@@ -591,53 +605,62 @@ class UniformMesh3d(StructuredMesh, TensorMesh, Plotable):
 
         return face2cell
         
+    def cell_to_cell(self, index: Index=_S) -> TensorLike:
+        """
+        @brief Neighbors of the cells across the six faces, ordered as the
+        local faces, and the cell itself on the boundary
+        """
+        nx, ny, nz = self.nx, self.ny, self.nz
+        c = bm.arange(self.NC, dtype=self.itype, device=self.device)[index]
+        i, j, k = c // (ny * nz), (c // nz) % ny, c % nz
+        cell2cell = bm.stack([bm.where(i > 0, c - ny * nz, c),
+                              bm.where(i < nx - 1, c + ny * nz, c),
+                              bm.where(j > 0, c - nz, c),
+                              bm.where(j < ny - 1, c + nz, c),
+                              bm.where(k > 0, c - 1, c),
+                              bm.where(k < nz - 1, c + 1, c)], axis=-1)
+
+        return cell2cell
+
     def boundary_node_flag(self):
         """
         @brief Determine if a point is a boundary point.
         """
-        NN = self.NN
-        face = self.face
-        isBdFace = self.boundary_face_flag()
-        isBdPoint = bm.zeros((NN,), dtype=bool)
-        # isBdPoint[face[isBdFace, :]] = True
-        isBdPoint = bm.set_at(isBdPoint, face[isBdFace, :], True)
-        
-        return isBdPoint
+        nx, ny, nz = self.nx, self.ny, self.nz
+
+        return grid_boundary_flag((nx + 1, ny + 1, nz + 1), (0, 1, 2), device=self.device)
         
     def boundary_edge_flag(self):
         """
         @brief Determine if an edge is a boundary edge.
         """
-        NE = self.NE
-        face2edge = self.face_to_edge()
-        isBdFace = self.boundary_face_flag()
-        isBdEdge = bm.zeros((NE,), dtype=bool)
-        # isBdEdge[face2edge[isBdFace, :]] = True
-        isBdEdge = bm.set_at(isBdEdge, face2edge[isBdFace, :], True)
-        
-        return isBdEdge
+        nx, ny, nz = self.nx, self.ny, self.nz
+        device = self.device
+        isBdEdge = [grid_boundary_flag((nx, ny + 1, nz + 1), (1, 2), device=device),
+                    grid_boundary_flag((nx + 1, ny, nz + 1), (0, 2), device=device),
+                    grid_boundary_flag((nx + 1, ny + 1, nz), (0, 1), device=device)]
+
+        return bm.concat(isBdEdge)
         
     def boundary_face_flag(self):
         """
         @brief Determine if a face is a boundary face.
         """
-        face2cell = self.face_to_cell()
+        nx, ny, nz = self.nx, self.ny, self.nz
+        device = self.device
+        isBdFace = [grid_boundary_flag((nx + 1, ny, nz), (0, ), device=device),
+                    grid_boundary_flag((nx, ny + 1, nz), (1, ), device=device),
+                    grid_boundary_flag((nx, ny, nz + 1), (2, ), device=device)]
 
-        return face2cell[:, 0] == face2cell[:, 1]
+        return bm.concat(isBdFace)
 
     def boundary_cell_flag(self):
         """
         @brief Determine if a cell is a boundary cell.
         """
-        NC = self.NC
-
-        face2cell = self.face_to_cell()
-        isBdFace = self.boundary_face_flag()
-        isBdCell = bm.zeros((NC,), dtype=bool)
-        isBdCell = bm.set_at(isBdCell, face2cell[isBdFace, 0], True)
-        # isBdCell[face2cell[isBdFace, 0]] = True
+        nx, ny, nz = self.nx, self.ny, self.nz
 
-        return isBdCell
+        return grid_boundary_flag((nx, ny, nz), (0, 1, 2), device=self.device)
         
 
 #################################### 实体几何 #############################################
@@ -664,7 +687,7 @@ class UniformMesh3d(StructuredMesh, TensorMesh, Plotable):
         elif etype == 3:
             # Measure of cells (volumes)
             temp = bm.tensor(self.h[0] * self.h[1] * self.h[2], dtype=self.ftype)
-            return bm.broadcast_to(temp, (NC,))
+            return bm.broadcast_to(temp, (NC,))[index]
         else:
             raise ValueError(f"Unsupported entity or top-dimension: {etype}")
         
@@ -928,7 +951,7 @@ class UniformMesh3d(StructuredMesh, TensorMesh, Plotable):
         v2 = node[face[:, 1]] - node[face[:, 3]]
         normals = bm.cross(v1, v2)
 
-        adjusted_face_mask = self.get_adjusted_face_mask() 
+        adjusted_face_mask = self.adjusted_face_mask[index]
 
         # Use the adjusted face mask to flip the normals if necessary
         normals = bm.set_at(normals, (adjusted_face_mask, slice(None)), 
@@ -958,6 +981,18 @@ class UniformMesh3d(StructuredMesh, TensorMesh, Plotable):
         """
         return self.face_normal(index=index, unit=True, out=out)
 
+    def cell_location(self, points) -> TensorLike:
+        """
+        @brief 给定一组点，确定所有点所在的单元
+
+        """
+        v = bm.real(points - bm.array(self.origin, dtype=points.dtype))
+        n0 = v[..., 0] // self.h[0]
+        n1 = v[..., 1] // self.h[1]
+        n2 = v[..., 2] // self.h[2]
+
+        return bm.astype(n0, bm.int64), bm.astype(n1, bm.int64), bm.astype(n2, bm.int64)
+
 
 #################################### 插值点 #############################################
     def interpolation_points(self, p: int, index: Index=_S) -> TensorLike:
@@ -1301,18 +1336,13 @@ class UniformMesh3d(StructuredMesh, TensorMesh, Plotable):
 
             self.NN = (self.nx + 1) * (self.ny + 1) * (self.nz + 1)
             self.NE = (self.nx + 1) * (self.ny + 1) * self.nz + \
-                    (self.nx + 1) * (self.ny + 1) * self.nz + \
+                    (self.nx + 1) * self.ny * (self.nz + 1) + \
                     self.nx * (self.ny + 1) * (self.nz + 1)
             self.NF = self.nx * self.ny * (self.nz + 1) + \
                     self.nx * (self.ny + 1) * self.nz + \
                     (self.nx + 1) * self.ny * self.nz
             self.NC = self.nx * self.ny * self.nz
 
-            self.cell2edge = self.cell_to_edge()
-            self.cell2face = self.cell_to_face()
-            self.face2edge = self.face_to_edge()
-            self.face2cell = self.face_to_cell()
-
         self.clear()
 
     def to_vtk(self, filename, celldata=None, nodedata=None):
@@ -4,6 +4,7 @@ from math import comb
 
 from ..backend import backend_manager as bm
 from ..backend import TensorLike
+from ..sparse.csr_tensor import CSRTensor
 from .. import logger
 
 _Meth = TypeVar('_Meth', bound=Callable)
@@ -155,6 +156,56 @@ def entitymethod(top_dim: int):
     return decorator
 
 
+def grid_boundary_flag(shape: Tuple[int, ...], axes: Tuple[int, ...], *, device=None) -> TensorLike:
+    """Boundary flags of entities laid out as a grid in C order.
+
+    Parameters:
+        shape (Tuple[int, ...]): Shape of the grid of the entities.
+        axes (Tuple[int, ...]): Axes on which the first and the last layers are
+            on the boundary.
+
+    Returns:
+        Tensor: Boolean flags shaped (prod(shape), ).
+    """
+    flag = bm.zeros(shape, dtype=bool, device=device)
+    for a in axes:
+        n = shape[a]
+        i = bm.arange(n, device=device)
+        s = [1, ] * len(shape)
+        s[a] = n
+        flag = flag | ((i == 0) | (i == n - 1)).reshape(s)
+    return flag.reshape(-1)
+
+
+def barycenter_prolongation(NN: int, *entities: TensorLike, dtype=None) -> CSRTensor:
+    """Linear interpolation from the nodes to the nodes followed by the
+    barycenters of the entities, as new nodes of a refined mesh are numbered.
+
+    Parameters:
+        NN (int): Number of nodes.
+        *entities (Tensor): Vertices of the entities, each shaped (N, K), whose
+            barycenters take 1/K of the value at each vertex.
+        dtype (optional): Data type of the values. Defaults to None.
+
+    Returns:
+        CSRTensor: The interpolation matrix shaped (NN + sum(N), NN).
+    """
+    kwargs = bm.context(entities[0])
+    device = bm.get_device(entities[0])
+    crow = [bm.arange(NN + 1, **kwargs)]
+    col = [bm.arange(NN, **kwargs)]
+    values = [bm.ones((NN, ), dtype=dtype, device=device)]
+    nrow, nnz = NN, NN
+    for entity in entities:
+        N, K = entity.shape
+        crow.append(nnz + K * bm.arange(1, N + 1, **kwargs))
+        col.append(entity.reshape(-1))
+        values.append(bm.full((N * K, ), 1 / K, dtype=dtype, device=device))
+        nrow, nnz = nrow + N, nnz + N * K
+    return CSRTensor(bm.concatenate(crow, axis=0), bm.concatenate(col, axis=0),
+                     bm.concatenate(values, axis=0), spshape=(nrow, NN))
+
+
 def simplex_ldof(p: int, iptype: int) -> int:
     """Number of local dofs in a simplex entity."""
     if iptype == 0:
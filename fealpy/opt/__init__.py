@@ -1,27 +1,38 @@
 
-from .objective import Objective
-from .A_star import AStar, GridMap
-from .ANT_TSP import calD, Ant_TSP
-from .particle_swarm_opt_alg import  PSOProblem, PSO
-from .optimizer_base import opt_alg_options, Optimizer
-from .initialize import initialize
-from .crayfish_opt_alg import CrayfishOptAlg
-from .honeybadger_alg import HoneybadgerAlg
-from .quantum_particle_swarm_opt import QuantumParticleSwarmOpt, LevyQuantumParticleSwarmOpt
-from .snow_ablation_opt import SnowAblationOpt
-from .grey_wolf_optimizer import GreyWolfOptimizer
-from .particle_swarm_opt import ParticleSwarmOpt
-from .hippopotamus_opt_alg import HippopotamusOptAlg
-from .antcolony_opt_alg import AntColonyOptAlg
-from .opt_function import initialize, levy
-from .crested_porcupine_opt import CrestedPorcupineOpt
-from .black_winged_kite_alg import BlackwingedKiteAlg
-from .cuckoo_search_opt import CuckooSearchOpt
-from .Butterfly_opt_alg import ButterflyOptAlg
-from .exponential_trigonometric_opt_alg import ExponentialTrigonometricOptAlg
-from .differential_evolution import DifferentialEvolution
-from .differentialted_creative_search import DifferentialtedCreativeSearch
-from .cuckoo_quantum_particle_swarm_opt import CuckooQuantumParticleSwarmOpt
-from .marine_predators_alg import MarinePredatorsAlg
-from .rime_opt_alg import RimeOptAlg
-from .moss_growth_opt import MossGrowthOpt
\ No newline at end of file
+from .._lazy import attach
+
+# NOTE: The algorithms are imported on first access, and their optional
+# dependencies, e.g. pygame for the A* demo, are only needed on use.
+__getattr__, __dir__, __all__ = attach(__name__, {
+    'Objective': '.objective',
+    'AStar': '.A_star',
+    'GridMap': '.A_star',
+    'calD': '.ANT_TSP',
+    'Ant_TSP': '.ANT_TSP',
+    'PSOProblem': '.particle_swarm_opt_alg',
+    'PSO': '.particle_swarm_opt_alg',
+    'opt_alg_options': '.optimizer_base',
+    'Optimizer': '.optimizer_base',
+    'CrayfishOptAlg': '.crayfish_opt_alg',
+    'HoneybadgerAlg': '.honeybadger_alg',
+    'QuantumParticleSwarmOpt': '.quantum_particle_swarm_opt',
+    'LevyQuantumParticleSwarmOpt': '.quantum_particle_swarm_opt',
+    'SnowAblationOpt': '.snow_ablation_opt',
+    'GreyWolfOptimizer': '.grey_wolf_optimizer',
+    'ParticleSwarmOpt': '.particle_swarm_opt',
+    'HippopotamusOptAlg': '.hippopotamus_opt_alg',
+    'AntColonyOptAlg': '.Antcolony_opt_alg',
+    'initialize': '.opt_function',
+    'levy': '.opt_function',
+    'CrestedPorcupineOpt': '.crested_porcupine_opt',
+    'BlackwingedKiteAlg': '.black_winged_kite_alg',
+    'CuckooSearchOpt': '.cuckoo_search_opt',
+    'ButterflyOptAlg': '.Butterfly_opt_alg',
+    'ExponentialTrigonometricOptAlg': '.exponential_trigonometric_opt_alg',
+    'DifferentialEvolution': '.differential_evolution',
+    'DifferentialtedCreativeSearch': '.differentialted_creative_search',
+    'CuckooQuantumParticleSwarmOpt': '.cuckoo_quantum_particle_swarm_opt',
+    'MarinePredatorsAlg': '.marine_predators_alg',
+    'RimeOptAlg': '.rime_opt_alg',
+    'MossGrowthOpt': '.moss_growth_opt',
+})
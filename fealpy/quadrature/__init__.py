@@ -1,5 +1,5 @@
 
-from .quadrature import Quadrature
+from .quadrature import Quadrature, QuadratureCache, quadrature_cache
 
 from .gauss_legendre import GaussLegendreQuadrature
 from .gauss_lobatto import GaussLobattoQuadrature
@@ -1,16 +1,94 @@
 
-from typing import Tuple, Optional
+from typing import Tuple, Optional, Callable, Dict, Any
+from collections import OrderedDict
+import threading
 
 from ..backend import TensorLike
 from ..backend import backend_manager as bm
 
 
+class QuadratureCache():
+    """Bounded LRU cache of quadrature points and weights, shared by all
+    quadrature formulas in the process.
+
+    Tables are keyed by (rule class, index, dtype, device, backend), and other
+    tables derived from them, e.g. the reference basis, can use their own
+    instance keyed by the identity of the quadrature points. Cached
+    tensors are shared by meshes and integrators, so they must not be modified
+    in place. Arrays of the NumPy backend are marked read-only.
+
+    Parameters:
+        maxsize (int, optional): Maximum number of tables kept. Defaults to 128.
+    """
+    def __init__(self, maxsize: int=128):
+        self.maxsize = maxsize
+        self.hits = 0
+        self.misses = 0
+        self._data: OrderedDict = OrderedDict()
+        self._owned: Dict[int, Tuple] = {}
+        self._lock = threading.Lock()
+
+    def __len__(self) -> int:
+        return len(self._data)
+
+    def get(self, key: Tuple, make: Callable[[], Tuple[TensorLike, TensorLike]]):
+        """Return the cached points and weights of `key`, or make and cache them."""
+        with self._lock:
+            if key in self._data:
+                self.hits += 1
+                self._data.move_to_end(key)
+                return self._data[key]
+
+        value = tuple(make())
+        if bm.backend_name == 'numpy':
+            for tensor in value:
+                tensor.flags.writeable = False
+
+        with self._lock:
+            self.misses += 1
+            self._data[key] = value
+            for tensor in value:
+                self._owned[id(tensor)] = key
+            while len(self._data) > self.maxsize:
+                _, old = self._data.popitem(last=False)
+                for tensor in old:
+                    self._owned.pop(id(tensor), None)
+        return value
+
+    def owns(self, tensor: TensorLike) -> bool:
+        """Whether the tensor is one of the cached tables."""
+        key = self._owned.get(id(tensor), None)
+        return (key is not None) and any(t is tensor for t in self._data.get(key, ()))
+
+    def clear(self):
+        """Remove all cached tables and reset the counters."""
+        with self._lock:
+            self._data.clear()
+            self._owned.clear()
+            self.hits = 0
+            self.misses = 0
+
+    def info(self) -> Dict[str, Any]:
+        """Return `hits`, `misses`, `size` and `maxsize` of the cache."""
+        return {'hits': self.hits, 'misses': self.misses,
+                'size': len(self._data), 'maxsize': self.maxsize}
+
+
+quadrature_cache = QuadratureCache()
+
+
 class Quadrature():
-    r"""Base class for quadrature generators."""
+    r"""Base class for quadrature generators.
+
+    Points and weights are made once for each (rule, index, dtype, device, backend)
+    and shared through `quadrature_cache`."""
     def __init__(self, index: Optional[int]=None, *, dtype=None, device=None) -> None:
         self.dtype = dtype if dtype else bm.float64
         self.device = device
-        self.quadpts, self.weights = self.make(index)
+        # NOTE: finfo normalizes dtypes, e.g. np.float64 and np.dtype('float64').
+        dtype_key = bm.finfo(self.dtype).dtype
+        key = (self.__class__, index, dtype_key, str(device), bm.backend_name)
+        self.quadpts, self.weights = quadrature_cache.get(key, lambda: self.make(index))
 
     def __len__(self) -> int:
         return self.number_of_quadrature_points()
@@ -2,3 +2,11 @@
 from .conjugate_gradient import cg
 from .direct_solver import spsolve
 from .gmres_solver import gmres
+from .amg_solver import AMGSolver
+from .minres_solver import minres
+from .bicgstab_solver import bicgstab
+from .fast_poisson import FastPoissonSolver
+from .preconditioner import (
+    JacobiPreconditioner, BlockJacobiPreconditioner,
+    SSORPreconditioner, ILU0Preconditioner
+)
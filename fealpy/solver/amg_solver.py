@@ -0,0 +1,410 @@
+from typing import Optional, List, Tuple
+import time
+
+from .. import logger
+from ..backend import backend_manager as bm
+from ..backend import TensorLike
+from ..sparse import CSRTensor
+from ..sparse._spspmm import spspmm_csr_symbolic, spspmm_numeric
+from .conjugate_gradient import cg
+
+# NOTE: Multiplicative hash of node indices used as the random weights in
+# the parallel aggregation. It is injective for indices less than `_HASH_MOD`.
+_HASH_MOD = 2**32
+_HASH_MUL = 2654435761
+
+# NOTE: The coarsest level is solved by a dense pseudo-inverse only if it is at
+# most this many times `max_coarse`, as the pseudo-inverse costs O(n^3).
+_DENSE_COARSE_FACTOR = 4
+
+
+def _expand_row(crow: TensorLike) -> TensorLike:
+    nrow = crow.shape[0] - 1
+    return bm.repeat(bm.arange(nrow, **bm.context(crow)), crow[1:] - crow[:-1])
+
+
+def _row_max(crow: TensorLike, col: TensorLike, x: TensorLike, bound: int) -> TensorLike:
+    """Maximum of `x[col]` in each row of a CSR pattern, where `0 <= x < bound`
+    and every row is not empty."""
+    nrow = crow.shape[0] - 1
+    kwargs = bm.context(x)
+    row = bm.astype(_expand_row(crow), x.dtype)
+    key = bm.sort(row * bound + x[col])
+    return key[crow[1:] - 1] - bm.arange(nrow, **kwargs) * bound
+
+
+def _compress(crow: TensorLike, flag: TensorLike) -> TensorLike:
+    """crow of the CSR pattern with the selected non-zeros only."""
+    ZERO = bm.zeros((1, ), **bm.context(crow))
+    selected_cum = bm.concat([ZERO, bm.cumsum(flag, axis=0)], axis=0)
+    return bm.astype(selected_cum[crow], crow.dtype)
+
+
+def csr_diagonal(A: CSRTensor) -> TensorLike:
+    """Return the diagonal of a CSR matrix."""
+    row, col = _expand_row(A.crow()), A.col()
+    is_diag = (row == col)
+    diag = bm.zeros((A.shape[0], ), **A.values_context())
+    return bm.index_add(diag, row[is_diag], A.values()[is_diag])
+
+
+def csr_transpose(crow: TensorLike, col: TensorLike, spshape: Tuple[int, int]):
+    """Transpose the pattern of a CSR matrix.
+
+    Returns:
+        Tuple[Tensor, Tensor, Tensor]: crow and col of the transpose, and the
+            permutation of values, i.e. the values of the transpose are `values[perm]`.
+    """
+    nrow, ncol = spshape
+    row = _expand_row(crow)
+    perm = bm.argsort(bm.astype(col, bm.int64) * nrow + row)
+    new_col = row[perm]
+    bounds = bm.arange(ncol + 1, **bm.context(col))
+    new_crow = bm.astype(bm.searchsorted(col[perm], bounds), crow.dtype)
+    return new_crow, new_col, perm
+
+
+def strength_graph(A: CSRTensor, theta: float=0.0):
+    """Strong connections of a symmetric matrix, including the diagonal.
+
+    Entry (i, j) is strong if |a_ij|^2 > theta^2 |a_ii a_jj|. The threshold is
+    at least 1e-12, to drop the round-off of cancelled entries.
+
+    Returns:
+        Tuple[Tensor, Tensor]: crow and col of the strength graph.
+    """
+    row, col, values = _expand_row(A.crow()), A.col(), A.values()
+    diag = bm.abs(csr_diagonal(A))
+    theta = max(theta, 1e-12)
+    is_strong = values**2 > (theta**2) * diag[row] * diag[col]
+    is_strong = is_strong | (row == col)
+    return _compress(A.crow(), is_strong), col[is_strong]
+
+
+def aggregate(crow: TensorLike, col: TensorLike) -> Tuple[TensorLike, int]:
+    """Aggregate nodes of a symmetric graph around a maximal distance-2
+    independent set, computed in parallel rounds.
+
+    Parameters:
+        crow (Tensor): crow of the graph, each row contains the diagonal.
+        col (Tensor): col of the graph.
+
+    Returns:
+        Tuple[Tensor, int]: The aggregate index of each node and the number of
+            aggregates. Isolated nodes are not aggregated and marked by -1.
+    """
+    n = crow.shape[0] - 1
+    ikwargs = dict(dtype=bm.int64, device=bm.get_device(crow))
+    weight = (bm.arange(n, **ikwargs) * _HASH_MUL) % _HASH_MOD
+    bound = 3 * _HASH_MOD
+    # state: 0 for removed, 1 for undecided, 2 for roots.
+    is_isolated = (crow[1:] - crow[:-1]) <= 1
+    state = bm.astype(~is_isolated, bm.int64)
+
+    while bm.any(state == 1):
+        value = state * _HASH_MOD + weight
+        max_value = _row_max(crow, col, _row_max(crow, col, value, bound), bound)
+        undecided = (state == 1)
+        new_root = undecided & (max_value == value)
+        removed = undecided & (max_value >= 2 * _HASH_MOD) & (~new_root)
+        state = bm.where(new_root, 2, state)
+        state = bm.where(removed, 0, state)
+
+    is_root = (state == 2)
+    root_id = bm.astype(bm.cumsum(is_root, axis=0), bm.int64)
+    n_agg = int(root_id[-1]) if n > 0 else 0
+    agg = _row_max(crow, col, bm.where(is_root, root_id, 0), n_agg + 1) - 1
+    # NOTE: nodes at distance 2 of roots join aggregates of their neighbors.
+    agg2 = _row_max(crow, col, agg + 1, n_agg + 1) - 1
+    agg = bm.where(agg >= 0, agg, agg2)
+
+    return agg, n_agg
+
+
+def _estimate_rho(A: CSRTensor, dinv: TensorLike, maxit: int=15) -> float:
+    """Estimate the spectral radius of D^{-1}A by the power iteration."""
+    n = A.shape[0]
+    kwargs = A.values_context()
+    x = bm.sin(bm.arange(n, **kwargs) * 1.618 + 0.5) + 1.5
+    rho = 1.0
+
+    for _ in range(maxit):
+        y = dinv * (A @ x)
+        rho = float(bm.linalg.norm(y) / bm.linalg.norm(x))
+        x = y / bm.linalg.norm(y)
+
+    return rho
+
+
+class AMGLevel():
+    """A level of the AMG hierarchy, containing the operator and the transfer
+    operators to the next coarser level."""
+    def __init__(self, A: CSRTensor):
+        self.A = A
+        self.dinv: Optional[TensorLike] = None
+        self.omega = 1.0
+        self.P: Optional[CSRTensor] = None
+        self.R: Optional[CSRTensor] = None
+        self.AP_symbolic = None
+        self.RAP_symbolic = None
+
+    def update_smoother(self, omega: float):
+        diag = csr_diagonal(self.A)
+        self.dinv = 1.0 / diag
+        self.omega = omega / _estimate_rho(self.A, self.dinv)
+
+    def galerkin(self) -> CSRTensor:
+        """Compute R A P with the cached symbolic phase."""
+        A, P, R = self.A, self.P, self.R
+
+        if self.AP_symbolic is None:
+            self.AP_symbolic = spspmm_csr_symbolic(A.crow(), A.col(), A.sparse_shape,
+                                                   P.crow(), P.col(), P.sparse_shape)
+        crow, col, left, right, target, shape = self.AP_symbolic
+        AP_values = spspmm_numeric(A.values(), P.values(), left, right, target, col.shape[0])
+
+        if self.RAP_symbolic is None:
+            self.RAP_symbolic = spspmm_csr_symbolic(R.crow(), R.col(), R.sparse_shape,
+                                                    crow, col, shape)
+        crow2, col2, left, right, target, shape2 = self.RAP_symbolic
+        values = spspmm_numeric(R.values(), AP_values, left, right, target, col2.shape[0])
+
+        return CSRTensor(crow2, col2, values, shape2)
+
+
+class AMGSolver():
+    """Smoothed aggregation algebraic multigrid for symmetric positive-definite
+    `CSRTensor` matrices.
+
+    Nodes are aggregated around a maximal distance-2 independent set of the
+    strength graph. The tentative prolongation interpolates the constant
+    vector and is smoothed by a damped Jacobi step. Coarse operators are
+    formed by the Galerkin product R A P, of which the symbolic phase is kept.
+
+    The hierarchy is built once and reused for all right-hand sides. Use `update`
+    to refresh the coarse operators when values of the matrix change while the
+    sparsity pattern is unchanged, e.g. in time steps.
+
+    One V-cycle is applied by `@`, so the solver can be passed as the
+    preconditioner `M` of `fealpy.solver.cg` and `fealpy.solver.gmres`.
+
+    Parameters:
+        A (CSRTensor): The matrix of the linear system.
+        theta (float, optional): Threshold of the strength of connections. Defaults to 0.0.
+        max_levels (int, optional): Maximum number of levels. Defaults to 10.
+        max_coarse (int, optional): Size of the coarsest level, which is solved
+            directly. If the coarsening stalls or `max_levels` is reached before,
+            a coarsest level much larger than this is solved by the Jacobi
+            preconditioned CG instead. Defaults to 500.
+        presmooth (int, optional): Number of Jacobi sweeps before the coarse
+            correction. Defaults to 1.
+        postsmooth (int, optional): Number of Jacobi sweeps after the coarse
+            correction. Defaults to 1.
+        omega (float, optional): Weight of the Jacobi smoother and the prolongation
+            smoother, relative to the inverse spectral radius of D^{-1}A. Defaults to 4/3.
+
+    Example:
+    ```
+        ml = AMGSolver(A)
+        x = cg(A, b, M=ml)
+    ```
+    """
+    def __init__(self, A: CSRTensor, *,
+                 theta: float=0.0,
+                 max_levels: int=10,
+                 max_coarse: int=500,
+                 presmooth: int=1,
+                 postsmooth: int=1,
+                 omega: float=4/3):
+        if not isinstance(A, CSRTensor):
+            raise TypeError(f"A must be a CSRTensor, but got {type(A).__name__}.")
+        if A.dense_ndim != 0:
+            raise ValueError("AMGSolver does not support batched matrices.")
+
+        self.theta = theta
+        self.max_levels = max_levels
+        self.max_coarse = max_coarse
+        self.presmooth = presmooth
+        self.postsmooth = postsmooth
+        self.omega = omega
+        self.levels: List[AMGLevel] = []
+        self.coarse_inv: Optional[TensorLike] = None
+        self.coarse_precond = None
+        self.setup(A)
+
+    @property
+    def shape(self):
+        return self.levels[0].A.shape
+
+    def setup(self, A: CSRTensor):
+        """Build the hierarchy of the matrix."""
+        start = time.perf_counter()
+        level = AMGLevel(A)
+        self.levels = [level]
+
+        while (len(self.levels) < self.max_levels) and (level.A.shape[0] > self.max_coarse):
+            A = level.A
+            level.update_smoother(self.omega)
+            P0 = self._tentative_prolongation(A)
+            if P0.shape[1] >= A.shape[0]:
+                break
+            level.P = self._smooth_prolongation(level, P0)
+            crow, col, perm = csr_transpose(level.P.crow(), level.P.col(), level.P.sparse_shape)
+            level.R = CSRTensor(crow, col, level.P.values()[perm], level.P.shape[::-1])
+            level = AMGLevel(level.galerkin())
+            self.levels.append(level)
+
+        self.levels[-1].P = None
+        self._setup_coarse()
+        logger.info(f"AMG: hierarchy of {len(self.levels)} levels with sizes "
+                    f"{[lvl.A.shape[0] for lvl in self.levels]} built in "
+                    f"{time.perf_counter() - start:.3f} seconds, "
+                    f"operator complexity {self.operator_complexity():.2f}.")
+        return self
+
+    def update(self, A: CSRTensor):
+        """Refresh the coarse operators and smoothers with new values of the
+        matrix, reusing the aggregates, prolongations and symbolic products.
+        The sparsity pattern of `A` must be the same as the one in setup.
+
+        Note:
+            The prolongations are frozen: they stay smoothed with the matrix
+            given to `setup`, and only the Galerkin products use the new values.
+            Call `setup` instead when the values change a lot."""
+        A0 = self.levels[0].A
+        if (A.nnz != A0.nnz) or (A.shape != A0.shape):
+            raise ValueError("The sparsity pattern of A is changed, use setup instead.")
+        self.levels[0].A = A
+
+        for i, level in enumerate(self.levels[:-1]):
+            level.update_smoother(self.omega)
+            self.levels[i+1].A = level.galerkin()
+
+        self._setup_coarse()
+        return self
+
+    def operator_complexity(self) -> float:
+        """Total number of non-zeros in all levels relative to the finest."""
+        return sum(lvl.A.nnz for lvl in self.levels) / self.levels[0].A.nnz
+
+    def _tentative_prolongation(self, A: CSRTensor) -> CSRTensor:
+        crow, col = strength_graph(A, self.theta)
+        agg, n_agg = aggregate(crow, col)
+        n = A.shape[0]
+        kwargs = A.values_context()
+        # NOTE: Isolated nodes, e.g. Dirichlet dofs, are solved by the smoother
+        # and left out of coarse levels.
+        is_aggregated = (agg >= 0)
+        P0_crow = _compress(bm.arange(n + 1, **bm.context(A.crow())), is_aggregated)
+        agg = bm.astype(agg[is_aggregated], A.itype)
+        size = bm.index_add(bm.zeros((n_agg, ), **kwargs), agg,
+                            bm.ones(agg.shape, **kwargs))
+        values = 1.0 / bm.sqrt(size[agg])
+        return CSRTensor(P0_crow, agg, values, (n, n_agg))
+
+    def _smooth_prolongation(self, level: AMGLevel, P0: CSRTensor) -> CSRTensor:
+        # P = (I - omega D^{-1} A) P0
+        A = level.A
+        row, col = _expand_row(A.crow()), A.col()
+        values = -level.omega * level.dinv[row] * A.values()
+        values = values + bm.astype(row == col, values.dtype)
+        crow, col, values, shape = self._spspmm(A.crow(), col, values, A.sparse_shape, P0)
+        return CSRTensor(crow, col, values, shape)
+
+    @staticmethod
+    def _spspmm(crow1, col1, values1, spshape1, B: CSRTensor):
+        crow, col, left, right, target, shape = spspmm_csr_symbolic(
+            crow1, col1, spshape1, B.crow(), B.col(), B.sparse_shape
+        )
+        values = spspmm_numeric(values1, B.values(), left, right, target, col.shape[0])
+        return crow, col, values, shape
+
+    def _setup_coarse(self):
+        Ac = self.levels[-1].A
+        n = Ac.shape[0]
+        if n <= _DENSE_COARSE_FACTOR * self.max_coarse:
+            self.coarse_inv = bm.linalg.pinv(Ac.to_dense())
+            return
+
+        from .preconditioner import JacobiPreconditioner
+        logger.warning(f"AMG: the coarsest level of size {n} is larger than "
+                       f"{_DENSE_COARSE_FACTOR} times max_coarse ({self.max_coarse}), "
+                       "and is solved by the Jacobi preconditioned CG.")
+        self.coarse_inv = None
+        self.coarse_precond = JacobiPreconditioner(Ac)
+
+    def _coarse_solve(self, b: TensorLike) -> TensorLike:
+        if self.coarse_inv is not None:
+            return self.coarse_inv @ b
+        Ac = self.levels[-1].A
+        return cg(Ac, b, M=self.coarse_precond, atol=0., rtol=1e-10, maxiter=Ac.shape[0])
+
+    def _smooth(self, level: AMGLevel, b: TensorLike, x: Optional[TensorLike], nsweep: int):
+        dinv = level.dinv if b.ndim == 1 else level.dinv[:, None]
+        w = level.omega
+
+        for _ in range(nsweep):
+            if x is None:
+                x = w * dinv * b
+            else:
+                x = x + w * dinv * (b - level.A @ x)
+
+        return x
+
+    def vcycle(self, b: TensorLike, lvl: int=0) -> TensorLike:
+        """Apply one V-cycle with zero initial guess from the given level.
+
+        Parameters:
+            b (Tensor): The right-hand side, shaped (N, ) or (N, K).
+            lvl (int, optional): The level index. Defaults to 0.
+
+        Returns:
+            Tensor: The approximate solution.
+        """
+        if lvl == len(self.levels) - 1:
+            return self._coarse_solve(b)
+
+        level = self.levels[lvl]
+        x = self._smooth(level, b, None, self.presmooth)
+        r = b if x is None else b - level.A @ x
+        e = level.P @ self.vcycle(level.R @ r, lvl + 1)
+        x = e if x is None else x + e
+        x = self._smooth(level, b, x, self.postsmooth)
+
+        return x
+
+    def __matmul__(self, b: TensorLike) -> TensorLike:
+        return self.vcycle(b)
+
+    def solve(self, b: TensorLike, x0: Optional[TensorLike]=None, *,
+              atol: float=1e-12, rtol: float=1e-8,
+              maxiter: int=100) -> TensorLike:
+        """Solve the linear system by V-cycle iterations.
+
+        Parameters:
+            b (Tensor): The right-hand side, shaped (N, ) or (N, K).
+            x0 (Tensor | None, optional): Initial guess. Defaults to None.
+            atol (float, optional): Absolute tolerance. Defaults to 1e-12.
+            rtol (float, optional): Relative tolerance. Defaults to 1e-8.
+            maxiter (int, optional): Maximum number of V-cycles. Defaults to 100.
+
+        Returns:
+            Tensor: The approximate solution.
+        """
+        A = self.levels[0].A
+        x = bm.zeros_like(b) if x0 is None else x0
+        r = b - A @ x
+        b_norm = bm.linalg.norm(b)
+
+        for n_iter in range(1, maxiter + 1):
+            x = x + self.vcycle(r)
+            r = b - A @ x
+            r_norm = bm.linalg.norm(r)
+
+            if (r_norm < atol) or (r_norm < rtol * b_norm):
+                logger.info(f"AMG: converged in {n_iter} iterations.")
+                break
+        else:
+            logger.info(f"AMG: failed, stopped by maxiter ({maxiter}).")
+
+        return x
@@ -0,0 +1,106 @@
+from typing import Optional, Callable, Any
+
+from ..backend import backend_manager as bm
+from ..backend import TensorLike
+
+from .conjugate_gradient import SupportsMatmul
+from .monitor import IterationMonitor
+
+
+def bicgstab(A: SupportsMatmul, b: TensorLike, x0: Optional[TensorLike]=None, *,
+             M: Optional[SupportsMatmul]=None,
+             atol: float=1e-12, rtol: float=1e-8,
+             maxiter: Optional[int]=10000,
+             callback: Optional[Callable[[int, float], Any]]=None,
+             returninfo: bool=False):
+    """Solve a general linear system Ax = b using the right-preconditioned
+    Biconjugate Gradient Stabilized (BiCGStab) method.
+
+    Parameters:
+        A (SupportsMatmul): The coefficient matrix of the linear system.
+        b (TensorLike): The right-hand side vector, a 1D tensor.
+        x0 (TensorLike, optional): Initial guess for the solution. Default is None.
+        M (SupportsMatmul, optional): The preconditioner approximating the inverse of A,\\
+        applied as `M @ r`. Default is None.
+        atol (float, optional): Absolute tolerance for convergence. Default is 1e-12.
+        rtol (float, optional): Relative tolerance for convergence. Default is 1e-8.
+        maxiter (int, optional): Maximum number of iterations allowed. Default is 10000.
+        callback (Callable[[int, float], Any], optional): Called after each iteration\\
+        with the iteration number and the residual norm. Default is None.
+        returninfo (bool, optional): Whether to return the solving information.\\
+        See `IterationMonitor.info`. Default is False.
+
+    Returns:
+        Tensor: The approximate solution to the system Ax = b.
+        dict: The solving information, only if `returninfo` is True.
+    """
+    assert isinstance(b, TensorLike), "b must be a Tensor"
+    if b.ndim != 1:
+        raise ValueError("b must be a 1D dense tensor")
+
+    if x0 is None:
+        x = bm.zeros_like(b)
+    else:
+        if x0.shape != b.shape:
+            raise ValueError("x0 and b must have the same shape")
+        x = x0
+
+    monitor = IterationMonitor("BiCGStab", callback)
+    r = b - monitor.matvec(A, x)
+    r_hat = r
+    b_norm = bm.linalg.norm(b)
+    r_norm = bm.linalg.norm(r)
+    monitor.start(r_norm)
+    rho, alpha, omega = 1., 1., 1.
+    p = bm.zeros_like(b)
+    v = bm.zeros_like(b)
+
+    while True:
+        rho_new = bm.sum(r_hat * r)
+        if rho_new == 0.:
+            monitor.finish(False, "breakdown (rho = 0)")
+            break
+
+        beta = (rho_new / rho) * (alpha / omega)
+        p = r + beta * (p - omega * v)
+        p_hat = monitor.precond(M, p)
+        v = monitor.matvec(A, p_hat)
+        alpha = rho_new / bm.sum(r_hat * v)
+        s = r - alpha * v
+        x = x + alpha * p_hat
+        s_norm = bm.linalg.norm(s)
+
+        if (s_norm < atol) or (s_norm < rtol * b_norm):
+            monitor.step(s_norm)
+            reason = "absolute tolerance" if s_norm < atol else "relative tolerance"
+            monitor.finish(True, reason)
+            break
+
+        s_hat = monitor.precond(M, s)
+        t = monitor.matvec(A, s_hat)
+        omega = bm.sum(t * s) / bm.sum(t * t)
+        x = x + omega * s_hat
+        r = s - omega * t
+        rho = rho_new
+        r_norm = bm.linalg.norm(r)
+        monitor.step(r_norm)
+
+        if r_norm < atol:
+            monitor.finish(True, "absolute tolerance")
+            break
+
+        if r_norm < rtol * b_norm:
+            monitor.finish(True, "relative tolerance")
+            break
+
+        if omega == 0.:
+            monitor.finish(False, "breakdown (omega = 0)")
+            break
+
+        if (maxiter is not None) and (monitor.niter >= maxiter):
+            monitor.finish(False, f"maxiter ({maxiter})")
+            break
+
+    if returninfo:
+        return x, monitor.info()
+    return x
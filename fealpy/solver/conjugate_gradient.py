@@ -1,10 +1,9 @@
-
-from typing import Optional, Protocol
+from typing import Optional, Protocol, Callable, Any
 
 from ..backend import backend_manager as bm
 from ..backend import TensorLike
 
-from .. import logger
+from .monitor import IterationMonitor
 
 
 class SupportsMatmul(Protocol):
@@ -12,25 +11,35 @@ class SupportsMatmul(Protocol):
 
 
 def cg(A: SupportsMatmul, b: TensorLike, x0: Optional[TensorLike]=None, *,
+       M: Optional[SupportsMatmul]=None,
        batch_first: bool=False,
        atol: float=1e-12, rtol: float=1e-8,
-       maxiter: Optional[int]=10000) -> TensorLike:
-    """Solve a linear system Ax = b using the Conjugate Gradient (CG) method.
+       maxiter: Optional[int]=10000,
+       callback: Optional[Callable[[int, float], Any]]=None,
+       returninfo: bool=False):
+    """Solve a linear system Ax = b using the (preconditioned) Conjugate Gradient (CG) method.
 
     Parameters:
         A (SupportsMatmul): The coefficient matrix of the linear system.
         b (TensorLike): The right-hand side vector of the linear system, can be a 1D or 2D tensor.
         x0 (TensorLike): Initial guess for the solution, a 1D or 2D tensor.\
         Must have the same shape as b when reshaped appropriately.
+        M (SupportsMatmul, optional): The preconditioner approximating the inverse of A,\
+        applied as `M @ r`. Must be symmetric positive-definite. Default is None.
         batch_first (bool, optional): Whether the batch dimension of `b` and `x0`\
         is the first dimension. Ignored if `b` is an 1-d tensor. Default is False.
         atol (float, optional): Absolute tolerance for convergence. Default is 1e-12.
         rtol (float, optional): Relative tolerance for convergence. Default is 1e-8.
         maxiter (int, optional): Maximum number of iterations allowed. Default is 10000.\
         If not provided, the method will continue until convergence based on the given tolerances.
+        callback (Callable[[int, float], Any], optional): Called after each iteration\
+        with the iteration number and the residual norm. Default is None.
+        returninfo (bool, optional): Whether to return the solving information.\
+        See `IterationMonitor.info`. Default is False.
 
     Returns:
         Tensor: The approximate solution to the system Ax = b.
+        dict: The solving information, only if `returninfo` is True.
 
     Raises:
         ValueError: If inputs do not meet the specified conditions (e.g., A is not sparse, dimensions mismatch).
@@ -57,53 +66,61 @@ def cg(A: SupportsMatmul, b: TensorLike, x0: Optional[TensorLike]=None, *,
         b = bm.swapaxes(b, 0, 1)
         x0 = bm.swapaxes(x0, 0, 1)
 
-    sol = _cg_impl(A, b, x0, atol, rtol, maxiter)
+    monitor = IterationMonitor("CG", callback)
+    sol = _cg_impl(A, b, x0, M, atol, rtol, maxiter, monitor)
 
     if (not single_vector) and batch_first:
         sol = bm.swapaxes(sol, 0, 1)
 
+    if returninfo:
+        return sol, monitor.info()
     return sol
 
 
-def _cg_impl(A: SupportsMatmul, b: TensorLike, x0: TensorLike, atol, rtol, maxiter):
+def _cg_impl(A: SupportsMatmul, b: TensorLike, x0: TensorLike, M, atol, rtol, maxiter,
+             monitor: IterationMonitor):
     # initialize
     x = x0              # (dof, batch)
-    r = b - A @ x       # (dof, batch)
-    p = r               # (dof, batch)
-    n_iter = 0
+    r = b - monitor.matvec(A, x) # (dof, batch)
+    z = monitor.precond(M, r)
+    p = z               # (dof, batch)
     b_norm = bm.linalg.norm(b)
     sum_func = bm.sum
     sqrt_func = bm.sqrt
+    rTr = sum_func(r**2, axis=0) # (batch,)
+    rTz = rTr if M is None else sum_func(r*z, axis=0) # (batch,)
+    monitor.start(sqrt_func(sum_func(rTr)))
 
     # iterate
     while True:
-        Ap = A @ p      # (dof, batch)
-        rTr = sum_func(r**2, axis=0)
-        alpha = rTr / sum_func(p*Ap, axis=0)  # r @ r / (p @ Ap) # (batch,)
+        Ap = monitor.matvec(A, p) # (dof, batch)
+        alpha = rTz / sum_func(p*Ap, axis=0)  # r @ z / (p @ Ap) # (batch,)
         x = x + alpha[None, ...] * p  # (dof, batch)
-        r_new = r - alpha[None, ...] * Ap
-        rTr_new = sum_func(r_new**2, axis=0)  # (batch,)
-        r_norm_new = sqrt_func(sum_func(rTr_new))
-
-        n_iter += 1
+        r = r - alpha[None, ...] * Ap
+        rTr = sum_func(r**2, axis=0) # (batch,)
+        r_norm_new = sqrt_func(sum_func(rTr))
+        monitor.step(r_norm_new)
 
         if r_norm_new < atol:
-            logger.info(f"CG: converged in {n_iter} iterations, "
-                        "stopped by absolute tolerance.")
+            monitor.finish(True, "absolute tolerance")
             break
 
         if r_norm_new < rtol * b_norm:
-            logger.info(f"CG: converged in {n_iter} iterations, "
-                        "stopped by relative tolerance.")
+            monitor.finish(True, "relative tolerance")
             break
 
-        if (maxiter is not None) and (n_iter >= maxiter):
-            logger.info(f"CG: failed, stopped by maxiter ({maxiter}).")
+        if (maxiter is not None) and (monitor.niter >= maxiter):
+            monitor.finish(False, f"maxiter ({maxiter})")
             break
 
-        beta = rTr_new / rTr # (batch,)
-        p = r_new + beta[None, ...] * p
-        r = r_new
+        if M is None:
+            z, rTz_new = r, rTr
+        else:
+            z = monitor.precond(M, r)
+            rTz_new = sum_func(r*z, axis=0) # (batch,)
+        beta = rTz_new / rTz # (batch,)
+        p = z + beta[None, ...] * p
+        rTz = rTz_new
 
     return x
 
@@ -59,30 +59,38 @@ def _cupy_solve(A, b, tol, x0, maxiter ,atol):
         x = cp.asnumpy(x)
     return x
 
-def _scipy_solve(A, b, tol, x0, maxiter, atol):
-    from scipy.sparse.linalg import gmres 
+def _scipy_solve(A, b, tol, x0, maxiter, atol, M=None):
+    from scipy.sparse.linalg import gmres, LinearOperator
     from scipy.sparse import csr_matrix
 
+    if M is not None:
+        precond = M
+        M = LinearOperator(A.shape, dtype=np.float64,
+                           matvec=lambda r: bm.to_numpy(precond @ bm.from_numpy(r)))
     A = A.to_scipy()
     b = bm.to_numpy(b)
-    return gmres(A, b, x0=x0, maxiter=maxiter, atol=atol, rtol=tol)[0]
+    return gmres(A, b, x0=x0, maxiter=maxiter, atol=atol, rtol=tol, M=M)[0]
 
 
 def gmres(A:[COOTensor, CSRTensor], b, solver:str="scipy", 
-          tol=1e-5, x0=None, maxiter=None, atol=0.0):
+          tol=1e-5, x0=None, maxiter=None, atol=0.0, M=None):
     """Solve a linear system using a gmres solver.
 
     Parameters:
         A(COOTensor | CSRTensor): The matrix of the linear system.
         b(Tensor): The right-hand side.
         solver(str): The solver to use. It can be "mumps", "scipy", or "cupy".
+        M(SupportsMatmul | None): The preconditioner approximating the inverse of A,
+            applied as `M @ r`. Only supported by the "scipy" solver.
 
     Returns:
         Tensor: The solution of the linear system.
     """
     if solver == "scipy":
-        return bm.tensor(_scipy_solve(A, b, tol=tol, x0=x0, maxiter=maxiter, atol=atol))
+        return bm.tensor(_scipy_solve(A, b, tol=tol, x0=x0, maxiter=maxiter, atol=atol, M=M))
     elif solver == "cupy":
+        if M is not None:
+            raise ValueError("The cupy gmres solver does not support preconditioners.")
         A = A.tocoo()
         return bm.tensor(_cupy_solve(A, b, tol=tol, x0=x0, maxiter=maxiter, atol=atol))
     else:
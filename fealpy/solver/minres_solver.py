@@ -0,0 +1,131 @@
+from typing import Optional, Callable, Any
+from math import sqrt
+
+from ..backend import backend_manager as bm
+from ..backend import TensorLike
+
+from .conjugate_gradient import SupportsMatmul
+from .monitor import IterationMonitor
+
+
+def minres(A: SupportsMatmul, b: TensorLike, x0: Optional[TensorLike]=None, *,
+           M: Optional[SupportsMatmul]=None,
+           atol: float=1e-12, rtol: float=1e-8,
+           maxiter: Optional[int]=10000,
+           callback: Optional[Callable[[int, float], Any]]=None,
+           returninfo: bool=False):
+    """Solve a symmetric, possibly indefinite, linear system Ax = b using the
+    (preconditioned) Minimal Residual (MINRES) method of Paige and Saunders,
+    e.g. the saddle-point systems of the Stokes problems.
+
+    Parameters:
+        A (SupportsMatmul): The symmetric coefficient matrix of the linear system.
+        b (TensorLike): The right-hand side vector, a 1D tensor.
+        x0 (TensorLike, optional): Initial guess for the solution. Default is None.
+        M (SupportsMatmul, optional): The preconditioner approximating the inverse of A,\\
+        applied as `M @ r`. Must be symmetric positive-definite. Default is None.
+        atol (float, optional): Absolute tolerance for convergence. Default is 1e-12.
+        rtol (float, optional): Relative tolerance for convergence. Default is 1e-8.
+        maxiter (int, optional): Maximum number of iterations allowed. Default is 10000.
+        callback (Callable[[int, float], Any], optional): Called after each iteration\\
+        with the iteration number and the residual norm. Default is None.
+        returninfo (bool, optional): Whether to return the solving information.\\
+        See `IterationMonitor.info`. Default is False.
+
+    Returns:
+        Tensor: The approximate solution to the system Ax = b.
+        dict: The solving information, only if `returninfo` is True.
+
+    Note:
+        The residual norm is estimated by the recurrence, which is the norm
+        of M^{1/2}r when preconditioned. As in `cg`, the relative tolerance is
+        measured against the right-hand side, in the same norm ||M^{1/2}b||,
+        which is ||b|| without preconditioner. This costs one more application
+        of M when `x0` is given.
+    """
+    assert isinstance(b, TensorLike), "b must be a Tensor"
+    if b.ndim != 1:
+        raise ValueError("b must be a 1D dense tensor")
+
+    if x0 is None:
+        x = bm.zeros_like(b)
+    else:
+        if x0.shape != b.shape:
+            raise ValueError("x0 and b must have the same shape")
+        x = x0
+
+    monitor = IterationMonitor("MINRES", callback)
+    r1 = b - monitor.matvec(A, x)
+    y = monitor.precond(M, r1)
+    beta1 = float(bm.sum(r1 * y))
+
+    if beta1 < 0:
+        raise ValueError("The preconditioner M is not positive-definite.")
+
+    beta1 = sqrt(beta1)
+    monitor.start(beta1)
+
+    if beta1 == 0.:
+        monitor.finish(True, "zero initial residual")
+        return (x, monitor.info()) if returninfo else x
+
+    if x0 is None: # r1 = b
+        bnorm = beta1
+    else:
+        bnorm = sqrt(max(float(bm.sum(b * monitor.precond(M, b))), 0.))
+    tol = max(atol, rtol * bnorm)
+    oldb, beta, dbar, epsln, phibar = 0., beta1, 0., 0., beta1
+    cs, sn = -1., 0.
+    w = bm.zeros_like(b)
+    w2 = bm.zeros_like(b)
+    r2 = r1
+
+    while True:
+        v = y / beta
+        y = monitor.matvec(A, v)
+        if monitor.niter >= 1:
+            y = y - (beta / oldb) * r1
+
+        alfa = float(bm.sum(v * y))
+        y = y - (alfa / beta) * r2
+        r1, r2 = r2, y
+        y = monitor.precond(M, r2)
+        oldb = beta
+        beta = float(bm.sum(r2 * y))
+        if beta < 0:
+            raise ValueError("The preconditioner M is not positive-definite.")
+        beta = sqrt(beta)
+
+        # Apply the previous rotation and compute the new one.
+        oldeps = epsln
+        delta = cs * dbar + sn * alfa
+        gbar = sn * dbar - cs * alfa
+        epsln = sn * beta
+        dbar = -cs * beta
+        gamma = max(sqrt(gbar**2 + beta**2), 1e-300)
+        cs, sn = gbar / gamma, beta / gamma
+        phi = cs * phibar
+        phibar = sn * phibar
+
+        # Update the solution.
+        w1, w2 = w2, w
+        w = (v - oldeps * w1 - delta * w2) / gamma
+        x = x + phi * w
+        monitor.step(phibar)
+
+        if phibar < tol:
+            reason = "absolute tolerance" if phibar < atol else "relative tolerance"
+            monitor.finish(True, reason)
+            break
+
+        if beta == 0.:
+            monitor.finish(True, "an exact Krylov subspace")
+            break
+
+        if (maxiter is not None) and (monitor.niter >= maxiter):
+            monitor.finish(False, f"maxiter ({maxiter})")
+            break
+
+    if returninfo:
+        return x, monitor.info()
+    return x
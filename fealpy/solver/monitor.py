@@ -0,0 +1,72 @@
+from typing import Optional, Callable, Any, Dict, List
+import time
+
+from .. import logger
+from ..backend import TensorLike
+
+
+class IterationMonitor():
+    """Record the residual history, the number of matrix-vector products and
+    the wall time of an iterative solver.
+
+    Parameters:
+        name (str): Name of the solver, used in logs.
+        callback (Callable[[int, float], Any] | None, optional): Called after
+            each iteration with the iteration number and the residual norm.
+            Defaults to None.
+    """
+    def __init__(self, name: str, callback: Optional[Callable[[int, float], Any]]=None):
+        self.name = name
+        self.callback = callback
+        self.residual: List[float] = []
+        self.nmatvec = 0
+        self.nprecond = 0
+        self.niter = 0
+        self.converged = False
+        self._start = time.perf_counter()
+        self.time = 0.
+
+    def matvec(self, A, x: TensorLike) -> TensorLike:
+        self.nmatvec += 1
+        return A @ x
+
+    def precond(self, M, r: TensorLike) -> TensorLike:
+        if M is None:
+            return r
+        self.nprecond += 1
+        return M @ r
+
+    def start(self, res_norm: float):
+        """Record the initial residual norm."""
+        self.residual.append(float(res_norm))
+
+    def step(self, res_norm: float):
+        """Record the residual norm of a new iteration."""
+        self.niter += 1
+        res_norm = float(res_norm)
+        self.residual.append(res_norm)
+        if self.callback is not None:
+            self.callback(self.niter, res_norm)
+
+    def finish(self, converged: bool, reason: str):
+        self.converged = converged
+        self.time = time.perf_counter() - self._start
+
+        if converged:
+            logger.info(f"{self.name}: converged in {self.niter} iterations, "
+                        f"stopped by {reason}.")
+        else:
+            logger.info(f"{self.name}: failed, stopped by {reason}.")
+
+    def info(self) -> Dict[str, Any]:
+        """Return the solving information, with keys `residual` (residual norm of
+        each iteration, starting from the initial one), `niter`, `nmatvec`,
+        `nprecond`, `time` (in seconds) and `converged`."""
+        return {
+            'residual': self.residual,
+            'niter': self.niter,
+            'nmatvec': self.nmatvec,
+            'nprecond': self.nprecond,
+            'time': self.time,
+            'converged': self.converged
+        }
@@ -0,0 +1,278 @@
+from typing import Optional, List, Tuple
+
+from .. import logger
+from ..backend import backend_manager as bm
+from ..backend import TensorLike
+from ..sparse import CSRTensor
+from ..sparse._spspmm import _expand_products
+from .amg_solver import csr_diagonal, csr_transpose, _expand_row, _compress
+
+
+def _check_matrix(A: CSRTensor):
+    if not isinstance(A, CSRTensor):
+        raise TypeError(f"A must be a CSRTensor, but got {type(A).__name__}.")
+    if A.dense_ndim != 0:
+        raise ValueError("Preconditioners do not support batched matrices.")
+    if A.shape[0] != A.shape[1]:
+        raise ValueError(f"A must be a square matrix, but got shape {A.shape}.")
+
+
+def _expand_dims(a: TensorLike, ndim: int) -> TensorLike:
+    return a.reshape(a.shape + (1, ) * (ndim - 1))
+
+
+def _csr_ranges(crow: TensorLike, rows: TensorLike) -> Tuple[TensorLike, TensorLike]:
+    """Positions of the non-zeros in the given rows, and the local index of
+    their rows in `rows`."""
+    kwargs = bm.context(crow)
+    start = crow[rows]
+    counts = crow[rows + 1] - start
+    local = bm.repeat(bm.arange(rows.shape[0], **kwargs), counts)
+    offsets = bm.cumsum(counts, axis=0) - counts
+    pos = start[local] + bm.arange(local.shape[0], **kwargs) - offsets[local]
+    return pos, local
+
+
+class SparseTriangularSolver():
+    """Solve sparse triangular systems by level scheduling.
+
+    Rows are grouped into levels such that rows in the same level only depend
+    on rows in the previous levels. The levels are computed once, then each
+    solve sweeps them with vectorized operations.
+
+    Parameters:
+        A (CSRTensor): Matrix providing the off-diagonal entries, of which only
+            the strict lower (upper) triangle is used.
+        diag (Tensor): The diagonal of the triangular matrix.
+        lower (bool, optional): Whether the matrix is lower triangular. Defaults to True.
+    """
+    def __init__(self, A: CSRTensor, diag: TensorLike, lower: bool=True):
+        n = A.shape[0]
+        crow, col, values = A.crow(), A.col(), A.values()
+        row = _expand_row(crow)
+        flag = (col < row) if lower else (col > row)
+        dep_crow = _compress(crow, flag)
+        dep_col, dep_values = col[flag], values[flag]
+
+        self.shape = A.shape
+        self.dinv = 1.0 / diag
+        self.levels: List[Tuple[TensorLike, TensorLike, TensorLike, TensorLike]] = []
+
+        for rows in self._schedule(dep_crow, dep_col, n):
+            pos, local = _csr_ranges(dep_crow, rows)
+            self.levels.append((rows, local, dep_col[pos], dep_values[pos]))
+
+    @staticmethod
+    def _schedule(crow: TensorLike, col: TensorLike, n: int) -> List[TensorLike]:
+        kwargs = bm.context(crow)
+        ndeps = crow[1:] - crow[:-1]
+        # dependents of each row, in the transposed pattern
+        crow_t, dependents, _ = csr_transpose(crow, col, (n, n))
+        frontier = bm.nonzero(ndeps == 0)[0]
+        levels = []
+
+        while frontier.shape[0] > 0:
+            levels.append(frontier)
+            pos, _ = _csr_ranges(crow_t, frontier)
+            hit = dependents[pos]
+            ndeps = bm.index_add(ndeps, hit, -bm.ones(hit.shape, **kwargs))
+            hit = bm.unique(hit)
+            frontier = hit[ndeps[hit] == 0]
+
+        return levels
+
+    @property
+    def depth(self) -> int:
+        """Number of levels."""
+        return len(self.levels)
+
+    def __matmul__(self, b: TensorLike) -> TensorLike:
+        x = bm.zeros_like(b)
+        dinv = _expand_dims(self.dinv, b.ndim)
+
+        for rows, local, cols, values in self.levels:
+            rhs = b[rows]
+            if cols.shape[0] > 0:
+                s = bm.zeros_like(rhs)
+                s = bm.index_add(s, local, _expand_dims(values, b.ndim) * x[cols], axis=0)
+                rhs = rhs - s
+            x = bm.set_at(x, rows, rhs * dinv[rows])
+
+        return x
+
+
+class JacobiPreconditioner():
+    """Jacobi preconditioner M = D^{-1}.
+
+    Parameters:
+        A (CSRTensor): The matrix of the linear system.
+    """
+    def __init__(self, A: CSRTensor):
+        _check_matrix(A)
+        self.shape = A.shape
+        self.dinv = 1.0 / csr_diagonal(A)
+
+    def __matmul__(self, r: TensorLike) -> TensorLike:
+        return _expand_dims(self.dinv, r.ndim) * r
+
+
+class BlockJacobiPreconditioner():
+    """Block-Jacobi preconditioner with the inverse of diagonal blocks.
+
+    Parameters:
+        A (CSRTensor): The matrix of the linear system.
+        block_size (int, optional): Size of the contiguous diagonal blocks, e.g. the
+            number of components of the vector field in the node-wise dof ordering.
+            The last block is padded if the matrix size is not divisible. Defaults to 3.
+    """
+    def __init__(self, A: CSRTensor, block_size: int=3):
+        _check_matrix(A)
+        self.shape = A.shape
+        self.block_size = block_size
+        n, bs = A.shape[0], block_size
+        nblock = -(-n // bs)
+        kwargs = A.values_context()
+
+        row, col, values = _expand_row(A.crow()), A.col(), A.values()
+        flag = (row // bs) == (col // bs)
+        row, col = row[flag], col[flag]
+        flat = (row // bs) * bs * bs + (row % bs) * bs + col % bs
+        blocks = bm.zeros((nblock * bs * bs, ), **kwargs)
+        blocks = bm.index_add(blocks, flat, values[flag])
+
+        # NOTE: diagonal of the padded dofs are set to 1.
+        npad = nblock * bs - n
+        if npad > 0:
+            pad = bm.arange(n, nblock * bs, **bm.context(row))
+            flat = (pad // bs) * bs * bs + (pad % bs) * (bs + 1)
+            blocks = bm.index_add(blocks, flat, bm.ones((npad, ), **kwargs))
+
+        self.inv_blocks = bm.linalg.inv(blocks.reshape(nblock, bs, bs))
+
+    def __matmul__(self, r: TensorLike) -> TensorLike:
+        n, bs = self.shape[0], self.block_size
+        nblock = self.inv_blocks.shape[0]
+        npad = nblock * bs - n
+        if npad > 0:
+            r = bm.concat([r, bm.zeros((npad, ) + r.shape[1:], **bm.context(r))], axis=0)
+        rb = r.reshape((nblock, bs) + r.shape[1:])
+        subs = 'bij, bj -> bi' if r.ndim == 1 else 'bij, bjk -> bik'
+        z = bm.einsum(subs, self.inv_blocks, rb)
+        return z.reshape((nblock * bs, ) + r.shape[1:])[:n]
+
+
+class SSORPreconditioner():
+    """Symmetric successive over-relaxation (SSOR) preconditioner
+
+        M = (D + wL) D^{-1} (D + wU) / (w(2-w)),
+
+    where D, L and U are the diagonal, strict lower and strict upper parts of A.
+    The triangular solves are done by level scheduling.
+
+    Parameters:
+        A (CSRTensor): The matrix of the linear system.
+        omega (float, optional): The relaxation factor in (0, 2). Defaults to 1.0.
+    """
+    def __init__(self, A: CSRTensor, omega: float=1.0):
+        _check_matrix(A)
+        if not (0. < omega < 2.):
+            raise ValueError(f"omega must be in (0, 2), but got {omega}.")
+        self.shape = A.shape
+        self.omega = omega
+        self.diag = csr_diagonal(A)
+        Aw = CSRTensor(A.crow(), A.col(), omega * A.values(), A.sparse_shape)
+        self.lower = SparseTriangularSolver(Aw, self.diag, lower=True)
+        self.upper = SparseTriangularSolver(Aw, self.diag, lower=False)
+
+    def __matmul__(self, r: TensorLike) -> TensorLike:
+        w = self.omega
+        y = self.lower @ r
+        y = _expand_dims(self.diag, r.ndim) * y
+        return (w * (2 - w)) * (self.upper @ y)
+
+
+class ILU0Preconditioner():
+    """Incomplete LU factorization with zero fill-in, ILU(0).
+
+    The factors are computed by the fine-grained fixed-point iterations of
+    Chow and Patel, where all entries are updated in parallel in each sweep.
+    The sweeps converge to the exact ILU(0) factorization, but only after as
+    many sweeps as the depth of the dependency of the entries, so the factors
+    are in general approximate ones, which are good enough for preconditioning.
+    A warning is logged when `tol` is not reached in `maxsweep` sweeps; raise
+    `maxsweep` for factors close to the exact ones. The triangular solves are
+    done by level scheduling.
+
+    Parameters:
+        A (CSRTensor): The matrix of the linear system, with all diagonal
+            entries in the pattern.
+        maxsweep (int, optional): Maximum number of sweeps. Defaults to 10.
+        tol (float, optional): Stop sweeping when the relative change of the
+            factors is less than `tol`. Defaults to 1e-8.
+
+    Attributes:
+        nsweep (int): Number of sweeps done.
+        change (float): Relative change of the factors in the last sweep.
+    """
+    def __init__(self, A: CSRTensor, maxsweep: int=10, tol: float=1e-8):
+        _check_matrix(A)
+        self.shape = A.shape
+        n = A.shape[0]
+        crow, col, values = A.crow(), A.col(), A.values()
+        row = _expand_row(crow)
+        is_lower = (col < row)
+        is_diag = (col == row)
+        is_upper = (col > row)
+        nnz = col.shape[0]
+
+        # NOTE: products l_ik * u_kj contributing to entry (i, j) of the pattern,
+        # with k < min(i, j).
+        ikwargs = bm.context(col)
+        lower_idx = bm.nonzero(is_lower)[0]
+        upper_idx = bm.nonzero(is_upper)[0]
+        upper_crow = _compress(crow, is_upper)
+        key, left, right = _expand_products(row[lower_idx], col[lower_idx],
+                                            upper_crow, col[upper_idx], n)
+        pattern_key = bm.astype(row, bm.int64) * n + col
+        order = bm.argsort(pattern_key)
+        sorted_key = pattern_key[order]
+        loc = bm.searchsorted(sorted_key, key)
+        loc = bm.where(loc < nnz, loc, 0)
+        is_fill = sorted_key[loc] != key
+        keep = bm.logical_not(is_fill)
+        left, right = lower_idx[left[keep]], upper_idx[right[keep]]
+        target = order[loc[keep]]
+
+        diag_pos = bm.zeros((n, ), **ikwargs)
+        diag_pos = bm.set_at(diag_pos, row[is_diag], bm.nonzero(is_diag)[0])
+        if int(bm.sum(is_diag)) != n:
+            raise ValueError("ILU(0) requires all diagonal entries in the pattern.")
+
+        factor = bm.where(is_lower, values / values[diag_pos][col], values)
+
+        for sweep in range(1, maxsweep + 1):
+            s = bm.zeros_like(values)
+            s = bm.index_add(s, target, factor[left] * factor[right])
+            new = values - s
+            new = bm.where(is_lower, new / factor[diag_pos][col], new)
+            change = bm.max(bm.abs(new - factor)) / bm.max(bm.abs(new))
+            factor = new
+            if change < tol:
+                break
+
+        self.nsweep = sweep
+        self.change = float(change)
+        if self.change < tol:
+            logger.info(f"ILU(0): factorized in {sweep} sweeps, relative change {self.change:.2e}.")
+        else:
+            logger.warning(f"ILU(0): relative change {self.change:.2e} of the factors is "
+                           f"larger than tol={tol:.2e} after {sweep} sweeps, "
+                           "the factors are approximate.")
+        # strict lower part for L (with unit diagonal), the rest for U
+        self.factor = CSRTensor(crow, col, factor, A.sparse_shape)
+        ones = bm.ones((n, ), **A.values_context())
+        self.lower = SparseTriangularSolver(self.factor, ones, lower=True)
+        self.upper = SparseTriangularSolver(self.factor, factor[diag_pos], lower=False)
+
+    def __matmul__(self, r: TensorLike) -> TensorLike:
+        return self.upper @ (self.lower @ r)
@@ -28,44 +28,60 @@ def _shape_check(spshape: _Size, xshape: _Size):
 
 
 def spmm_coo(indices: _DT, values: _DT, spshape: _Size, x: _DT) -> _DT:
+    """Sparse-dense matrix multiplication for COO layout.
+
+    Parameters:
+        indices (Tensor): Indices of non-zeros, shaped (2, nnz).
+        values (Tensor): Values of non-zeros, shaped (*B, nnz).
+        spshape (Size): Shape of the sparse dimensions, (M, N).
+        x (Tensor): Dense tensor shaped (N,), (N, K) or (*B, N, K).
+
+    Returns:
+        Tensor: Result shaped (*B, M) or (*B, M, K).
+    """
     _shape_check(spshape, x.shape)
     row = indices[0]
     col = indices[1]
+    context = dict(dtype=bm.result_type(values, x), device=bm.get_device(x))
 
     if x.ndim == 1:
-        new_vals = values * x[col]
+        new_vals = values * x[col] # (*B, nnz)
         shape = new_vals.shape[:-1] + (spshape[0], )
-        result = bm.zeros(shape, dtype=x.dtype)
+        result = bm.zeros(shape, **context)
         result = bm.index_add(result, row, new_vals, axis=-1)
         return result
 
     else: # x.ndim >= 2
-        new_vals = values[..., None] * x[..., col, :] # (*batch, nnz, x_col)
+        new_vals = values[..., None] * x[..., col, :] # (*B, nnz, K)
         shape = new_vals.shape[:-2] + (spshape[0], x.shape[-1])
-        result = bm.zeros(shape, dtype=x.dtype)
+        result = bm.zeros(shape, **context)
         result = bm.index_add(result, row, new_vals, axis=-2)
         return result
 
 
 def spmm_csr(crow: _DT, col: _DT, values: _DT, spshape: _Size, x: _DT) -> _DT:
+    """Sparse-dense matrix multiplication for CSR layout.
+
+    The products of non-zeros are reduced in row segments given by `crow`,
+    so that no Python loop over rows is needed. Batched values and multiple
+    right-hand sides are supported.
+
+    Parameters:
+        crow (Tensor): Compressed row pointers, shaped (M+1,).
+        col (Tensor): Column indices of non-zeros, shaped (nnz,).
+        values (Tensor): Values of non-zeros, shaped (*B, nnz).
+        spshape (Size): Shape of the sparse dimensions, (M, N).
+        x (Tensor): Dense tensor shaped (N,), (N, K) or (*B, N, K).
+
+    Returns:
+        Tensor: Result shaped (*B, M) or (*B, M, K).
+    """
     _shape_check(spshape, x.shape)
     nrow = spshape[0]
-    unsqueezed = False
-
-    if x.ndim == 1:
-        x = x[:, None]
-        unsqueezed = True
-
-    shape = x.shape[:-2] + (nrow, x.shape[-1])
-    result = bm.zeros(shape, dtype=x.dtype)
-
-    for i in range(nrow):
-        start = crow[i]
-        end = crow[i + 1]
-        r = bm.einsum('...i, ...ij -> ...j', values[..., start:end], x[..., col[start:end], :])
-        result[..., i, :] = r
-
-    if unsqueezed:
-        result = result[..., 0]
+    row = bm.repeat(
+        bm.arange(nrow, dtype=crow.dtype, device=bm.get_device(crow)),
+        crow[1:] - crow[:-1]
+    )
+    indices = bm.stack([row, col], axis=0)
 
-    return result
+    return spmm_coo(indices, values, spshape, x)
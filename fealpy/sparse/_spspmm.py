@@ -17,97 +17,141 @@ def _shape_check(spshape1: _Size, spshape2: _Size):
                         f"got shape {spshape1} and {spshape2}.")
 
 
-def spspmm_coo(indices1: _DT, values1: _DT, spshape1: _Size,
-               indices2: _DT, values2: _DT, spshape2: _Size) -> Tuple[_DT, _DT, _Size]:
-    _shape_check(spshape1, spshape2)
-
+def _check_structure(values1: _DT, values2: _DT):
     structure = values1.shape[:-1]
     if values2.shape[:-1] != structure:
         raise ValueError(f"the dense shape of matrix2 ({values2.shape[:-1]}) "
                          f"must match that of matrix1 {structure}")
 
-    size = spshape1[1]
-    indices_list = []
-    values_list = []
 
-    for i in range(size):
-        left_col_flag = (indices1[1, :] == i)
+def _expand_products(row1: _DT, col1: _DT, crow2: _DT, col2: _DT, ncol: int):
+    """Expand all the products a_ik * b_kj of two sparse matrices.
 
-        if not bm.any(left_col_flag, axis=0):
-            continue
+    Each non-zero of the left matrix in column k is paired with every
+    non-zero in the k-th row of the right matrix, like the row merge in
+    Gustavson's algorithm, but vectorized over all the non-zeros.
 
-        right_row_flag = (indices2[0, :] == i)
+    Returns:
+        Tuple[Tensor, Tensor, Tensor]: the flattened output position
+        `row * ncol + col` (int64), the index of the left factor and
+        the index of the right factor, all shaped (n_products,).
+    """
+    kwargs = bm.context(col1)
+    nnz1 = col1.shape[0]
+    rowcnt2 = crow2[1:] - crow2[:-1]
+    cnt = rowcnt2[col1]
+    left = bm.repeat(bm.arange(nnz1, **kwargs), cnt)
+    start = bm.cumsum(cnt, axis=0) - cnt
+    offset = bm.arange(left.shape[0], **kwargs) - bm.repeat(start, cnt)
+    right = bm.repeat(crow2[:-1][col1], cnt) + offset
+    key = bm.astype(row1[left], bm.int64) * ncol + col2[right]
 
-        if not bm.any(right_row_flag, axis=0):
-            continue
+    return key, left, right
 
-        row = indices1[0, left_col_flag]
-        col = indices2[1, right_row_flag]
-        nnz = col.shape[0] * row.shape[0]
-        idx = bm.meshgrid(row, col, indexing='ij')
-        idx = bm.reshape(bm.stack(idx, axis=0), (2, nnz))
-        val1 = values1[..., left_col_flag]
-        val2 = values2[..., right_row_flag]
 
-        val = bm.einsum('...i, ...j -> ...ij', val1, val2).reshape(*structure, nnz)
-        indices_list.append(idx)
-        values_list.append(val)
+def _compress_products(key: _DT, nrow: int, ncol: int, itype):
+    """Sum up products at the same position and build the CSR pattern."""
+    kwargs = dict(dtype=itype, device=bm.get_device(key))
 
-    indices = bm.concat(indices_list, axis=1)
-    values = bm.concat(values_list, axis=-1)
-    return indices, values, (spshape1[0], spshape2[1])
+    if key.shape[0] == 0:
+        empty = bm.zeros((0, ), **kwargs)
+        return bm.zeros((nrow + 1, ), **kwargs), empty, empty, empty
 
+    keys, target = bm.unique(key, return_inverse=True)
+    row = bm.astype(keys // ncol, itype)
+    col = bm.astype(keys % ncol, itype)
+    crow = bm.astype(bm.searchsorted(row, bm.arange(nrow + 1, **kwargs)), itype)
 
-def spspmm_csr(crow1: _DT, col1: _DT, values1: _DT, spshape1: _Size,
-               crow2: _DT, col2: _DT, values2: _DT, spshape2: _Size) -> Tuple[_DT, _DT, _Size]:
-    _shape_check(spshape1, spshape2)
+    return crow, row, col, target.reshape(-1)
 
-    structure = values1.shape[:-1]
-    if values2.shape[:-1] != structure:
-        raise ValueError(f"the dense shape of matrix2 ({values2.shape[:-1]}) "
-                         f"must match that of matrix1 {structure}")
 
-    size = spshape1[1]
-    indices_list = []
-    values_list = []
-    new_crow = bm.zeros(size+1,dtype=bm.int64)
+def spspmm_numeric(values1: _DT, values2: _DT, left: _DT, right: _DT,
+                   target: _DT, nnz: int) -> _DT:
+    """Numeric phase of the sparse-sparse matrix multiplication.
 
-    for i in range(size):
-        row = bm.array([],dtype=bm.int64)
-        left_col_flag = (col1 == i)
+    Parameters:
+        values1 (Tensor): Values of the left matrix, shaped (..., nnz1).
+        values2 (Tensor): Values of the right matrix, shaped (..., nnz2).
+        left (Tensor): Index of the left factor of each product.
+        right (Tensor): Index of the right factor of each product.
+        target (Tensor): Index of the output non-zero of each product.
+        nnz (int): Number of non-zeros of the output.
 
-        for x in bm.where(left_col_flag == True)[0]+1:
-            flag = ~(x>crow1[:-1])^(x<=crow1[1:])
-            row = bm.concat((row,(bm.where(flag == True))[0]))
+    Returns:
+        Tensor: Values of the output, shaped (..., nnz).
+    """
+    _check_structure(values1, values2)
+    prod_vals = values1[..., left] * values2[..., right]
+    context = dict(dtype=prod_vals.dtype, device=bm.get_device(prod_vals))
+    new_values = bm.zeros(values1.shape[:-1] + (nnz, ), **context)
 
-        col = col2[crow2[i]:crow2[i+1]]
+    if target.shape[0] == 0:
+        return new_values
 
-        if not bm.any(row, axis=0):
-            continue
+    return bm.index_add(new_values, target, prod_vals, axis=-1)
 
-        if not bm.any(col, axis=0):
-            continue
 
-        idx = bm.meshgrid(row, col, indexing='ij')
-        nnz = col.shape[0] * row.shape[0]
-        idx = bm.reshape(bm.stack(idx, axis=0), (2, nnz))
-        val1 = values1[..., left_col_flag]
-        val2 = values2[..., crow2[i]:crow2[i+1]]
-        val = bm.einsum('...i, ...j -> ...ij', val1, val2).reshape(*structure, nnz)
+def spspmm_coo(indices1: _DT, values1: _DT, spshape1: _Size,
+               indices2: _DT, values2: _DT, spshape2: _Size) -> Tuple[_DT, _DT, _Size]:
+    """Multiply two sparse matrices in COO layout.
+
+    Returns:
+        Tuple[Tensor, Tensor, Size]: the coalesced indices and values of the
+        output, and the output shape.
+    """
+    _shape_check(spshape1, spshape2)
+    _check_structure(values1, values2)
+    nrow, ncol = spshape1[0], spshape2[1]
+    kwargs = bm.context(indices2)
+
+    order2 = bm.argsort(indices2[0], stable=True)
+    row2 = indices2[0, order2]
+    crow2 = bm.searchsorted(row2, bm.arange(spshape2[0] + 1, **kwargs))
+    col2 = indices2[1, order2]
+
+    key, left, right = _expand_products(indices1[0], indices1[1], crow2, col2, ncol)
+    _, row, col, target = _compress_products(key, nrow, ncol, indices1.dtype)
+    values = spspmm_numeric(values1, values2, left, order2[right], target, col.shape[0])
 
-        indices_list.append(idx)
-        values_list.append(val)
+    return bm.stack([row, col], axis=0), values, (nrow, ncol)
 
-    indices = bm.concat(indices_list, axis=1)
-    values = bm.concat(values_list, axis=-1)
 
-    unique_indices, inverse_indices = bm.unique(indices, return_inverse=True, axis=1)
-    new_values = bm.zeros(unique_indices.shape[1])
-    new_values = bm.index_add(new_values, inverse_indices, values, axis=-1)
+def spspmm_csr_symbolic(crow1: _DT, col1: _DT, spshape1: _Size,
+                        crow2: _DT, col2: _DT, spshape2: _Size):
+    """Symbolic phase of the sparse-sparse matrix multiplication in CSR layout.
 
-    for x in unique_indices[0,:]:
-        new_crow[x+1]+=1
+    The output pattern and the map from products to output non-zeros only
+    depend on the patterns of inputs. Keep them to multiply matrices with
+    the same patterns but new values by `spspmm_numeric`.
 
-    new_crow=bm.cumsum(new_crow, axis =-1)
+    Returns:
+        Tuple[Tensor, Tensor, Tensor, Tensor, Tensor, Size]: crow and col of
+        the output, `left`, `right` and `target` indices for the numeric phase,
+        and the output shape.
+    """
+    _shape_check(spshape1, spshape2)
+    nrow, ncol = spshape1[0], spshape2[1]
+    kwargs = bm.context(crow1)
+    row1 = bm.repeat(bm.arange(nrow, **kwargs), crow1[1:] - crow1[:-1])
+
+    key, left, right = _expand_products(row1, col1, crow2, col2, ncol)
+    crow, _, col, target = _compress_products(key, nrow, ncol, crow1.dtype)
+
+    return crow, col, left, right, target, (nrow, ncol)
 
-    return new_crow, unique_indices[1,:], new_values,(spshape1[0], spshape2[1])
+
+def spspmm_csr(crow1: _DT, col1: _DT, values1: _DT, spshape1: _Size,
+               crow2: _DT, col2: _DT, values2: _DT, spshape2: _Size) -> Tuple[_DT, _DT, _DT, _Size]:
+    """Multiply two sparse matrices in CSR layout.
+
+    Returns:
+        Tuple[Tensor, Tensor, Tensor, Size]: crow, col and values of the
+        output, and the output shape.
+    """
+    _check_structure(values1, values2)
+    crow, col, left, right, target, spshape = spspmm_csr_symbolic(
+        crow1, col1, spshape1, crow2, col2, spshape2
+    )
+    values = spspmm_numeric(values1, values2, left, right, target, col.shape[0])
+
+    return crow, col, values, spshape
@@ -448,7 +448,7 @@ class COOTensor(SparseTensor):
                 self.indices(), self.values(), self.sparse_shape,
                 other.indices(), other.values(), other.sparse_shape,
             )
-            return COOTensor(indices, values, spshape).coalesce()
+            return COOTensor(indices, values, spshape, is_coalesced=True)
 
         elif isinstance(other, TensorLike):
             if self.values() is None:
@@ -1,2 +1,9 @@
-from .MeshWriter import MeshWriter
-from .VTKMeshWriter import VTKMeshWriter
+from .._lazy import attach
+
+# NOTE: The writers are imported on first access, so vtk is only needed
+# by `MeshWriter` and `VTKMeshWriter`.
+__getattr__, __dir__, __all__ = attach(__name__, {
+    'VTUWriter': '.vtu_writer',
+    'MeshWriter': '.MeshWriter',
+    'VTKMeshWriter': '.VTKMeshWriter',
+})
@@ -0,0 +1,264 @@
+import os
+import zlib
+import queue
+import threading
+from typing import Optional, Dict, List, Tuple, Any
+
+import numpy as np
+
+from ..backend import backend_manager as bm
+
+
+_VTK_TYPES = {
+    np.dtype(np.int8): 'Int8', np.dtype(np.uint8): 'UInt8',
+    np.dtype(np.int16): 'Int16', np.dtype(np.uint16): 'UInt16',
+    np.dtype(np.int32): 'Int32', np.dtype(np.uint32): 'UInt32',
+    np.dtype(np.int64): 'Int64', np.dtype(np.uint64): 'UInt64',
+    np.dtype(np.float32): 'Float32', np.dtype(np.float64): 'Float64'
+}
+
+
+def _to_numpy(array) -> np.ndarray:
+    if hasattr(array, 'array') and not bm.is_tensor(array): # Function
+        array = array[:]
+    array = np.asarray(bm.to_numpy(array))
+    if array.dtype == np.bool_:
+        array = array.astype(np.uint8)
+    return array
+
+
+class _DataArray():
+    """A named array encoded for the appended section of a VTU file."""
+    def __init__(self, name: str, array: np.ndarray, compress: bool):
+        array = np.ascontiguousarray(array, dtype=array.dtype.newbyteorder('<'))
+        if array.dtype.newbyteorder('=') not in _VTK_TYPES:
+            raise TypeError(f"Unsupported dtype {array.dtype} of data '{name}'.")
+        self.name = name
+        self.type = _VTK_TYPES[array.dtype.newbyteorder('=')]
+        self.ncomponents = 1 if array.ndim == 1 else int(np.prod(array.shape[1:]))
+        raw = array.tobytes()
+
+        if compress:
+            data = zlib.compress(raw)
+            # NOTE: one block, header [#blocks, block size, last block size, compressed sizes]
+            header = np.array([1, len(raw), len(raw), len(data)], dtype='<u8')
+        else:
+            data = raw
+            header = np.array([len(raw)], dtype='<u8')
+        self.block = header.tobytes() + data
+
+    def xml(self, offset: int) -> str:
+        name = f' Name="{self.name}"' if self.name else ''
+        return (f'<DataArray type="{self.type}"{name} NumberOfComponents="{self.ncomponents}" '
+                f'format="appended" offset="{offset}"/>')
+
+
+class _Geometry():
+    """Encoded points and cells of a mesh, from the outputs of `to_vtk`."""
+    def __init__(self, node: np.ndarray, cell: np.ndarray, cell_type, NC: int,
+                 compress: bool):
+        if node.shape[1] < 3:
+            node = np.concatenate([node, np.zeros((node.shape[0], 3 - node.shape[1]),
+                                                  dtype=node.dtype)], axis=1)
+        connectivity, offsets = self._parse_cells(cell, NC)
+        types = np.broadcast_to(np.asarray(cell_type, dtype=np.uint8), (NC, ))
+
+        self.NN = node.shape[0]
+        self.NC = NC
+        self.points = _DataArray('', node, compress)
+        self.cells = [
+            _DataArray('connectivity', connectivity, compress),
+            _DataArray('offsets', offsets, compress),
+            _DataArray('types', np.ascontiguousarray(types), compress)
+        ]
+
+    @staticmethod
+    def _parse_cells(cell: np.ndarray, NC: int) -> Tuple[np.ndarray, np.ndarray]:
+        """Split the vtk cell list [nv, v0, v1, ..., nv, ...] into the
+        connectivity and offsets."""
+        cell = cell.astype(np.int64)
+        if NC > 0 and cell.shape[0] % NC == 0:
+            cell2d = cell.reshape(NC, -1)
+            if np.all(cell2d[:, 0] == cell2d.shape[1] - 1):
+                nv = cell2d.shape[1] - 1
+                return cell2d[:, 1:].reshape(-1), np.arange(1, NC + 1, dtype=np.int64) * nv
+        # variable number of vertices, e.g. polygon meshes
+        counts = np.zeros(NC, dtype=np.int64)
+        starts = np.zeros(NC, dtype=np.int64)
+        pos = 0
+        for i in range(NC):
+            counts[i] = cell[pos]
+            starts[i] = pos + 1
+            pos += counts[i] + 1
+        idx = np.repeat(starts - np.cumsum(counts) + counts, counts) + np.arange(counts.sum())
+        return cell[idx], np.cumsum(counts)
+
+
+class VTUWriter():
+    """Write meshes and data to appended raw binary VTU files with a PVD time
+    series, in a background thread.
+
+    The points and cells are encoded once for each version of each mesh, and
+    reused by all steps. Data are copied to numpy arrays in `write`, so the
+    simulation can go on changing them while the files are written. The queue
+    of pending steps is bounded, so `write` blocks when I/O falls behind.
+
+    Parameters:
+        path (str): The output directory.
+        prefix (str, optional): Prefix of the file names, as in `prefix_000000.vtu`
+            and `prefix.pvd`. Defaults to 'solution'.
+        compress (bool, optional): Compress the data with zlib. Defaults to False.
+        maxsize (int, optional): Maximum number of pending steps. Defaults to 4.
+
+    Example:
+        with VTUWriter('output') as writer:
+            for step in range(nt):
+                ...
+                writer.write(mesh, time=t, nodedata={'uh': uh})
+    """
+    def __init__(self, path: str, prefix: str='solution', *, compress: bool=False,
+                 maxsize: int=4):
+        os.makedirs(path, exist_ok=True)
+        self.path = path
+        self.prefix = prefix
+        self.compress = compress
+        self.steps: List[Tuple[float, str]] = []
+        # NOTE: meshes are kept alive so that their ids are not reused.
+        self._meshes: Dict[Tuple[int, str], Tuple[Any, int]] = {}
+        self._geometry: Dict[Tuple[int, str], _Geometry] = {} # used by the thread only
+        self._error: Optional[BaseException] = None
+        self._queue = queue.Queue(maxsize=maxsize)
+        self._thread = threading.Thread(target=self._run, daemon=True)
+        self._thread.start()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *args):
+        self.close()
+
+    def write(self, mesh, time: Optional[float]=None, *,
+              nodedata: Optional[Dict[str, Any]]=None,
+              celldata: Optional[Dict[str, Any]]=None,
+              etype: str='cell') -> str:
+        """Add a step to the time series.
+
+        Parameters:
+            mesh (Mesh): The mesh, with a `to_vtk` method.
+            time (float | None, optional): Time of the step. Defaults to the step number.
+            nodedata (Dict[str, Tensor] | None, optional): Data on nodes. Defaults to
+                `mesh.nodedata`.
+            celldata (Dict[str, Tensor] | None, optional): Data on cells. Defaults to
+                `mesh.celldata`.
+            etype (str, optional): Type of the entities to write. Defaults to 'cell'.
+
+        Returns:
+            str: The name of the VTU file of this step.
+        """
+        self._check()
+        step = len(self.steps)
+        time = float(step) if time is None else float(time)
+        fname = f'{self.prefix}_{step:06d}.vtu'
+        self.steps.append((time, fname))
+
+        nodedata = getattr(mesh, 'nodedata', {}) if nodedata is None else nodedata
+        celldata = getattr(mesh, 'celldata', {}) if celldata is None else celldata
+        nodedata = {k: np.array(_to_numpy(v)) for k, v in nodedata.items() if v is not None}
+        celldata = {k: np.array(_to_numpy(v)) for k, v in celldata.items() if v is not None}
+
+        key = (id(mesh), etype)
+        version = getattr(mesh, 'version', 0)
+        stored = self._meshes.get(key, None)
+        if (stored is None) or (stored[0] is not mesh) or (stored[1] != version):
+            self._meshes[key] = (mesh, version)
+            node, cell, cell_type, NC = mesh.to_vtk(etype=etype)
+            geometry = (np.array(_to_numpy(node)), np.array(_to_numpy(cell)), cell_type, NC)
+        else:
+            geometry = None
+
+        self._queue.put((key, geometry, fname, nodedata, celldata, list(self.steps)))
+        return fname
+
+    def flush(self):
+        """Wait until all pending steps are written."""
+        self._queue.join()
+        self._check()
+
+    def close(self):
+        """Write the pending steps and stop the background thread."""
+        if self._thread.is_alive():
+            self._queue.put(None)
+            self._thread.join()
+        self._check()
+
+    def _check(self):
+        if self._error is not None:
+            error, self._error = self._error, None
+            raise RuntimeError("Failed to write VTU files.") from error
+
+    def _run(self):
+        while True:
+            job = self._queue.get()
+            try:
+                if job is None:
+                    return
+                if self._error is None:
+                    self._write(*job)
+            except BaseException as e:
+                self._error = e
+            finally:
+                self._queue.task_done()
+
+    def _write(self, key, geometry, fname, nodedata, celldata, steps):
+        if geometry is not None:
+            self._geometry[key] = _Geometry(*geometry, compress=self.compress)
+        geo = self._geometry[key]
+
+        for kind, data, n in (('node', nodedata, geo.NN), ('cell', celldata, geo.NC)):
+            for k, v in data.items():
+                if v.shape[0] != n:
+                    raise ValueError(f"Data '{k}' has {v.shape[0]} entries, "
+                                     f"but the mesh has {n} {kind}s.")
+        pdata = [_DataArray(k, v, self.compress) for k, v in nodedata.items()]
+        cdata = [_DataArray(k, v, self.compress) for k, v in celldata.items()]
+
+        blocks, lines, offset = [], [], 0
+        def add(section: List[_DataArray]):
+            nonlocal offset
+            for a in section:
+                lines.append(a.xml(offset))
+                blocks.append(a.block)
+                offset += len(a.block)
+
+        compressor = ' compressor="vtkZLibDataCompressor"' if self.compress else ''
+        lines.append('<?xml version="1.0"?>')
+        lines.append(f'<VTKFile type="UnstructuredGrid" version="1.0" byte_order="LittleEndian" '
+                     f'header_type="UInt64"{compressor}>')
+        lines.append('<UnstructuredGrid>')
+        lines.append(f'<Piece NumberOfPoints="{geo.NN}" NumberOfCells="{geo.NC}">')
+        lines.append('<PointData>'); add(pdata); lines.append('</PointData>')
+        lines.append('<CellData>'); add(cdata); lines.append('</CellData>')
+        lines.append('<Points>'); add([geo.points]); lines.append('</Points>')
+        lines.append('<Cells>'); add(geo.cells); lines.append('</Cells>')
+        lines.append('</Piece>')
+        lines.append('</UnstructuredGrid>')
+        lines.append('<AppendedData encoding="raw">')
+
+        with open(os.path.join(self.path, fname), 'wb') as f:
+            f.write('\n'.join(lines).encode() + b'\n_')
+            for block in blocks:
+                f.write(block)
+            f.write(b'\n</AppendedData>\n</VTKFile>\n')
+
+        self._write_pvd(steps)
+
+    def _write_pvd(self, steps):
+        lines = ['<?xml version="1.0"?>',
+                 '<VTKFile type="Collection" version="0.1" byte_order="LittleEndian">',
+                 '<Collection>']
+        lines.extend(f'<DataSet timestep="{t!r}" part="0" file="{f}"/>' for t, f in steps)
+        lines.extend(['</Collection>', '</VTKFile>', ''])
+        fname = os.path.join(self.path, self.prefix + '.pvd')
+        with open(fname + '.tmp', 'w') as f:
+            f.write('\n'.join(lines))
+        os.replace(fname + '.tmp', fname)
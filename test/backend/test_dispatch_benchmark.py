@@ -0,0 +1,86 @@
+import time
+import threading
+
+import pytest
+
+from fealpy.backend import backend_manager as bm
+from fealpy.backend.manager import BackendManager
+
+
+class _GetattrManager():
+    """The former dispatch path, through `__getattr__` and a check of the
+    thread-local dict, kept here as the reference."""
+    def __init__(self, manager: BackendManager):
+        self._manager = manager
+        self._THREAD_LOCAL = threading.local()
+        self._THREAD_LOCAL.__dict__['backend'] = manager.get_current_backend()
+
+    def get_current_backend(self, logger_msg=None):
+        if 'backend' not in self._THREAD_LOCAL.__dict__:
+            raise RuntimeError(logger_msg)
+        return self._THREAD_LOCAL.__dict__['backend']
+
+    def __getattr__(self, item):
+        return getattr(self.get_current_backend("GET_ATTR: " + item), item)
+
+
+def _per_call(stmt, number: int=100000, repeat: int=5):
+    best = float('inf')
+    for _ in range(repeat):
+        start = time.perf_counter()
+        for _ in range(number):
+            stmt()
+        best = min(best, time.perf_counter() - start)
+    return best / number
+
+
+def run_dispatch_benchmark(number: int=100000):
+    old = _GetattrManager(bm)
+    xp = bm.get_current_backend()
+    a = bm.ones(3)
+
+    t_old = _per_call(lambda: old.abs, number)
+    t_new = _per_call(lambda: bm.abs, number)
+    t_bound = _per_call(lambda: xp.abs, number)
+    t_call_old = _per_call(lambda: old.abs(a), number)
+    t_call_new = _per_call(lambda: bm.abs(a), number)
+
+    print(f"\n[{bm.backend_name}] per-access: __getattr__ {t_old*1e9:.0f} ns, "
+          f"__getattribute__ {t_new*1e9:.0f} ns, bound backend {t_bound*1e9:.0f} ns; "
+          f"bm.abs(a): {t_call_old*1e9:.0f} ns -> {t_call_new*1e9:.0f} ns")
+    return t_old, t_new, t_bound
+
+
+@pytest.mark.parametrize("backend", ['numpy', 'pytorch'])
+def test_dispatch_benchmark(backend):
+    bm.set_backend(backend)
+    # NOTE: only reports the timings, which are too noisy to be asserted.
+    t_old, t_new, t_bound = run_dispatch_benchmark(20000)
+    assert min(t_old, t_new, t_bound) > 0
+
+
+@pytest.mark.parametrize("backend", ['numpy', 'pytorch'])
+def test_dispatch_per_thread(backend):
+    bm.set_backend(backend)
+    result = {}
+
+    def worker():
+        result['default'] = bm.backend_name # the default backend of a new thread
+        bm.set_backend('pytorch' if backend == 'numpy' else 'numpy')
+        result['switched'] = bm.backend_name
+
+    thread = threading.Thread(target=worker)
+    thread.start()
+    thread.join()
+
+    assert result['default'] == 'numpy'
+    assert result['switched'] != backend
+    assert bm.backend_name == backend
+    assert bm.get_current_backend().backend_name == backend
+    assert isinstance(bm, BackendManager)
+
+
+if __name__ == "__main__":
+    for backend in ['numpy', 'pytorch']:
+        bm.set_backend(backend)
+        run_dispatch_benchmark()
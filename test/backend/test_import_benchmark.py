@@ -0,0 +1,72 @@
+import sys
+import time
+import subprocess
+
+import pytest
+
+
+HEAVY_MODULES = ['scipy.sparse', 'sympy', 'torch', 'jax', 'vtk', 'pygame']
+
+
+def run_import_benchmark(package: str, repeat: int=3):
+    """Import a package in fresh interpreters, and return the best wall time
+    and the heavy modules imported with it."""
+    code = (
+        "import sys, time\n"
+        "start = time.perf_counter()\n"
+        f"import {package}\n"
+        "t = time.perf_counter() - start\n"
+        f"print(t, *[m for m in {HEAVY_MODULES!r} if m in sys.modules])\n"
+    )
+    best, loaded = float('inf'), []
+    for _ in range(repeat):
+        out = subprocess.run([sys.executable, '-c', code], capture_output=True,
+                             text=True, check=True).stdout.split()
+        best, loaded = min(best, float(out[0])), out[1:]
+    print(f"\nimport {package}: {best*1e3:.1f} ms, heavy modules: {loaded}")
+    return best, loaded
+
+
+@pytest.mark.parametrize("package", [
+    'fealpy', 'fealpy.backend', 'fealpy.mesh', 'fealpy.functionspace',
+    'fealpy.fem', 'fealpy.opt', 'fealpy.writer'
+])
+def test_import_benchmark(package):
+    t, loaded = run_import_benchmark(package, repeat=1)
+    assert loaded == []
+
+
+def test_lazy_attributes():
+    import fealpy.mesh
+    import fealpy.fem
+    from fealpy.mesh import TriangleMesh
+    from fealpy.fem import SourceIntegrator, CellSourceIntegrator
+
+    assert TriangleMesh.__module__ == 'fealpy.mesh.triangle_mesh'
+    assert SourceIntegrator is CellSourceIntegrator
+    assert 'TetrahedronMesh' in dir(fealpy.mesh)
+    with pytest.raises(AttributeError):
+        fealpy.mesh.NoSuchMesh
+
+
+OPTIONAL_MODULES = {'jax', 'pygame', 'vtk'}
+
+
+@pytest.mark.parametrize("package", [
+    'fealpy.mesh', 'fealpy.functionspace', 'fealpy.fem', 'fealpy.fdm',
+    'fealpy.cfd', 'fealpy.opt', 'fealpy.writer'
+])
+def test_lazy_all(package):
+    import importlib
+    module = importlib.import_module(package)
+    for name in module.__all__:
+        try:
+            getattr(module, name)
+        except ModuleNotFoundError as e:
+            if e.name.split('.')[0] not in OPTIONAL_MODULES:
+                raise
+
+
+if __name__ == "__main__":
+    for package in ['fealpy', 'fealpy.mesh', 'fealpy.functionspace', 'fealpy.fem']:
+        run_import_benchmark(package)
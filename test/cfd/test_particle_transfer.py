@@ -0,0 +1,111 @@
+import numpy as np
+import pytest
+
+from fealpy.backend import backend_manager as bm
+from fealpy.mesh import UniformMesh2d, UniformMesh3d
+from fealpy.cfd.particle_transfer import ParticleGridTransfer
+
+
+def _mesh(GD):
+    if GD == 2:
+        return UniformMesh2d((0, 8, 0, 6), h=(1/8, 1/6), origin=(0.0, 0.0))
+    return UniformMesh3d((0, 5, 0, 4, 0, 6), h=(1/5, 1/4, 1/6), origin=(0.0, 0.0, 0.0))
+
+
+def _points(GD, NP=50, low=0.0, high=1.0):
+    rng = np.random.default_rng(0)
+    return bm.from_numpy(low + (high - low) * rng.random((NP, GD)))
+
+
+class TestParticleGridTransfer:
+    @pytest.mark.parametrize('backend', ['numpy', 'pytorch'])
+    @pytest.mark.parametrize('GD', [2, 3])
+    @pytest.mark.parametrize('kernel', ['nearest', 'linear', 'quadratic'])
+    @pytest.mark.parametrize('location', ['node', 'cell'])
+    def test_weights(self, backend, GD, kernel, location):
+        bm.set_backend(backend)
+        transfer = ParticleGridTransfer(_mesh(GD), kernel=kernel, location=location)
+        points = _points(GD)
+        index, weight = transfer.weights(points)
+        S = {'nearest': 1, 'linear': 2, 'quadratic': 3}[kernel]
+        assert index.shape == (50, S**GD)
+        np.testing.assert_allclose(bm.to_numpy(bm.sum(weight, axis=-1)), 1.0, atol=1e-12)
+        assert bm.to_numpy(index).min() >= 0
+        assert bm.to_numpy(index).max() < transfer.number_of_grid_points()
+
+    @pytest.mark.parametrize('backend', ['numpy', 'pytorch'])
+    @pytest.mark.parametrize('GD', [2, 3])
+    def test_cell_location(self, backend, GD):
+        bm.set_backend(backend)
+        mesh = _mesh(GD)
+        transfer = ParticleGridTransfer(mesh, kernel='nearest', location='cell')
+        points = _points(GD)
+        bc = bm.to_numpy(mesh.entity_barycenter('cell'))
+        p = bm.to_numpy(points)
+        h = np.array(mesh.h)
+        host = np.all(np.abs(p[:, None] - bc[None]) <= h / 2, axis=-1)
+        cell = bm.to_numpy(transfer.cell_location(points))
+        assert np.all(host[np.arange(50), cell])
+        index, _ = transfer.weights(points)
+        np.testing.assert_array_equal(bm.to_numpy(index)[:, 0], cell)
+
+    @pytest.mark.parametrize('backend', ['numpy', 'pytorch'])
+    @pytest.mark.parametrize('GD', [2, 3])
+    @pytest.mark.parametrize('kernel', ['linear', 'quadratic'])
+    def test_linear_field(self, backend, GD, kernel):
+        bm.set_backend(backend)
+        mesh = _mesh(GD)
+        transfer = ParticleGridTransfer(mesh, kernel=kernel)
+        points = _points(GD, low=0.2, high=0.8)
+        A = bm.from_numpy(np.arange(GD*GD, dtype=np.float64).reshape(GD, GD) / 10)
+        b = bm.from_numpy(np.arange(1, GD + 1, dtype=np.float64))
+        U = mesh.entity('node') @ A.T + b
+
+        v, C = transfer.grid_to_particle(points, U, affine=True)
+        np.testing.assert_allclose(bm.to_numpy(v), bm.to_numpy(points @ A.T + b), atol=1e-12)
+        np.testing.assert_allclose(bm.to_numpy(C), np.broadcast_to(bm.to_numpy(A), (50, GD, GD)),
+                                   atol=1e-10)
+
+        # APIC keeps affine velocity fields on the grid
+        mass = bm.from_numpy(np.linspace(1.0, 2.0, 50))
+        M, U1 = transfer.particle_to_grid(points, v, mass=mass, affine=C)
+        flag = bm.to_numpy(M) > 0
+        assert np.any(~flag)
+        np.testing.assert_allclose(bm.to_numpy(U1)[flag], bm.to_numpy(U)[flag], atol=1e-10)
+        np.testing.assert_allclose(bm.to_numpy(U1)[~flag], 0.0)
+        np.testing.assert_allclose(bm.to_numpy(bm.sum(M)), bm.to_numpy(bm.sum(mass)))
+
+    @pytest.mark.parametrize('backend', ['numpy', 'pytorch'])
+    @pytest.mark.parametrize('kernel', ['nearest', 'linear', 'quadratic'])
+    def test_operator(self, backend, kernel):
+        bm.set_backend(backend)
+        mesh = _mesh(2)
+        transfer = ParticleGridTransfer(mesh, kernel=kernel)
+        points = _points(2, NP=30)
+        P = transfer.operator(points).to_scipy().toarray()
+        assert P.shape == (30, transfer.number_of_grid_points())
+
+        U = bm.sin(mesh.entity('node')[:, 0]) + mesh.entity('node')[:, 1]
+        np.testing.assert_allclose(P @ bm.to_numpy(U),
+                                   bm.to_numpy(transfer.grid_to_particle(points, U)), atol=1e-12)
+        q = bm.from_numpy(np.linspace(0.0, 1.0, 30))
+        np.testing.assert_allclose(P.T @ bm.to_numpy(q),
+                                   bm.to_numpy(transfer.particle_to_grid(points, q)), atol=1e-12)
+
+    def test_flip_solver(self):
+        from fealpy.cfd import NSFlipSolver
+        bm.set_backend('numpy')
+        mesh = UniformMesh2d((0, 4, 0, 4), h=(0.25, 0.25), origin=(0.0, 0.0))
+        particles = {'position': bm.to_numpy(_points(2, NP=10)),
+                     'velocity': np.tile([0.0, 1.0], (10, 1)),
+                     'mass': np.ones(10),
+                     'internal_energy': np.full(10, 2.0)}
+        solver = NSFlipSolver(particles, mesh)
+
+        rho_c, I_c = solver.P2G_center(particles)
+        np.testing.assert_allclose(rho_c.sum() * 0.0625, 10.0)
+        np.testing.assert_allclose(I_c[rho_c > 0], 2.0)
+        M_v, U_v = solver.P2G_vertex(particles)
+        np.testing.assert_allclose(M_v.sum(), 10.0)
+        np.testing.assert_allclose(U_v[M_v > 0], np.tile([0.0, 1.0], ((M_v > 0).sum(), 1)))
+        assert solver.bilinear(particles['position']).shape == (10, 25)
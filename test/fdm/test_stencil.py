@@ -0,0 +1,105 @@
+import numpy as np
+import pytest
+
+from fealpy.backend import backend_manager as bm
+from fealpy.mesh import UniformMesh2d, UniformMesh3d
+from fealpy.fdm import (StencilOperator, LaplaceOperator, GradientOperator,
+                        DivergenceOperator, AdvectionOperator)
+
+
+def _mesh(GD):
+    if GD == 2:
+        return UniformMesh2d((0, 8, 0, 6), h=(1/8, 1/6), origin=(0.0, 0.0))
+    return UniformMesh3d((0, 5, 0, 4, 0, 6), h=(1/5, 1/4, 1/6), origin=(0.0, 0.0, 0.0))
+
+
+def _matvec(op, u):
+    return op.to_csr().to_scipy() @ bm.to_numpy(u)
+
+
+class TestStencilOperator:
+    @pytest.mark.parametrize('backend', ['numpy', 'pytorch'])
+    @pytest.mark.parametrize('GD', [2, 3])
+    @pytest.mark.parametrize('bc', ['dirichlet', 'neumann'])
+    def test_laplace(self, backend, GD, bc):
+        bm.set_backend(backend)
+        mesh = _mesh(GD)
+        node = mesh.entity('node')
+        u = bm.sum(node**2, axis=-1)
+        L = LaplaceOperator(mesh, bc=bc)
+        val = L(u)
+
+        np.testing.assert_allclose(bm.to_numpy(val), _matvec(L, u), atol=1e-10)
+        shape = L.shape
+        inner = bm.to_numpy(val).reshape(shape)[(slice(1, -1), )*GD]
+        np.testing.assert_allclose(inner, 2.0*GD, atol=1e-8)
+        if bc == 'dirichlet':
+            boundary = bm.to_numpy(mesh.boundary_node_flag())
+            np.testing.assert_allclose(bm.to_numpy(val)[boundary], bm.to_numpy(u)[boundary])
+        # batched and grid-shaped input
+        U = bm.stack([u, 2*u], axis=0)
+        np.testing.assert_allclose(bm.to_numpy(L(U))[1], 2*bm.to_numpy(val), atol=1e-8)
+        np.testing.assert_allclose(bm.to_numpy(L(u.reshape(shape))).reshape(-1),
+                                   bm.to_numpy(val), atol=1e-10)
+
+    @pytest.mark.parametrize('backend', ['numpy', 'pytorch'])
+    @pytest.mark.parametrize('GD', [2, 3])
+    def test_gradient_divergence(self, backend, GD):
+        bm.set_backend(backend)
+        mesh = _mesh(GD)
+        node = mesh.entity('node')
+        a = bm.tensor([1.0, -2.0, 3.0][:GD], dtype=node.dtype)
+        u = node @ a
+        grad = GradientOperator(mesh)
+        gu = grad(u)
+        NN = mesh.number_of_nodes()
+
+        assert gu.shape == (NN, GD)
+        np.testing.assert_allclose(bm.to_numpy(gu), np.broadcast_to(bm.to_numpy(a), (NN, GD)),
+                                   atol=1e-10)
+        G = grad.to_csr().to_scipy()
+        assert G.shape == (GD*NN, NN)
+        np.testing.assert_allclose(G @ bm.to_numpy(u), bm.to_numpy(gu).T.reshape(-1), atol=1e-10)
+
+        div = DivergenceOperator(mesh)
+        w = node**2
+        dw = bm.to_numpy(div(w))
+        D = div.to_csr().to_scipy()
+        assert D.shape == (NN, GD*NN)
+        np.testing.assert_allclose(D @ bm.to_numpy(w).T.reshape(-1), dw, atol=1e-10)
+        # one-sided differences are exact for quadratics only inside the grid
+        inner = dw.reshape(grad.ops[0].shape)[(slice(1, -1), )*GD]
+        expected = 2*bm.to_numpy(bm.sum(node, axis=-1)).reshape(grad.ops[0].shape)
+        np.testing.assert_allclose(inner, expected[(slice(1, -1), )*GD], atol=1e-10)
+
+    @pytest.mark.parametrize('backend', ['numpy', 'pytorch'])
+    @pytest.mark.parametrize('scheme', ['upwind', 'central'])
+    def test_advection(self, backend, scheme):
+        bm.set_backend(backend)
+        mesh = _mesh(2)
+        node = mesh.entity('node')
+        velocity = bm.stack([node[:, 1] - 0.5, 0.5 - node[:, 0]], axis=-1)
+        u = node[:, 0] + 3*node[:, 1]
+        A = AdvectionOperator(mesh, velocity, scheme=scheme)
+        val = A(u)
+
+        np.testing.assert_allclose(bm.to_numpy(val), _matvec(A, u), atol=1e-10)
+        exact = velocity[:, 0] + 3*velocity[:, 1]
+        np.testing.assert_allclose(bm.to_numpy(val), bm.to_numpy(exact), atol=1e-10)
+
+    @pytest.mark.parametrize('backend', ['numpy', 'pytorch'])
+    def test_arithmetic(self, backend):
+        bm.set_backend(backend)
+        mesh = _mesh(2)
+        node = mesh.entity('node')
+        u = bm.sin(node[:, 0]) * node[:, 1]
+        L = LaplaceOperator(mesh)
+        I = StencilOperator(mesh, [((0, 0), 1.0)])
+        M = I - 0.1 * L
+        np.testing.assert_allclose(bm.to_numpy(M(u)), _matvec(M, u), atol=1e-10)
+        isBdNode = bm.to_numpy(mesh.boundary_node_flag())
+        expected = bm.to_numpy(u - 0.1*L(u))
+        expected[isBdNode] = bm.to_numpy(u)[isBdNode]
+        np.testing.assert_allclose(bm.to_numpy(M(u)), expected, atol=1e-10)
+        with pytest.raises(ValueError):
+            StencilOperator(mesh, [((0, 0), 1.0)], bc='periodic')
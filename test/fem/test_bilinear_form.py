@@ -2,10 +2,10 @@ import numpy as np
 import pytest
 from fealpy.backend import backend_manager as bm
 
-from fealpy.mesh import TriangleMesh
+from fealpy.mesh import TriangleMesh, TetrahedronMesh
 from fealpy.functionspace import LagrangeFESpace
 from fealpy.fem import (
-        BilinearForm, ScalarDiffusionIntegrator
+        BilinearForm, ScalarDiffusionIntegrator, ScalarMassIntegrator
     )
 
 from bilinear_form_data import *
@@ -43,6 +43,136 @@ class TestBilinearFormInterface:
         z = bm.to_numpy(bform @ x)
         assert np.linalg.norm(y-z) < 1e-12 
 
+    @pytest.mark.parametrize("backend", ['numpy', 'pytorch'])
+    @pytest.mark.parametrize("data", mesh_data)
+    @pytest.mark.parametrize("p", range(1, 4))
+    @pytest.mark.parametrize("format", ['csr', 'coo'])
+    def test_keep_pattern(self, backend, data, p, format):
+        bm.set_backend(backend)
+
+        Mesh = mesh_map[data["class"]]
+        node = bm.from_numpy(data['node'])
+        cell = bm.from_numpy(data['cell'])
+        mesh = Mesh(node, cell)
+        space = LagrangeFESpace(mesh, p)
+
+        bform = BilinearForm(space)
+        bform.add_integrator(ScalarDiffusionIntegrator())
+        bform.add_integrator(ScalarMassIntegrator())
+        A = bm.to_numpy(bform.assembly(format=format).to_dense())
+
+        bform.keep_pattern(True)
+        B = bm.to_numpy(bform.assembly(format=format).to_dense()) # symbolic
+        assert bform._pattern is not None
+        np.testing.assert_allclose(A, B, atol=1e-12)
+
+        bform.integrators['_group_1'].coef = 2.0
+        C = bm.to_numpy(bform.assembly(format=format).to_dense()) # numeric
+        bform.keep_pattern(False)
+        assert bform._pattern is None
+        D = bm.to_numpy(bform.assembly(format=format).to_dense())
+        np.testing.assert_allclose(C, D, atol=1e-12)
+
+    @pytest.mark.parametrize("backend", ['numpy', 'pytorch'])
+    @pytest.mark.parametrize("p", range(1, 3))
+    def test_keep_pattern_layout(self, backend, p):
+        bm.set_backend(backend)
+        mesh = TriangleMesh.from_box([0, 1, 0, 1], nx=3, ny=3)
+        space = LagrangeFESpace(mesh, p)
+        NC = mesh.number_of_cells()
+
+        def fresh(*integrators):
+            bform = BilinearForm(space)
+            for integrator in integrators:
+                bform.add_integrator(integrator)
+            return bm.to_numpy(bform.assembly().to_dense())
+
+        bform = BilinearForm(space).keep_pattern(True)
+        diffusion = ScalarDiffusionIntegrator()
+        bform.add_integrator(diffusion)
+        bform.assembly()
+
+        # a new group added after the first assembly
+        mass = ScalarMassIntegrator()
+        bform.add_integrator(mass)
+        A = bm.to_numpy(bform.assembly().to_dense())
+        np.testing.assert_allclose(A, fresh(diffusion, mass), atol=1e-12)
+
+        # a region changed to other cells of the same number
+        mass.set_region(bm.arange(0, NC // 2, device=mesh.device))
+        bform.assembly()
+        mass.set_region(bm.arange(NC // 2, NC // 2 * 2, device=mesh.device))
+        A = bm.to_numpy(bform.assembly().to_dense())
+        np.testing.assert_allclose(A, fresh(diffusion, mass), atol=1e-12)
+
+    @pytest.mark.parametrize("backend", ['numpy', 'pytorch'])
+    @pytest.mark.parametrize("ordering", ['rcm', 'sfc'])
+    def test_keep_pattern_renumber(self, backend, ordering):
+        bm.set_backend(backend)
+        mesh = TriangleMesh.from_box([0, 1, 0, 1], nx=4, ny=4)
+        space = LagrangeFESpace(mesh, 2)
+
+        bform = BilinearForm(space).keep_pattern(True)
+        bform.add_integrator(ScalarDiffusionIntegrator())
+        bform.assembly()
+
+        space.renumber(ordering)
+        A = bm.to_numpy(bform.assembly().to_dense())
+        bform = BilinearForm(space)
+        bform.add_integrator(ScalarDiffusionIntegrator())
+        B = bm.to_numpy(bform.assembly().to_dense())
+        np.testing.assert_allclose(A, B, atol=1e-12)
+
+    @pytest.mark.parametrize("backend", ['numpy', 'pytorch'])
+    @pytest.mark.parametrize("data", mesh_data)
+    @pytest.mark.parametrize("p", range(1, 4))
+    @pytest.mark.parametrize("chunk_size, max_workers", [(5, 0), (5, 2), (3, 4)])
+    def test_chunk_workers(self, backend, data, p, chunk_size, max_workers):
+        bm.set_backend(backend)
+
+        Mesh = mesh_map[data["class"]]
+        node = bm.from_numpy(data['node'])
+        cell = bm.from_numpy(data['cell'])
+        mesh = Mesh(node, cell)
+        space = LagrangeFESpace(mesh, p)
+
+        bform = BilinearForm(space)
+        bform.add_integrator(ScalarDiffusionIntegrator())
+        bform.add_integrator(ScalarMassIntegrator())
+        A = bm.to_numpy(bform.assembly().to_dense())
+
+        bform = BilinearForm(space).set_workers(max_workers)
+        bform.add_integrator(ScalarDiffusionIntegrator(), chunk_size=chunk_size)
+        bform.add_integrator(ScalarMassIntegrator(), chunk_size=chunk_size)
+        ntensor = len(list(bform.assembly_local_iterative()))
+        assert ntensor == 2 * -(-mesh.number_of_cells() // chunk_size)
+        B = bm.to_numpy(bform.assembly().to_dense())
+        np.testing.assert_allclose(A, B, atol=1e-12)
+
+    @pytest.mark.parametrize("backend", ['numpy', 'pytorch'])
+    @pytest.mark.parametrize("p", range(1, 4))
+    @pytest.mark.parametrize("batch_size", [0, 2])
+    def test_memory_budget(self, backend, p, batch_size):
+        bm.set_backend(backend)
+        mesh = TetrahedronMesh.from_box([0, 1, 0, 1, 0, 1], nx=2, ny=2, nz=2)
+        space = LagrangeFESpace(mesh, p)
+        NC = mesh.number_of_cells()
+
+        bform = BilinearForm(space, batch_size=batch_size)
+        bform.add_integrator(ScalarDiffusionIntegrator(), ScalarMassIntegrator())
+        A = bm.to_numpy(bform.assembly().to_dense())
+        entity_memory = bform.estimate_entity_memory('_group_0')
+        assert entity_memory > 0
+        assert len(list(bform.assembly_local_iterative())) == 1
+
+        bform.set_memory_budget(entity_memory * 5)
+        assert len(list(bform.assembly_local_iterative())) == -(-NC // 5)
+        B = bm.to_numpy(bform.assembly().to_dense())
+        np.testing.assert_allclose(A, B, atol=1e-12)
+
+        bform.set_memory_budget(entity_memory * NC)
+        assert len(list(bform.assembly_local_iterative())) == 1
+
 
 if __name__ == "__main__":
     pytest.main(['./test_bilinear_form.py', '-k', 'test_matmul'])
@@ -0,0 +1,99 @@
+import numpy as np
+import pytest
+
+from fealpy.backend import backend_manager as bm
+from fealpy.mesh import QuadrangleMesh, HexahedronMesh, UniformMesh2d, TriangleMesh
+from fealpy.functionspace import LagrangeFESpace
+from fealpy.fem import (
+        BilinearForm, ScalarDiffusionIntegrator, ScalarMassIntegrator,
+        MatrixFreeOperator
+    )
+
+
+def _mesh(name):
+    if name == 'QuadrangleMesh':
+        return QuadrangleMesh.from_box([0, 1, 0, 2], nx=4, ny=3)
+    elif name == 'HexahedronMesh':
+        return HexahedronMesh.from_box([0, 1, 0, 1, 0, 2], nx=2, ny=3, nz=2)
+    return UniformMesh2d((0, 4, 0, 3), h=(0.25, 1/3), origin=(0.0, 0.0))
+
+
+class TestCongruentAssembly:
+    @pytest.mark.parametrize("backend", ['numpy', 'pytorch'])
+    @pytest.mark.parametrize("name", ['QuadrangleMesh', 'HexahedronMesh', 'UniformMesh2d'])
+    @pytest.mark.parametrize("Integrator", [ScalarDiffusionIntegrator, ScalarMassIntegrator])
+    @pytest.mark.parametrize("cellwise", [False, True])
+    def test_assembly(self, backend, name, Integrator, cellwise):
+        bm.set_backend(backend)
+        mesh = _mesh(name)
+        assert mesh.is_congruent()
+        space = LagrangeFESpace(mesh, p=2 if backend == 'numpy' else 1)
+        NC = mesh.number_of_cells()
+        coef = bm.arange(1, NC+1, dtype=bm.float64) if cellwise else 2.0
+
+        K = Integrator(coef, q=4).assembly(space)
+        mesh.is_congruent = lambda: False
+        expected = Integrator(coef, q=4).assembly(space)
+        np.testing.assert_allclose(bm.to_numpy(K), bm.to_numpy(expected), atol=1e-12)
+
+    @pytest.mark.parametrize("name", ['QuadrangleMesh', 'HexahedronMesh'])
+    def test_linear_elastic(self, name):
+        from fealpy.functionspace import TensorFunctionSpace
+        from fealpy.material.elastic_material import LinearElasticMaterial
+        from fealpy.fem.linear_elastic_integrator import LinearElasticIntegrator
+        bm.set_backend('numpy')
+        mesh = _mesh(name)
+        GD = mesh.geo_dimension()
+        space = TensorFunctionSpace(LagrangeFESpace(mesh, p=1), (-1, GD))
+        material = LinearElasticMaterial('steel', elastic_modulus=1.0, poisson_ratio=0.3,
+                                         hypo='plane_stress' if GD == 2 else '3D')
+
+        K = LinearElasticIntegrator(material, q=3).assembly(space)
+        mesh.is_congruent = lambda: False
+        expected = LinearElasticIntegrator(material, q=3).assembly(space)
+        np.testing.assert_allclose(K, expected, atol=1e-12)
+
+    def test_not_congruent(self):
+        bm.set_backend('numpy')
+        assert not TriangleMesh.from_box(nx=2, ny=2).is_congruent()
+        mesh = QuadrangleMesh.from_box(nx=2, ny=2)
+        node = mesh.entity('node')
+        node[4] += 0.1
+        mesh.node = node
+        assert not mesh.is_congruent()
+
+    @pytest.mark.parametrize("backend", ['numpy', 'pytorch'])
+    def test_nodes_moved_in_place(self, backend):
+        bm.set_backend(backend)
+        mesh = QuadrangleMesh.from_box(nx=4, ny=4)
+        ScalarDiffusionIntegrator(q=3).assembly(LagrangeFESpace(mesh, 1))
+        node = mesh.entity('node')
+        node[:, 0] **= 2
+        assert not mesh.is_congruent()
+
+        K = ScalarDiffusionIntegrator(q=3).assembly(LagrangeFESpace(mesh, 1))
+        mesh.is_congruent = lambda: False
+        expected = ScalarDiffusionIntegrator(q=3).assembly(LagrangeFESpace(mesh, 1))
+        np.testing.assert_allclose(bm.to_numpy(K), bm.to_numpy(expected), atol=1e-12)
+
+    @pytest.mark.parametrize("backend", ['numpy', 'pytorch'])
+    def test_matrix_free(self, backend):
+        bm.set_backend(backend)
+        mesh = _mesh('QuadrangleMesh')
+        space = LagrangeFESpace(mesh, p=2)
+        NC = mesh.number_of_cells()
+        bform = BilinearForm(space)
+        bform.add_integrator(ScalarDiffusionIntegrator(bm.arange(1, NC+1, dtype=bm.float64)))
+        op = MatrixFreeOperator(bform)
+        group_tensor, _, _, scale = op.local_data()[0]
+        assert group_tensor.shape == (9, 9)
+        assert scale.shape == (NC, )
+
+        A = bform.assembly()
+        gdof = space.number_of_global_dofs()
+        x = bm.from_numpy(np.random.rand(gdof))
+        X = bm.from_numpy(np.random.rand(2, gdof))
+        np.testing.assert_allclose(bm.to_numpy(op @ x), bm.to_numpy(A @ x), atol=1e-12)
+        np.testing.assert_allclose(bm.to_numpy(op @ X), bm.to_numpy(A @ X.T).T, atol=1e-12)
+        np.testing.assert_allclose(bm.to_numpy(op.diagonal()),
+                                   np.diag(bm.to_numpy(A.to_dense())), atol=1e-12)
@@ -0,0 +1,72 @@
+import numpy as np
+import pytest
+from fealpy.backend import backend_manager as bm
+
+from fealpy.mesh import TriangleMesh
+from fealpy.functionspace import LagrangeFESpace
+from fealpy.fem import (
+        BilinearForm, ScalarDiffusionIntegrator, ScalarMassIntegrator,
+        MatrixFreeOperator
+    )
+from fealpy.solver import cg
+
+from bilinear_form_data import *
+
+mesh_map = {
+        "TriangleMesh": TriangleMesh,
+        }
+
+
+def _get_form(data, p):
+    Mesh = mesh_map[data["class"]]
+    node = bm.from_numpy(data['node'])
+    cell = bm.from_numpy(data['cell'])
+    mesh = Mesh(node, cell)
+    space = LagrangeFESpace(mesh, p)
+    bform = BilinearForm(space)
+    bform.add_integrator(ScalarDiffusionIntegrator())
+    bform.add_integrator(ScalarMassIntegrator())
+    return space, bform
+
+
+class TestMatrixFreeOperatorInterface:
+
+    @pytest.mark.parametrize("backend", ['numpy', 'pytorch'])
+    @pytest.mark.parametrize("data", mesh_data)
+    @pytest.mark.parametrize("p", range(1, 4))
+    @pytest.mark.parametrize("max_memory", [None, 0])
+    def test_matmul(self, backend, data, p, max_memory):
+        bm.set_backend(backend)
+        space, bform = _get_form(data, p)
+        gdof = space.number_of_global_dofs()
+        op = MatrixFreeOperator(bform, max_memory=max_memory)
+        assert op.cached == (max_memory is None)
+        assert op.shape == (gdof, gdof)
+
+        A = bform.assembly()
+        x = bm.from_numpy(np.random.rand(gdof))
+        X = bm.from_numpy(np.random.rand(2, gdof))
+        np.testing.assert_allclose(bm.to_numpy(op @ x), bm.to_numpy(A @ x), atol=1e-12)
+        np.testing.assert_allclose(bm.to_numpy(op @ X), bm.to_numpy(A @ X.T).T, atol=1e-12)
+
+        diag = bm.to_numpy(A.to_dense())
+        np.testing.assert_allclose(bm.to_numpy(op.diagonal()), np.diag(diag), atol=1e-12)
+
+    @pytest.mark.parametrize("backend", ['numpy', 'pytorch'])
+    def test_cg(self, backend):
+        bm.set_backend(backend)
+        mesh = TriangleMesh.from_box([0, 1, 0, 1], nx=8, ny=8)
+        space = LagrangeFESpace(mesh, 2)
+        bform = BilinearForm(space)
+        bform.add_integrator(ScalarDiffusionIntegrator())
+        bform.add_integrator(ScalarMassIntegrator())
+        gdof = space.number_of_global_dofs()
+        b = bm.from_numpy(np.random.rand(gdof))
+
+        x = cg(MatrixFreeOperator(bform), b, atol=1e-14, rtol=1e-12)
+        y = cg(bform.assembly(), b, atol=1e-14, rtol=1e-12)
+        np.testing.assert_allclose(bm.to_numpy(x), bm.to_numpy(y), atol=1e-8)
+
+
+if __name__ == "__main__":
+    pytest.main(['./test_matrix_free_operator.py'])
@@ -0,0 +1,66 @@
+import time
+
+import numpy as np
+import pytest
+
+from fealpy.backend import backend_manager as bm
+from fealpy.mesh import TriangleMesh
+from fealpy.functionspace import LagrangeFESpace
+from fealpy.fem import (
+        BilinearForm, LinearForm,
+        ScalarDiffusionIntegrator, ScalarMassIntegrator, ScalarSourceIntegrator
+    )
+
+
+def _timeit(func, repeat: int=1):
+    start = time.perf_counter()
+    for _ in range(repeat):
+        out = func()
+    return (time.perf_counter() - start) / repeat, out
+
+
+def _forms(space, chunk_size: int, max_workers: int):
+    bform = BilinearForm(space).set_workers(max_workers)
+    bform.add_integrator(ScalarDiffusionIntegrator(), chunk_size=chunk_size)
+    bform.add_integrator(ScalarMassIntegrator(), chunk_size=chunk_size)
+    lform = LinearForm(space).set_workers(max_workers)
+    lform.add_integrator(ScalarSourceIntegrator(1.0), chunk_size=chunk_size)
+    return bform, lform
+
+
+def run_parallel_assembly_benchmark(nx: int, workers=(0, 1, 2, 4), chunk_size: int=100000):
+    mesh = TriangleMesh.from_box([0, 1, 0, 1], nx=nx, ny=nx)
+    space = LagrangeFESpace(mesh, 1)
+    NC = mesh.number_of_cells()
+
+    bform, lform = _forms(space, 0, 0)
+    t_ref, A_ref = _timeit(lambda: bform.assembly())
+    F_ref = bm.to_numpy(lform.assembly())
+    A_ref = A_ref.values()
+    print(f"\n[{bm.backend_name}] NC={NC:.1e}, whole: {t_ref:.3f} s")
+
+    timing = {}
+    for max_workers in workers:
+        bform, lform = _forms(space, chunk_size, max_workers)
+        t, A = _timeit(lambda: bform.assembly())
+        np.testing.assert_allclose(bm.to_numpy(A.values()), bm.to_numpy(A_ref), atol=1e-12)
+        np.testing.assert_allclose(bm.to_numpy(lform.assembly()), F_ref, atol=1e-12)
+        timing[max_workers] = t
+        print(f"  chunk={chunk_size}, workers={max_workers}: {t:.3f} s, "
+              f"speedup {timing[workers[0]]/t:.2f}")
+
+    return t_ref, timing
+
+
+@pytest.mark.parametrize("backend", ['numpy', 'pytorch'])
+def test_parallel_assembly_benchmark(backend):
+    bm.set_backend(backend)
+    run_parallel_assembly_benchmark(100, workers=(0, 2), chunk_size=4000)
+
+
+if __name__ == "__main__":
+    # 2M cells for nx = 1000
+    for backend in ['numpy', 'pytorch']:
+        bm.set_backend(backend)
+        for nx in [250, 500, 1000]:
+            run_parallel_assembly_benchmark(nx, workers=(0, 1, 2, 4, 8))
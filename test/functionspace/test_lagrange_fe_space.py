@@ -4,7 +4,9 @@ import pytest
 
 from fealpy.backend import backend_manager as bm
 from fealpy.mesh.triangle_mesh import TriangleMesh
-from fealpy.functionspace import LagrangeFESpace
+from fealpy.mesh import QuadrangleMesh, TetrahedronMesh
+from fealpy.functionspace import LagrangeFESpace, TensorFunctionSpace
+from fealpy.fem import BilinearForm, ScalarDiffusionIntegrator
 
 from lagrange_fe_space_data import *
 
@@ -105,6 +107,142 @@ class TestLagrangeFiniteElementSpace:
 
 
 
+    @pytest.mark.parametrize("backend", ['numpy', 'pytorch'])
+    @pytest.mark.parametrize("p", [1, 2, 3])
+    def test_memoized_dofs(self, backend, p):
+        bm.set_backend(backend)
+        mesh = TriangleMesh.from_box([0, 1, 0, 1], 2, 2)
+        space = LagrangeFESpace(mesh, p)
+        calls = []
+        cell_to_ipoint = mesh.cell_to_ipoint
+        mesh.cell_to_ipoint = lambda *args, **kwargs: calls.append(1) or cell_to_ipoint(*args, **kwargs)
+
+        space.cell_to_dof()
+        space.cell_to_dof(index=bm.arange(3))
+        assert len(calls) == 1
+        assert space.is_boundary_dof() is space.is_boundary_dof()
+        np.testing.assert_array_equal(bm.to_numpy(space.cell_to_dof(index=bm.arange(3))),
+                                      bm.to_numpy(cell_to_ipoint(p)[:3]))
+        np.testing.assert_array_equal(bm.to_numpy(space.interpolation_points()),
+                                      bm.to_numpy(mesh.interpolation_points(p)))
+
+        version = mesh.version
+        mesh.uniform_refine()
+        assert mesh.version > version
+        space.cell_to_dof()
+        assert len(calls) == 2
+        assert space.cell_to_dof().shape[0] == mesh.number_of_cells()
+        np.testing.assert_array_equal(bm.to_numpy(space.cell_to_dof()),
+                                      bm.to_numpy(cell_to_ipoint(p)))
+        np.testing.assert_array_equal(bm.to_numpy(space.edge_to_dof()),
+                                      bm.to_numpy(mesh.edge_to_ipoint(p)))
+        assert space.is_boundary_dof().shape[0] == space.number_of_global_dofs()
+
+        # shared maps are read-only, while the mesh keeps its own arrays writable
+        if backend == 'numpy':
+            with pytest.raises(ValueError):
+                space.cell_to_dof()[0, 0] = 0
+            with pytest.raises(ValueError):
+                space.is_boundary_dof()[0] = False
+            assert mesh.cell.flags.writeable
+
+        # concurrent first access from threads fills the cache once
+        from concurrent.futures import ThreadPoolExecutor
+        mesh.uniform_refine()
+        with ThreadPoolExecutor(max_workers=4, initializer=bm.set_backend,
+                                initargs=(backend, )) as executor:
+            results = list(executor.map(lambda _: space.cell_to_dof(), range(8)))
+        assert len(calls) == 3
+        for r in results:
+            np.testing.assert_array_equal(bm.to_numpy(r), bm.to_numpy(cell_to_ipoint(p)))
+
+    @pytest.mark.parametrize("backend", ['numpy', 'pytorch'])
+    @pytest.mark.parametrize("Mesh", [TriangleMesh, QuadrangleMesh, TetrahedronMesh])
+    @pytest.mark.parametrize("p", [1, 2, 3])
+    def test_transfer(self, backend, Mesh, p):
+        bm.set_backend(backend)
+        if Mesh is TetrahedronMesh:
+            source, target = Mesh.from_box(nx=2, ny=2, nz=2), Mesh.from_box(nx=3, ny=3, nz=3)
+        else:
+            source, target = Mesh.from_box(nx=4, ny=4), Mesh.from_box(nx=5, ny=7)
+        space0 = LagrangeFESpace(source, p)
+        space1 = LagrangeFESpace(target, p)
+        f = lambda x: bm.sum(x**p, axis=-1) + x[..., 0]
+
+        # exact for polynomials of degree p
+        uh = space0.interpolate(f)
+        vh = space0.transfer(uh, space1)
+        np.testing.assert_allclose(bm.to_numpy(vh[:]),
+                                   bm.to_numpy(f(space1.interpolation_points())), atol=1e-10)
+
+        T = space0.transfer_matrix(space1)
+        assert T.shape == (space1.number_of_global_dofs(), space0.number_of_global_dofs())
+        np.testing.assert_allclose(bm.to_numpy(T @ uh[:]), bm.to_numpy(vh[:]), atol=1e-12)
+
+        # the operator is reused for batched values
+        T = space0._transfer_cache[2]
+        U = bm.stack([uh[:], 2 * uh[:]], axis=0)
+        V = space0.transfer(U, space1)
+        assert space0._transfer_cache[2] is T
+        np.testing.assert_allclose(bm.to_numpy(V[1]), 2 * bm.to_numpy(vh[:]), atol=1e-10)
+
+        # renumbering either space rebuilds the operator
+        for space in (space1, space0):
+            space.renumber('rcm')
+            uh = space0.interpolate(f)
+            vh = space0.transfer(uh, space1)
+            np.testing.assert_allclose(bm.to_numpy(vh[:]),
+                                       bm.to_numpy(f(space1.interpolation_points())), atol=1e-10)
+
+    @pytest.mark.parametrize("backend", ['numpy', 'pytorch'])
+    @pytest.mark.parametrize("ordering", ['rcm', 'sfc'])
+    def test_renumber(self, backend, ordering):
+        bm.set_backend(backend)
+        mesh = TetrahedronMesh.from_box(nx=3, ny=3, nz=3)
+        space0 = LagrangeFESpace(mesh, 2)
+        space = LagrangeFESpace(mesh, 2)
+        perm = space.renumber(ordering)
+        c2d0, c2d = bm.to_numpy(space0.cell_to_dof()), bm.to_numpy(space.cell_to_dof())
+        assert space.cell_to_dof().dtype == space0.cell_to_dof().dtype
+        np.testing.assert_array_equal(np.sort(bm.to_numpy(perm)), np.arange(c2d.max() + 1))
+        if ordering == 'rcm':
+            assert np.ptp(c2d, axis=1).max() < np.ptp(c2d0, axis=1).max()
+
+        # dof maps, boundary flags and interpolation points are consistent
+        ips0, ips = bm.to_numpy(space0.interpolation_points()), bm.to_numpy(space.interpolation_points())
+        np.testing.assert_allclose(ips[c2d], ips0[c2d0])
+        np.testing.assert_allclose(ips[bm.to_numpy(space.face_to_dof())],
+                                   ips0[bm.to_numpy(space0.face_to_dof())])
+        np.testing.assert_array_equal(bm.to_numpy(space.to_default_ordering(space.is_boundary_dof())),
+                                      bm.to_numpy(space0.is_boundary_dof()))
+
+        # the same operator up to the permutation
+        A0 = BilinearForm(space0).add_integrator(ScalarDiffusionIntegrator(q=3)).assembly()
+        A = BilinearForm(space).add_integrator(ScalarDiffusionIntegrator(q=3)).assembly()
+        x = space0.interpolate(lambda p: bm.sin(p[..., 0]) + p[..., 1]*p[..., 2])
+        np.testing.assert_allclose(bm.to_numpy(space.to_default_ordering(A @ space.from_default_ordering(x))),
+                                   bm.to_numpy(A0 @ x[:]), atol=1e-12)
+        np.testing.assert_allclose(bm.to_numpy(space.interpolate(lambda p: bm.sin(p[..., 0]))[:]),
+                                   bm.to_numpy(space.from_default_ordering(
+                                       space0.interpolate(lambda p: bm.sin(p[..., 0])))))
+
+        # tensor spaces follow the scalar space
+        for shape in [(3, -1), (-1, 3)]:
+            tspace = TensorFunctionSpace(space, shape)
+            tspace0 = TensorFunctionSpace(space0, shape)
+            u = bm.arange(tspace.number_of_global_dofs(), dtype=mesh.ftype)
+            v = tspace.from_default_ordering(u)
+            np.testing.assert_array_equal(bm.to_numpy(tspace.to_default_ordering(v)), bm.to_numpy(u))
+            np.testing.assert_array_equal(bm.to_numpy(v[tspace.cell_to_dof()]),
+                                          bm.to_numpy(u[tspace0.cell_to_dof()]))
+
+        # kept when the mesh changes
+        mesh.uniform_refine()
+        assert space.dof.permutation().shape[0] == space.number_of_global_dofs()
+        ips0, ips = bm.to_numpy(space0.interpolation_points()), bm.to_numpy(space.interpolation_points())
+        np.testing.assert_allclose(ips[bm.to_numpy(space.cell_to_dof())],
+                                   ips0[bm.to_numpy(space0.cell_to_dof())])
+
 
 if __name__ == "__main__":
     #pytest.main(['test_lagrange_fe_space.py', "-q", "-k","test_basis", "-s"])
@@ -0,0 +1,87 @@
+import numpy as np
+import pytest
+
+from fealpy.backend import backend_manager as bm
+from fealpy.mesh import TriangleMesh, TetrahedronMesh, QuadrangleMesh, HexahedronMesh
+
+
+def _perturbed_mesh(Mesh, n):
+    mesh = Mesh.from_box(nx=n, ny=n) if Mesh in (TriangleMesh, QuadrangleMesh) \
+        else Mesh.from_box(nx=n, ny=n, nz=n)
+    rng = np.random.default_rng(0)
+    node = bm.to_numpy(mesh.entity('node')).copy()
+    isInNode = ~bm.to_numpy(mesh.boundary_node_flag())
+    node[isInNode] += 0.1 / n * rng.uniform(-1, 1, node[isInNode].shape)
+    mesh.node = bm.tensor(node, dtype=mesh.ftype)
+    return mesh
+
+
+class TestCellLocator:
+    @pytest.mark.parametrize('backend', ['numpy', 'pytorch'])
+    @pytest.mark.parametrize('Mesh', [TriangleMesh, TetrahedronMesh, QuadrangleMesh, HexahedronMesh])
+    def test_point_to_bc(self, backend, Mesh):
+        bm.set_backend(backend)
+        mesh = _perturbed_mesh(Mesh, 4)
+        NC = mesh.number_of_cells()
+        TD = mesh.top_dimension()
+        rng = np.random.default_rng(1)
+        cell = rng.integers(0, NC, 200)
+
+        # random points in given cells
+        if Mesh in (TriangleMesh, TetrahedronMesh):
+            bc = rng.uniform(0.01, 1, (200, TD+1))
+            bc = bm.tensor(bc / bc.sum(axis=-1, keepdims=True), dtype=mesh.ftype)
+            vertex = mesh.entity('node')[mesh.entity('cell')[bm.tensor(cell)]]
+            points = bm.einsum('pv, pvd -> pd', bc, vertex)
+        else:
+            xi = rng.uniform(0.01, 0.99, (200, TD))
+            bc = bm.tensor(np.stack([1 - xi, xi], axis=-1), dtype=mesh.ftype)
+            points = bm.stack([mesh.bc_to_point(tuple(b[None, :] for b in bc[i]),
+                               index=bm.tensor(cell[i:i+1]))[0, 0] for i in range(200)], axis=0)
+
+        c, b = mesh.point_to_bc(points)
+        np.testing.assert_array_equal(bm.to_numpy(c), cell)
+        np.testing.assert_allclose(bm.to_numpy(b), bm.to_numpy(bc), atol=1e-10)
+
+        # walking (or checking) from random hint cells
+        hint = bm.tensor(rng.integers(0, NC, 200), dtype=mesh.itype)
+        np.testing.assert_array_equal(bm.to_numpy(mesh.location(points, hint)), cell)
+
+        # outside
+        outside = bm.full((3, TD), 2.0, dtype=mesh.ftype)
+        np.testing.assert_array_equal(bm.to_numpy(mesh.location(outside)), -1)
+
+    @pytest.mark.parametrize('backend', ['numpy', 'pytorch'])
+    def test_boundary_points(self, backend):
+        bm.set_backend(backend)
+        mesh = TriangleMesh.from_box(nx=5, ny=5)
+        node = mesh.entity('node')
+        c, bc = mesh.point_to_bc(node)
+        assert bm.all(c >= 0)
+        vertex = node[mesh.entity('cell')[c]]
+        np.testing.assert_allclose(bm.to_numpy(bm.einsum('pv, pvd -> pd', bc, vertex)),
+                                   bm.to_numpy(node), atol=1e-14)
+
+    @pytest.mark.parametrize('backend', ['numpy', 'pytorch'])
+    def test_rebuild(self, backend):
+        bm.set_backend(backend)
+        mesh = TriangleMesh.from_box(nx=4, ny=4)
+        locator = mesh.cell_locator()
+        assert mesh.cell_locator() is locator
+        points = bm.tensor([[0.3, 0.6], [1.3, 1.6]], dtype=mesh.ftype)
+        np.testing.assert_array_equal(bm.to_numpy(mesh.location(points) >= 0), [True, False])
+
+        # new nodes rebuild the locator
+        mesh.node = mesh.entity('node') + 1.0
+        assert mesh.cell_locator() is not locator
+        np.testing.assert_array_equal(bm.to_numpy(mesh.location(points) >= 0), [False, True])
+
+        # in-place changes need update()
+        node = mesh.entity('node')
+        node[:] = node - 1.0
+        mesh.cell_locator().update()
+        np.testing.assert_array_equal(bm.to_numpy(mesh.location(points) >= 0), [True, False])
+
+
+if __name__ == "__main__":
+    pytest.main(['./test_cell_locator.py'])
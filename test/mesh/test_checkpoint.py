@@ -0,0 +1,67 @@
+import json
+
+import numpy as np
+import pytest
+
+from fealpy.backend import backend_manager as bm
+from fealpy.mesh import (
+    TriangleMesh, TetrahedronMesh, QuadrangleMesh, save_checkpoint, load_checkpoint
+)
+from fealpy.functionspace import LagrangeFESpace
+
+
+class TestCheckpoint:
+    @pytest.mark.parametrize('backend', ['numpy', 'pytorch'])
+    @pytest.mark.parametrize('Mesh', [TriangleMesh, TetrahedronMesh, QuadrangleMesh])
+    def test_restart(self, backend, Mesh, tmp_path):
+        bm.set_backend(backend)
+        mesh = Mesh.from_box(nx=2, ny=2) if Mesh is not TetrahedronMesh \
+            else Mesh.from_box(nx=2, ny=2, nz=2)
+        mesh.nodedata['u'] = mesh.entity('node')[:, 0]
+        mesh.celldata['index'] = bm.arange(mesh.number_of_cells())
+        space = LagrangeFESpace(mesh, 2)
+        uh = space.interpolate(lambda p: p[..., 0]**2)
+        path = str(tmp_path / 'ckpt')
+
+        save_checkpoint(path, mesh, fields={'uh': uh}, meta={'t': 0.5, 'step': 3})
+        save_checkpoint(path, mesh, fields={'uh': uh}, meta={'t': 0.5, 'step': 3}) # overwrite
+        ckpt = load_checkpoint(path)
+        restored = ckpt.mesh
+
+        assert type(restored) is Mesh
+        assert ckpt.meta == {'t': 0.5, 'step': 3}
+        for name in ['node', 'edge', 'face', 'cell', 'face2cell', 'cell2face', 'cell2edge']:
+            np.testing.assert_array_equal(bm.to_numpy(getattr(restored, name)),
+                                          bm.to_numpy(getattr(mesh, name)))
+        if mesh.TD == 2:
+            assert restored.edge2cell is restored.face2cell
+            assert restored.facedata is restored.edgedata
+
+        # data and fields are loaded lazily
+        assert not ckpt.fields.is_loaded('uh')
+        np.testing.assert_allclose(bm.to_numpy(ckpt.fields['uh']), bm.to_numpy(uh[:]))
+        assert ckpt.fields.is_loaded('uh')
+        np.testing.assert_array_equal(bm.to_numpy(restored.celldata['index']),
+                                      np.arange(mesh.number_of_cells()))
+
+        # the restored mesh works downstream, and in-place changes are not saved
+        space = LagrangeFESpace(restored, 2)
+        np.testing.assert_allclose(bm.to_numpy(space.interpolate(lambda p: p[..., 0]**2)[:]),
+                                   bm.to_numpy(uh[:]), atol=1e-14)
+        restored.node[0, 0] = 5.0
+        assert float(load_checkpoint(path).mesh.node[0, 0]) == 0.0
+
+    def test_version(self, tmp_path):
+        bm.set_backend('numpy')
+        path = tmp_path / 'ckpt'
+        save_checkpoint(str(path), TriangleMesh.from_box(nx=1, ny=1))
+        header = json.loads((path / 'header.json').read_text())
+        header['version'] += 1
+        (path / 'header.json').write_text(json.dumps(header))
+
+        with pytest.raises(ValueError):
+            load_checkpoint(str(path))
+
+
+if __name__ == "__main__":
+    pytest.main(['./test_checkpoint.py'])
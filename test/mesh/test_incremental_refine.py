@@ -0,0 +1,145 @@
+import numpy as np
+import pytest
+
+from fealpy.backend import backend_manager as bm
+from fealpy.mesh import TriangleMesh, QuadrangleMesh, TetrahedronMesh, HexahedronMesh
+
+
+def _sorted_barycenter(mesh, etype):
+    bc = bm.to_numpy(mesh.entity_barycenter(etype))
+    return bc[np.lexsort(bc.T)]
+
+
+def _jiggled_tetrahedron_mesh():
+    # perturbed nodes, so that all three splits of the inner octahedron occur
+    mesh = TetrahedronMesh.from_box([0, 1, 0, 1, 0, 1], nx=2, ny=2, nz=2)
+    rng = np.random.default_rng(0)
+    node = bm.to_numpy(mesh.node) + 0.08 * (rng.random((mesh.number_of_nodes(), 3)) - 0.5)
+    return TetrahedronMesh(bm.from_numpy(node), mesh.cell)
+
+
+class TestIncrementalRefine:
+    @pytest.mark.parametrize('backend', ['numpy', 'pytorch'])
+    @pytest.mark.parametrize('n', [1, 2])
+    def test_topology(self, backend, n):
+        bm.set_backend(backend)
+        mesh0 = TriangleMesh.from_box(nx=3, ny=2)
+        mesh1 = TriangleMesh.from_box(nx=3, ny=2)
+        mesh0.uniform_refine(n)
+        mesh1.uniform_refine(n, incremental=True)
+
+        if n == 1:
+            np.testing.assert_array_equal(bm.to_numpy(mesh1.cell), bm.to_numpy(mesh0.cell))
+        np.testing.assert_allclose(bm.to_numpy(mesh1.entity_barycenter('cell')),
+                                   bm.to_numpy(mesh0.entity_barycenter('cell')), atol=1e-14)
+
+        # the same edges, up to the numbering
+        key = lambda m: np.lexsort(bm.to_numpy(m.entity_barycenter('edge')).T)
+        bc0 = bm.to_numpy(mesh0.entity_barycenter('edge'))[key(mesh0)]
+        bc1 = bm.to_numpy(mesh1.entity_barycenter('edge'))[key(mesh1)]
+        np.testing.assert_allclose(bc1, bc0, atol=1e-14)
+
+        # consistent with the local edges of cells
+        cell = bm.to_numpy(mesh1.cell)
+        edge = bm.to_numpy(mesh1.edge)
+        cell2edge = bm.to_numpy(mesh1.cell_to_edge())
+        edge2cell = bm.to_numpy(mesh1.face_to_cell())
+        localEdge = bm.to_numpy(mesh1.localEdge)
+        NE = edge.shape[0]
+        np.testing.assert_array_equal(cell[edge2cell[:, [0]], localEdge[edge2cell[:, 2]]], edge)
+        np.testing.assert_array_equal(cell2edge[edge2cell[:, 0], edge2cell[:, 2]], np.arange(NE))
+        np.testing.assert_array_equal(cell2edge[edge2cell[:, 1], edge2cell[:, 3]], np.arange(NE))
+        np.testing.assert_array_equal(bm.to_numpy(mesh1.boundary_face_flag()).sum(),
+                                      bm.to_numpy(mesh0.boundary_face_flag()).sum())
+
+    @pytest.mark.parametrize('backend', ['numpy', 'pytorch'])
+    @pytest.mark.parametrize('n', [1, 2])
+    @pytest.mark.parametrize('mesh_factory', [
+        lambda: QuadrangleMesh.from_box(nx=3, ny=2),
+        lambda: HexahedronMesh.from_box([0, 1, 0, 1, 0, 1], nx=2, ny=2, nz=1),
+        lambda: TetrahedronMesh.from_box([0, 1, 0, 1, 0, 1], nx=2, ny=1, nz=1),
+        _jiggled_tetrahedron_mesh,
+    ])
+    def test_topology_other_meshes(self, backend, n, mesh_factory):
+        bm.set_backend(backend)
+        mesh0 = mesh_factory()
+        mesh1 = mesh_factory()
+        mesh0.uniform_refine(n)
+        mesh1.uniform_refine(n, incremental=True)
+
+        np.testing.assert_allclose(_sorted_barycenter(mesh1, 'cell'),
+                                   _sorted_barycenter(mesh0, 'cell'), atol=1e-14)
+        etypes = ['edge', 'face'] if mesh1.TD == 3 else ['edge']
+        for etype in etypes:
+            np.testing.assert_allclose(_sorted_barycenter(mesh1, etype),
+                                       _sorted_barycenter(mesh0, etype), atol=1e-14)
+
+        # consistent with the local faces and edges of cells
+        cell = bm.to_numpy(mesh1.cell)
+        face = bm.to_numpy(mesh1.face)
+        cell2face = bm.to_numpy(mesh1.cell_to_face())
+        face2cell = bm.to_numpy(mesh1.face_to_cell())
+        localFace = bm.to_numpy(mesh1.localFace)
+        NF = face.shape[0]
+        np.testing.assert_array_equal(cell[face2cell[:, [0]], localFace[face2cell[:, 2]]], face)
+        np.testing.assert_array_equal(cell2face[face2cell[:, 0], face2cell[:, 2]], np.arange(NF))
+        np.testing.assert_array_equal(cell2face[face2cell[:, 1], face2cell[:, 3]], np.arange(NF))
+        np.testing.assert_array_equal(bm.to_numpy(mesh1.boundary_face_flag()).sum(),
+                                      bm.to_numpy(mesh0.boundary_face_flag()).sum())
+        if mesh1.TD == 3:
+            edge = bm.to_numpy(mesh1.edge)
+            cell2edge = bm.to_numpy(mesh1.cell_to_edge())
+            localEdge = bm.to_numpy(mesh1.localEdge)
+            np.testing.assert_array_equal(np.sort(cell[:, localEdge], axis=-1),
+                                          np.sort(edge[cell2edge], axis=-1))
+
+    @pytest.mark.parametrize('backend', ['numpy', 'pytorch'])
+    def test_prolongation(self, backend):
+        bm.set_backend(backend)
+        mesh0 = TriangleMesh.from_box(nx=2, ny=2)
+        mesh1 = TriangleMesh.from_box(nx=2, ny=2)
+        IM0 = mesh0.uniform_refine(2, returnim=True, incremental=True)
+        IM1 = mesh1.uniform_refine(2, returnim=True, incremental=True, imformat='csr')
+
+        for A, B in zip(IM0, IM1):
+            assert B.shape == A.shape
+            np.testing.assert_allclose(bm.to_numpy(B.to_dense()), A.toarray(), atol=1e-14)
+
+        with pytest.raises(ValueError):
+            mesh0.uniform_refine(returnim=True, imformat='coo')
+
+    @pytest.mark.parametrize('backend', ['numpy', 'pytorch'])
+    @pytest.mark.parametrize('Mesh', [QuadrangleMesh, HexahedronMesh, TetrahedronMesh])
+    def test_prolongation_other_meshes(self, backend, Mesh):
+        bm.set_backend(backend)
+        mesh = Mesh.from_box(nx=2, ny=2) if Mesh is QuadrangleMesh else Mesh.from_box(nx=2, ny=1, nz=2)
+        node = [bm.to_numpy(mesh.entity('node'))]
+        IM = mesh.uniform_refine(2, returnim=True, incremental=True, imformat='csr')
+        if Mesh is TetrahedronMesh:
+            IM, CM = IM
+            assert CM[0].shape == (8 * 4 * 6, 4 * 6)
+            np.testing.assert_allclose(bm.to_numpy(CM[0].to_dense()),
+                                       np.tile(np.eye(4 * 6), (8, 1)), atol=1e-14)
+        mesh0 = Mesh.from_box(nx=2, ny=2) if Mesh is QuadrangleMesh else Mesh.from_box(nx=2, ny=1, nz=2)
+        mesh0.uniform_refine()
+        node += [bm.to_numpy(mesh0.entity('node')), bm.to_numpy(mesh.entity('node'))]
+
+        # the new nodes are the barycenters of the parent entities
+        for k, B in enumerate(IM):
+            assert B.shape == (node[k + 1].shape[0], node[k].shape[0])
+            np.testing.assert_allclose(bm.to_numpy(B.to_dense()) @ node[k], node[k + 1], atol=1e-14)
+
+        if backend == 'numpy':
+            mesh1 = Mesh.from_box(nx=2, ny=2) if Mesh is QuadrangleMesh else Mesh.from_box(nx=2, ny=1, nz=2)
+            IM1 = mesh1.uniform_refine(2, returnim=True, incremental=True)
+            if Mesh is TetrahedronMesh:
+                IM1 = IM1[0]
+            for A, B in zip(IM1, IM):
+                np.testing.assert_allclose(bm.to_numpy(B.to_dense()), A.toarray(), atol=1e-14)
+
+        with pytest.raises(ValueError):
+            mesh.uniform_refine(returnim=True, imformat='coo')
+
+
+if __name__ == "__main__":
+    pytest.main(['./test_incremental_refine.py'])
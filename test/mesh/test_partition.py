@@ -0,0 +1,82 @@
+import numpy as np
+import pytest
+
+from fealpy.backend import backend_manager as bm
+from fealpy.mesh import TriangleMesh, TetrahedronMesh, QuadrangleMesh, partition_mesh
+
+
+class TestMeshPartition:
+    @pytest.mark.parametrize('backend', ['numpy', 'pytorch'])
+    @pytest.mark.parametrize('Mesh', [TriangleMesh, TetrahedronMesh, QuadrangleMesh])
+    @pytest.mark.parametrize('method', ['rcb', 'rib'])
+    def test_partition(self, backend, Mesh, method):
+        bm.set_backend(backend)
+        mesh = Mesh.from_box(nx=6, ny=6, nz=6) if Mesh is TetrahedronMesh \
+            else Mesh.from_box(nx=20, ny=20)
+        NC = mesh.number_of_cells()
+        coarse = partition_mesh(mesh, 5, method=method, refine=False)
+        partition = partition_mesh(mesh, 5, method=method, imbalance=0.05)
+        sizes = bm.to_numpy(partition.number_of_cells())
+
+        assert partition.part.shape == (NC, )
+        assert sizes.sum() == NC
+        assert sizes.max() <= np.ceil(1.05 * NC / 5)
+        assert partition.edge_cut() <= coarse.edge_cut()
+
+        part = bm.to_numpy(partition.part)
+        cell = bm.to_numpy(mesh.entity('cell'))
+        face2cell = bm.to_numpy(mesh.face_to_cell())
+        for k in range(5):
+            cells = bm.to_numpy(partition.cells(k))
+            nodes = bm.to_numpy(partition.nodes(k))
+            np.testing.assert_array_equal(cells, np.nonzero(part == k)[0])
+            np.testing.assert_array_equal(nodes[bm.to_numpy(partition.local_cells(k))], cell[cells])
+
+            ghost = bm.to_numpy(partition.ghost_cells(k))
+            assert np.all(part[ghost] != k)
+            inner = face2cell[:, :2][(part[face2cell[:, 0]] == k) ^ (part[face2cell[:, 1]] == k)]
+            np.testing.assert_array_equal(ghost, np.unique(inner[part[inner] != k]))
+
+            inodes = bm.to_numpy(partition.interface_nodes(k))
+            assert np.all(np.isin(inodes, nodes))
+            assert np.all(np.isin(inodes, cell[ghost]))
+
+        iface = bm.to_numpy(partition.interface_faces())
+        assert iface.shape[0] == partition.edge_cut()
+        assert np.all(part[face2cell[iface, 0]] != part[face2cell[iface, 1]])
+
+    @pytest.mark.parametrize('backend', ['numpy', 'pytorch'])
+    def test_reorder(self, backend):
+        bm.set_backend(backend)
+        mesh = TriangleMesh.from_box(nx=10, ny=10)
+        mesh.celldata['index'] = bm.arange(mesh.number_of_cells())
+        mesh.nodedata['x'] = mesh.entity('node')[:, 0]
+        partition = partition_mesh(mesh, 4)
+        reordered, cperm, nperm = partition.reorder()
+        new_mesh = reordered.mesh
+
+        # parts are contiguous ranges of cells, with the same geometry
+        part = bm.to_numpy(reordered.part)
+        assert np.all(np.diff(part) >= 0)
+        np.testing.assert_array_equal(bm.to_numpy(reordered.number_of_cells()),
+                                      bm.to_numpy(partition.number_of_cells()))
+        assert reordered.edge_cut() == partition.edge_cut()
+        np.testing.assert_allclose(bm.to_numpy(new_mesh.entity_barycenter('cell')),
+                                   bm.to_numpy(mesh.entity_barycenter('cell')[cperm]))
+        np.testing.assert_array_equal(bm.to_numpy(new_mesh.celldata['index']), bm.to_numpy(cperm))
+        np.testing.assert_allclose(bm.to_numpy(new_mesh.nodedata['x']),
+                                   bm.to_numpy(new_mesh.entity('node')[:, 0]))
+        np.testing.assert_allclose(bm.to_numpy(new_mesh.entity('node')),
+                                   bm.to_numpy(mesh.entity('node')[nperm]))
+
+    def test_errors(self):
+        bm.set_backend('numpy')
+        mesh = TriangleMesh.from_box(nx=2, ny=2)
+        with pytest.raises(ValueError):
+            partition_mesh(mesh, 2, method='metis')
+        with pytest.raises(ValueError):
+            partition_mesh(mesh, 100)
+
+
+if __name__ == "__main__":
+    pytest.main(['./test_partition.py'])
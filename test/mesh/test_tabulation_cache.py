@@ -0,0 +1,51 @@
+import numpy as np
+import pytest
+
+from fealpy.backend import backend_manager as bm
+from fealpy.mesh import TriangleMesh, TetrahedronMesh
+from fealpy.mesh.mesh_base import tabulation_cache, tabulate_simplex_basis
+from fealpy.functionspace import LagrangeFESpace
+
+
+class TestTabulationCache:
+    @pytest.mark.parametrize('backend', ['numpy', 'pytorch'])
+    @pytest.mark.parametrize('Mesh', [TriangleMesh, TetrahedronMesh])
+    @pytest.mark.parametrize('p', [1, 2, 3])
+    def test_basis(self, backend, Mesh, p):
+        bm.set_backend(backend)
+        tabulation_cache.clear()
+        mesh = Mesh.from_box(nx=2, ny=2) if Mesh is TriangleMesh else Mesh.from_box(nx=1, ny=1, nz=1)
+        space = LagrangeFESpace(mesh, p)
+        bcs, _ = mesh.quadrature_formula(p+2).get_quadrature_points_and_weights()
+
+        phi0 = space.basis(bcs)
+        gphi0 = space.grad_basis(bcs)
+        misses = tabulation_cache.info()['misses']
+        phi1 = space.basis(bcs)
+        gphi1 = space.grad_basis(bcs)
+        assert tabulation_cache.info()['misses'] == misses
+        assert tabulation_cache.info()['hits'] >= 2
+
+        # the same values as tabulated on a copy of the points, without cache
+        bcs_copy = bm.copy(bcs)
+        phi = bm.simplex_shape_function(bcs_copy, p)
+        R = bm.simplex_grad_shape_function(bcs_copy, p)
+        np.testing.assert_allclose(bm.to_numpy(phi1[0]), bm.to_numpy(phi), atol=1e-14)
+        np.testing.assert_allclose(bm.to_numpy(mesh.grad_shape_function(bcs, p, variables='u')),
+                                   bm.to_numpy(R), atol=1e-14)
+        np.testing.assert_allclose(bm.to_numpy(gphi0), bm.to_numpy(gphi1), atol=1e-14)
+
+    @pytest.mark.parametrize('backend', ['numpy', 'pytorch'])
+    def test_not_cached(self, backend):
+        bm.set_backend(backend)
+        tabulation_cache.clear()
+        bcs = bm.tensor([[0.2, 0.3, 0.5], [0.1, 0.1, 0.8]], dtype=bm.float64)
+        mi = bm.multi_index_matrix(2, 2)
+        tabulate_simplex_basis(bcs, 2)
+        tabulate_simplex_basis(bcs, 2, grad=True)
+        tabulate_simplex_basis(bcs, 2, mi=mi)
+        assert tabulation_cache.info()['size'] == 0
+
+
+if __name__ == "__main__":
+    pytest.main(['./test_tabulation_cache.py'])
@@ -315,6 +315,37 @@ class TestUniformMesh2dInterfaces:
         np.testing.assert_allclose(boundary_cell_flag, boundary_cell_flag_true, 
                                 atol=1e-8)
 
+    @pytest.mark.parametrize("backend", ['numpy', 'pytorch'])
+    def test_lazy_topology(self, backend):
+        bm.set_backend(backend)
+        mesh = UniformMesh2d((0, 3, 0, 2), h=(0.5, 0.5))
+        assert '_topology_cache' not in mesh.__dict__
+
+        edge2cell = bm.to_numpy(mesh.edge2cell)
+        np.testing.assert_array_equal(edge2cell, bm.to_numpy(mesh.edge_to_cell()))
+        np.testing.assert_array_equal(bm.to_numpy(mesh.boundary_edge_flag()),
+                                      edge2cell[:, 0] == edge2cell[:, 1])
+
+        mesh.uniform_refine()
+        assert mesh.face2cell.shape == (mesh.number_of_edges(), 4)
+        assert mesh.cell2edge.shape == (mesh.number_of_cells(), 4)
+
+    @pytest.mark.parametrize("backend", ['numpy', 'pytorch'])
+    def test_cell_to_cell(self, backend):
+        bm.set_backend(backend)
+        mesh = UniformMesh2d((0, 3, 0, 2), h=(0.5, 0.25))
+        cell2cell = bm.to_numpy(mesh.cell_to_cell())
+        bc = bm.to_numpy(mesh.entity_barycenter('cell'))
+        d = bc[cell2cell] - bc[:, None]
+        isBdCell = bm.to_numpy(mesh.boundary_cell_flag())
+
+        expected = np.array([[0, -0.25], [0, 0.25], [-0.5, 0], [0.5, 0]])
+        isSelf = cell2cell == np.arange(mesh.number_of_cells())[:, None]
+        assert np.all(np.all(np.abs(d - expected) < 1e-12, axis=-1) | isSelf)
+        np.testing.assert_array_equal(np.any(isSelf, axis=-1), isBdCell)
+        np.testing.assert_array_equal(bm.to_numpy(mesh.cell_to_cell(index=bm.arange(2, 4))),
+                                      cell2cell[2:4])
+
     @pytest.mark.parametrize("meshdata", uniform_refine_data)
     @pytest.mark.parametrize("backend", ['numpy', 'pytorch', 'jax'])
     def test_uniform_refine(self, meshdata, backend):
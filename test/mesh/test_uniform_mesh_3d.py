@@ -134,6 +134,43 @@ class TestUniformMesh3dInterfaces:
 
 
 
+    @pytest.mark.parametrize("backend", ['numpy', 'pytorch'])
+    def test_lazy_topology(self, backend):
+        bm.set_backend(backend)
+        mesh = UniformMesh3d((0, 3, 0, 2, 0, 4), h=(0.5, 0.5, 0.5))
+        assert '_topology_cache' not in mesh.__dict__
+
+        face2cell = bm.to_numpy(mesh.face2cell)
+        np.testing.assert_array_equal(face2cell, bm.to_numpy(mesh.face_to_cell()))
+        isBdFace = face2cell[:, 0] == face2cell[:, 1]
+        np.testing.assert_array_equal(bm.to_numpy(mesh.boundary_face_flag()), isBdFace)
+
+        isBdEdge = np.zeros(mesh.number_of_edges(), dtype=bool)
+        isBdEdge[bm.to_numpy(mesh.face2edge)[isBdFace]] = True
+        np.testing.assert_array_equal(bm.to_numpy(mesh.boundary_edge_flag()), isBdEdge)
+        isBdNode = np.zeros(mesh.number_of_nodes(), dtype=bool)
+        isBdNode[bm.to_numpy(mesh.face)[isBdFace]] = True
+        np.testing.assert_array_equal(bm.to_numpy(mesh.boundary_node_flag()), isBdNode)
+
+        mesh.uniform_refine()
+        assert mesh.face2cell.shape == (mesh.number_of_faces(), 4)
+        assert mesh.cell2edge.max() == mesh.number_of_edges() - 1
+
+    @pytest.mark.parametrize("backend", ['numpy', 'pytorch'])
+    def test_cell_to_cell(self, backend):
+        bm.set_backend(backend)
+        mesh = UniformMesh3d((0, 3, 0, 2, 0, 4), h=(0.5, 0.25, 0.125))
+        cell2cell = bm.to_numpy(mesh.cell_to_cell())
+        bc = bm.to_numpy(mesh.entity_barycenter('cell'))
+        d = bc[cell2cell] - bc[:, None]
+        isBdCell = bm.to_numpy(mesh.boundary_cell_flag())
+
+        expected = np.array([[-0.5, 0, 0], [0.5, 0, 0], [0, -0.25, 0],
+                             [0, 0.25, 0], [0, 0, -0.125], [0, 0, 0.125]])
+        isSelf = cell2cell == np.arange(mesh.number_of_cells())[:, None]
+        assert np.all(np.all(np.abs(d - expected) < 1e-12, axis=-1) | isSelf)
+        np.testing.assert_array_equal(np.any(isSelf, axis=-1), isBdCell)
+
     @pytest.mark.parametrize("meshdata", uniform_refine_data)
     @pytest.mark.parametrize("backend", ['numpy', 'pytorch', 'jax'])
     def test_uniform_refine(self, meshdata, backend):
@@ -0,0 +1,60 @@
+import numpy as np
+import pytest
+
+from fealpy.backend import backend_manager as bm
+from fealpy.quadrature import (
+    GaussLegendreQuadrature, TriangleQuadrature, QuadratureCache, quadrature_cache
+)
+from fealpy.mesh import TriangleMesh
+
+
+class TestQuadratureCache:
+    @pytest.mark.parametrize('backend', ['numpy', 'pytorch'])
+    def test_shared_tables(self, backend):
+        bm.set_backend(backend)
+        quadrature_cache.clear()
+        mesh0 = TriangleMesh.from_box(nx=2, ny=2)
+        mesh1 = TriangleMesh.from_box(nx=3, ny=3)
+        kwargs = {'dtype': bm.float64, 'device': mesh0.device}
+
+        qf0 = TriangleQuadrature(3, **kwargs)
+        qf1 = TriangleQuadrature(3, **kwargs)
+        assert quadrature_cache.info()['misses'] == 1
+        assert quadrature_cache.info()['hits'] == 1
+        assert qf0.quadpts is qf1.quadpts
+        assert qf0.weights is qf1.weights
+
+        bcs0, _ = mesh0.quadrature_formula(3).get_quadrature_points_and_weights()
+        bcs1, _ = mesh1.quadrature_formula(3).get_quadrature_points_and_weights()
+        assert bcs0 is bcs1
+
+        # different rules, indices and dtypes are cached separately
+        GaussLegendreQuadrature(3, **kwargs)
+        TriangleQuadrature(4, **kwargs)
+        qf2 = TriangleQuadrature(3, dtype=bm.float32, device=mesh0.device)
+        assert qf2.weights.dtype == bm.float32
+        assert quadrature_cache.info()['size'] == 4
+
+        if backend == 'numpy':
+            with pytest.raises(ValueError):
+                qf0.weights[0] = 0.
+
+    @pytest.mark.parametrize('backend', ['numpy', 'pytorch'])
+    def test_bounded(self, backend):
+        bm.set_backend(backend)
+        cache = QuadratureCache(maxsize=2)
+        make = lambda: (bm.zeros((1, 2)), bm.ones((1, )))
+        cache.get('a', make)
+        cache.get('b', make)
+        cache.get('a', make)
+        cache.get('c', make) # 'b' is the least recently used
+        assert len(cache) == 2
+        cache.get('a', make)
+        cache.get('b', make)
+        assert cache.info() == {'hits': 2, 'misses': 4, 'size': 2, 'maxsize': 2}
+        cache.clear()
+        assert cache.info() == {'hits': 0, 'misses': 0, 'size': 0, 'maxsize': 2}
+
+
+if __name__ == "__main__":
+    pytest.main(['./test_quadrature_cache.py'])
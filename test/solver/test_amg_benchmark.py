@@ -0,0 +1,64 @@
+import time
+
+import pytest
+
+from fealpy.backend import backend_manager as bm
+from fealpy.mesh import TetrahedronMesh
+from fealpy.functionspace import LagrangeFESpace
+from fealpy.fem import BilinearForm, ScalarDiffusionIntegrator
+from fealpy.fem import LinearForm, ScalarSourceIntegrator, DirichletBC
+from fealpy.solver import cg, AMGSolver
+
+
+class MatmulCounter():
+    def __init__(self, A):
+        self.A = A
+        self.count = 0
+
+    def __matmul__(self, x):
+        self.count += 1
+        return self.A @ x
+
+
+def run_amg_benchmark(n: int, rtol: float=1e-8):
+    mesh = TetrahedronMesh.from_box([0, 1, 0, 1, 0, 1], n, n, n)
+    space = LagrangeFESpace(mesh, p=1)
+    bform = BilinearForm(space)
+    bform.add_integrator(ScalarDiffusionIntegrator())
+    lform = LinearForm(space)
+    lform.add_integrator(ScalarSourceIntegrator(1.0))
+    A, F = DirichletBC(space, gd=0.0).apply(bform.assembly(), lform.assembly())
+
+    start = time.perf_counter()
+    ml = AMGSolver(A)
+    t_setup = time.perf_counter() - start
+
+    M = MatmulCounter(ml)
+    start = time.perf_counter()
+    x = cg(A, F, M=M, rtol=rtol)
+    t_pcg = time.perf_counter() - start
+    assert bm.linalg.norm(F - A @ x) < 10 * rtol * bm.linalg.norm(F)
+
+    plain = MatmulCounter(A)
+    start = time.perf_counter()
+    cg(plain, F, rtol=rtol)
+    t_cg = time.perf_counter() - start
+
+    print(f"\n[{bm.backend_name}] gdof={A.shape[0]}, levels={[l.A.shape[0] for l in ml.levels]}, "
+          f"complexity={ml.operator_complexity():.2f}: "
+          f"setup {t_setup:.3f} s, AMG-PCG {t_pcg:.3f} s ({M.count} iters), "
+          f"CG {t_cg:.3f} s ({plain.count - 1} iters)")
+    return t_setup, t_pcg, t_cg
+
+
+@pytest.mark.parametrize("backend", ['numpy', 'pytorch'])
+def test_amg_benchmark(backend):
+    bm.set_backend(backend)
+    run_amg_benchmark(12)
+
+
+if __name__ == "__main__":
+    for backend in ['numpy', 'pytorch']:
+        bm.set_backend(backend)
+        for n in [10, 20, 40]:
+            run_amg_benchmark(n)
@@ -0,0 +1,99 @@
+import pytest
+
+from fealpy.backend import backend_manager as bm
+from fealpy.mesh import TetrahedronMesh
+from fealpy.functionspace import LagrangeFESpace
+from fealpy.fem import BilinearForm, ScalarDiffusionIntegrator
+from fealpy.fem import LinearForm, ScalarSourceIntegrator, DirichletBC
+from fealpy.sparse import CSRTensor
+from fealpy.solver import cg, AMGSolver
+from fealpy.solver.amg_solver import strength_graph, aggregate
+
+
+class MatmulCounter():
+    def __init__(self, A):
+        self.A = A
+        self.count = 0
+
+    def __matmul__(self, x):
+        self.count += 1
+        return self.A @ x
+
+
+def poisson_system(n: int):
+    mesh = TetrahedronMesh.from_box([0, 1, 0, 1, 0, 1], n, n, n)
+    space = LagrangeFESpace(mesh, p=1)
+    bform = BilinearForm(space)
+    bform.add_integrator(ScalarDiffusionIntegrator())
+    lform = LinearForm(space)
+    lform.add_integrator(ScalarSourceIntegrator(1.0))
+    A, F = DirichletBC(space, gd=0.0).apply(bform.assembly(), lform.assembly())
+    return A, F
+
+
+@pytest.mark.parametrize("backend", ['numpy', 'pytorch'])
+def test_aggregate(backend):
+    bm.set_backend(backend)
+    A, _ = poisson_system(6)
+    crow, col = strength_graph(A)
+    agg, n_agg = aggregate(crow, col)
+    is_isolated = (crow[1:] - crow[:-1]) == 1
+
+    assert bm.all(agg[is_isolated] == -1)
+    assert bm.all(agg[~is_isolated] >= 0)
+    assert bm.all(agg < n_agg)
+    assert 0 < n_agg < A.shape[0] // 4
+
+
+@pytest.mark.parametrize("backend", ['numpy', 'pytorch'])
+def test_amg_pcg(backend):
+    bm.set_backend(backend)
+    A, F = poisson_system(10)
+    ml = AMGSolver(A, max_coarse=50)
+    assert len(ml.levels) >= 3
+
+    counter = MatmulCounter(ml)
+    x = cg(A, F, M=counter, rtol=1e-10)
+    assert bm.linalg.norm(F - A @ x) < 1e-9 * bm.linalg.norm(F)
+
+    plain = MatmulCounter(A)
+    cg(plain, F, rtol=1e-10)
+    assert counter.count < plain.count
+
+    x = ml.solve(F, rtol=1e-10)
+    assert bm.linalg.norm(F - A @ x) < 1e-9 * bm.linalg.norm(F)
+
+    X = cg(A, bm.stack([F, 2*F], axis=1), M=ml, rtol=1e-10)
+    assert bm.allclose(X[:, 1], 2*X[:, 0])
+
+
+@pytest.mark.parametrize("backend", ['numpy', 'pytorch'])
+def test_amg_large_coarse_level(backend):
+    bm.set_backend(backend)
+    A, F = poisson_system(10)
+    # max_levels is reached far above max_coarse
+    ml = AMGSolver(A, max_levels=1, max_coarse=10)
+    assert ml.coarse_inv is None
+    x = ml @ F
+    assert bm.linalg.norm(F - A @ x) < 1e-8 * bm.linalg.norm(F)
+
+    ml = AMGSolver(A, max_levels=2, max_coarse=10)
+    assert ml.levels[-1].A.shape[0] > 40
+    assert ml.coarse_inv is None
+    x = cg(A, F, M=ml, rtol=1e-10)
+    assert bm.linalg.norm(F - A @ x) < 1e-9 * bm.linalg.norm(F)
+
+
+@pytest.mark.parametrize("backend", ['numpy', 'pytorch'])
+def test_amg_update(backend):
+    bm.set_backend(backend)
+    A, F = poisson_system(8)
+    ml = AMGSolver(A, max_coarse=50)
+    x = cg(A, F, M=ml, rtol=1e-12)
+
+    A2 = CSRTensor(A.crow(), A.col(), 2 * A.values(), A.sparse_shape)
+    ml.update(A2)
+    assert bm.allclose(ml.levels[1].A.values(), 2 * AMGSolver(A, max_coarse=50).levels[1].A.values())
+
+    x2 = cg(A2, F, M=ml, rtol=1e-12)
+    assert bm.allclose(2 * x2, x, atol=1e-10)
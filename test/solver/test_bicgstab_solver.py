@@ -0,0 +1,31 @@
+import pytest
+
+from fealpy.backend import backend_manager as bm
+from fealpy.sparse import CSRTensor
+from fealpy.solver import bicgstab, JacobiPreconditioner, ILU0Preconditioner
+
+from test_amg_solver import poisson_system
+
+
+def convection_diffusion(n: int):
+    A, F = poisson_system(n)
+    crow, col = A.crow(), A.col()
+    row = bm.repeat(bm.arange(A.shape[0], **bm.context(crow)), crow[1:] - crow[:-1])
+    skew = bm.astype(bm.sign(col - row), A.values().dtype) * 0.2
+    values = bm.where(A.values() == 0., 0., A.values() + skew)
+    values = bm.where(row == col, A.values(), values)
+    return CSRTensor(crow, col, values, A.sparse_shape), F
+
+
+@pytest.mark.parametrize("backend", ['numpy', 'pytorch'])
+@pytest.mark.parametrize("precond", [None, JacobiPreconditioner, ILU0Preconditioner])
+def test_bicgstab(backend, precond):
+    bm.set_backend(backend)
+    A, F = convection_diffusion(5)
+    assert not bm.allclose(A.to_dense(), A.to_dense().T)
+    M = None if precond is None else precond(A)
+
+    x, info = bicgstab(A, F, M=M, rtol=1e-10, returninfo=True)
+    assert info['converged']
+    assert len(info['residual']) == info['niter'] + 1
+    assert bm.linalg.norm(F - A @ x) < 1e-9 * bm.linalg.norm(F)
@@ -0,0 +1,41 @@
+import pytest
+
+from fealpy.backend import backend_manager as bm
+from fealpy.solver import cg, JacobiPreconditioner, SSORPreconditioner, ILU0Preconditioner
+
+from test_amg_solver import poisson_system
+
+
+@pytest.mark.parametrize("backend", ['numpy', 'pytorch'])
+@pytest.mark.parametrize("precond", [None, JacobiPreconditioner, SSORPreconditioner, ILU0Preconditioner])
+def test_cg_info(backend, precond):
+    bm.set_backend(backend)
+    A, F = poisson_system(6)
+    M = None if precond is None else precond(A)
+    history = []
+    x, info = cg(A, F, M=M, rtol=1e-10, returninfo=True,
+                 callback=lambda n, res: history.append((n, res)))
+
+    assert bm.linalg.norm(F - A @ x) < 1e-9 * bm.linalg.norm(F)
+    assert info['converged']
+    assert info['nmatvec'] == info['niter'] + 1
+    assert len(info['residual']) == info['niter'] + 1
+    assert info['residual'][-1] < 1e-10 * float(bm.linalg.norm(F))
+    assert info['time'] > 0
+    assert history == list(enumerate(info['residual'][1:], 1))
+    if M is not None:
+        assert info['nprecond'] == info['niter']
+
+
+@pytest.mark.parametrize("backend", ['numpy', 'pytorch'])
+def test_cg_batch(backend):
+    bm.set_backend(backend)
+    A, F = poisson_system(4)
+    B = bm.stack([F, 3*F], axis=0)
+    X = cg(A, B, M=SSORPreconditioner(A), batch_first=True, rtol=1e-12)
+    assert bm.allclose(X[1], 3 * X[0])
+    assert bm.allclose(A @ X[0], F)
+
+    x, info = cg(A, F, maxiter=3, returninfo=True)
+    assert not info['converged']
+    assert info['niter'] == 3
@@ -0,0 +1,70 @@
+import numpy as np
+import pytest
+
+from fealpy.backend import backend_manager as bm
+from fealpy.mesh import UniformMesh2d, UniformMesh3d
+from fealpy.fdm import LaplaceOperator
+from fealpy.solver import FastPoissonSolver
+
+
+def _mesh(GD):
+    if GD == 2:
+        return UniformMesh2d((0, 16, 0, 12), h=(1/16, 1/12), origin=(0.0, 0.0))
+    return UniformMesh3d((0, 6, 0, 5, 0, 8), h=(1/6, 1/5, 1/8), origin=(0.0, 0.0, 0.0))
+
+
+class TestFastPoissonSolver:
+    @pytest.mark.parametrize('backend', ['numpy', 'pytorch'])
+    @pytest.mark.parametrize('GD', [2, 3])
+    @pytest.mark.parametrize('shift', [0.0, 2.0])
+    def test_dirichlet(self, backend, GD, shift):
+        bm.set_backend(backend)
+        mesh = _mesh(GD)
+        node = mesh.entity('node')
+        f = bm.sin(3*node[:, 0]) + node[:, 1]
+        g = bm.cos(node[:, 0]) * node[:, -1]
+        u = FastPoissonSolver(mesh, shift=shift).solve(f, g)
+
+        isBdNode = bm.to_numpy(mesh.boundary_node_flag())
+        r = bm.to_numpy(shift*u - LaplaceOperator(mesh)(u) - f)
+        np.testing.assert_allclose(r[~isBdNode], 0.0, atol=1e-9)
+        np.testing.assert_allclose(bm.to_numpy(u)[isBdNode], bm.to_numpy(g)[isBdNode])
+
+    @pytest.mark.parametrize('backend', ['numpy', 'pytorch'])
+    @pytest.mark.parametrize('GD', [2, 3])
+    def test_neumann(self, backend, GD):
+        bm.set_backend(backend)
+        mesh = _mesh(GD)
+        node = mesh.entity('node')
+        L = LaplaceOperator(mesh, bc='neumann')
+        w = bm.sin(2*node[:, 0]) * bm.cos(node[:, 1])
+        f = -L(w) # compatible right-hand side
+        u = FastPoissonSolver(mesh, bc='neumann').solve(f)
+
+        np.testing.assert_allclose(bm.to_numpy(-L(u)), bm.to_numpy(f), atol=1e-9)
+        d = bm.to_numpy(u - w)
+        np.testing.assert_allclose(d, d[0], atol=1e-9)
+
+    @pytest.mark.parametrize('backend', ['numpy', 'pytorch'])
+    def test_periodic_batched(self, backend):
+        bm.set_backend(backend)
+        mesh = _mesh(2)
+        node = mesh.entity('node')
+        solver = FastPoissonSolver(mesh, bc=('periodic', 'dirichlet'))
+        f = bm.stack([bm.sin(2*bm.pi*node[:, 0]) * node[:, 1],
+                      bm.cos(2*bm.pi*node[:, 0])], axis=0)
+        u = solver.solve(f.reshape((2, ) + solver.shape))
+        assert u.shape == (2, ) + solver.shape
+
+        # periodic second difference along x, Dirichlet along y
+        un = bm.to_numpy(u)[..., :-1, :]
+        hx, hy = mesh.h
+        lap = (np.roll(un, 1, axis=-2) - 2*un + np.roll(un, -1, axis=-2))[..., 1:-1] / hx**2 \
+            + (un[..., :-2] - 2*un[..., 1:-1] + un[..., 2:]) / hy**2
+        fn = bm.to_numpy(f).reshape((2, ) + solver.shape)[..., :-1, 1:-1]
+        np.testing.assert_allclose(-lap, fn, atol=1e-9)
+        np.testing.assert_allclose(bm.to_numpy(u)[..., -1, :], bm.to_numpy(u)[..., 0, :])
+        np.testing.assert_allclose(bm.to_numpy(u)[..., 0], 0.0)
+
+        with pytest.raises(ValueError):
+            FastPoissonSolver(mesh, bc='robin')
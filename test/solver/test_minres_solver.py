@@ -0,0 +1,73 @@
+import pytest
+
+from fealpy.backend import backend_manager as bm
+from fealpy.solver import minres, cg
+from fealpy.solver.amg_solver import csr_diagonal
+
+from test_amg_solver import poisson_system
+
+
+class SaddlePointOperator():
+    """[[A, B^T], [B, 0]]"""
+    def __init__(self, A, B):
+        self.A, self.B = A, B
+        self.n = A.shape[0]
+
+    def __matmul__(self, x):
+        u, p = x[:self.n], x[self.n:]
+        return bm.concat([self.A @ u + self.B.T @ p, self.B @ u], axis=0)
+
+
+class BlockDiagonalPreconditioner():
+    def __init__(self, A, m):
+        self.dinv = 1.0 / csr_diagonal(A)
+        self.m = m
+
+    def __matmul__(self, r):
+        n = self.dinv.shape[0]
+        return bm.concat([self.dinv * r[:n], r[n:]], axis=0)
+
+
+@pytest.mark.parametrize("backend", ['numpy', 'pytorch'])
+@pytest.mark.parametrize("preconditioned", [False, True])
+def test_minres_saddle_point(backend, preconditioned):
+    bm.set_backend(backend)
+    A, F = poisson_system(4)
+    n, m = A.shape[0], 6
+    idx = bm.arange(n).reshape(1, n) % m == bm.arange(m).reshape(m, 1)
+    B = bm.astype(idx, bm.float64)
+    K = SaddlePointOperator(A, B)
+    b = bm.concat([F, bm.ones((m, ), dtype=bm.float64)], axis=0)
+    M = BlockDiagonalPreconditioner(A, m) if preconditioned else None
+
+    x, info = minres(K, b, M=M, rtol=1e-12, returninfo=True)
+    assert info['converged']
+    assert info['nmatvec'] == info['niter'] + 1
+    assert bm.linalg.norm(b - K @ x) < 1e-9 * bm.linalg.norm(b)
+
+
+@pytest.mark.parametrize("backend", ['numpy', 'pytorch'])
+def test_minres_spd(backend):
+    bm.set_backend(backend)
+    A, F = poisson_system(4)
+    x0 = cg(A, F, rtol=1e-12)
+    x, info = minres(A, F, rtol=1e-12, returninfo=True)
+    assert bm.allclose(x, x0)
+    residual = info['residual']
+    assert all(r1 <= r0 * (1 + 1e-12) for r0, r1 in zip(residual, residual[1:]))
+
+
+@pytest.mark.parametrize("backend", ['numpy', 'pytorch'])
+def test_minres_rtol_with_x0(backend):
+    bm.set_backend(backend)
+    A, F = poisson_system(8)
+    x1 = cg(A, F, rtol=1e-12)
+    # the relative tolerance is measured against b, not the initial residual
+    x0 = x1 + 1e-3 * bm.sin(bm.arange(x1.shape[0], dtype=bm.float64))
+    x, info = minres(A, F, x0, rtol=1e-6, returninfo=True)
+    b_norm = float(bm.linalg.norm(F))
+    residual = info['residual']
+    assert info['converged']
+    assert residual[0] < b_norm
+    assert residual[-1] < 1e-6 * b_norm
+    assert residual[-2] >= 1e-6 * b_norm
@@ -0,0 +1,95 @@
+import pytest
+
+from fealpy.backend import backend_manager as bm
+from fealpy.sparse import CSRTensor
+from fealpy.solver import (
+    JacobiPreconditioner, BlockJacobiPreconditioner,
+    SSORPreconditioner, ILU0Preconditioner
+)
+from fealpy.solver.preconditioner import SparseTriangularSolver
+from fealpy.solver.amg_solver import csr_diagonal
+
+from test_amg_solver import poisson_system
+
+
+def tridiagonal(n: int):
+    col = [j for i in range(n) for j in (i-1, i, i+1) if 0 <= j < n]
+    values = [4. if j == i else -1. for i in range(n) for j in (i-1, i, i+1) if 0 <= j < n]
+    crow = [0] + [min(3*i + 2, 3*n - 2) for i in range(n)]
+    return CSRTensor(bm.tensor(crow, dtype=bm.int64), bm.tensor(col, dtype=bm.int64),
+                     bm.tensor(values, dtype=bm.float64), (n, n))
+
+
+@pytest.mark.parametrize("backend", ['numpy', 'pytorch'])
+def test_jacobi_and_block_jacobi(backend):
+    bm.set_backend(backend)
+    A, F = poisson_system(3)
+    D = A.to_dense()
+    n = A.shape[0]
+
+    M = JacobiPreconditioner(A)
+    assert bm.allclose(M @ F, F / csr_diagonal(A))
+
+    M = BlockJacobiPreconditioner(A, block_size=n)
+    assert bm.allclose(M @ F, bm.linalg.solve(D, F))
+
+    M = BlockJacobiPreconditioner(A, block_size=5)
+    z = M @ bm.stack([F, 2*F], axis=1)
+    assert z.shape == (n, 2)
+    assert bm.allclose(z[:5, 0], bm.linalg.solve(D[:5, :5], F[:5]))
+    assert bm.allclose(z[-(n % 5):, 1], 2*bm.linalg.solve(D[-(n % 5):, -(n % 5):], F[-(n % 5):]))
+
+
+@pytest.mark.parametrize("backend", ['numpy', 'pytorch'])
+@pytest.mark.parametrize("lower", [True, False])
+def test_triangular_solver(backend, lower):
+    bm.set_backend(backend)
+    A, F = poisson_system(3)
+    D = A.to_dense()
+    T = bm.tril(D) if lower else bm.triu(D)
+    solver = SparseTriangularSolver(A, csr_diagonal(A), lower=lower)
+
+    assert 1 < solver.depth < A.shape[0]
+    assert bm.allclose(solver @ F, bm.linalg.solve(T, F))
+
+
+@pytest.mark.parametrize("backend", ['numpy', 'pytorch'])
+@pytest.mark.parametrize("omega", [1.0, 1.5])
+def test_ssor(backend, omega):
+    bm.set_backend(backend)
+    A, F = poisson_system(3)
+    D = A.to_dense()
+    diag = bm.eye(A.shape[0], dtype=D.dtype) * csr_diagonal(A)[None, :]
+    L = diag + omega * bm.tril(D, k=-1)
+    U = diag + omega * bm.triu(D, k=1)
+    expected = omega * (2 - omega) * bm.linalg.solve(U, diag @ bm.linalg.solve(L, F))
+
+    M = SSORPreconditioner(A, omega=omega)
+    assert bm.allclose(M @ F, expected)
+
+
+@pytest.mark.parametrize("backend", ['numpy', 'pytorch'])
+def test_ilu0(backend):
+    bm.set_backend(backend)
+    # ILU(0) of a tridiagonal matrix is the exact LU factorization.
+    A = tridiagonal(20)
+    b = bm.astype(bm.arange(20), bm.float64)
+    M = ILU0Preconditioner(A, maxsweep=30, tol=1e-14)
+    assert bm.allclose(M @ b, bm.linalg.solve(A.to_dense(), b))
+
+    A, F = poisson_system(3)
+    M = ILU0Preconditioner(A, maxsweep=100, tol=1e-14)
+    assert M.nsweep < 100
+    # LU equals A on the pattern of A.
+    n = A.shape[0]
+    F = M.factor.to_dense()
+    LU = (bm.eye(n, dtype=bm.float64) + bm.tril(F, k=-1)) @ bm.triu(F)
+    is_pattern = A.to_dense(fill_value=1.) != 0.
+    D = A.to_dense()
+    assert bm.allclose(LU[is_pattern], D[is_pattern])
+    assert not bm.allclose(LU, D)
+
+    # approximate factors when the sweeps stop early
+    M = ILU0Preconditioner(A, maxsweep=2, tol=1e-14)
+    assert M.nsweep == 2
+    assert M.change > 1e-14
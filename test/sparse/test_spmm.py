@@ -2,7 +2,8 @@
 import pytest
 
 from fealpy.backend import backend_manager as bm
-from fealpy.sparse._spmm import spmm_coo
+from fealpy.sparse._spmm import spmm_coo, spmm_csr
+from fealpy.sparse import CSRTensor
 
 ALL_BACKENDS = ['numpy', 'pytorch']
 
@@ -140,3 +141,56 @@ def test_spmm_coo_invalid_spshape(backend):
     # Expect a ValueError to be raised
     with pytest.raises(ValueError):
         spmm_coo(indices, values, spshape, x)
+
+
+@pytest.mark.parametrize("backend", ALL_BACKENDS)
+def test_spmm_csr_vector_and_matrix(backend):
+    bm.set_backend(backend)
+    crow = bm.tensor([0, 3, 4, 7])
+    col = bm.tensor([0, 2, 3, 2, 0, 1, 3])
+    values = bm.tensor([1, 2, 4, -1, 3, 2, 5], dtype=bm.float32)
+    spshape = (3, 4)
+    x = bm.tensor([[-1, -1, -1, -1, -1],
+                   [6, 9, 1, 2, 7],
+                   [2, 2, 2, 2, 1],
+                   [1, 8, 2, 2, 5]], dtype=bm.float32)
+    expected = bm.tensor([[7, 35, 11, 11, 21],
+                          [-2, -2, -2, -2, -1],
+                          [14, 55, 9, 11, 36]], dtype=bm.float32)
+
+    output = spmm_csr(crow, col, values, spshape, x)
+    assert bm.allclose(output, expected)
+    output = spmm_csr(crow, col, values, spshape, x[:, 0])
+    assert bm.allclose(output, expected[:, 0])
+
+
+@pytest.mark.parametrize("backend", ALL_BACKENDS)
+def test_spmm_csr_batched_values(backend):
+    bm.set_backend(backend)
+    crow = bm.tensor([0, 3, 4, 7])
+    col = bm.tensor([0, 2, 3, 2, 0, 1, 3])
+    values = bm.tensor([[1, 2, 4, -1, 3, 2, 5],
+                        [2, 4, 8, -2, 6, 4, 10]], dtype=bm.float32)
+    spshape = (3, 4)
+    x = bm.tensor([[[-1, -1, -1, -1, -1],
+                    [6, 9, 1, 2, 7],
+                    [2, 2, 2, 2, 1],
+                    [1, 8, 2, 2, 5]],
+                   [[1, 1, 1, 1, 1],
+                    [-6, -9, -1, -2, -7],
+                    [-2, -2, -2, -2, -1],
+                    [-1, -8, -2, -2, -5]]], dtype=bm.float32)
+    expected = bm.tensor([[[7, 35, 11, 11, 21],
+                           [-2, -2, -2, -2, -1],
+                           [14, 55, 9, 11, 36]],
+                          [[-14, -70, -22, -22, -42],
+                           [4, 4, 4, 4, 2],
+                           [-28, -110, -18, -22, -72]]], dtype=bm.float32)
+
+    output = spmm_csr(crow, col, values, spshape, x)
+    assert bm.allclose(output, expected)
+
+    A = CSRTensor(crow, col, values, spshape)
+    assert bm.allclose(A @ x, expected)
+    assert bm.allclose(A.tocoo() @ x, expected)
+    assert bm.allclose(A @ x[0], bm.stack([expected[0], 2*expected[0]], axis=0))
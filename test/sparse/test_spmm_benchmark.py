@@ -0,0 +1,74 @@
+import time
+
+import numpy as np
+import pytest
+import scipy.sparse as sp
+
+from fealpy.backend import backend_manager as bm
+from fealpy.sparse import CSRTensor
+from fealpy.sparse._spmm import spmm_csr
+
+
+def _random_csr(nnz: int, nnz_per_row: int=20, seed: int=0):
+    rng = np.random.default_rng(seed)
+    nrow = max(nnz // nnz_per_row, 1)
+    row = np.repeat(np.arange(nrow), nnz_per_row)
+    col = rng.integers(0, nrow, nrow * nnz_per_row)
+    mat = sp.csr_matrix((rng.random(row.shape[0]), (row, col)), shape=(nrow, nrow))
+    mat.sum_duplicates()
+    return mat
+
+
+def _timeit(func, repeat: int=3):
+    func()
+    start = time.perf_counter()
+    for _ in range(repeat):
+        func()
+    return (time.perf_counter() - start) / repeat
+
+
+def run_spmm_benchmark(nnz: int, n_rhs: int=1, batch: int=0):
+    mat = _random_csr(nnz)
+    nrow = mat.shape[0]
+    x_np = np.random.rand(nrow) if n_rhs == 1 else np.random.rand(nrow, n_rhs)
+    crow = bm.from_numpy(mat.indptr.astype(np.int64))
+    col = bm.from_numpy(mat.indices.astype(np.int64))
+    values = bm.from_numpy(mat.data)
+    if batch > 0:
+        values = bm.stack([values]*batch, axis=0)
+    x = bm.from_numpy(x_np)
+    A = CSRTensor(crow, col, values, mat.shape)
+
+    t_scipy = _timeit(lambda: mat @ x_np)
+    t_generic = _timeit(lambda: spmm_csr(crow, col, values, mat.shape, x))
+    t_tensor = _timeit(lambda: A @ x)
+
+    expected = mat @ x_np
+    if batch > 0:
+        expected = np.stack([expected]*batch, axis=0)
+    np.testing.assert_allclose(bm.to_numpy(A @ x), expected, rtol=1e-10)
+    np.testing.assert_allclose(bm.to_numpy(spmm_csr(crow, col, values, mat.shape, x)),
+                               expected, rtol=1e-10)
+
+    print(f"\n[{bm.backend_name}] nnz={mat.nnz:.1e}, rhs={n_rhs}, batch={batch}: "
+          f"scipy {t_scipy*1e3:.2f} ms, "
+          f"spmm_csr {t_generic*1e3:.2f} ms, "
+          f"CSRTensor.matmul {t_tensor*1e3:.2f} ms")
+    return t_scipy, t_generic, t_tensor
+
+
+@pytest.mark.parametrize("backend", ['numpy', 'pytorch'])
+@pytest.mark.parametrize("n_rhs", [1, 4])
+@pytest.mark.parametrize("batch", [0, 2])
+def test_spmm_csr_benchmark(backend, n_rhs, batch):
+    bm.set_backend(backend)
+    run_spmm_benchmark(int(1e5), n_rhs=n_rhs, batch=batch)
+
+
+if __name__ == "__main__":
+    for backend in ['numpy', 'pytorch']:
+        bm.set_backend(backend)
+        for nnz in [int(1e5), int(1e6), int(1e7)]:
+            for n_rhs in [1, 8]:
+                run_spmm_benchmark(nnz, n_rhs=n_rhs)
+            run_spmm_benchmark(nnz, n_rhs=1, batch=4)
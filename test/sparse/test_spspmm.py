@@ -2,8 +2,10 @@
 import pytest
 
 from fealpy.backend import backend_manager as bm
-from fealpy.sparse._spspmm import spspmm_coo
-from fealpy.sparse import COOTensor
+from fealpy.sparse._spspmm import (
+    spspmm_coo, spspmm_csr, spspmm_csr_symbolic, spspmm_numeric
+)
+from fealpy.sparse import COOTensor, CSRTensor
 
 ALL_BACKENDS = ['numpy', 'pytorch']
 
@@ -47,5 +49,67 @@ def test_spspmm_coo_valid_input(backend):
 
     assert bm.allclose(result, expected)
 
+
+@pytest.mark.parametrize("backend", ALL_BACKENDS)
+def test_spspmm_csr_valid_input(backend):
+    bm.set_backend(backend)
+    crow1 = bm.tensor([0, 2, 3, 4])
+    col1 = bm.tensor([0, 1, 1, 2])
+    values1 = bm.tensor([1., 3., 4., 2.], dtype=bm.float64)
+    crow2 = bm.tensor([0, 1, 2, 3])
+    col2 = bm.tensor([1, 0, 0])
+    values2 = bm.tensor([2., 9., 3.], dtype=bm.float64)
+
+    crow, col, values, spshape = spspmm_csr(crow1, col1, values1, (3, 3),
+                                            crow2, col2, values2, (3, 2))
+    result = CSRTensor(crow, col, values, spshape).to_dense()
+    expected = bm.tensor([[27., 2.],
+                          [36., 0.],
+                          [6., 0.]], dtype=bm.float64)
+
+    assert spshape == (3, 2)
+    assert bm.allclose(result, expected)
+    assert bm.allclose(crow, bm.tensor([0, 2, 3, 4], dtype=crow.dtype))
+
+
+@pytest.mark.parametrize("backend", ALL_BACKENDS)
+def test_spspmm_csr_symbolic_numeric(backend):
+    bm.set_backend(backend)
+    crow1 = bm.tensor([0, 2, 3, 4])
+    col1 = bm.tensor([0, 1, 1, 2])
+    crow2 = bm.tensor([0, 1, 2, 3])
+    col2 = bm.tensor([1, 0, 0])
+    crow, col, left, right, target, spshape = spspmm_csr_symbolic(
+        crow1, col1, (3, 3), crow2, col2, (3, 2)
+    )
+    # batched values sharing the same pattern
+    values1 = bm.tensor([[1., 3., 4., 2.], [2., 6., 8., 4.]], dtype=bm.float64)
+    values2 = bm.tensor([[2., 9., 3.], [2., 9., 3.]], dtype=bm.float64)
+    values = spspmm_numeric(values1, values2, left, right, target, col.shape[0])
+    result = CSRTensor(crow, col, values, spshape).to_dense()
+    expected = bm.tensor([[27., 2.],
+                          [36., 0.],
+                          [6., 0.]], dtype=bm.float64)
+
+    assert bm.allclose(result[0], expected)
+    assert bm.allclose(result[1], 2*expected)
+
+
+@pytest.mark.parametrize("backend", ALL_BACKENDS)
+def test_sparse_matmul(backend):
+    bm.set_backend(backend)
+    A = COOTensor(bm.tensor([[0, 0, 1, 2, 2], [0, 2, 1, 0, 2]]),
+                  bm.tensor([1., 2., 3., 4., 5.], dtype=bm.float64), (3, 3))
+    B = COOTensor(bm.tensor([[2, 0, 1, 1], [1, 0, 0, 1]]),
+                  bm.tensor([1., -1., 2., 3.], dtype=bm.float64), (3, 2))
+    expected = A.to_dense() @ B.to_dense()
+
+    C = A @ B
+    assert C.is_coalesced
+    assert bm.allclose(C.to_dense(), expected)
+
+    C = A.tocsr() @ B.tocsr()
+    assert bm.allclose(C.to_dense(), expected)
+
 # Additional tests can be added here to cover more edge cases, different shapes,
 # or to ensure consistency with other matrix multiplication methods under various conditions.
@@ -0,0 +1,93 @@
+import zlib
+import xml.etree.ElementTree as ET
+
+import numpy as np
+import pytest
+
+from fealpy.backend import backend_manager as bm
+from fealpy.mesh import TriangleMesh, TetrahedronMesh
+from fealpy.writer import VTUWriter
+
+
+_DTYPES = {'Float64': '<f8', 'Float32': '<f4', 'Int64': '<i8', 'Int32': '<i4', 'UInt8': '<u1'}
+
+
+def read_vtu(fname):
+    """Read arrays of an appended raw binary VTU file."""
+    with open(fname, 'rb') as f:
+        content = f.read()
+    head, _, tail = content.partition(b'<AppendedData encoding="raw">\n_')
+    root = ET.fromstring(head + b'</VTKFile>')
+    compressed = root.get('compressor') is not None
+    arrays = {}
+    for section in ['PointData', 'CellData', 'Points', 'Cells']:
+        for da in root.iter(section):
+            for a in da.findall('DataArray'):
+                offset = int(a.get('offset'))
+                if compressed:
+                    nblock, _, _, size = np.frombuffer(tail, '<u8', 4, offset)
+                    raw = zlib.decompress(tail[offset+32:offset+32+int(size)])
+                else:
+                    size = int(np.frombuffer(tail, '<u8', 1, offset)[0])
+                    raw = tail[offset+8:offset+8+size]
+                data = np.frombuffer(raw, _DTYPES[a.get('type')])
+                ncomp = int(a.get('NumberOfComponents'))
+                arrays[(section, a.get('Name'))] = data.reshape(-1, ncomp) if ncomp > 1 else data
+    piece = root.find('UnstructuredGrid/Piece')
+    return int(piece.get('NumberOfPoints')), int(piece.get('NumberOfCells')), arrays
+
+
+class TestVTUWriter:
+    @pytest.mark.parametrize('backend', ['numpy', 'pytorch'])
+    @pytest.mark.parametrize('compress', [False, True])
+    def test_time_series(self, backend, compress, tmp_path):
+        bm.set_backend(backend)
+        mesh = TriangleMesh.from_box(nx=3, ny=2)
+        node = bm.to_numpy(mesh.entity('node'))
+        cell = bm.to_numpy(mesh.entity('cell'))
+        u = mesh.entity('node')[:, 0]
+
+        with VTUWriter(str(tmp_path), 'u', compress=compress, maxsize=2) as writer:
+            for step in range(3):
+                writer.write(mesh, time=0.1*step, nodedata={'u': u},
+                             celldata={'flag': bm.arange(mesh.number_of_cells()) % 2 == 0})
+                u = u + 1. # data are copied in write
+            mesh.uniform_refine()
+            writer.write(mesh, time=0.3, nodedata={'u': mesh.entity('node')[:, 0]}, celldata={})
+
+        pvd = ET.parse(tmp_path / 'u.pvd').getroot()
+        steps = [(float(d.get('timestep')), d.get('file')) for d in pvd.iter('DataSet')]
+        assert [t for t, _ in steps] == [0.0, 0.1, 0.2, 0.3]
+
+        NN, NC, arrays = read_vtu(tmp_path / steps[2][1])
+        assert (NN, NC) == (12, 12)
+        np.testing.assert_allclose(arrays[('PointData', 'u')], node[:, 0] + 2.)
+        np.testing.assert_array_equal(arrays[('CellData', 'flag')], np.arange(NC) % 2 == 0)
+        np.testing.assert_allclose(arrays[('Points', None)][:, :2], node)
+        np.testing.assert_array_equal(arrays[('Cells', 'connectivity')].reshape(NC, 3), cell)
+        np.testing.assert_array_equal(arrays[('Cells', 'offsets')], 3 * np.arange(1, NC + 1))
+        np.testing.assert_array_equal(arrays[('Cells', 'types')], 5)
+
+        # the refined mesh
+        NN, NC, arrays = read_vtu(tmp_path / steps[3][1])
+        assert (NN, NC) == (mesh.number_of_nodes(), mesh.number_of_cells())
+        np.testing.assert_array_equal(arrays[('Cells', 'connectivity')].reshape(NC, 3),
+                                      bm.to_numpy(mesh.entity('cell')))
+
+    @pytest.mark.parametrize('backend', ['numpy', 'pytorch'])
+    def test_errors(self, backend, tmp_path):
+        bm.set_backend(backend)
+        mesh = TetrahedronMesh.from_box(nx=1, ny=1, nz=1)
+        writer = VTUWriter(str(tmp_path))
+        writer.write(mesh, nodedata={'u': bm.zeros(3)}, celldata={})
+        with pytest.raises(RuntimeError):
+            writer.flush()
+        writer.write(mesh, nodedata={'u': bm.zeros(mesh.number_of_nodes())}, celldata={})
+        writer.close()
+        NN, NC, arrays = read_vtu(tmp_path / 'solution_000001.vtu')
+        assert (NN, NC) == (8, mesh.number_of_cells())
+        np.testing.assert_array_equal(arrays[('Cells', 'types')], 10)
+
+
+if __name__ == "__main__":
+    pytest.main(['./test_vtu_writer.py'])